@@ -0,0 +1,47 @@
+"""accent word bank
+
+Revision ID: 25bdcf0c3904
+Revises: 8093d4b4ceb3
+Create Date: 2025-06-27 10:14:05.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '25bdcf0c3904'
+down_revision: Union[str, None] = '8093d4b4ceb3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('accent_words',
+    sa.Column('word_id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('language', sa.String(length=50), nullable=False),
+    sa.Column('word', sa.String(length=100), nullable=False),
+    sa.Column('word_no_accent', sa.String(length=100), nullable=False),
+    sa.Column('accent_index', sa.Integer(), nullable=False),
+    sa.Column('vowel_indexes', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+    sa.Column('language_level', sa.String(), nullable=False),
+    sa.Column('is_suitable', sa.Boolean(), nullable=True),
+    sa.Column('confidence_level', sa.String(length=10), nullable=True),
+    sa.Column('meaning', sa.Text(), nullable=True),
+    sa.Column('examples', postgresql.JSONB(astext_type=sa.Text()), server_default=sa.text("'[]'::jsonb"), nullable=False),
+    sa.Column('grammar_tags', postgresql.JSONB(astext_type=sa.Text()), server_default=sa.text("'{}'::jsonb"), nullable=False),
+    sa.Column('used_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('word_id'),
+    sa.UniqueConstraint('language', 'word', name='uq_accent_words_word')
+    )
+    op.create_index('ix_accent_words_available', 'accent_words', ['language', 'language_level', 'word_id'], unique=False, postgresql_where=sa.text('is_suitable IS TRUE AND used_at IS NULL'))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_accent_words_available', table_name='accent_words', postgresql_where=sa.text('is_suitable IS TRUE AND used_at IS NULL'))
+    op.drop_table('accent_words')
@@ -0,0 +1,40 @@
+"""exercise fingerprints
+
+Revision ID: 7c41e9a2d5f8
+Revises: 25bdcf0c3904
+Create Date: 2025-06-30 09:41:27.503116
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '7c41e9a2d5f8'
+down_revision: Union[str, None] = '25bdcf0c3904'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('exercise_fingerprints',
+    sa.Column('exercise_id', sa.Integer(), nullable=False),
+    sa.Column('exercise_language', sa.String(), nullable=False),
+    sa.Column('signature', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+    sa.Column('band_keys', postgresql.ARRAY(sa.String()), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['exercise_id'], ['exercises.exercise_id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('exercise_id')
+    )
+    op.create_index('ix_exercise_fingerprints_band_keys', 'exercise_fingerprints', ['band_keys'], unique=False, postgresql_using='gin')
+    op.create_index('ix_exercise_fingerprints_language', 'exercise_fingerprints', ['exercise_language'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_exercise_fingerprints_language', table_name='exercise_fingerprints')
+    op.drop_index('ix_exercise_fingerprints_band_keys', table_name='exercise_fingerprints', postgresql_using='gin')
+    op.drop_table('exercise_fingerprints')
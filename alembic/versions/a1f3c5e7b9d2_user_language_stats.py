@@ -0,0 +1,45 @@
+"""user language stats
+
+Revision ID: a1f3c5e7b9d2
+Revises: d5a7c3e9f1b4
+Create Date: 2025-07-04 10:22:14.318907
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'a1f3c5e7b9d2'
+down_revision: Union[str, None] = 'd5a7c3e9f1b4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('user_language_stats',
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('exercise_language', sa.String(), nullable=False),
+    sa.Column('active_days', sa.Integer(), nullable=False),
+    sa.Column('total_attempts', sa.Integer(), nullable=False),
+    sa.Column('correct_attempts', sa.Integer(), nullable=False),
+    sa.Column('last_active_date', sa.Date(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.user_id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('user_id', 'exercise_language')
+    )
+    op.create_table('aggregation_watermarks',
+    sa.Column('name', sa.String(length=100), nullable=False),
+    sa.Column('watermark', sa.DateTime(timezone=True), nullable=False),
+    sa.PrimaryKeyConstraint('name')
+    )
+    op.create_index(op.f('ix_exercise_attempts_created_at'), 'exercise_attempts', ['created_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_exercise_attempts_created_at'), table_name='exercise_attempts')
+    op.drop_table('aggregation_watermarks')
+    op.drop_table('user_language_stats')
@@ -0,0 +1,36 @@
+"""audio artifacts
+
+Revision ID: b3d8f0a61c27
+Revises: 7c41e9a2d5f8
+Create Date: 2025-07-01 14:22:51.730184
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3d8f0a61c27'
+down_revision: Union[str, None] = '7c41e9a2d5f8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('audio_artifacts',
+    sa.Column('digest', sa.String(length=64), nullable=False),
+    sa.Column('r2_key', sa.String(), nullable=True),
+    sa.Column('audio_url', sa.Text(), nullable=True),
+    sa.Column('telegram_file_ids', postgresql.JSONB(astext_type=sa.Text()), server_default=sa.text("'{}'::jsonb"), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('digest')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('audio_artifacts')
@@ -0,0 +1,39 @@
+"""exercise quality stats
+
+Revision ID: b7d2e4f6a8c1
+Revises: a1f3c5e7b9d2
+Create Date: 2025-07-07 09:41:36.502114
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7d2e4f6a8c1'
+down_revision: Union[str, None] = 'a1f3c5e7b9d2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('exercise_quality_stats',
+    sa.Column('exercise_id', sa.Integer(), nullable=False),
+    sa.Column('weighted_attempts', sa.Float(), nullable=False),
+    sa.Column('weighted_incorrect', sa.Float(), nullable=False),
+    sa.Column('error_ratio', sa.Float(), sa.Computed('weighted_incorrect / NULLIF(weighted_attempts, 0)', persisted=True), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['exercise_id'], ['exercises.exercise_id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('exercise_id')
+    )
+    op.create_index(op.f('ix_exercise_quality_stats_error_ratio'), 'exercise_quality_stats', ['error_ratio'], unique=False)
+    op.create_index(op.f('ix_exercise_attempts_user_id'), 'exercise_attempts', ['user_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_exercise_attempts_user_id'), table_name='exercise_attempts')
+    op.drop_index(op.f('ix_exercise_quality_stats_error_ratio'), table_name='exercise_quality_stats')
+    op.drop_table('exercise_quality_stats')
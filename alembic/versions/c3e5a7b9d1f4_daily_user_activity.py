@@ -0,0 +1,41 @@
+"""daily user activity
+
+Revision ID: c3e5a7b9d1f4
+Revises: b7d2e4f6a8c1
+Create Date: 2025-07-09 14:05:52.730416
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3e5a7b9d1f4'
+down_revision: Union[str, None] = 'b7d2e4f6a8c1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('daily_user_activity',
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('bot_id', sa.String(length=50), nullable=False),
+    sa.Column('activity_date', sa.Date(), nullable=False),
+    sa.Column('attempts', sa.Integer(), nullable=False),
+    sa.Column('correct_attempts', sa.Integer(), nullable=False),
+    sa.Column('grammar_tags', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    sa.Column('vocab_tags', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    sa.Column('error_grammar_tags', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    sa.Column('error_vocab_tags', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.user_id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('user_id', 'bot_id', 'activity_date')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('daily_user_activity')
@@ -0,0 +1,69 @@
+"""next reminder due at
+
+Revision ID: d5a7c3e9f1b4
+Revises: b3d8f0a61c27
+Create Date: 2025-07-03 11:08:37.512904
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy import text
+
+from app.core.services.reminder_schedule import (
+    compute_next_long_break_reminder,
+)
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5a7c3e9f1b4'
+down_revision: Union[str, None] = 'b3d8f0a61c27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('user_bot_profiles', sa.Column('next_reminder_due_at', sa.DateTime(timezone=True), nullable=True))
+    op.add_column('user_bot_profiles', sa.Column('next_reminder_type', sa.String(), nullable=True))
+    op.create_index(op.f('ix_user_bot_profiles_next_reminder_due_at'), 'user_bot_profiles', ['next_reminder_due_at'], unique=False)
+
+    connection = op.get_bind()
+    profiles = connection.execute(text("""
+        SELECT user_id, bot_id, last_exercise_at,
+               last_long_break_reminder_type_sent,
+               last_long_break_reminder_sent_at
+        FROM user_bot_profiles
+        WHERE last_exercise_at IS NOT NULL
+    """)).fetchall()
+
+    updates = []
+    for row in profiles:
+        due_at, reminder_type = compute_next_long_break_reminder(
+            row.last_exercise_at,
+            row.last_long_break_reminder_type_sent,
+            row.last_long_break_reminder_sent_at,
+        )
+        if due_at is not None:
+            updates.append({
+                'user_id': row.user_id,
+                'bot_id': row.bot_id,
+                'due_at': due_at,
+                'reminder_type': reminder_type,
+            })
+
+    if updates:
+        connection.execute(text("""
+            UPDATE user_bot_profiles
+            SET next_reminder_due_at = :due_at,
+                next_reminder_type = :reminder_type
+            WHERE user_id = :user_id AND bot_id = :bot_id
+        """), updates)
+    print(f"Scheduled long break reminders for {len(updates)} of {len(profiles)} profiles.")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_user_bot_profiles_next_reminder_due_at'), table_name='user_bot_profiles')
+    op.drop_column('user_bot_profiles', 'next_reminder_type')
+    op.drop_column('user_bot_profiles', 'next_reminder_due_at')
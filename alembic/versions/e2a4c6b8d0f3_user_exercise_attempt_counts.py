@@ -0,0 +1,58 @@
+"""user exercise attempt counts
+
+Revision ID: e2a4c6b8d0f3
+Revises: d9f1b3c5e7a2
+Create Date: 2025-07-14 10:12:48.630517
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2a4c6b8d0f3'
+down_revision: Union[str, None] = 'd9f1b3c5e7a2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('user_exercise_attempt_counts',
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('exercise_language', sa.String(), nullable=False),
+    sa.Column('exercise_id', sa.Integer(), nullable=False),
+    sa.Column('attempts', sa.Integer(), nullable=False),
+    sa.Column('incorrect_attempts', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['exercise_id'], ['exercises.exercise_id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['user_id'], ['users.user_id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('user_id', 'exercise_language', 'exercise_id')
+    )
+    op.add_column('user_bot_profiles', sa.Column('quality_weight', sa.Float(), nullable=True))
+    # exercise_quality_stats already holds the attempts up to the watermark
+    # weighted with the current ratings.
+    op.execute('UPDATE user_bot_profiles SET quality_weight = rating')
+    op.execute("""
+        INSERT INTO user_exercise_attempt_counts (
+            user_id, exercise_language, exercise_id, attempts,
+            incorrect_attempts
+        )
+        SELECT
+            ea.user_id,
+            ex.exercise_language,
+            ea.exercise_id,
+            COUNT(*),
+            COUNT(*) FILTER (WHERE ea.is_correct IS FALSE)
+        FROM exercise_attempts ea
+        JOIN exercises ex ON ex.exercise_id = ea.exercise_id
+        JOIN aggregation_watermarks w ON w.name = 'exercise_quality_stats'
+        WHERE ea.created_at <= w.watermark
+        GROUP BY ea.user_id, ex.exercise_language, ea.exercise_id
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('user_bot_profiles', 'quality_weight')
+    op.drop_table('user_exercise_attempt_counts')
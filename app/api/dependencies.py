@@ -28,8 +28,14 @@ from app.db.repositories.user_bot_profile import (
     SQLAlchemyUserBotProfileRepository,
 )
 from app.db.repositories.user_report import SQLAlchemyUserReportRepository
+from app.infrastructure.delay_queue import SessionReminderQueue
+from app.infrastructure.notification_state import (
+    NotificationTaskRegistry,
+    ProfileStateCache,
+)
 from app.llm.llm_service import LLMService
 from app.llm.llm_translator import LLMTranslator
+from app.services.notification_relevance import NotificationRelevanceService
 
 
 def get_user_service(
@@ -38,12 +44,6 @@ def get_user_service(
     return UserService(SQLAlchemyUserRepository(session))
 
 
-def get_user_bot_profile_service(
-    session: Annotated[AsyncSession, Depends(get_async_session)],
-) -> UserBotProfileService:
-    return UserBotProfileService(SQLAlchemyUserBotProfileRepository(session))
-
-
 async def get_language_config_service(
     request: Request,
 ) -> LanguageConfigService:
@@ -60,6 +60,17 @@ async def get_redis_dependency(request: Request) -> AsyncRedis:
     return request.app.state.redis_client
 
 
+def get_user_bot_profile_service(
+    session: Annotated[AsyncSession, Depends(get_async_session)],
+    redis_client: Annotated[AsyncRedis, Depends(get_redis_dependency)],
+) -> UserBotProfileService:
+    return UserBotProfileService(
+        SQLAlchemyUserBotProfileRepository(session),
+        session_reminder_queue=SessionReminderQueue(redis_client),
+        profile_state_cache=ProfileStateCache(redis_client, session=session),
+    )
+
+
 async def get_arq_pool(request: Request) -> ArqRedis:
     if not hasattr(request.app.state, 'arq_pool'):
         raise RuntimeError('ARQ pool not initialized in app.state')
@@ -186,3 +197,16 @@ def get_user_progress_service(
         payment_service=payment_service,
         user_settings_service=user_settings_service,
     )
+
+
+def get_notification_relevance_service(
+    user_bot_profile_service: Annotated[
+        UserBotProfileService, Depends(get_user_bot_profile_service)
+    ],
+    redis_client: Annotated[AsyncRedis, Depends(get_redis_dependency)],
+) -> NotificationRelevanceService:
+    return NotificationRelevanceService(
+        profile_state_cache=ProfileStateCache(redis_client),
+        task_registry=NotificationTaskRegistry(redis_client),
+        user_bot_profile_service=user_bot_profile_service,
+    )
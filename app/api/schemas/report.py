@@ -7,6 +7,7 @@ from app.core.configs.enums import ReportStatus
 
 class DetailedReportResponse(BaseModel):
     current_report_status: Optional[ReportStatus] = None
+    report_text: Optional[str] = None
 
 
 class ReportNotFoundDetail(BaseModel):
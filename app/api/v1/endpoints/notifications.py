@@ -1,6 +1,11 @@
 import logging
+from typing import Annotated
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Depends, Query
+
+from app.api.dependencies import get_notification_relevance_service
+from app.api.schemas.notification import RelevanceCheckResponse
+from app.services.notification_relevance import NotificationRelevanceService
 
 logger = logging.getLogger(__name__)
 
@@ -9,12 +14,17 @@ router = APIRouter()
 
 @router.get(
     '/{task_id}/relevance',
+    response_model=RelevanceCheckResponse,
     summary='Check if a notification task is still relevant for a user.',
     response_description='Returns a boolean indicating if '
     'the notification is relevant.',
 )
 async def check_notification_relevance(
     task_id: str,
+    relevance_service: Annotated[
+        NotificationRelevanceService,
+        Depends(get_notification_relevance_service),
+    ],
     bot_id: str = Query(..., description='The ID of the bot (language pair).'),
     user_id: int = Query(..., description='The ID of the user.'),
 ):
@@ -25,28 +35,20 @@ async def check_notification_relevance(
     - **bot_id**: The identifier of the bot (e.g., "Bulgarian").
     - **user_id**: The unique identifier of the user.
 
-    On the first stage, this endpoint will always return
-    `{"is_relevant": True}`.
-    Future enhancements will include logic to check:
-    - User's current status in the bot (e.g., active, blocked).
-    - User's notification preferences.
-    - Specific conditions related to the notification type (e.g.,
-    if a session
-      reminder is still needed if the user already started a session).
+    A notification is not relevant if the user is no longer active in
+    the bot. For notifications enqueued by this backend the type is known
+    from the task_id, and additionally:
+    - a session reminder is not relevant if the user turned reminders
+      off, the session is frozen again or the user exercised after the
+      reminder was enqueued;
+    - a long break reminder is not relevant if the user exercised after
+      it was enqueued.
     """
-    logger.info(
+    logger.debug(
         f'Checking relevance for notification task_id: {task_id}, '
         f'user_id: {user_id}, bot_id: {bot_id}'
     )
-
-    # TODO: Implement actual relevance check logic here.
-    # For now, always return True as per the initial requirement.
-    is_relevant = True
-
-    if not is_relevant:
-        logger.info(
-            f'Notification task {task_id} for user {user_id} '
-            f'is no longer relevant.'
-        )
-
-    return {'is_relevant': is_relevant}
+    is_relevant = await relevance_service.is_relevant(
+        task_id=task_id, user_id=user_id, bot_id=bot_id
+    )
+    return RelevanceCheckResponse(is_relevant=is_relevant)
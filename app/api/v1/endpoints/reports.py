@@ -33,7 +33,8 @@ router = APIRouter()
     description=(
         'Retrieves the status of the latest detailed weekly report for '
         'a user and bot. '
-        'If it is being generated, a status message is returned. '
+        'If it is being generated, its status and the part of the text '
+        'generated so far are returned. '
         'If it needs to be generated, a task is enqueued '
         'and a status message is returned.'
     ),
@@ -75,12 +76,14 @@ async def get_latest_detailed_report(
                 f'for user {user_id} and bot {bot_id_str}'
             )
 
-        current_report_status = await report_service.request_detailed_report(
-            user_profile
-        )
+        (
+            current_report_status,
+            report_text,
+        ) = await report_service.request_detailed_report(user_profile)
 
         return DetailedReportResponse(
             current_report_status=current_report_status,
+            report_text=report_text,
         )
 
     except ReportNotFoundError as e:
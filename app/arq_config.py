@@ -1,15 +1,22 @@
 import logging
 
 import httpx
-from arq import cron
+from arq import cron, func
 from arq.connections import RedisSettings
 
 from app.config import settings
+from app.infrastructure.celery_publisher import CeleryTaskPublisher
+from app.infrastructure.notification_state import NotificationTaskRegistry
+from app.infrastructure.redis_client import (
+    close_redis_client,
+    get_redis_client,
+)
 from app.llm.llm_service import LLMService
 from app.logging_config import configure_logging
 from app.workers.arq_tasks.reports import (
     generate_and_send_detailed_report_arq,
     run_report_generation_cycle_arq,
+    run_report_generation_shard_arq,
     send_detailed_report_notification_arq,
 )
 
@@ -23,6 +30,12 @@ async def startup(ctx):
     ctx['http_client'] = http_client
     ctx['llm_service'] = LLMService(http_client=http_client)
     ctx['arq_pool'] = ctx['redis']
+    redis_client = await get_redis_client()
+    ctx['redis_client'] = redis_client
+    task_publisher = CeleryTaskPublisher(redis_client)
+    task_publisher.start()
+    ctx['task_publisher'] = task_publisher
+    ctx['task_registry'] = NotificationTaskRegistry(redis_client)
 
     logger.info('ARQ worker started successfully with all dependencies.')
 
@@ -32,6 +45,10 @@ async def shutdown(ctx):
     http_client: httpx.AsyncClient = ctx.get('http_client')
     if http_client:
         await http_client.aclose()
+    task_publisher: CeleryTaskPublisher = ctx.get('task_publisher')
+    if task_publisher:
+        await task_publisher.close()
+    await close_redis_client()
     logger.info('ARQ worker shut down successfully.')
 
 
@@ -47,6 +64,11 @@ class WorkerSettings:
         generate_and_send_detailed_report_arq,
         send_detailed_report_notification_arq,
         run_report_generation_cycle_arq,
+        func(
+            run_report_generation_shard_arq,
+            timeout=settings.report_generation_shard_timeout_seconds,
+            max_tries=settings.report_generation_shard_max_runs,
+        ),
     ]
     on_startup = startup
     on_shutdown = shutdown
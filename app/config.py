@@ -41,17 +41,41 @@ class Settings(BaseSettings):  # type: ignore
     tts_model: str = ''
     google_tts_proxy_url: str = ''
     generate_audio: bool = True
+    ffmpeg_max_concurrency: int = 2
+    ffmpeg_timeout_seconds: int = 60
+    tts_chunk_max_chars: int = 600
+    tts_chunk_max_concurrency: int = 4
+    tts_chunk_max_attempts: int = 3
+    tts_chunk_retry_delay_seconds: float = 1.0
 
     min_exercise_count_to_generate_new: int = 5
     exercise_refill_interval: int = 60 * 10
     chance_to_generate_persona_for_topic: float = 0.5
-    tts_cooldown_seconds: int = 60 * 60
+    accent_word_bank_min_available: int = 50
+    accent_word_harvest_batch_size: int = 15
+    accent_word_batch_top_picks: int = 5
+    accent_word_harvest_interval_seconds: int = 60 * 10
+    minhash_num_permutations: int = 128
+    minhash_lsh_bands: int = 32
+    minhash_shingle_size: int = 3
+    exercise_duplicate_similarity_threshold: float = 0.7
+    exercise_duplicate_max_regenerations: int = 2
+    exercise_fingerprint_backfill_batch_size: int = 500
+    exercise_fingerprint_index_interval_seconds: int = 60
+    # Published exercises not indexed yet are compared directly, up to
+    # this many per check.
+    exercise_duplicate_unindexed_check_limit: int = 50
 
     cloudflare_r2_account_id: str = ''
     cloudflare_r2_access_key_id: str = ''
     cloudflare_r2_secret_access_key: str = ''
     cloudflare_r2_bucket_name: str = 'duoniche'
     cloudflare_r2_public_url_prefix: str = ''
+    r2_max_attempts: int = 3
+    r2_retry_mode: str = 'standard'
+    r2_max_pool_connections: int = 10
+    r2_connect_timeout_seconds: int = 5
+    r2_read_timeout_seconds: int = 30
 
     telegram_upload_bot_tokens_json: str = ''
     telegram_upload_bot_tokens: Dict[str, str] = {}
@@ -63,6 +87,16 @@ class Settings(BaseSettings):  # type: ignore
     sentry_dsn: str = ''
 
     worker_shutdown_timeout_seconds: int = 10
+    circuit_breaker_failure_rate_threshold: float = 0.5
+    circuit_breaker_min_calls: int = 5
+    circuit_breaker_window_seconds: int = 60 * 5
+    circuit_breaker_bucket_seconds: int = 30
+    circuit_breaker_open_seconds: int = 60 * 5
+    circuit_breaker_probe_timeout_seconds: int = 60 * 2
+    worker_metrics_port: int = 8001
+    leader_lease_ttl_seconds: int = 30
+    leader_lease_renew_interval_seconds: int = 10
+    leader_lease_retry_interval_seconds: int = 15
 
     default_bot_message_language: str = 'en'
     exercise_fill_in_the_blank_blanks: str = '___'
@@ -82,12 +116,30 @@ class Settings(BaseSettings):  # type: ignore
     report_donation_amount_xtr: int = 50
 
     update_user_metrics_interval: int = 60
+    aggregation_settle_seconds: int = 5 * 60
+    quality_review_default_user_rating: float = 0.1
+    quality_stats_reweight_epsilon: float = 0.01
+    exercise_review_concurrency: int = 4
+    daily_activity_rollup_interval_seconds: int = 5 * 60
+    daily_activity_rollup_batch_days: int = 1
+    profile_scan_chunk_size: int = 500
     session_ttl_since_last_exercise: timedelta = timedelta(minutes=5)
 
     notification_tasks_queue_name: str = 'notification_tasks_default'
     notification_scheduler_interval_seconds: int = 60 * 5
+    notification_publish_buffer_size: int = 10000
+    notification_publish_batch_size: int = 500
+    notification_publish_flush_interval_seconds: float = 0.005
+    notification_publish_ack_timeout_seconds: float = 10.0
+    session_reminder_batch_size: int = 100
+    session_reminder_max_wait_seconds: float = 1.0
+    session_reminder_retry_delay_seconds: int = 60
+    session_reminder_dedup_ttl_seconds: int = 60 * 60 * 24
+    # Kept below the dedup TTL so backfilled reminders are not resent.
+    session_reminder_backfill_window_seconds: int = 60 * 60 * 6
+    profile_state_snapshot_ttl_seconds: int = 60 * 5
+    notification_task_record_ttl_seconds: int = 60 * 60 * 24 * 2
     long_break_reminders_cooldown_hours: int = 47
-    long_break_reminder_time_window_seconds: int = 30 * 60
     long_break_reminder_intervals: Dict[str, timedelta] = {
         '1d': timedelta(days=1),
         '3d': timedelta(days=3),
@@ -111,9 +163,18 @@ class Settings(BaseSettings):  # type: ignore
 
     async_task_cache_ttl: int = 60 * 2
 
-    report_notification_batch_size: int = 10
-    report_notification_batch_delay_seconds: int = 1
+    report_generation_shard_count: int = 8
+    # A shard job stops taking new chunks after the budget and continues
+    # in a retry of the same job, well within the job timeout.
+    report_generation_shard_budget_seconds: int = 4 * 60
+    report_generation_shard_timeout_seconds: int = 10 * 60
+    report_generation_shard_max_runs: int = 1000
+    report_notification_rate_per_second: float = 25.0
+    report_notification_burst: int = 25
+    job_checkpoint_ttl_seconds: int = 60 * 60 * 24 * 8
     full_weekly_report_sending_delay: int = 10 * 60
+    detailed_report_streaming: bool = True
+    detailed_report_partial_save_interval_seconds: float = 2.0
 
     model_config = SettingsConfigDict(
         env_file='.env',
@@ -0,0 +1,65 @@
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.core.configs.enums import LanguageLevel
+
+
+class AccentWord(BaseModel):
+    """
+    A dictionary word with a known stress position, harvested for
+    CHOOSE_ACCENT exercises together with the cached LLM verdict.
+    """
+
+    word_id: Optional[int] = Field(None, description='Internal word ID')
+    language: str = Field(
+        ...,
+        description='Exercise language (bot_id), e.g. "Bulgarian".',
+    )
+    word: str = Field(
+        ...,
+        description='NFC-normalized word with the accent mark.',
+    )
+    word_no_accent: str = Field(
+        ...,
+        description='The same word without the accent mark.',
+    )
+    accent_index: int = Field(
+        ...,
+        description='Index of the stressed vowel in the word.',
+    )
+    vowel_indexes: List[int] = Field(
+        ...,
+        description='Indexes of all vowels in the word.',
+    )
+    language_level: LanguageLevel = Field(
+        ...,
+        description='Learner level the suitability was assessed for.',
+    )
+    is_suitable: Optional[bool] = Field(
+        None,
+        description='Cached LLM verdict; None if not assessed yet.',
+    )
+    confidence_level: Optional[str] = Field(
+        None,
+        description="LLM confidence in the verdict: 'HIGH', 'MEDIUM', 'LOW'.",
+    )
+    meaning: Optional[str] = Field(
+        None,
+        description='Dictionary-like definition in the word language.',
+    )
+    examples: List[str] = Field(
+        default_factory=list,
+        description='Example sentences using the word.',
+    )
+    grammar_tags: Dict[str, Any] = Field(
+        default_factory=dict,
+        description='Vocabulary tags returned by the LLM.',
+    )
+    used_at: Optional[datetime] = Field(
+        None,
+        description='When the word was drawn for an exercise.',
+    )
+
+    model_config = ConfigDict(from_attributes=True)
@@ -0,0 +1,29 @@
+from typing import Dict, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class AudioArtifact(BaseModel):
+    """
+    Synthesized story audio addressed by a digest of everything that
+    affects the audio bytes, with the places it was already uploaded to.
+    """
+
+    digest: str = Field(
+        ...,
+        description='SHA-256 of text, voice, emotion and codec settings.',
+    )
+    r2_key: Optional[str] = Field(
+        None,
+        description='R2 object key, derived from the digest.',
+    )
+    audio_url: Optional[str] = Field(
+        None,
+        description='Public URL of the uploaded R2 object.',
+    )
+    telegram_file_ids: Dict[str, str] = Field(
+        default_factory=dict,
+        description='Telegram voice file_id per upload bot (bot_id).',
+    )
+
+    model_config = ConfigDict(from_attributes=True)
@@ -0,0 +1,26 @@
+from typing import List, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class ExerciseFingerprint(BaseModel):
+    """
+    MinHash signature of an exercise text with its LSH band keys, used to
+    detect near-duplicate exercises before publishing.
+    """
+
+    exercise_id: Optional[int] = Field(None, description='Exercise ID')
+    exercise_language: str = Field(
+        ...,
+        description='Exercise language (bot_id), e.g. "Bulgarian".',
+    )
+    signature: List[int] = Field(
+        ...,
+        description='MinHash signature of the exercise data text.',
+    )
+    band_keys: List[str] = Field(
+        ...,
+        description='LSH band keys derived from the signature.',
+    )
+
+    model_config = ConfigDict(from_attributes=True)
@@ -78,6 +78,15 @@ class UserBotProfile(BaseModel):
         None, description='Timestamp of the last long break reminder sent'
     )
 
+    next_reminder_due_at: Optional[datetime] = Field(
+        None,
+        description='When the next long break reminder is due; '
+        'maintained by the repository',
+    )
+    next_reminder_type: Optional[str] = Field(
+        None, description='Type of the next long break reminder'
+    )
+
     last_report_generated_at: Optional[datetime] = Field(
         None, description='Timestamp of the last report generation'
     )
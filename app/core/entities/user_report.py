@@ -1,5 +1,5 @@
 from datetime import date, datetime
-from typing import Optional
+from typing import Any, Dict, Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -41,6 +41,11 @@ class UserReport(BaseModel):
         ...,
         description='Timestamp of when the report was generated',
     )
+    summary: Optional[Dict[str, Any]] = Field(
+        None,
+        description='Weekly summary (counts and tag histograms) the report '
+        'was built from. Final once the week is over.',
+    )
     model_config = ConfigDict(
         from_attributes=True,
     )
@@ -0,0 +1,44 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional, Set
+
+from app.core.configs.enums import LanguageLevel
+from app.core.entities.accent_word import AccentWord
+
+
+class AccentWordRepository(ABC):
+    """
+    Abstract base class for the CHOOSE_ACCENT word bank.
+    """
+
+    @abstractmethod
+    async def add_many(self, words: List[AccentWord]) -> int:
+        """
+        Stores new words, silently skipping ones already in the bank.
+        Returns the number of inserted words.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_existing_words(
+        self, language: str, words: List[str]
+    ) -> Set[str]:
+        """
+        Returns which of the given accented words are already stored,
+        whether suitable or rejected.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def count_available(self, language: str) -> int:
+        """Counts suitable words that were not used yet."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def claim_available_word(
+        self, language: str, language_levels: List[LanguageLevel]
+    ) -> Optional[AccentWord]:
+        """
+        Picks an unused suitable word assessed for one of the given
+        levels and marks it as used.
+        """
+        raise NotImplementedError
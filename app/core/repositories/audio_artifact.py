@@ -0,0 +1,23 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from app.core.entities.audio_artifact import AudioArtifact
+
+
+class AudioArtifactRepository(ABC):
+    """
+    Abstract base class for the content-addressed story audio cache.
+    """
+
+    @abstractmethod
+    async def get_by_digest(self, digest: str) -> Optional[AudioArtifact]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def save(self, artifact: AudioArtifact) -> AudioArtifact:
+        """
+        Inserts the artifact or merges it into the stored one: a known R2
+        object is kept if the new one is missing and Telegram file_ids
+        are combined per bot.
+        """
+        raise NotImplementedError
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence, Tuple
 
 from app.core.entities.exercise_attempt import (
     ExerciseAttempt,
@@ -64,6 +64,18 @@ class ExerciseAttemptRepository(ABC):
         Aggregates user's performance data over the last week.
         """
 
+    @abstractmethod
+    async def get_period_summaries_for_users_and_bots(
+        self,
+        user_bot_ids: Sequence[Tuple[int, str]],
+        start_date: datetime,
+        end_date: datetime,
+    ) -> Dict[Tuple[int, str], Dict]:
+        """
+        Aggregates the performance data of many (user_id, bot_id) pairs
+        in one query. Returns their summaries keyed by the pair.
+        """
+
     @abstractmethod
     async def get_incorrect_attempts_with_details(
         self,
@@ -0,0 +1,39 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.core.entities.exercise_fingerprint import ExerciseFingerprint
+
+
+class ExerciseFingerprintRepository(ABC):
+    """
+    Abstract base class for the LSH index of exercise fingerprints.
+    """
+
+    @abstractmethod
+    async def add_many(self, fingerprints: List[ExerciseFingerprint]) -> int:
+        """
+        Stores fingerprints, skipping exercises that already have one.
+        Returns the number of inserted fingerprints.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_published_without_fingerprint(
+        self, limit: int, language: Optional[str] = None
+    ) -> List[Tuple[int, str, Dict[str, Any]]]:
+        """
+        Returns (exercise_id, exercise_language, data) of published
+        exercises that are not indexed yet, oldest first, optionally
+        only those of one language.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def find_candidates(
+        self, language: str, band_keys: List[str]
+    ) -> List[ExerciseFingerprint]:
+        """
+        Returns fingerprints of published exercises sharing at least one
+        LSH band key with the given ones.
+        """
+        raise NotImplementedError
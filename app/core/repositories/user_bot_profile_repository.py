@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 
 from app.core.entities.user import User
 from app.core.entities.user_bot_profile import (
@@ -39,9 +39,11 @@ class UserBotProfileRepository(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    async def get_active_profiles_for_reporting(
+    def iter_active_profiles_for_reporting(
         self,
         activity_since: datetime,
         report_due_before: datetime,
-    ) -> List[Tuple[UserBotProfile, User]]:
+        shard: Optional[Tuple[int, int]] = None,
+        after: Optional[Tuple[int, str]] = None,
+    ) -> AsyncIterator[List[Tuple[UserBotProfile, User]]]:
         raise NotImplementedError
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from datetime import date
 from typing import Optional
 
 from app.core.entities.user_report import UserReport
@@ -30,6 +31,14 @@ class UserReportRepository(ABC):
         Retrieves the most recent user report for a given user and bot.
         """
 
+    @abstractmethod
+    async def get_by_user_bot_and_week(
+        self, user_id: int, bot_id: str, week_start_date: date
+    ) -> Optional[UserReport]:
+        """
+        Retrieves the report of a user and bot for the given week.
+        """
+
     @abstractmethod
     async def update(self, report: UserReport) -> UserReport:
         """Updates an existing user report."""
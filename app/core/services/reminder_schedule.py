@@ -0,0 +1,49 @@
+import math
+from datetime import datetime, timedelta
+from typing import Optional, Tuple
+
+from app.config import settings
+
+
+def compute_next_long_break_reminder(
+    last_exercise_at: Optional[datetime],
+    last_reminder_type_sent: Optional[str],
+    last_reminder_sent_at: Optional[datetime],
+) -> Tuple[Optional[datetime], Optional[str]]:
+    """
+    Returns (due_at, reminder_type) of the next long break reminder, or
+    (None, None) when no further reminder will be sent.
+
+    Reminders go out at the time of day of the last exercise, so a due
+    time pushed back by the cooldown is rounded up to a whole number of
+    days after last_exercise_at. The type is the one the scheduler will
+    pick at due_at: the longest unsent interval that has elapsed.
+    """
+    if last_exercise_at is None:
+        return None, None
+
+    sequence = settings.long_break_reminder_sequence
+    intervals = settings.long_break_reminder_intervals
+    next_index = 0
+    if last_reminder_type_sent in sequence:
+        next_index = sequence.index(last_reminder_type_sent) + 1
+    remaining = sequence[next_index:]
+    if not remaining:
+        return None, None
+
+    break_duration = intervals[remaining[0]]
+    if last_reminder_sent_at is not None:
+        cooldown_ends_at = last_reminder_sent_at + timedelta(
+            hours=settings.long_break_reminders_cooldown_hours
+        )
+        if last_exercise_at + break_duration < cooldown_ends_at:
+            days = math.ceil(
+                (cooldown_ends_at - last_exercise_at) / timedelta(days=1)
+            )
+            break_duration = timedelta(days=days)
+
+    reminder_type = remaining[0]
+    for key in remaining:
+        if intervals[key] <= break_duration:
+            reminder_type = key
+    return last_exercise_at + break_duration, reminder_type
@@ -1,6 +1,17 @@
 import logging
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Set, Tuple, Union
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+from redis.exceptions import RedisError
 
 from app.config import settings
 from app.core.configs.enums import LanguageLevel
@@ -13,6 +24,8 @@ from app.core.entities.user_settings import UserCustomSettings
 from app.core.repositories.user_bot_profile_repository import (
     UserBotProfileRepository,
 )
+from app.infrastructure.delay_queue import SessionReminderQueue
+from app.infrastructure.notification_state import ProfileStateCache
 
 logger = logging.getLogger(__name__)
 
@@ -40,8 +53,12 @@ class UserBotProfileService:
     def __init__(
         self,
         profile_repo: UserBotProfileRepository,
+        session_reminder_queue: Optional[SessionReminderQueue] = None,
+        profile_state_cache: Optional[ProfileStateCache] = None,
     ):
         self._profile_repo = profile_repo
+        self._session_reminder_queue = session_reminder_queue
+        self._profile_state_cache = profile_state_cache
 
     async def get_all_by_user_id(
         self, user_id: int
@@ -55,6 +72,7 @@ class UserBotProfileService:
 
     async def save(self, profile: UserBotProfile) -> UserBotProfile:
         profile = await self._profile_repo.update(profile)
+        await self._invalidate_profile_state(profile)
         return profile
 
     async def get_or_create(
@@ -85,6 +103,8 @@ class UserBotProfileService:
             wants_session_reminders=None,
             last_long_break_reminder_type_sent=None,
             last_long_break_reminder_sent_at=None,
+            next_reminder_due_at=None,
+            next_reminder_type=None,
             rating=None,
             rating_last_calculated_at=None,
             settings=None,
@@ -93,6 +113,7 @@ class UserBotProfileService:
         )
         try:
             created_profile = await self._profile_repo.create(new_profile)
+            await self._invalidate_profile_state(created_profile)
             is_created = True
             return created_profile, is_created
         except Exception as e:
@@ -125,13 +146,56 @@ class UserBotProfileService:
 
         try:
             updated_profile = await self._profile_repo.update(profile)
-            return updated_profile
         except Exception as e:
             logger.error(
                 f'Error saving profile updates '
                 f'for {profile.user_id}/{profile.bot_id}: {e}'
             )
             raise
+        await self._invalidate_profile_state(updated_profile)
+        if 'session_frozen_until' in actual_changes:
+            await self._sync_session_reminder(updated_profile)
+        return updated_profile
+
+    async def _invalidate_profile_state(self, profile: UserBotProfile) -> None:
+        """
+        Drops the Redis snapshot used by relevance checks once the write
+        is committed, so the next check reloads the new state.
+        """
+        if not self._profile_state_cache:
+            return
+        try:
+            await self._profile_state_cache.invalidate(
+                profile.user_id, profile.bot_id
+            )
+        except RedisError as e:
+            logger.error(
+                f'Failed to invalidate profile state snapshot for '
+                f'{profile.user_id}/{profile.bot_id}: {e}'
+            )
+
+    async def _sync_session_reminder(self, profile: UserBotProfile) -> None:
+        """
+        Schedules the session-unlock reminder for the new freeze time, or
+        cancels it when the session is unfrozen early (e.g. paid unlock).
+        """
+        if not self._session_reminder_queue:
+            return
+        queue = self._session_reminder_queue
+        try:
+            if profile.session_frozen_until:
+                await queue.schedule_reminder(
+                    profile.user_id,
+                    profile.bot_id,
+                    profile.session_frozen_until,
+                )
+            else:
+                await queue.cancel_reminder(profile.user_id, profile.bot_id)
+        except RedisError as e:
+            logger.error(
+                f'Failed to sync session reminder for '
+                f'{profile.user_id}/{profile.bot_id}: {e}'
+            )
 
     async def update_session(
         self,
@@ -192,10 +256,11 @@ class UserBotProfileService:
 
             try:
                 updated_profile = await self._profile_repo.update(profile)
-                return updated_profile
             except Exception as e:
                 logger.error(f'Error updating profile: {e}')
                 raise
+            await self._invalidate_profile_state(updated_profile)
+            return updated_profile
         else:
             return profile
 
@@ -220,10 +285,11 @@ class UserBotProfileService:
             profile.reason = reason
             try:
                 updated_profile = await self._profile_repo.update(profile)
-                return updated_profile
             except Exception as e:
                 logger.error(f'Error updating profile: {e}')
                 raise
+            await self._invalidate_profile_state(updated_profile)
+            return updated_profile
         else:
             return profile
 
@@ -256,14 +322,18 @@ class UserBotProfileService:
         logger.info(f'Session unlocked for user {user_id}, ' f'bot {bot_id}.')
         return updated_profile
 
-    async def get_active_profiles_for_reporting(
+    def iter_active_profiles_for_reporting(
         self,
         activity_since: datetime,
         report_due_before: datetime,
-    ) -> List[Tuple[UserBotProfile, User]]:
-        return await self._profile_repo.get_active_profiles_for_reporting(
+        shard: Optional[Tuple[int, int]] = None,
+        after: Optional[Tuple[int, str]] = None,
+    ) -> AsyncIterator[List[Tuple[UserBotProfile, User]]]:
+        return self._profile_repo.iter_active_profiles_for_reporting(
             activity_since,
             report_due_before,
+            shard=shard,
+            after=after,
         )
 
     async def update_preferences(
@@ -35,6 +35,30 @@ from app.metrics import BACKEND_EXERCISE_METRICS, BACKEND_USER_METRICS
 logger = logging.getLogger(__name__)
 
 
+def _observe_session_end(user: User, profile: UserBotProfile) -> None:
+    """Records the length and exercise count of a session that ends now."""
+    if not profile.session_started_at or not profile.last_exercise_at:
+        return
+    session_duration = (
+        profile.last_exercise_at - profile.session_started_at
+    ).total_seconds()
+    if session_duration < 0:
+        return
+    labels = dict(
+        cohort=user.cohort,
+        plan=user.plan,
+        target_language=profile.bot_id,
+        user_language=profile.user_language,
+        language_level=profile.language_level.value,
+    )
+    BACKEND_USER_METRICS['session_length'].labels(**labels).observe(
+        session_duration
+    )
+    BACKEND_USER_METRICS['exercises_per_session'].labels(**labels).inc(
+        profile.exercises_get_in_session
+    )
+
+
 class UserProgressService:
     def __init__(
         self,
@@ -51,7 +75,10 @@ class UserProgressService:
         self.user_settings_service = user_settings_service
 
     async def get_next_action(self, user_id: int, bot_id: str) -> NextAction:
-        async def _start_new_session() -> UserBotProfile:
+        async def _start_new_session(user: User) -> UserBotProfile:
+            if user_bot_profile.session_frozen_until is None:
+                # A frozen session was recorded when it was frozen.
+                _observe_session_end(user, user_bot_profile)
             updated_profile = await (
                 self.user_bot_profile_service.reset_and_start_new_session(
                     user_id=user_bot_profile.user_id,
@@ -170,17 +197,17 @@ class UserProgressService:
                     f'User {user.user_id} WAS frozen '
                     f'until {user_bot_profile.session_frozen_until}, {now=}'
                 )
-                user_bot_profile = await _start_new_session()
+                user_bot_profile = await _start_new_session(user)
 
         if user_bot_profile.session_started_at is None:
             logger.info(f'New user {user.user_id} first session started')
-            user_bot_profile = await _start_new_session()
+            user_bot_profile = await _start_new_session(user)
             current_session_time = timedelta(0)
         else:
             current_session_time = now - user_bot_profile.session_started_at
 
         if current_session_time > settings.max_sessions_length:
-            user_bot_profile = await _start_new_session()
+            user_bot_profile = await _start_new_session(user)
 
         if (
             user_bot_profile.exercises_get_in_session
@@ -205,6 +232,7 @@ class UserProgressService:
                 user_language=user_bot_profile.user_language,
                 language_level=user_bot_profile.language_level.value,
             ).inc()
+            _observe_session_end(user, user_bot_profile)
 
             logger.info(
                 f'User {user_id} ended session and is frozen. '
@@ -1,9 +1,12 @@
 import logging
-from datetime import datetime, timedelta, timezone
-from typing import Optional
+import time
+from contextlib import aclosing
+from datetime import date, datetime, timedelta, timezone
+from typing import AsyncGenerator, Awaitable, Callable, Optional, Tuple
 
 from arq.connections import ArqRedis
 
+from app.config import settings
 from app.core.configs.enums import ReportStatus
 from app.core.configs.texts import Messages, get_text
 from app.core.entities.user import User
@@ -13,6 +16,7 @@ from app.core.repositories.exercise_attempt import ExerciseAttemptRepository
 from app.core.repositories.user_report import UserReportRepository
 from app.core.services.user_bot_profile import UserBotProfileService
 from app.llm.llm_service import LLMService
+from app.utils.html_cleaner import close_open_tags
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +32,15 @@ class ReportNotFoundError(Exception):
     pass
 
 
+def get_weekly_report_period(now: datetime) -> Tuple[datetime, datetime]:
+    """Returns (start, end) of the last full week (Monday to Monday)."""
+    current_week_start = now - timedelta(days=now.weekday())
+    report_end_date = current_week_start.replace(
+        hour=0, minute=0, second=0, microsecond=0
+    )
+    return report_end_date - timedelta(days=7), report_end_date
+
+
 class UserReportService:
     def __init__(
         self,
@@ -53,120 +66,141 @@ class UserReportService:
             report_id, user_id
         )
 
-    async def generate_and_save_short_weekly_reports(
+    async def iter_short_weekly_reports(
         self,
-    ) -> list[tuple[UserBotProfile, User, UserReport]]:
+        shard: Optional[Tuple[int, int]] = None,
+        after: Optional[Tuple[int, str]] = None,
+    ) -> AsyncGenerator[list[tuple[UserBotProfile, User, UserReport]], None]:
         """
-        Generates summary weekly reports for all active users.
-        - Retrieves profiles of active users.
-        - Calculates their weekly summary.
+        Generates summary weekly reports for all active users, or for one
+        (index, count) shard of them, resuming after the (user_id, bot_id)
+        given in after.
+        - Retrieves profiles of active users chunk by chunk.
+        - Calculates the weekly summaries of a chunk in one query.
         - Creates and stores a UserReport entity with the summary report.
-        - Returns a list of tuples (profile, user, report)
-        for sending notifications.
+        - Yields, per chunk of profiles, a list of tuples
+        (profile, user, report) for sending notifications.
         """
         logger.info('Starting short weekly report generation cycle.')
-        now = datetime.now(timezone.utc)
-
-        current_week_start = now - timedelta(days=now.weekday())
-        current_week_start = current_week_start.replace(
-            hour=0, minute=0, second=0, microsecond=0
+        report_start_date, report_end_date = get_weekly_report_period(
+            datetime.now(timezone.utc)
         )
-
-        report_end_date = current_week_start
-        report_start_date = report_end_date - timedelta(days=7)
         report_due_before = report_start_date + timedelta(days=1)
         report_week_start_date = report_start_date.date()
 
-        active_profiles = await (
-            self.profile_service.get_active_profiles_for_reporting(
+        profile_chunks = (
+            self.profile_service.iter_active_profiles_for_reporting(
                 activity_since=report_start_date,
                 report_due_before=report_due_before,
+                shard=shard,
+                after=after,
             )
         )
+        profiles_count = 0
+        async for active_profiles in profile_chunks:
+            profiles_count += len(active_profiles)
+            get_summaries = (
+                self.attempt_repo.get_period_summaries_for_users_and_bots
+            )
+            summaries = await get_summaries(
+                [
+                    (profile.user_id, profile.bot_id)
+                    for profile, _ in active_profiles
+                ],
+                start_date=report_start_date,
+                end_date=report_end_date,
+            )
+            reports_to_notify: list[
+                tuple[UserBotProfile, User, UserReport]
+            ] = []
+            for profile, user in active_profiles:
+                report = await self._generate_short_weekly_report(
+                    profile,
+                    summaries[(profile.user_id, profile.bot_id)],
+                    report_week_start_date=report_week_start_date,
+                )
+                if report:
+                    reports_to_notify.append((profile, user, report))
+            yield reports_to_notify
 
         logger.info(
-            f'Found {len(active_profiles)} active users for weekly report '
+            f'Processed {profiles_count} active users for weekly report '
             'generation.'
         )
 
-        reports_to_notify: list[tuple[UserBotProfile, User, UserReport]] = []
-        for profile, user in active_profiles:
-            current_summary = (
-                await self.attempt_repo.get_period_summary_for_user_and_bot(
-                    user_id=profile.user_id,
-                    bot_id=profile.bot_id,
-                    start_date=report_start_date,
-                    end_date=report_end_date,
-                )
-            )
-
-            if (
-                not current_summary
-                or current_summary.get('total_attempts', 0)
-                < MIN_ATTEMPTS_FOR_WEEKLY_REPORT
-            ):
-                logger.info(
-                    f'Skipping report for user {profile.user_id}/'
-                    f'{profile.bot_id} due to low activity.'
-                )
-                continue
-
-            total_attempts = current_summary.get('total_attempts', 0)
-            correct_attempts = current_summary.get('correct_attempts', 0)
-            accuracy = (
-                (correct_attempts / total_attempts) * 100
-                if total_attempts > 0
-                else 0
-            )
-            active_days = min(current_summary.get('active_days', 0), 7)
-
-            short_report_text = get_text(
-                Messages.WEEKLY_REPORT,
-                language_code=profile.user_language,
-                active_days=active_days,
-                total_attempts=total_attempts,
-                accuracy=accuracy,
+    async def _generate_short_weekly_report(
+        self,
+        profile: UserBotProfile,
+        current_summary: dict,
+        report_week_start_date: date,
+    ) -> Optional[UserReport]:
+        if (
+            not current_summary
+            or current_summary.get('total_attempts', 0)
+            < MIN_ATTEMPTS_FOR_WEEKLY_REPORT
+        ):
+            logger.info(
+                f'Skipping report for user {profile.user_id}/'
+                f'{profile.bot_id} due to low activity.'
             )
+            return None
 
-            try:
-                new_report = UserReport(
-                    report_id=None,
-                    user_id=profile.user_id,
-                    bot_id=profile.bot_id,
-                    week_start_date=report_week_start_date,
-                    short_report=short_report_text,
-                    full_report=None,
-                    generated_at=datetime.now(timezone.utc),
-                )
-
-                saved_report = await self.user_report_repo.create(new_report)
-                profile.last_report_generated_at = saved_report.generated_at
-                await self.profile_service.save(profile)
+        total_attempts = current_summary.get('total_attempts', 0)
+        correct_attempts = current_summary.get('correct_attempts', 0)
+        accuracy = (
+            (correct_attempts / total_attempts) * 100
+            if total_attempts > 0
+            else 0
+        )
+        active_days = min(current_summary.get('active_days', 0), 7)
+
+        short_report_text = get_text(
+            Messages.WEEKLY_REPORT,
+            language_code=profile.user_language,
+            active_days=active_days,
+            total_attempts=total_attempts,
+            accuracy=accuracy,
+        )
 
-                reports_to_notify.append((profile, user, saved_report))
+        try:
+            new_report = UserReport(
+                report_id=None,
+                user_id=profile.user_id,
+                bot_id=profile.bot_id,
+                week_start_date=report_week_start_date,
+                short_report=short_report_text,
+                full_report=None,
+                generated_at=datetime.now(timezone.utc),
+                summary=current_summary,
+            )
 
-                logger.info(
-                    f'Successfully prepared report for user '
-                    f'{profile.user_id}/{profile.bot_id} '
-                    f'(report_id: {saved_report.report_id})'
-                )
-            except Exception as e:
-                logger.error(
-                    f'Failed to prepare report for user '
-                    f'{profile.user_id}/{profile.bot_id}. Error: {e}',
-                    exc_info=True,
-                )
+            saved_report = await self.user_report_repo.create(new_report)
+            profile.last_report_generated_at = saved_report.generated_at
+            await self.profile_service.save(profile)
 
-        return reports_to_notify
+            logger.info(
+                f'Successfully prepared report for user '
+                f'{profile.user_id}/{profile.bot_id} '
+                f'(report_id: {saved_report.report_id})'
+            )
+            return saved_report
+        except Exception as e:
+            logger.error(
+                f'Failed to prepare report for user '
+                f'{profile.user_id}/{profile.bot_id}. Error: {e}',
+                exc_info=True,
+            )
+            return None
 
     async def request_detailed_report(
         self,
         profile: UserBotProfile,
-    ) -> ReportStatus:
+    ) -> Tuple[ReportStatus, Optional[str]]:
         """Handles a user's request for a detailed weekly report.
 
         It checks the status of the latest report. If a detailed report is
-        already being generated or is ready, it returns a message.
+        already being generated or is ready, it returns its status and text,
+        which is partial while the report is being generated.
         Otherwise, it enqueues a background task to generate the report.
         """
         if not profile:
@@ -187,7 +221,7 @@ class UserReportService:
             ReportStatus.GENERATED,
             ReportStatus.SENT,
         ]:
-            return latest_report.status
+            return latest_report.status, latest_report.full_report
 
         await self.arq_pool.enqueue_job(
             'generate_and_send_detailed_report_arq',
@@ -198,14 +232,20 @@ class UserReportService:
             f'{latest_report.report_id}'
         )
 
-        return ReportStatus.GENERATING
+        return ReportStatus.GENERATING, None
 
     async def generate_full_report_text(
         self,
         user_id: int,
         bot_id: str,
+        on_partial: Optional[Callable[[str], Awaitable[None]]] = None,
     ) -> str:
-        """Generates the full report text content using an LLM."""
+        """Generates the full report text content using an LLM.
+
+        With on_partial the text is streamed, and the part generated so far
+        is passed to on_partial at most every
+        detailed_report_partial_save_interval_seconds.
+        """
 
         profile = await self.profile_service.get(
             user_id=user_id, bot_id=bot_id
@@ -250,25 +290,26 @@ class UserReportService:
             )
         )
 
-        current_summary_data = (
-            await self.attempt_repo.get_period_summary_for_user_and_bot(
-                user_id=profile.user_id,
-                bot_id=profile.bot_id,
-                start_date=report_start_date,
-                end_date=report_end_date,
-            )
+        current_summary_data = await self._get_week_summary(
+            profile,
+            latest_report,
+            start_date=report_start_date,
+            end_date=report_end_date,
         )
         current_summary = UserReportService._prepare_summary_context(
             current_summary_data
         )
 
-        prev_summary_data = (
-            await self.attempt_repo.get_period_summary_for_user_and_bot(
-                user_id=profile.user_id,
-                bot_id=profile.bot_id,
-                start_date=prev_report_start_date,
-                end_date=prev_report_end_date,
-            )
+        prev_report = await self.user_report_repo.get_by_user_bot_and_week(
+            user_id=profile.user_id,
+            bot_id=profile.bot_id,
+            week_start_date=prev_report_start_date.date(),
+        )
+        prev_summary_data = await self._get_week_summary(
+            profile,
+            prev_report,
+            start_date=prev_report_start_date,
+            end_date=prev_report_end_date,
         )
         prev_summary = UserReportService._prepare_summary_context(
             prev_summary_data
@@ -287,13 +328,18 @@ class UserReportService:
         current_retry = 0
         full_report_text = ''
         while current_retry <= MAX_RETRIES_FULL_REPORT_GENERATION:
-            full_report_text = await (
-                self.llm_service.generate_detailed_report_text(
-                    context=context,
-                    user_language=profile.user_language,
-                    target_language=profile.bot_id,
+            if on_partial is None:
+                full_report_text = await (
+                    self.llm_service.generate_detailed_report_text(
+                        context=context,
+                        user_language=profile.user_language,
+                        target_language=profile.bot_id,
+                    )
+                )
+            else:
+                full_report_text = await self._stream_full_report_text(
+                    context, profile, on_partial
                 )
-            )
 
             if len(full_report_text) <= MAX_LENGTH_FULL_REPORT:
                 break
@@ -323,6 +369,63 @@ class UserReportService:
 
         return full_report_text
 
+    async def _stream_full_report_text(
+        self,
+        context: dict,
+        profile: UserBotProfile,
+        on_partial: Callable[[str], Awaitable[None]],
+    ) -> str:
+        """
+        Streams the report text, stopping as soon as it gets longer than
+        MAX_LENGTH_FULL_REPORT.
+        """
+        report_text = ''
+        last_partial_at = time.monotonic()
+        stream = self.llm_service.stream_detailed_report_text(
+            context=context,
+            user_language=profile.user_language,
+            target_language=profile.bot_id,
+        )
+        async with aclosing(stream):
+            async for piece in stream:
+                report_text += piece
+                if len(report_text) > MAX_LENGTH_FULL_REPORT:
+                    break
+                if (
+                    time.monotonic() - last_partial_at
+                    >= settings.detailed_report_partial_save_interval_seconds
+                ):
+                    await on_partial(close_open_tags(report_text))
+                    last_partial_at = time.monotonic()
+        return report_text
+
+    async def _get_week_summary(
+        self,
+        profile: UserBotProfile,
+        report: Optional[UserReport],
+        start_date: datetime,
+        end_date: datetime,
+    ) -> dict:
+        """
+        Returns the summary stored with the report of the week. Reports
+        stored without one get it computed and saved once the week is
+        over; weeks without a report are computed every time.
+        """
+        if report is not None and report.summary is not None:
+            return report.summary
+
+        summary = await self.attempt_repo.get_period_summary_for_user_and_bot(
+            user_id=profile.user_id,
+            bot_id=profile.bot_id,
+            start_date=start_date,
+            end_date=end_date,
+        )
+        if report is not None and end_date <= datetime.now(timezone.utc):
+            report.summary = summary
+            await self.user_report_repo.update(report)
+            logger.info(f'Stored summary for report_id {report.report_id}.')
+        return summary
+
     @staticmethod
     def _format_tags_for_summary(
         tags_dict: dict,
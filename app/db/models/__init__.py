@@ -1,19 +1,37 @@
 from app.db.base import Base
+from app.db.models.accent_word import AccentWord
+from app.db.models.aggregation_watermark import AggregationWatermark
+from app.db.models.audio_artifact import AudioArtifact
+from app.db.models.daily_user_activity import DailyUserActivity
 from app.db.models.exercise import Exercise
 from app.db.models.exercise_answer import ExerciseAnswer
 from app.db.models.exercise_attempt import ExerciseAttempt
+from app.db.models.exercise_fingerprint import ExerciseFingerprint
+from app.db.models.exercise_quality_stats import ExerciseQualityStats
 from app.db.models.payment import DBPayment
 from app.db.models.user import User
 from app.db.models.user_bot_profile import DBUserBotProfile
+from app.db.models.user_exercise_attempt_counts import (
+    UserExerciseAttemptCounts,
+)
+from app.db.models.user_language_stats import UserLanguageStats
 from app.db.models.user_report import UserReport
 
 __all__ = [
     'Base',
+    'AccentWord',
+    'AggregationWatermark',
+    'AudioArtifact',
+    'DailyUserActivity',
     'Exercise',
     'ExerciseAnswer',
     'ExerciseAttempt',
+    'ExerciseFingerprint',
+    'ExerciseQualityStats',
     'User',
     'DBUserBotProfile',
+    'UserExerciseAttemptCounts',
+    'UserLanguageStats',
     'DBPayment',
     'UserReport',
 ]
@@ -0,0 +1,65 @@
+from datetime import datetime
+
+from sqlalchemy import (
+    Boolean,
+    DateTime,
+    Index,
+    Integer,
+    String,
+    Text,
+    UniqueConstraint,
+    text,
+)
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from app.db.base import Base
+
+
+class AccentWord(Base):
+    __tablename__ = 'accent_words'
+
+    word_id: Mapped[int] = mapped_column(
+        Integer, primary_key=True, autoincrement=True
+    )
+    language: Mapped[str] = mapped_column(String(50), nullable=False)
+    word: Mapped[str] = mapped_column(String(100), nullable=False)
+    word_no_accent: Mapped[str] = mapped_column(String(100), nullable=False)
+    accent_index: Mapped[int] = mapped_column(Integer, nullable=False)
+    vowel_indexes: Mapped[list] = mapped_column(JSONB, nullable=False)
+    language_level: Mapped[str] = mapped_column(String, nullable=False)
+    is_suitable: Mapped[bool | None] = mapped_column(Boolean, nullable=True)
+    confidence_level: Mapped[str | None] = mapped_column(
+        String(10), nullable=True
+    )
+    meaning: Mapped[str | None] = mapped_column(Text, nullable=True)
+    examples: Mapped[list] = mapped_column(
+        JSONB, nullable=False, server_default=text("'[]'::jsonb")
+    )
+    grammar_tags: Mapped[dict] = mapped_column(
+        JSONB, nullable=False, server_default=text("'{}'::jsonb")
+    )
+    used_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+
+    __table_args__ = (
+        UniqueConstraint('language', 'word', name='uq_accent_words_word'),
+        Index(
+            'ix_accent_words_available',
+            'language',
+            'language_level',
+            'word_id',
+            postgresql_where=text('is_suitable IS TRUE AND used_at IS NULL'),
+        ),
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f'<AccentWord(word_id={self.word_id}, word={self.word}, '
+            f'language={self.language}, is_suitable={self.is_suitable})>'
+        )
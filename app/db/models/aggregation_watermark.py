@@ -0,0 +1,20 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class AggregationWatermark(Base):
+    """
+    Position up to which an incremental aggregate has consumed its
+    source rows (by created_at).
+    """
+
+    __tablename__ = 'aggregation_watermarks'
+
+    name: Mapped[str] = mapped_column(String(100), primary_key=True)
+    watermark: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
@@ -0,0 +1,34 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, String, Text, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from app.db.base import Base
+
+
+class AudioArtifact(Base):
+    __tablename__ = 'audio_artifacts'
+
+    digest: Mapped[str] = mapped_column(String(64), primary_key=True)
+    r2_key: Mapped[str | None] = mapped_column(String, nullable=True)
+    audio_url: Mapped[str | None] = mapped_column(Text, nullable=True)
+    telegram_file_ids: Mapped[dict] = mapped_column(
+        JSONB, nullable=False, server_default=text("'{}'::jsonb")
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f'<AudioArtifact(digest={self.digest}, r2_key={self.r2_key}, '
+            f'telegram_bots={list(self.telegram_file_ids or {})})>'
+        )
@@ -0,0 +1,38 @@
+from datetime import date, datetime
+
+from sqlalchemy import Date, DateTime, ForeignKey, Integer, String
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from app.db.base import Base
+
+
+class DailyUserActivity(Base):
+    """
+    Attempt counts and tag histograms of a user per bot and UTC day,
+    advanced incrementally from exercise_attempts.
+    """
+
+    __tablename__ = 'daily_user_activity'
+
+    user_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey('users.user_id', ondelete='CASCADE'),
+        primary_key=True,
+    )
+    bot_id: Mapped[str] = mapped_column(String(50), primary_key=True)
+    activity_date: Mapped[date] = mapped_column(Date, primary_key=True)
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    correct_attempts: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0
+    )
+    grammar_tags: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
+    vocab_tags: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
+    error_grammar_tags: Mapped[dict | None] = mapped_column(
+        JSONB, nullable=True
+    )
+    error_vocab_tags: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
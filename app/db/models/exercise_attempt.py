@@ -20,7 +20,9 @@ class ExerciseAttempt(Base):
         Integer, primary_key=True, index=True, autoincrement=True
     )
     user_id: Mapped[int] = mapped_column(
-        ForeignKey('users.user_id', ondelete='CASCADE'), nullable=False
+        ForeignKey('users.user_id', ondelete='CASCADE'),
+        index=True,
+        nullable=False,
     )
     exercise_id: Mapped[int] = mapped_column(
         ForeignKey('exercises.exercise_id', ondelete='CASCADE'),
@@ -35,7 +37,10 @@ class ExerciseAttempt(Base):
     )
     error_tags: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=datetime.now, nullable=False
+        DateTime(timezone=True),
+        default=datetime.now,
+        nullable=False,
+        index=True,
     )
 
     user: Mapped['User'] = relationship(back_populates='attempts')
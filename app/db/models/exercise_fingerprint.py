@@ -0,0 +1,42 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from app.db.base import Base
+
+
+class ExerciseFingerprint(Base):
+    __tablename__ = 'exercise_fingerprints'
+
+    exercise_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey('exercises.exercise_id', ondelete='CASCADE'),
+        primary_key=True,
+    )
+    exercise_language: Mapped[str] = mapped_column(String, nullable=False)
+    signature: Mapped[list] = mapped_column(JSONB, nullable=False)
+    band_keys: Mapped[list[str]] = mapped_column(ARRAY(String), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+
+    __table_args__ = (
+        Index(
+            'ix_exercise_fingerprints_band_keys',
+            'band_keys',
+            postgresql_using='gin',
+        ),
+        Index(
+            'ix_exercise_fingerprints_language',
+            'exercise_language',
+        ),
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f'<ExerciseFingerprint(exercise_id={self.exercise_id}, '
+            f'exercise_language={self.exercise_language})>'
+        )
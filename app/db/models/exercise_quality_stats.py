@@ -0,0 +1,40 @@
+from datetime import datetime
+
+from sqlalchemy import Computed, DateTime, Float, ForeignKey, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from app.db.base import Base
+
+
+class ExerciseQualityStats(Base):
+    """
+    Attempt totals of an exercise weighted by the rating of the user who
+    made them, advanced incrementally from exercise_attempts and adjusted
+    when user ratings change.
+    """
+
+    __tablename__ = 'exercise_quality_stats'
+
+    exercise_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey('exercises.exercise_id', ondelete='CASCADE'),
+        primary_key=True,
+    )
+    weighted_attempts: Mapped[float] = mapped_column(
+        Float, nullable=False, default=0
+    )
+    weighted_incorrect: Mapped[float] = mapped_column(
+        Float, nullable=False, default=0
+    )
+    error_ratio: Mapped[float | None] = mapped_column(
+        Float,
+        Computed(
+            'weighted_incorrect / NULLIF(weighted_attempts, 0)',
+            persisted=True,
+        ),
+        index=True,
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
@@ -86,11 +86,23 @@ class DBUserBotProfile(Base):
         )
     )
 
+    next_reminder_due_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True, index=True
+    )
+    next_reminder_type: Mapped[Optional[str]] = mapped_column(
+        String, nullable=True
+    )
+
     last_report_generated_at: Mapped[Optional[datetime]] = mapped_column(
         DateTime(timezone=True), nullable=True
     )
 
     rating: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    # Rating the user's attempts are weighted with in exercise_quality_stats;
+    # it follows rating only when the difference is worth a reweight.
+    quality_weight: Mapped[Optional[float]] = mapped_column(
+        Float, nullable=True
+    )
     rating_last_calculated_at: Mapped[Optional[datetime]] = mapped_column(
         DateTime(timezone=True), nullable=True
     )
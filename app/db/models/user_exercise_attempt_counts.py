@@ -0,0 +1,30 @@
+from sqlalchemy import ForeignKey, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class UserExerciseAttemptCounts(Base):
+    """
+    Attempts of a user per exercise already consumed into
+    exercise_quality_stats, so a rating change of the user can be applied
+    without rescanning exercise_attempts.
+    """
+
+    __tablename__ = 'user_exercise_attempt_counts'
+
+    user_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey('users.user_id', ondelete='CASCADE'),
+        primary_key=True,
+    )
+    exercise_language: Mapped[str] = mapped_column(String, primary_key=True)
+    exercise_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey('exercises.exercise_id', ondelete='CASCADE'),
+        primary_key=True,
+    )
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    incorrect_attempts: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0
+    )
@@ -0,0 +1,42 @@
+from datetime import date, datetime
+
+from sqlalchemy import (
+    Date,
+    DateTime,
+    ForeignKey,
+    Integer,
+    String,
+)
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from app.db.base import Base
+
+
+class UserLanguageStats(Base):
+    """
+    Running totals of a user's exercise attempts per exercise language,
+    advanced incrementally from exercise_attempts.
+    """
+
+    __tablename__ = 'user_language_stats'
+
+    user_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey('users.user_id', ondelete='CASCADE'),
+        primary_key=True,
+    )
+    exercise_language: Mapped[str] = mapped_column(String, primary_key=True)
+    active_days: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0
+    )
+    total_attempts: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0
+    )
+    correct_attempts: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0
+    )
+    last_active_date: Mapped[date | None] = mapped_column(Date, nullable=True)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
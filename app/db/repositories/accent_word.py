@@ -0,0 +1,91 @@
+import logging
+from datetime import datetime, timezone
+from typing import List, Optional, Set, override
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.configs.enums import LanguageLevel
+from app.core.entities.accent_word import AccentWord
+from app.core.repositories.accent_word import AccentWordRepository
+from app.db.models import AccentWord as AccentWordModel
+
+logger = logging.getLogger(__name__)
+
+
+class SQLAlchemyAccentWordRepository(AccentWordRepository):
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    def _to_entity(self, db_word: AccentWordModel) -> AccentWord:
+        return AccentWord.model_validate(db_word)
+
+    @override
+    async def add_many(self, words: List[AccentWord]) -> int:
+        if not words:
+            return 0
+        values = [
+            {
+                **word.model_dump(exclude={'word_id', 'used_at'}),
+                'language_level': word.language_level.value,
+            }
+            for word in words
+        ]
+        stmt = (
+            insert(AccentWordModel)
+            .values(values)
+            .on_conflict_do_nothing(constraint='uq_accent_words_word')
+            .returning(AccentWordModel.word_id)
+        )
+        result = await self.session.execute(stmt)
+        return len(result.scalars().all())
+
+    @override
+    async def get_existing_words(
+        self, language: str, words: List[str]
+    ) -> Set[str]:
+        if not words:
+            return set()
+        stmt = select(AccentWordModel.word).where(
+            AccentWordModel.language == language,
+            AccentWordModel.word.in_(words),
+        )
+        result = await self.session.execute(stmt)
+        return set(result.scalars().all())
+
+    @override
+    async def count_available(self, language: str) -> int:
+        stmt = select(func.count(AccentWordModel.word_id)).where(
+            AccentWordModel.language == language,
+            AccentWordModel.is_suitable.is_(True),
+            AccentWordModel.used_at.is_(None),
+        )
+        return (await self.session.scalar(stmt)) or 0
+
+    @override
+    async def claim_available_word(
+        self, language: str, language_levels: List[LanguageLevel]
+    ) -> Optional[AccentWord]:
+        stmt = (
+            select(AccentWordModel)
+            .where(
+                AccentWordModel.language == language,
+                AccentWordModel.language_level.in_(
+                    [level.value for level in language_levels]
+                ),
+                AccentWordModel.is_suitable.is_(True),
+                AccentWordModel.used_at.is_(None),
+            )
+            .order_by(AccentWordModel.word_id)
+            .limit(1)
+            .with_for_update(skip_locked=True)
+        )
+        db_word = await self.session.scalar(stmt)
+        if not db_word:
+            return None
+
+        db_word.used_at = datetime.now(timezone.utc)
+        await self.session.flush()
+        logger.info(f'Claimed accent word {db_word.word_id} ({db_word.word}).')
+        return self._to_entity(db_word)
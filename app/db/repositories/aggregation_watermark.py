@@ -0,0 +1,47 @@
+import logging
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models import AggregationWatermark
+
+logger = logging.getLogger(__name__)
+
+
+class SQLAlchemyAggregationWatermarkRepository:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def lock(self, name: str) -> Optional[datetime]:
+        """
+        Returns the watermark and locks it until the end of the
+        transaction, so concurrent runs cannot consume the same rows.
+        None means nothing was aggregated yet.
+
+        An advisory lock is taken on the name rather than a row lock, as
+        there is no row to lock before the first save.
+        """
+        await self.session.execute(
+            select(func.pg_advisory_xact_lock(func.hashtext(name)))
+        )
+        return await self.get(name)
+
+    async def get(self, name: str) -> Optional[datetime]:
+        """Returns the watermark without locking it."""
+        stmt = select(AggregationWatermark.watermark).where(
+            AggregationWatermark.name == name
+        )
+        return (await self.session.execute(stmt)).scalar_one_or_none()
+
+    async def save(self, name: str, watermark: datetime) -> None:
+        stmt = insert(AggregationWatermark).values(
+            name=name, watermark=watermark
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[AggregationWatermark.name],
+            set_={'watermark': stmt.excluded.watermark},
+        )
+        await self.session.execute(stmt)
@@ -0,0 +1,50 @@
+import logging
+from typing import Optional, override
+
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.entities.audio_artifact import AudioArtifact
+from app.core.repositories.audio_artifact import AudioArtifactRepository
+from app.db.models import AudioArtifact as AudioArtifactModel
+
+logger = logging.getLogger(__name__)
+
+
+class SQLAlchemyAudioArtifactRepository(AudioArtifactRepository):
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    @override
+    async def get_by_digest(self, digest: str) -> Optional[AudioArtifact]:
+        db_artifact = await self.session.get(AudioArtifactModel, digest)
+        if not db_artifact:
+            return None
+        return AudioArtifact.model_validate(db_artifact)
+
+    @override
+    async def save(self, artifact: AudioArtifact) -> AudioArtifact:
+        insert_stmt = insert(AudioArtifactModel).values(
+            **artifact.model_dump()
+        )
+        stmt = insert_stmt.on_conflict_do_update(
+            index_elements=[AudioArtifactModel.digest],
+            set_={
+                'r2_key': func.coalesce(
+                    insert_stmt.excluded.r2_key, AudioArtifactModel.r2_key
+                ),
+                'audio_url': func.coalesce(
+                    insert_stmt.excluded.audio_url,
+                    AudioArtifactModel.audio_url,
+                ),
+                'telegram_file_ids': AudioArtifactModel.telegram_file_ids.op(
+                    '||'
+                )(insert_stmt.excluded.telegram_file_ids),
+                'updated_at': func.now(),
+            },
+        ).returning(AudioArtifactModel)
+        result = await self.session.execute(
+            stmt, execution_options={'populate_existing': True}
+        )
+        return AudioArtifact.model_validate(result.scalar_one())
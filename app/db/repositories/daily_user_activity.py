@@ -0,0 +1,212 @@
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Optional, cast
+
+from sqlalchemy import CursorResult, func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.db.models import ExerciseAttempt
+from app.db.repositories.aggregation_watermark import (
+    SQLAlchemyAggregationWatermarkRepository,
+)
+
+logger = logging.getLogger(__name__)
+
+DAILY_USER_ACTIVITY_WATERMARK = 'daily_user_activity'
+
+
+def _tag_array(tags: str) -> str:
+    """SQL turning a JSONB tag value (array or single string) into an
+    array."""
+    return (
+        f"CASE WHEN jsonb_typeof({tags}) = 'array' THEN {tags} "
+        f"WHEN jsonb_typeof({tags}) = 'string' "
+        f'THEN jsonb_build_array({tags}) '
+        f"ELSE '[]'::jsonb END"
+    )
+
+
+# LATERAL subquery expanding the attempt aliased "a" into one
+# (kind, tag) row per exercise tag, plus error tags of incorrect attempts.
+ATTEMPT_TAGS_LATERAL = f"""
+    CROSS JOIN LATERAL (
+        SELECT 'grammar' AS kind, jsonb_array_elements_text(
+            {_tag_array("a.grammar_tags->'grammar'")}
+        ) AS tag
+        UNION ALL
+        SELECT 'vocab', jsonb_array_elements_text(
+            {_tag_array("a.grammar_tags->'vocabulary'")}
+        )
+        UNION ALL
+        SELECT 'error_grammar', jsonb_array_elements_text(
+            {_tag_array("a.error_tags->'grammar'")}
+        )
+        WHERE a.is_correct = false
+        UNION ALL
+        SELECT 'error_vocab', jsonb_array_elements_text(
+            {_tag_array("a.error_tags->'vocabulary'")}
+        )
+        WHERE a.is_correct = false
+    ) AS t
+"""
+
+# Folds (kind, tag, count) rows into one histogram column per kind.
+TAG_HISTOGRAM_COLUMNS = """
+    jsonb_object_agg(tag, count)
+        FILTER (WHERE kind = 'grammar') AS grammar_tags,
+    jsonb_object_agg(tag, count)
+        FILTER (WHERE kind = 'vocab') AS vocab_tags,
+    jsonb_object_agg(tag, count)
+        FILTER (WHERE kind = 'error_grammar') AS error_grammar_tags,
+    jsonb_object_agg(tag, count)
+        FILTER (WHERE kind = 'error_vocab') AS error_vocab_tags
+"""
+
+HISTOGRAM_COLUMNS = (
+    'grammar_tags',
+    'vocab_tags',
+    'error_grammar_tags',
+    'error_vocab_tags',
+)
+
+
+def _merge_histograms(current: str, added: str) -> str:
+    """SQL adding up the counts of two JSONB {tag: count} histograms."""
+    return f"""(
+        SELECT jsonb_object_agg(key, total)
+        FROM (
+            SELECT key, SUM(value::integer) AS total
+            FROM (
+                SELECT * FROM jsonb_each_text({current})
+                UNION ALL
+                SELECT * FROM jsonb_each_text({added})
+            ) AS entries
+            GROUP BY key
+        ) AS totals
+    )"""
+
+
+def utc_midnight(moment: datetime) -> datetime:
+    return moment.astimezone(timezone.utc).replace(
+        hour=0, minute=0, second=0, microsecond=0
+    )
+
+
+class SQLAlchemyDailyUserActivityRepository:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get_complete_until(self) -> Optional[datetime]:
+        """
+        Returns the UTC midnight before which every day in
+        daily_user_activity is complete, or None if nothing was
+        aggregated yet.
+        """
+        watermark_repo = SQLAlchemyAggregationWatermarkRepository(self.session)
+        watermark = await watermark_repo.get(DAILY_USER_ACTIVITY_WATERMARK)
+        if watermark is None:
+            return None
+        return utc_midnight(watermark)
+
+    async def advance(
+        self, max_span: Optional[timedelta] = None
+    ) -> Optional[datetime]:
+        """
+        Adds the attempts created since the last run to the per-day rows.
+        Attempts are consumed only once they are aggregation_settle_seconds
+        old; max_span bounds how much history one call consumes. Returns
+        the new watermark, or None if there was nothing to consume.
+        """
+        watermark_repo = SQLAlchemyAggregationWatermarkRepository(self.session)
+        since = await watermark_repo.lock(DAILY_USER_ACTIVITY_WATERMARK)
+        until = datetime.now(timezone.utc) - timedelta(
+            seconds=settings.aggregation_settle_seconds
+        )
+        if since is None:
+            first_attempt_at = await self.session.scalar(
+                select(func.min(ExerciseAttempt.created_at))
+            )
+            if first_attempt_at is None:
+                return None
+            since = first_attempt_at - timedelta(microseconds=1)
+        if max_span is not None:
+            until = min(until, since + max_span)
+        if since >= until:
+            return None
+
+        histogram_updates = ',\n'.join(
+            f'{column} = '
+            + _merge_histograms(
+                f'daily_user_activity.{column}', f'EXCLUDED.{column}'
+            )
+            for column in HISTOGRAM_COLUMNS
+        )
+        result = await self.session.execute(
+            text(f"""
+            WITH period_attempts AS (
+                SELECT
+                    ea.user_id,
+                    e.exercise_language AS bot_id,
+                    (ea.created_at AT TIME ZONE 'UTC')::date
+                        AS activity_date,
+                    ea.is_correct,
+                    e.grammar_tags,
+                    ea.error_tags
+                FROM exercise_attempts ea
+                JOIN exercises e ON ea.exercise_id = e.exercise_id
+                WHERE ea.created_at > :since
+                  AND ea.created_at <= :until
+            ),
+            days AS (
+                SELECT
+                    user_id,
+                    bot_id,
+                    activity_date,
+                    COUNT(*) AS attempts,
+                    COUNT(*) FILTER (WHERE is_correct) AS correct_attempts
+                FROM period_attempts
+                GROUP BY user_id, bot_id, activity_date
+            ),
+            tag_counts AS (
+                SELECT
+                    a.user_id, a.bot_id, a.activity_date, t.kind, t.tag,
+                    COUNT(*) AS count
+                FROM period_attempts a
+                {ATTEMPT_TAGS_LATERAL}
+                GROUP BY a.user_id, a.bot_id, a.activity_date, t.kind, t.tag
+            ),
+            tag_histograms AS (
+                SELECT
+                    user_id, bot_id, activity_date,
+                    {TAG_HISTOGRAM_COLUMNS}
+                FROM tag_counts
+                GROUP BY user_id, bot_id, activity_date
+            )
+            INSERT INTO daily_user_activity (
+                user_id, bot_id, activity_date, attempts, correct_attempts,
+                grammar_tags, vocab_tags, error_grammar_tags,
+                error_vocab_tags, updated_at
+            )
+            SELECT
+                d.user_id, d.bot_id, d.activity_date, d.attempts,
+                d.correct_attempts, h.grammar_tags, h.vocab_tags,
+                h.error_grammar_tags, h.error_vocab_tags, now()
+            FROM days d
+            LEFT JOIN tag_histograms h
+                USING (user_id, bot_id, activity_date)
+            ON CONFLICT (user_id, bot_id, activity_date) DO UPDATE SET
+                attempts = daily_user_activity.attempts + EXCLUDED.attempts,
+                correct_attempts = daily_user_activity.correct_attempts
+                    + EXCLUDED.correct_attempts,
+                {histogram_updates},
+                updated_at = EXCLUDED.updated_at
+            """),
+            {'since': since, 'until': until},
+        )
+        await watermark_repo.save(DAILY_USER_ACTIVITY_WATERMARK, until)
+        logger.info(
+            f'Advanced daily user activity to {until.isoformat()}: '
+            f'{cast(CursorResult, result).rowcount} user/day rows changed.'
+        )
+        return until
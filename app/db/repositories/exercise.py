@@ -1,9 +1,21 @@
 import logging
-from typing import List, Optional, Union, override
-
-from sqlalchemy import and_, exists, func, literal, not_, select, text, update
+from datetime import datetime, timedelta, timezone
+from typing import Collection, List, Optional, Union, cast, override
+
+from sqlalchemy import (
+    CursorResult,
+    and_,
+    exists,
+    func,
+    literal,
+    not_,
+    select,
+    text,
+    update,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import settings
 from app.core.configs.enums import (
     ExerciseStatus,
     ExerciseType,
@@ -15,9 +27,15 @@ from app.core.repositories.exercise import ExerciseRepository
 from app.core.value_objects.exercise import ExerciseData
 from app.db.models import Exercise as ExerciseModel
 from app.db.models import ExerciseAttempt as ExerciseAttemptModel
+from app.db.models import ExerciseQualityStats
+from app.db.repositories.aggregation_watermark import (
+    SQLAlchemyAggregationWatermarkRepository,
+)
 
 logger = logging.getLogger(__name__)
 
+EXERCISE_QUALITY_STATS_WATERMARK = 'exercise_quality_stats'
+
 
 class SQLAlchemyExerciseRepository(ExerciseRepository):
     def __init__(self, session: AsyncSession):
@@ -307,69 +325,127 @@ class SQLAlchemyExerciseRepository(ExerciseRepository):
             return await self._to_entity(db_exercise)
         return None
 
+    async def advance_exercise_quality_stats(self) -> None:
+        """
+        Adds the attempts created since the last run to the weighted
+        totals in exercise_quality_stats, weighting each attempt with the
+        quality_weight of its user, and counts them per user and exercise
+        in user_exercise_attempt_counts. Changes of quality_weight are
+        applied to the consumed attempts when ratings are recalculated.
+        """
+        watermark_repo = SQLAlchemyAggregationWatermarkRepository(self.session)
+        since = await watermark_repo.lock(EXERCISE_QUALITY_STATS_WATERMARK)
+        until = datetime.now(timezone.utc) - timedelta(
+            seconds=settings.aggregation_settle_seconds
+        )
+        if since is not None and since >= until:
+            return
+
+        result = await self.session.execute(
+            text("""
+            WITH weighted_attempts AS (
+                SELECT
+                    ea.user_id,
+                    ex.exercise_language,
+                    ea.exercise_id,
+                    ea.is_correct,
+                    COALESCE(p.quality_weight, :default_rating) AS weight
+                FROM exercise_attempts ea
+                JOIN exercises ex ON ea.exercise_id = ex.exercise_id
+                LEFT JOIN user_bot_profiles p
+                    ON p.user_id = ea.user_id
+                    AND p.bot_id = ex.exercise_language
+                WHERE (CAST(:since AS timestamptz) IS NULL
+                       OR ea.created_at > :since)
+                  AND ea.created_at <= :until
+            ),
+            counted AS (
+                INSERT INTO user_exercise_attempt_counts (
+                    user_id, exercise_language, exercise_id, attempts,
+                    incorrect_attempts
+                )
+                SELECT
+                    user_id,
+                    exercise_language,
+                    exercise_id,
+                    COUNT(*),
+                    COUNT(*) FILTER (WHERE is_correct IS FALSE)
+                FROM weighted_attempts
+                GROUP BY user_id, exercise_language, exercise_id
+                ON CONFLICT (user_id, exercise_language, exercise_id)
+                DO UPDATE SET
+                    attempts = user_exercise_attempt_counts.attempts
+                        + EXCLUDED.attempts,
+                    incorrect_attempts =
+                        user_exercise_attempt_counts.incorrect_attempts
+                        + EXCLUDED.incorrect_attempts
+            )
+            INSERT INTO exercise_quality_stats (
+                exercise_id, weighted_attempts, weighted_incorrect,
+                updated_at
+            )
+            SELECT
+                exercise_id,
+                SUM(weight),
+                COALESCE(SUM(weight) FILTER (WHERE is_correct IS FALSE), 0),
+                now()
+            FROM weighted_attempts
+            GROUP BY exercise_id
+            ON CONFLICT (exercise_id) DO UPDATE SET
+                weighted_attempts = exercise_quality_stats.weighted_attempts
+                    + EXCLUDED.weighted_attempts,
+                weighted_incorrect =
+                    exercise_quality_stats.weighted_incorrect
+                    + EXCLUDED.weighted_incorrect,
+                updated_at = EXCLUDED.updated_at
+            """),
+            {
+                'since': since,
+                'until': until,
+                'default_rating': settings.quality_review_default_user_rating,
+            },
+        )
+        await watermark_repo.save(EXERCISE_QUALITY_STATS_WATERMARK, until)
+        logger.info(
+            f'Advanced exercise quality stats to {until.isoformat()}: '
+            f'{cast(CursorResult, result).rowcount} exercises changed.'
+        )
+
     async def get_exercise_ids_for_quality_review(
         self,
         min_weighted_attempts_sum_for_review: float,
         weighted_error_threshold: float,
-        default_user_rating: float = 0.1,
         min_hours_since_last_update: Optional[int] = None,
     ) -> List[int]:
         """
-        Fetches exercise IDs that are candidates for review based on
-        weighted error rates, using user ratings from DBUserBotProfile.
+        Fetches exercise IDs that are candidates for review based on the
+        rating-weighted error ratio in exercise_quality_stats.
         Optionally filters out exercises updated recently.
         """
-        updated_at_filter_condition = ''
+        stmt = (
+            select(ExerciseQualityStats.exercise_id)
+            .join(
+                ExerciseModel,
+                ExerciseModel.exercise_id == ExerciseQualityStats.exercise_id,
+            )
+            .where(
+                ExerciseQualityStats.error_ratio > weighted_error_threshold,
+                ExerciseQualityStats.weighted_attempts
+                >= min_weighted_attempts_sum_for_review,
+                ExerciseModel.status == ExerciseStatus.PUBLISHED,
+            )
+        )
         if (
             min_hours_since_last_update is not None
             and min_hours_since_last_update > 0
         ):
-            updated_at_filter_condition = (
-                f'AND e.updated_at <= NOW() '
-                f"- INTERVAL '{min_hours_since_last_update} hours'"
+            stmt = stmt.where(
+                ExerciseModel.updated_at
+                <= func.now() - timedelta(hours=min_hours_since_last_update)
             )
 
-        sql_query = f"""
-        WITH exercise_weighted_errors AS (
-            SELECT
-                e.exercise_id,
-                SUM(COALESCE(ubp.rating, {default_user_rating}))
-                    AS total_rating_sum_for_exercise,
-                SUM(
-                    CASE
-                        WHEN ea.is_correct IS FALSE THEN COALESCE(
-                            ubp.rating, {default_user_rating})
-                        ELSE 0
-                    END
-                ) AS incorrect_rating_sum_for_exercise,
-                COUNT(ea.attempt_id) as total_raw_attempts
-            FROM
-                exercises e
-            JOIN
-                exercise_attempts ea ON e.exercise_id = ea.exercise_id
-            LEFT JOIN user_bot_profiles ubp
-                ON ea.user_id = ubp.user_id
-                    AND e.exercise_language = ubp.bot_id::TEXT
-            WHERE
-                e.status = '{ExerciseStatus.PUBLISHED.value}'
-                {updated_at_filter_condition}
-            GROUP BY
-                e.exercise_id
-        )
-        SELECT
-            exercise_id
-        FROM
-            exercise_weighted_errors
-        WHERE
-            total_rating_sum_for_exercise >=
-                {min_weighted_attempts_sum_for_review}
-            AND (incorrect_rating_sum_for_exercise
-                / NULLIF(total_rating_sum_for_exercise, 0))
-                > {weighted_error_threshold};
-        """
-
-        result = await self.session.execute(text(sql_query))
-        exercise_ids = [row[0] for row in result.fetchall()]
+        result = await self.session.execute(stmt)
+        exercise_ids = list(result.scalars().all())
         logger.info(
             f'Found {len(exercise_ids)} exercises '
             f'for quality review based on DB ratings'
@@ -394,6 +470,30 @@ class SQLAlchemyExerciseRepository(ExerciseRepository):
         result = await self.session.execute(stmt)
         return result.rowcount
 
+    async def claim_exercise_by_status(
+        self,
+        status: ExerciseStatus,
+        exclude_ids: Collection[int] = (),
+    ) -> Optional[Exercise]:
+        """
+        Locks the oldest exercise with the given status until the end of
+        the transaction, skipping rows locked by other transactions so
+        that concurrent workers never claim the same exercise.
+        """
+        stmt = (
+            select(ExerciseModel)
+            .where(ExerciseModel.status == status)
+            .order_by(ExerciseModel.exercise_id)
+            .limit(1)
+            .with_for_update(skip_locked=True)
+        )
+        if exclude_ids:
+            stmt = stmt.where(ExerciseModel.exercise_id.not_in(exclude_ids))
+        db_exercise = await self.session.scalar(stmt)
+        if db_exercise is None:
+            return None
+        return await self._to_entity(db_exercise)
+
     async def get_exercises_by_status(
         self, status: ExerciseStatus, limit: Optional[int] = None
     ) -> List[Exercise]:
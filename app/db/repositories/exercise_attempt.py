@@ -1,5 +1,5 @@
-from datetime import datetime
-from typing import Dict, List, Optional, override
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Sequence, Tuple, override
 
 from sqlalchemy import bindparam, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -16,6 +16,24 @@ from app.core.repositories.exercise_attempt import (
 )
 from app.core.value_objects.answer import create_answer_model_validate
 from app.db.models import ExerciseAttempt
+from app.db.repositories.daily_user_activity import (
+    ATTEMPT_TAGS_LATERAL,
+    TAG_HISTOGRAM_COLUMNS,
+    SQLAlchemyDailyUserActivityRepository,
+    utc_midnight,
+)
+
+
+def _period_summary(row: Sequence) -> Dict:
+    return {
+        'active_days': row[0] or 0,
+        'total_attempts': row[1] or 0,
+        'correct_attempts': row[2] or 0,
+        'grammar_tags': row[3] or {},
+        'vocab_tags': row[4] or {},
+        'error_grammar_tags': row[5] or {},
+        'error_vocab_tags': row[6] or {},
+    }
 
 
 class SQLAlchemyExerciseAttemptRepository(ExerciseAttemptRepository):
@@ -137,136 +155,172 @@ class SQLAlchemyExerciseAttemptRepository(ExerciseAttemptRepository):
         start_date: datetime,
         end_date: datetime,
     ) -> Dict:
+        summaries = await self.get_period_summaries_for_users_and_bots(
+            [(user_id, bot_id)], start_date, end_date
+        )
+        return summaries[(user_id, bot_id)]
+
+    @override
+    async def get_period_summaries_for_users_and_bots(
+        self,
+        user_bot_ids: Sequence[Tuple[int, str]],
+        start_date: datetime,
+        end_date: datetime,
+    ) -> Dict[Tuple[int, str], Dict]:
+        """
+        Whole UTC days of the period that daily_user_activity already
+        covers are read from it; the partial days at the edges and the
+        days it has not reached yet are aggregated from the attempts.
+        """
+        if not user_bot_ids:
+            return {}
+        user_ids = [user_id for user_id, _ in user_bot_ids]
+        bot_ids = [bot_id for _, bot_id in user_bot_ids]
+
+        rollup_start = utc_midnight(start_date)
+        if rollup_start < start_date:
+            rollup_start += timedelta(days=1)
+        rollup_end = utc_midnight(end_date)
+        complete_until = await SQLAlchemyDailyUserActivityRepository(
+            self.session
+        ).get_complete_until()
+        if complete_until is None or complete_until < rollup_end:
+            rollup_end = complete_until or rollup_start
+        if rollup_end <= rollup_start:
+            rollup_start = rollup_end = end_date
+
         query = text(
-            """
-            WITH weekly_attempts AS (
+            f"""
+            WITH pairs AS (
+                SELECT *
+                FROM unnest(
+                    CAST(:user_ids AS integer[]), CAST(:bot_ids AS text[])
+                ) AS p(user_id, bot_id)
+            ),
+            rollup AS (
+                SELECT r.*
+                FROM
+                    pairs p
+                JOIN
+                    daily_user_activity r
+                    ON r.user_id = p.user_id AND r.bot_id = p.bot_id
+                WHERE
+                    r.activity_date >= :rollup_start_date
+                    AND r.activity_date < :rollup_end_date
+            ),
+            period_attempts AS (
                 SELECT
-                    ea.created_at,
+                    ea.user_id,
+                    p.bot_id,
+                    (ea.created_at AT TIME ZONE 'UTC')::date
+                        AS activity_date,
                     ea.is_correct,
                     e.grammar_tags,
                     ea.error_tags
                 FROM
-                    exercise_attempts ea
+                    pairs p
+                JOIN
+                    exercise_attempts ea ON ea.user_id = p.user_id
                 JOIN
                     exercises e ON ea.exercise_id = e.exercise_id
                 WHERE
-                    ea.user_id = :user_id
-                    AND e.exercise_language = :bot_id
-                    AND ea.created_at >= :start_date
-                    AND ea.created_at < :end_date
+                    e.exercise_language = p.bot_id
+                    AND (
+                        (ea.created_at >= :start_date
+                         AND ea.created_at < :rollup_start)
+                        OR (ea.created_at >= :rollup_end
+                            AND ea.created_at < :end_date)
+                    )
+            ),
+            days AS (
+                SELECT
+                    user_id, bot_id, activity_date, attempts,
+                    correct_attempts
+                FROM rollup
+                UNION ALL
+                SELECT
+                    user_id,
+                    bot_id,
+                    activity_date,
+                    COUNT(*),
+                    COUNT(*) FILTER (WHERE is_correct)
+                FROM period_attempts
+                GROUP BY user_id, bot_id, activity_date
+            ),
+            totals AS (
+                SELECT
+                    user_id,
+                    bot_id,
+                    COUNT(DISTINCT activity_date) AS active_days,
+                    SUM(attempts)::integer AS total_attempts,
+                    SUM(correct_attempts)::integer AS correct_attempts
+                FROM days
+                GROUP BY user_id, bot_id
+            ),
+            tag_counts AS (
+                SELECT user_id, bot_id, kind, tag, SUM(count) AS count
+                FROM (
+                    SELECT
+                        r.user_id, r.bot_id, h.kind, e.key AS tag,
+                        e.value::integer AS count
+                    FROM rollup r
+                    CROSS JOIN LATERAL (
+                        VALUES
+                            ('grammar', r.grammar_tags),
+                            ('vocab', r.vocab_tags),
+                            ('error_grammar', r.error_grammar_tags),
+                            ('error_vocab', r.error_vocab_tags)
+                    ) AS h(kind, tags)
+                    CROSS JOIN LATERAL jsonb_each_text(h.tags) AS e
+                    UNION ALL
+                    SELECT a.user_id, a.bot_id, t.kind, t.tag, 1
+                    FROM period_attempts a
+                    {ATTEMPT_TAGS_LATERAL}
+                ) AS all_tags
+                GROUP BY user_id, bot_id, kind, tag
+            ),
+            tag_histograms AS (
+                SELECT
+                    user_id,
+                    bot_id,
+                    {TAG_HISTOGRAM_COLUMNS}
+                FROM tag_counts
+                GROUP BY user_id, bot_id
             )
             SELECT
-                (SELECT COUNT(DISTINCT DATE(created_at))
-                    FROM weekly_attempts) as active_days,
-                COUNT(*) AS total_attempts,
-                SUM(CASE WHEN is_correct THEN 1 ELSE 0 END)
-                    AS correct_attempts,
-                (SELECT jsonb_object_agg(tag, count) FROM (
-                    SELECT
-                        jsonb_array_elements_text(
-                            CASE
-                            WHEN
-                            jsonb_typeof(grammar_tags->'grammar') = 'array'
-                            THEN grammar_tags->'grammar'
-                            WHEN
-                            jsonb_typeof(grammar_tags->'grammar') = 'string'
-                            THEN jsonb_build_array(grammar_tags->'grammar')
-                            ELSE '[]'::jsonb
-                            END
-                        ) AS tag,
-                        COUNT(*) as count
-                    FROM weekly_attempts
-                    WHERE grammar_tags->'grammar' IS NOT NULL
-                    GROUP BY tag ORDER BY count DESC
-                ) AS grammar_summary) AS grammar_tags,
-                (SELECT jsonb_object_agg(tag, count) FROM (
-                    SELECT
-                        jsonb_array_elements_text(
-                            CASE
-                            WHEN
-                            jsonb_typeof(grammar_tags->'vocabulary') = 'array'
-                            THEN grammar_tags->'vocabulary'
-                            WHEN
-                            jsonb_typeof(grammar_tags->'vocabulary') = 'string'
-                            THEN
-                            jsonb_build_array(grammar_tags->'vocabulary')
-                            ELSE '[]'::jsonb
-                            END
-                        ) AS tag,
-                        COUNT(*) as count
-                    FROM weekly_attempts
-                    WHERE grammar_tags->'vocabulary' IS NOT NULL
-                    GROUP BY tag ORDER BY count DESC
-                ) AS vocab_summary) AS vocab_tags,
-                (SELECT jsonb_object_agg(tag, count) FROM (
-                    SELECT
-                        jsonb_array_elements_text(
-                            CASE
-                            WHEN jsonb_typeof(error_tags->'grammar') = 'array'
-                            THEN error_tags->'grammar'
-                            WHEN jsonb_typeof(error_tags->'grammar') = 'string'
-                            THEN jsonb_build_array(error_tags->'grammar')
-                            ELSE '[]'::jsonb
-                            END
-                        ) AS tag,
-                        COUNT(*) as count
-                    FROM weekly_attempts
-                    WHERE is_correct = false
-                        AND error_tags->'grammar' IS NOT NULL
-                    GROUP BY tag ORDER BY count DESC
-                ) AS error_grammar_summary) AS error_grammar_tags,
-                (SELECT jsonb_object_agg(tag, count) FROM (
-                    SELECT
-                        jsonb_array_elements_text(
-                            CASE
-                            WHEN
-                            jsonb_typeof(error_tags->'vocabulary') = 'array'
-                            THEN error_tags->'vocabulary'
-                            WHEN
-                            jsonb_typeof(error_tags->'vocabulary') = 'string'
-                            THEN jsonb_build_array(error_tags->'vocabulary')
-                            ELSE '[]'::jsonb
-                            END
-                        ) AS tag,
-                        COUNT(*) as count
-                    FROM weekly_attempts
-                    WHERE is_correct = false
-                        AND error_tags->'vocabulary' IS NOT NULL
-                    GROUP BY tag ORDER BY count DESC
-                ) AS error_vocab_summary) AS error_vocab_tags
+                t.user_id,
+                t.bot_id,
+                t.active_days,
+                t.total_attempts,
+                t.correct_attempts,
+                h.grammar_tags,
+                h.vocab_tags,
+                h.error_grammar_tags,
+                h.error_vocab_tags
             FROM
-                weekly_attempts;
+                totals t
+            LEFT JOIN
+                tag_histograms h USING (user_id, bot_id)
             """,
         ).bindparams(
-            bindparam('user_id', value=user_id),
-            bindparam('bot_id', value=bot_id),
+            bindparam('user_ids', value=user_ids),
+            bindparam('bot_ids', value=bot_ids),
             bindparam('start_date', value=start_date),
             bindparam('end_date', value=end_date),
+            bindparam('rollup_start', value=rollup_start),
+            bindparam('rollup_end', value=rollup_end),
+            bindparam('rollup_start_date', value=rollup_start.date()),
+            bindparam('rollup_end_date', value=rollup_end.date()),
         )
 
         result = await self.session.execute(query)
-        summary = result.fetchone()
-
-        if not summary or summary[1] is None:
-            return {
-                'active_days': 0,
-                'total_attempts': 0,
-                'correct_attempts': 0,
-                'grammar_tags': {},
-                'vocab_tags': {},
-                'error_grammar_tags': {},
-                'error_vocab_tags': {},
-            }
-
-        return {
-            'active_days': summary[0] or 0,
-            'total_attempts': summary[1] or 0,
-            'correct_attempts': summary[2] or 0,
-            'grammar_tags': summary[3] or {},
-            'vocab_tags': summary[4] or {},
-            'error_grammar_tags': summary[5] or {},
-            'error_vocab_tags': summary[6] or {},
+        summaries = {
+            (row[0], row[1]): _period_summary(row[2:]) for row in result
         }
+        # Pairs without attempts in the period get an empty summary.
+        for user_bot_id in user_bot_ids:
+            summaries.setdefault(user_bot_id, _period_summary((None,) * 7))
+        return summaries
 
     @override
     async def get_incorrect_attempts_with_details(
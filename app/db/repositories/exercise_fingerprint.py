@@ -0,0 +1,89 @@
+import logging
+from typing import Any, Dict, List, Optional, Tuple, override
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.configs.enums import ExerciseStatus
+from app.core.entities.exercise_fingerprint import ExerciseFingerprint
+from app.core.repositories.exercise_fingerprint import (
+    ExerciseFingerprintRepository,
+)
+from app.db.models import Exercise as ExerciseModel
+from app.db.models import ExerciseFingerprint as ExerciseFingerprintModel
+
+logger = logging.getLogger(__name__)
+
+
+class SQLAlchemyExerciseFingerprintRepository(ExerciseFingerprintRepository):
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    @override
+    async def add_many(self, fingerprints: List[ExerciseFingerprint]) -> int:
+        if not fingerprints:
+            return 0
+        stmt = (
+            insert(ExerciseFingerprintModel)
+            .values([fp.model_dump() for fp in fingerprints])
+            .on_conflict_do_nothing(index_elements=['exercise_id'])
+            .returning(ExerciseFingerprintModel.exercise_id)
+        )
+        result = await self.session.execute(stmt)
+        return len(result.scalars().all())
+
+    @override
+    async def get_published_without_fingerprint(
+        self, limit: int, language: Optional[str] = None
+    ) -> List[Tuple[int, str, Dict[str, Any]]]:
+        stmt = (
+            select(
+                ExerciseModel.exercise_id,
+                ExerciseModel.exercise_language,
+                ExerciseModel.data,
+            )
+            .outerjoin(
+                ExerciseFingerprintModel,
+                ExerciseFingerprintModel.exercise_id
+                == ExerciseModel.exercise_id,
+            )
+            .where(
+                ExerciseModel.status == ExerciseStatus.PUBLISHED,
+                ExerciseFingerprintModel.exercise_id.is_(None),
+            )
+            .order_by(ExerciseModel.exercise_id)
+            .limit(limit)
+        )
+        if language is not None:
+            stmt = stmt.where(ExerciseModel.exercise_language == language)
+        result = await self.session.execute(stmt)
+        return [
+            (row.exercise_id, row.exercise_language, row.data)
+            for row in result.all()
+        ]
+
+    @override
+    async def find_candidates(
+        self, language: str, band_keys: List[str]
+    ) -> List[ExerciseFingerprint]:
+        if not band_keys:
+            return []
+        stmt = (
+            select(ExerciseFingerprintModel)
+            .join(
+                ExerciseModel,
+                ExerciseModel.exercise_id
+                == ExerciseFingerprintModel.exercise_id,
+            )
+            .where(
+                ExerciseFingerprintModel.exercise_language == language,
+                ExerciseFingerprintModel.band_keys.overlap(band_keys),
+                ExerciseModel.status == ExerciseStatus.PUBLISHED,
+            )
+        )
+        result = await self.session.execute(stmt)
+        return [
+            ExerciseFingerprint.model_validate(db_fingerprint)
+            for db_fingerprint in result.scalars().all()
+        ]
@@ -1,11 +1,39 @@
 import logging
-from datetime import datetime, time, timedelta, timezone
-from typing import Dict, List, Optional, Tuple, override
+import typing
+from datetime import datetime, timedelta, timezone
+from typing import (
+    AsyncIterator,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    override,
+)
 
-from sqlalchemy import Time, cast, or_, select, text, update
+from sqlalchemy import (
+    CursorResult,
+    DateTime,
+    Integer,
+    Row,
+    Select,
+    String,
+    cast,
+    column,
+    func,
+    literal,
+    or_,
+    select,
+    text,
+    tuple_,
+    update,
+    values,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
+from app.config import settings
 from app.core.entities.user import User
 from app.core.entities.user_bot_profile import (
     UserBotProfile,
@@ -14,15 +42,43 @@ from app.core.entities.user_bot_profile import (
 from app.core.repositories.user_bot_profile_repository import (
     UserBotProfileRepository,
 )
+from app.core.services.reminder_schedule import (
+    compute_next_long_break_reminder,
+)
 from app.db.models import (
     DBUserBotProfile,
 )
 from app.db.models import (
     ExerciseAttempt as ExerciseAttemptModel,
 )
+from app.db.models import (
+    User as UserModel,
+)
+from app.db.repositories.aggregation_watermark import (
+    SQLAlchemyAggregationWatermarkRepository,
+)
+from app.db.repositories.exercise import EXERCISE_QUALITY_STATS_WATERMARK
 
 logger = logging.getLogger(__name__)
 
+# Keeps a bulk UPDATE ... FROM (VALUES ...) under the asyncpg limit of
+# 32767 bind parameters.
+BULK_UPDATE_CHUNK_SIZE = 5000
+
+USER_LANGUAGE_STATS_WATERMARK = 'user_language_stats'
+
+
+def _refresh_next_reminder(db_profile: DBUserBotProfile) -> None:
+    """Recomputes the precomputed long break reminder schedule."""
+    (
+        db_profile.next_reminder_due_at,
+        db_profile.next_reminder_type,
+    ) = compute_next_long_break_reminder(
+        db_profile.last_exercise_at,
+        db_profile.last_long_break_reminder_type_sent,
+        db_profile.last_long_break_reminder_sent_at,
+    )
+
 
 class SQLAlchemyUserBotProfileRepository(UserBotProfileRepository):
     def __init__(self, session: AsyncSession):
@@ -37,6 +93,7 @@ class SQLAlchemyUserBotProfileRepository(UserBotProfileRepository):
             )
 
         new_db_profile = DBUserBotProfile(**new_db_profile_data)
+        _refresh_next_reminder(new_db_profile)
 
         self.session.add(new_db_profile)
         try:
@@ -103,6 +160,7 @@ class SQLAlchemyUserBotProfileRepository(UserBotProfileRepository):
                     f'on DBUserBotProfile for '
                     f'user {profile.user_id}, bot {profile.bot_id}'
                 )
+        _refresh_next_reminder(existing_db_profile)
 
         try:
             await self.session.flush()
@@ -113,70 +171,231 @@ class SQLAlchemyUserBotProfileRepository(UserBotProfileRepository):
 
         return UserBotProfile.model_validate(existing_db_profile)
 
-    async def get_by_recent_exercise_with_user_data(
+    @staticmethod
+    def keyset_page(
+        stmt: Select,
+        chunk_size: int,
+        after: Optional[Tuple[int, str]] = None,
+    ) -> Select:
+        """One page of stmt as _iter_keyset_chunks runs it."""
+        page = stmt.order_by(
+            DBUserBotProfile.user_id, DBUserBotProfile.bot_id
+        ).limit(chunk_size)
+        if after is not None:
+            page = page.where(
+                tuple_(DBUserBotProfile.user_id, DBUserBotProfile.bot_id)
+                > tuple_(*(literal(value) for value in after))
+            )
+        return page
+
+    async def _iter_keyset_chunks(
         self,
-        period_seconds: int,
-    ) -> List[DBUserBotProfile]:
-        now = datetime.now(timezone.utc)
+        stmt: Select,
+        chunk_size: int,
+        key: Callable[[Row], Tuple[int, str]],
+        after: Optional[Tuple[int, str]] = None,
+    ) -> AsyncIterator[Sequence[Row]]:
+        """
+        Runs stmt page by page, ordered by the profile primary key. Each
+        page starts after the last (user_id, bot_id) of the previous one
+        (or after `after` for the first page), so every query reads at
+        most chunk_size rows through the index and no cursor is kept open
+        between chunks.
+        """
+        last_key = after
+        while True:
+            page = self.keyset_page(stmt, chunk_size, last_key)
+            result = await self.session.execute(page)
+            rows = result.unique().all()
+            if not rows:
+                return
+            yield rows
+            if len(rows) < chunk_size:
+                return
+            last_key = key(rows[-1])
+
+    async def count_active_sessions_by_labels(
+        self, active_since: datetime
+    ) -> Sequence[Row]:
+        """
+        Number of running sessions per (cohort, plan, bot_id,
+        user_language, language_level). A session is running if it is not
+        frozen and its last exercise is after active_since.
+        """
+        labels = (
+            UserModel.cohort,
+            UserModel.plan,
+            DBUserBotProfile.bot_id,
+            DBUserBotProfile.user_language,
+            DBUserBotProfile.language_level,
+        )
         stmt = (
-            select(DBUserBotProfile)
+            select(*labels, func.count().label('sessions'))
+            .join(UserModel, UserModel.user_id == DBUserBotProfile.user_id)
             .where(
-                DBUserBotProfile.last_exercise_at.isnot(None),
-                DBUserBotProfile.last_exercise_at
-                >= now - timedelta(seconds=period_seconds),
+                DBUserBotProfile.session_started_at.isnot(None),
+                DBUserBotProfile.session_frozen_until.is_(None),
+                DBUserBotProfile.last_exercise_at > active_since,
             )
-            .options(joinedload(DBUserBotProfile.user))
+            .group_by(*labels)
         )
         result = await self.session.execute(stmt)
-        db_user_bot_profiles = result.scalars().unique().all()
-        return list(db_user_bot_profiles)
+        return result.all()
 
-    async def get_unfrozen_for_reminder(
+    async def iter_frozen_for_session_reminder(
         self,
-        period_seconds: int,
-    ) -> List[DBUserBotProfile]:
-        now = datetime.now(timezone.utc)
-        window_start_time = now - timedelta(seconds=period_seconds)
+        unlocks_after: datetime,
+        chunk_size: int = settings.profile_scan_chunk_size,
+    ) -> AsyncIterator[List[DBUserBotProfile]]:
+        """Profiles whose session unlocks after unlocks_after."""
+        stmt = select(DBUserBotProfile).where(
+            DBUserBotProfile.session_frozen_until > unlocks_after,
+            DBUserBotProfile.status == UserStatusInBot.ACTIVE,
+        )
+        async for rows in self._iter_keyset_chunks(
+            stmt, chunk_size, key=lambda row: (row[0].user_id, row[0].bot_id)
+        ):
+            yield [row[0] for row in rows]
 
-        stmt = (
-            select(DBUserBotProfile)
-            .where(
-                DBUserBotProfile.session_frozen_until.isnot(None),
-                DBUserBotProfile.wants_session_reminders,
-                DBUserBotProfile.status == UserStatusInBot.ACTIVE,
-                DBUserBotProfile.session_frozen_until > window_start_time,
-                DBUserBotProfile.session_frozen_until <= now,
-            )
-            .options(joinedload(DBUserBotProfile.user))
+    async def get_with_user(
+        self,
+        user_id: int,
+        bot_id: str,
+    ) -> Optional[DBUserBotProfile]:
+        return await self.session.get(
+            DBUserBotProfile,
+            (user_id, bot_id),
+            options=[joinedload(DBUserBotProfile.user)],
         )
-        result = await self.session.execute(stmt)
-        db_user_bot_profiles = result.scalars().unique().all()
-        return list(db_user_bot_profiles)
 
-    async def get_with_long_break_for_reminder(
+    async def iter_due_for_long_break_reminder(
         self,
-        min_break_duration_seconds: int,
-        window_start_time: time,
-        window_end_time: time,
-    ) -> List[DBUserBotProfile]:
-        now = datetime.now(timezone.utc)
-        stmt = (
-            select(DBUserBotProfile)
+        now: datetime,
+        chunk_size: int = settings.profile_scan_chunk_size,
+    ) -> AsyncIterator[List[Tuple[User, UserBotProfile]]]:
+        """
+        Users and profiles due for a long break reminder, carrying only the
+        columns the scheduler needs. Entities are built without validation
+        since the rows come straight from the database.
+        """
+        stmt = self.due_for_long_break_reminder_stmt(now)
+        async for rows in self._iter_keyset_chunks(
+            stmt, chunk_size, key=lambda row: (row.user_id, row.bot_id)
+        ):
+            yield [
+                (
+                    User.model_construct(
+                        user_id=row.user_id, telegram_id=row.telegram_id
+                    ),
+                    UserBotProfile.model_construct(
+                        user_id=row.user_id,
+                        bot_id=row.bot_id,
+                        user_language=row.user_language,
+                        current_streak_days=row.current_streak_days,
+                        last_exercise_at=row.last_exercise_at,
+                        last_long_break_reminder_type_sent=(
+                            row.last_long_break_reminder_type_sent
+                        ),
+                        last_long_break_reminder_sent_at=(
+                            row.last_long_break_reminder_sent_at
+                        ),
+                    ),
+                )
+                for row in rows
+            ]
+
+    @staticmethod
+    def due_for_long_break_reminder_stmt(now: datetime) -> Select:
+        """
+        The query iter_due_for_long_break_reminder pages through; it is
+        served by the index on next_reminder_due_at.
+        """
+        return (
+            select(
+                DBUserBotProfile.user_id,
+                DBUserBotProfile.bot_id,
+                DBUserBotProfile.user_language,
+                DBUserBotProfile.current_streak_days,
+                DBUserBotProfile.last_exercise_at,
+                DBUserBotProfile.last_long_break_reminder_type_sent,
+                DBUserBotProfile.last_long_break_reminder_sent_at,
+                UserModel.telegram_id,
+            )
+            .join(UserModel, UserModel.user_id == DBUserBotProfile.user_id)
             .where(
+                DBUserBotProfile.next_reminder_due_at <= now,
                 DBUserBotProfile.status == UserStatusInBot.ACTIVE,
-                DBUserBotProfile.last_exercise_at.isnot(None),
-                DBUserBotProfile.last_exercise_at
-                <= now - timedelta(seconds=min_break_duration_seconds),
-                cast(DBUserBotProfile.last_exercise_at, Time)
-                >= window_start_time,
-                cast(DBUserBotProfile.last_exercise_at, Time)
-                <= window_end_time,
             )
-            .options(joinedload(DBUserBotProfile.user))
         )
-        result = await self.session.execute(stmt)
-        db_user_bot_profiles = result.scalars().unique().all()
-        return list(db_user_bot_profiles)
+
+    async def mark_long_break_reminders_sent(
+        self,
+        sent: List[Tuple[UserBotProfile, str]],
+        sent_at: datetime,
+    ) -> int:
+        """
+        Records sent long break reminders and reschedules the next ones
+        with one UPDATE ... FROM (VALUES ...) per BULK_UPDATE_CHUNK_SIZE
+        profiles. Profiles whose last_exercise_at changed since they were
+        fetched keep their refreshed schedule. Returns the number of
+        updated profiles.
+        """
+        if not sent:
+            return 0
+        rows = []
+        for profile, reminder_type in sent:
+            next_due_at, next_type = compute_next_long_break_reminder(
+                profile.last_exercise_at, reminder_type, sent_at
+            )
+            rows.append(
+                (
+                    profile.user_id,
+                    profile.bot_id,
+                    profile.last_exercise_at,
+                    reminder_type,
+                    next_due_at,
+                    next_type,
+                )
+            )
+        updated = 0
+        for i in range(0, len(rows), BULK_UPDATE_CHUNK_SIZE):
+            sent_values = values(
+                column('user_id', Integer),
+                column('bot_id', String),
+                column('last_exercise_at', DateTime(timezone=True)),
+                column('reminder_type', String),
+                column('next_due_at', DateTime(timezone=True)),
+                column('next_type', String),
+                name='sent',
+            ).data(rows[i : i + BULK_UPDATE_CHUNK_SIZE])
+            stmt = (
+                update(DBUserBotProfile)
+                .where(
+                    DBUserBotProfile.user_id == sent_values.c.user_id,
+                    DBUserBotProfile.bot_id == sent_values.c.bot_id,
+                    DBUserBotProfile.last_exercise_at.is_not_distinct_from(
+                        cast(
+                            sent_values.c.last_exercise_at,
+                            DateTime(timezone=True),
+                        )
+                    ),
+                )
+                .values(
+                    last_long_break_reminder_type_sent=(
+                        sent_values.c.reminder_type
+                    ),
+                    last_long_break_reminder_sent_at=sent_at,
+                    # A column of NULLs only would be typed as text.
+                    next_reminder_due_at=cast(
+                        sent_values.c.next_due_at, DateTime(timezone=True)
+                    ),
+                    next_reminder_type=cast(sent_values.c.next_type, String),
+                )
+                .execution_options(synchronize_session=False)
+            )
+            result = await self.session.execute(stmt)
+            updated += result.rowcount
+        return updated
 
     async def get_all(self) -> List[UserBotProfile]:
         stmt = select(DBUserBotProfile)
@@ -184,125 +403,237 @@ class SQLAlchemyUserBotProfileRepository(UserBotProfileRepository):
         db_profiles = result.scalars().all()
         return [UserBotProfile.model_validate(p) for p in db_profiles]
 
-    @override
-    async def calc_and_store_ratings_for_profiles(
-        self,
-    ) -> Dict[Tuple[int, str], float]:
+    async def _advance_user_language_stats(self) -> None:
         """
-        Calculates ratings for all users per bot_id based on their
-        attempt history and updates the DBUserBotProfile.
-        Returns a map of (user_id, bot_id) to new rating.
+        Adds the attempts created since the last run to the running
+        per-(user, language) totals in user_language_stats. Attempts are
+        consumed only once they are aggregation_settle_seconds old, so
+        rows committed a little after their created_at are not skipped.
         """
-        sql_query = """
-            WITH user_lang_stats AS (
+        watermark_repo = SQLAlchemyAggregationWatermarkRepository(self.session)
+        since = await watermark_repo.lock(USER_LANGUAGE_STATS_WATERMARK)
+        until = datetime.now(timezone.utc) - timedelta(
+            seconds=settings.aggregation_settle_seconds
+        )
+        if since is not None and since >= until:
+            return
+
+        # A day counts as a new active day if it is later than the last
+        # active day already counted for the user and language.
+        result = await self.session.execute(
+            text("""
+            WITH new_days AS (
                 SELECT
                     ea.user_id,
                     ex.exercise_language,
-                    COUNT(DISTINCT DATE(ea.created_at)) AS active_days,
-                    COUNT(ea.attempt_id) AS total_attempts,
-                    AVG(CASE WHEN ea.is_correct IS TRUE THEN 1 ELSE 0 END)
-                        AS correct_ratio
+                    DATE(ea.created_at) AS active_date,
+                    COUNT(*) AS attempts,
+                    COUNT(*) FILTER (WHERE ea.is_correct IS TRUE)
+                        AS correct_attempts
                 FROM exercise_attempts ea
                 JOIN exercises ex ON ea.exercise_id = ex.exercise_id
-                GROUP BY ea.user_id, ex.exercise_language
+                WHERE (CAST(:since AS timestamptz) IS NULL
+                       OR ea.created_at > :since)
+                  AND ea.created_at <= :until
+                GROUP BY ea.user_id, ex.exercise_language, active_date
             ),
-            user_lang_norms_intermediate AS (
+            increments AS (
+                SELECT
+                    d.user_id,
+                    d.exercise_language,
+                    COUNT(*) FILTER (
+                        WHERE s.last_active_date IS NULL
+                           OR d.active_date > s.last_active_date
+                    ) AS active_days,
+                    SUM(d.attempts) AS total_attempts,
+                    SUM(d.correct_attempts) AS correct_attempts,
+                    MAX(d.active_date) AS last_active_date
+                FROM new_days d
+                LEFT JOIN user_language_stats s
+                    ON s.user_id = d.user_id
+                    AND s.exercise_language = d.exercise_language
+                GROUP BY d.user_id, d.exercise_language
+            )
+            INSERT INTO user_language_stats (
+                user_id, exercise_language, active_days, total_attempts,
+                correct_attempts, last_active_date, updated_at
+            )
+            SELECT
+                user_id, exercise_language, active_days, total_attempts,
+                correct_attempts, last_active_date, now()
+            FROM increments
+            ON CONFLICT (user_id, exercise_language) DO UPDATE SET
+                active_days =
+                    user_language_stats.active_days + EXCLUDED.active_days,
+                total_attempts = user_language_stats.total_attempts
+                    + EXCLUDED.total_attempts,
+                correct_attempts = user_language_stats.correct_attempts
+                    + EXCLUDED.correct_attempts,
+                last_active_date = GREATEST(
+                    user_language_stats.last_active_date,
+                    EXCLUDED.last_active_date
+                ),
+                updated_at = EXCLUDED.updated_at
+            """),
+            {'since': since, 'until': until},
+        )
+        await watermark_repo.save(USER_LANGUAGE_STATS_WATERMARK, until)
+        rows_changed = typing.cast(CursorResult, result).rowcount
+        logger.info(
+            f'Advanced user language stats to {until.isoformat()}: '
+            f'{rows_changed} user/language rows changed.'
+        )
+
+    @override
+    async def calc_and_store_ratings_for_profiles(
+        self,
+    ) -> Dict[Tuple[int, str], float]:
+        """
+        Calculates ratings for all users per bot_id from the running
+        totals in user_language_stats and stores them in one UPDATE.
+        When a rating moves away from the quality_weight of its profile by
+        at least quality_stats_reweight_epsilon, quality_weight follows it
+        and the attempts counted in user_exercise_attempt_counts are
+        reweighted in exercise_quality_stats in the same statement.
+        Returns a map of (user_id, bot_id) to new rating.
+        """
+        await self._advance_user_language_stats()
+        # Keeps advance_exercise_quality_stats from counting attempts with
+        # the old weights while they are being changed.
+        watermark_repo = SQLAlchemyAggregationWatermarkRepository(self.session)
+        await watermark_repo.lock(EXERCISE_QUALITY_STATS_WATERMARK)
+
+        result = await self.session.execute(
+            text("""
+            WITH user_lang_stats AS (
                 SELECT
                     user_id,
                     exercise_language,
                     active_days,
                     LOG(1 + total_attempts) AS log_total_attempts,
-                    correct_ratio,
-                    MIN(active_days) OVER () as min_active_days_global,
-                    MAX(active_days) OVER () as max_active_days_global,
-                    MIN(LOG(1 + total_attempts)) OVER ()
-                        as min_log_attempts_global,
-                    MAX(LOG(1 + total_attempts)) OVER ()
-                        as max_log_attempts_global
+                    correct_attempts::float / NULLIF(total_attempts, 0)
+                        AS correct_ratio
+                FROM user_language_stats
+            ),
+            global_ranges AS (
+                SELECT
+                    MIN(active_days) AS min_active_days,
+                    MAX(active_days) - MIN(active_days)
+                        AS active_days_range,
+                    MIN(log_total_attempts) AS min_log_attempts,
+                    MAX(log_total_attempts) - MIN(log_total_attempts)
+                        AS log_attempts_range
                 FROM user_lang_stats
             ),
-            user_lang_norms AS (
+            user_ratings AS (
+                SELECT
+                    s.user_id,
+                    s.exercise_language,
+                    old.quality_weight AS old_weight,
+                    ROUND(
+                        (0.4 * CASE WHEN g.active_days_range > 0
+                                     AND g.log_attempts_range > 0
+                            THEN (s.active_days - g.min_active_days)::float
+                                / g.active_days_range
+                            ELSE 0 END +
+                         0.3 * CASE WHEN g.active_days_range > 0
+                                     AND g.log_attempts_range > 0
+                            THEN (s.log_total_attempts - g.min_log_attempts)
+                                / g.log_attempts_range
+                            ELSE 0 END +
+                         0.3 * COALESCE(s.correct_ratio, 0)
+                        )::numeric, 4
+                    ) AS user_rating
+                FROM user_lang_stats s
+                CROSS JOIN global_ranges g
+                JOIN user_bot_profiles old
+                    ON old.user_id = s.user_id
+                    AND old.bot_id = s.exercise_language
+            ),
+            updated AS (
+                UPDATE user_bot_profiles p
+                SET rating = r.user_rating,
+                    rating_last_calculated_at = :now,
+                    quality_weight = CASE
+                        WHEN ABS(
+                            r.user_rating
+                            - COALESCE(r.old_weight, :default_rating)
+                        ) >= :epsilon
+                        THEN r.user_rating
+                        ELSE p.quality_weight
+                    END
+                FROM user_ratings r
+                WHERE p.user_id = r.user_id
+                  AND p.bot_id = r.exercise_language
+                RETURNING
+                    p.user_id, p.bot_id, p.rating, p.quality_weight,
+                    r.old_weight
+            ),
+            weight_changes AS (
                 SELECT
                     user_id,
-                    exercise_language,
-                    active_days,
-                    log_total_attempts,
-                    correct_ratio,
-                    (active_days - min_active_days_global)::float /
-                        NULLIF(
-                            (max_active_days_global - min_active_days_global),
-                            0) AS norm_active_days,
-                    (log_total_attempts - min_log_attempts_global)::float /
-                        NULLIF(
-                            (max_log_attempts_global
-                                - min_log_attempts_global),
-                            0) AS norm_log_attempts
-                FROM user_lang_norms_intermediate
-                WHERE (max_active_days_global - min_active_days_global) > 0
-                  AND (max_log_attempts_global - min_log_attempts_global) > 0
+                    bot_id,
+                    quality_weight - COALESCE(old_weight, :default_rating)
+                        AS delta
+                FROM updated
+                WHERE quality_weight IS DISTINCT FROM old_weight
+            ),
+            weight_deltas AS (
+                SELECT
+                    c.exercise_id,
+                    SUM(d.delta * c.attempts) AS weighted_attempts,
+                    SUM(d.delta * c.incorrect_attempts) AS weighted_incorrect
+                FROM weight_changes d
+                JOIN user_exercise_attempt_counts c
+                    ON c.user_id = d.user_id
+                    AND c.exercise_language = d.bot_id
+                GROUP BY c.exercise_id
+            ),
+            reweighted AS (
+                UPDATE exercise_quality_stats q
+                SET weighted_attempts =
+                        q.weighted_attempts + w.weighted_attempts,
+                    weighted_incorrect =
+                        q.weighted_incorrect + w.weighted_incorrect,
+                    updated_at = :now
+                FROM weight_deltas w
+                WHERE q.exercise_id = w.exercise_id
             )
-            SELECT
-                s.user_id,
-                s.exercise_language, -- Это будет наш BotID.value
-                COALESCE(s.correct_ratio, 0) as correct_ratio,
-                COALESCE(n.norm_active_days, 0) as norm_active_days,
-                COALESCE(n.norm_log_attempts, 0) as norm_log_attempts,
-                ROUND(
-                    (0.4 * COALESCE(n.norm_active_days, 0) +
-                     0.3 * COALESCE(n.norm_log_attempts, 0) +
-                     0.3 * COALESCE(s.correct_ratio, 0)
-                    )::numeric, 4
-                ) AS user_rating
-            FROM user_lang_stats s
-            LEFT JOIN user_lang_norms n ON s.user_id = n.user_id
-                AND s.exercise_language = n.exercise_language;
-            """
-        result = await self.session.execute(text(sql_query))
-        calculated_ratings: Dict[Tuple[int, str], float] = {}
-        for row in result.fetchall():
-            user_id, bot_id, _, _, _, rating = row
-            if rating is not None:
-                calculated_ratings[(user_id, bot_id)] = float(rating)
-
-        updated_ratings_map: Dict[Tuple[int, str], float] = {}
-        now = datetime.now(timezone.utc)
-
-        for (user_id, bot_id), rating_value in calculated_ratings.items():
-            try:
-                stmt = (
-                    update(DBUserBotProfile)
-                    .where(
-                        DBUserBotProfile.user_id == user_id,
-                        DBUserBotProfile.bot_id == bot_id,
-                    )
-                    .values(rating=rating_value, rating_last_calculated_at=now)
-                    .execution_options(synchronize_session=False)
-                )
-                await self.session.execute(stmt)
-                updated_ratings_map[(user_id, bot_id)] = rating_value
-            except Exception as e:
-                logger.error(
-                    f'Error updating rating for '
-                    f'user {user_id}, bot {bot_id}: {e}',
-                    exc_info=True,
-                )
+            SELECT user_id, bot_id, rating FROM updated
+            """),
+            {
+                'now': datetime.now(timezone.utc),
+                'default_rating': settings.quality_review_default_user_rating,
+                'epsilon': settings.quality_stats_reweight_epsilon,
+            },
+        )
+        updated_ratings_map: Dict[Tuple[int, str], float] = {
+            (user_id, bot_id): float(rating)
+            for user_id, bot_id, rating in result.fetchall()
+        }
 
         logger.info(
-            f'Calculated and attempted to store ratings '
+            f'Calculated and stored ratings '
             f'for {len(updated_ratings_map)} user/bot profiles.',
         )
         return updated_ratings_map
 
     @override
-    async def get_active_profiles_for_reporting(
+    async def iter_active_profiles_for_reporting(
         self,
         activity_since: datetime,
         report_due_before: datetime,
-    ) -> List[Tuple[UserBotProfile, User]]:
+        shard: Optional[Tuple[int, int]] = None,
+        after: Optional[Tuple[int, str]] = None,
+        chunk_size: int = settings.profile_scan_chunk_size,
+    ) -> AsyncIterator[List[Tuple[UserBotProfile, User]]]:
         """
         Get profiles of users who have made at least one attempt since
         activity_since and are due for a new report (last report was generated
-        before report_due_before).
+        before report_due_before), chunk_size profiles at a time.
+
+        shard is (index, count): only users with user_id % count == index
+        are returned. after is the (user_id, bot_id) to resume after.
         """
 
         subquery = (
@@ -324,19 +655,21 @@ class SQLAlchemyUserBotProfileRepository(UserBotProfileRepository):
             )
             .options(joinedload(DBUserBotProfile.user))
         )
-        result = await self.session.execute(stmt)
-        db_profiles_list = result.scalars().unique().all()
-
-        profiles_with_users: List[Tuple[UserBotProfile, User]] = []
-        for db_profile_instance in db_profiles_list:
-            profile_validated = UserBotProfile.model_validate(
-                db_profile_instance,
-            )
-            user_validated = User.model_validate(
-                db_profile_instance.user,
+        if shard is not None:
+            shard_index, shard_count = shard
+            stmt = stmt.where(
+                DBUserBotProfile.user_id % shard_count == shard_index
             )
-            profiles_with_users.append(
-                (profile_validated, user_validated),
-            )
-
-        return profiles_with_users
+        async for rows in self._iter_keyset_chunks(
+            stmt,
+            chunk_size,
+            key=lambda row: (row[0].user_id, row[0].bot_id),
+            after=after,
+        ):
+            yield [
+                (
+                    UserBotProfile.model_validate(row[0]),
+                    User.model_validate(row[0].user),
+                )
+                for row in rows
+            ]
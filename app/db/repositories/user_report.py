@@ -1,3 +1,4 @@
+from datetime import date
 from typing import Optional, override
 
 from sqlalchemy import and_, select
@@ -52,6 +53,21 @@ class SQLAlchemyUserReportRepository(UserReportRepository):
             return self._to_entity(db_report)
         return None
 
+    @override
+    async def get_by_user_bot_and_week(
+        self, user_id: int, bot_id: str, week_start_date: date
+    ) -> Optional[UserReportEntity]:
+        stmt = select(UserReportModel).where(
+            UserReportModel.user_id == user_id,
+            UserReportModel.bot_id == bot_id,
+            UserReportModel.week_start_date == week_start_date,
+        )
+        result = await self.session.execute(stmt)
+        db_report = result.scalars().first()
+        if db_report:
+            return self._to_entity(db_report)
+        return None
+
     @override
     async def get_by_id_and_user(
         self, report_id: int, user_id: int
@@ -74,9 +90,12 @@ class SQLAlchemyUserReportRepository(UserReportRepository):
         if not db_report:
             raise ValueError(f'Report with id {report.report_id} not found.')
 
-        update_data = report.model_dump(
-            exclude={'report_id', 'user_id', 'bot_id', 'week_start_date'}
-        )
+        exclude = {'report_id', 'user_id', 'bot_id', 'week_start_date'}
+        if report.summary is None:
+            # A stored summary is final, so an entity loaded before it was
+            # stored must not clear it.
+            exclude.add('summary')
+        update_data = report.model_dump(exclude=exclude)
         for key, value in update_data.items():
             setattr(db_report, key, value)
         await self.session.flush()
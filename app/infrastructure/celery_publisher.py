@@ -0,0 +1,233 @@
+import asyncio
+import base64
+import logging
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from celery import Celery
+from kombu.serialization import dumps as serialize_body
+from kombu.utils.json import dumps as json_dumps
+from redis.asyncio import Redis as AsyncRedis
+
+from app.celery_producer import notifier_celery_producer
+from app.config import settings
+from app.metrics import BACKEND_CELERY_PUBLISHER_METRICS
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _BufferedMessage:
+    queue: str
+    message: bytes
+    acknowledged: asyncio.Future
+    # Set once the message is handed to a Redis pipeline; from then on
+    # it can no longer be withdrawn.
+    sending: bool = False
+
+
+class CeleryTaskPublisher:
+    """
+    Publishes Celery tasks to the Redis broker without blocking the event
+    loop.
+
+    Messages are built in the format the kombu Redis transport stores
+    (task protocol 2, JSON body, base64 body encoding) and put into a
+    bounded buffer. A background task drains the buffer and LPUSHes the
+    messages in pipelined batches of up to batch_size, waiting at most
+    flush_interval_seconds for a batch to fill. publish() resolves once
+    the batch containing its message was written to Redis. A message that
+    was not acknowledged in time is withdrawn from the buffer, so a
+    publish() that returned False is never delivered later.
+
+    Messages go straight to the queue list, so the queue must be
+    consumed under its own name (Celery's default direct routing).
+    """
+
+    def __init__(
+        self,
+        redis_client: AsyncRedis,
+        celery_app: Celery = notifier_celery_producer,
+        max_buffer_size: int = settings.notification_publish_buffer_size,
+        batch_size: int = settings.notification_publish_batch_size,
+        flush_interval_seconds: float = (
+            settings.notification_publish_flush_interval_seconds
+        ),
+        ack_timeout_seconds: float = (
+            settings.notification_publish_ack_timeout_seconds
+        ),
+    ):
+        self._redis = redis_client
+        self.celery_app = celery_app
+        self.batch_size = batch_size
+        self.flush_interval_seconds = flush_interval_seconds
+        self.ack_timeout_seconds = ack_timeout_seconds
+        self._buffer: asyncio.Queue[Optional[_BufferedMessage]] = (
+            asyncio.Queue(maxsize=max_buffer_size)
+        )
+        self._flush_task: Optional[asyncio.Task] = None
+        self._closing = False
+
+    def build_message(
+        self, task_name: str, args: List[Any], queue: str, task_id: str
+    ) -> bytes:
+        """Serializes a task the way Celery's send_task does."""
+        task_message = self.celery_app.amqp.as_task_v2(
+            task_id, task_name, args=args, kwargs={}
+        )
+        content_type, content_encoding, body = serialize_body(
+            task_message.body, serializer='json'
+        )
+        if isinstance(body, str):
+            body = body.encode(content_encoding)
+        properties = {
+            **task_message.properties,
+            'delivery_mode': 2,
+            'delivery_info': {'exchange': queue, 'routing_key': queue},
+            'priority': 0,
+            'body_encoding': 'base64',
+            'delivery_tag': str(uuid.uuid4()),
+        }
+        return json_dumps(
+            {
+                'body': base64.b64encode(body).decode(),
+                'content-encoding': content_encoding,
+                'content-type': content_type,
+                'headers': task_message.headers,
+                'properties': properties,
+            }
+        ).encode()
+
+    def start(self) -> None:
+        if self._flush_task is None or self._flush_task.done():
+            self._closing = False
+            self._flush_task = asyncio.create_task(
+                self._run(), name='celery_task_publisher'
+            )
+            logger.info('Celery task publisher started.')
+
+    async def close(self) -> None:
+        """Flushes buffered messages and stops the background task."""
+        if self._flush_task is None:
+            return
+        self._closing = True
+        await self._buffer.put(None)
+        await self._flush_task
+        self._flush_task = None
+        logger.info('Celery task publisher closed.')
+
+    async def publish(
+        self, task_name: str, args: List[Any], queue: str, task_id: str
+    ) -> bool:
+        """
+        Buffers a task and waits for its batch to be written to Redis.
+        Returns False if the write failed or was not acknowledged in time.
+        """
+        if self._closing:
+            logger.error(
+                f'Celery task publisher is closing, task {task_id} '
+                f'was not published.'
+            )
+            return False
+        self.start()
+
+        started = time.perf_counter()
+        message = self.build_message(task_name, args, queue, task_id)
+        acknowledged = asyncio.get_running_loop().create_future()
+        BACKEND_CELERY_PUBLISHER_METRICS['loop_blocking_seconds'].labels(
+            mode='batched'
+        ).observe(time.perf_counter() - started)
+
+        item = _BufferedMessage(queue, message, acknowledged)
+        await self._buffer.put(item)
+        BACKEND_CELERY_PUBLISHER_METRICS['buffered'].set(self._buffer.qsize())
+        try:
+            return await asyncio.wait_for(
+                asyncio.shield(acknowledged), timeout=self.ack_timeout_seconds
+            )
+        except asyncio.TimeoutError:
+            if item.sending:
+                # Already written or being written: the outcome decides.
+                return await acknowledged
+            acknowledged.cancel()
+            logger.error(
+                f'Task {task_id} was not acknowledged by Redis within '
+                f'{self.ack_timeout_seconds}s and was dropped.'
+            )
+            return False
+
+    async def _next_batch(self) -> Tuple[List[_BufferedMessage], bool]:
+        """
+        Waits for a message, then collects more until the batch is full
+        or the flush interval has passed. Returns (batch, stop).
+        """
+        item = await self._buffer.get()
+        if item is None:
+            return [], True
+        batch = [item]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.flush_interval_seconds
+        while len(batch) < self.batch_size:
+            if self._buffer.empty():
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(
+                        self._buffer.get(), timeout=timeout
+                    )
+                except asyncio.TimeoutError:
+                    break
+            else:
+                item = self._buffer.get_nowait()
+            if item is None:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    async def _run(self) -> None:
+        stop = False
+        while not stop:
+            batch, stop = await self._next_batch()
+            if batch:
+                await self._flush(batch)
+                BACKEND_CELERY_PUBLISHER_METRICS['buffered'].set(
+                    self._buffer.qsize()
+                )
+
+    async def _flush(self, batch: List[_BufferedMessage]) -> None:
+        # Messages whose publish() timed out were already reported as not
+        # sent.
+        batch = [item for item in batch if not item.acknowledged.cancelled()]
+        if not batch:
+            return
+        messages_by_queue: Dict[str, List[bytes]] = {}
+        for item in batch:
+            item.sending = True
+            messages_by_queue.setdefault(item.queue, []).append(item.message)
+
+        succeeded = True
+        started = time.perf_counter()
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                for queue, messages in messages_by_queue.items():
+                    # LPUSH keeps order: workers BRPOP from the other end.
+                    pipe.lpush(queue, *messages)
+                await pipe.execute()
+        except Exception as e:
+            succeeded = False
+            BACKEND_CELERY_PUBLISHER_METRICS['flush_failures'].inc()
+            logger.error(
+                f'Failed to push {len(batch)} task messages to Redis: {e}',
+                exc_info=True,
+            )
+        BACKEND_CELERY_PUBLISHER_METRICS['flush_duration_seconds'].observe(
+            time.perf_counter() - started
+        )
+        BACKEND_CELERY_PUBLISHER_METRICS['batch_size'].observe(len(batch))
+
+        for item in batch:
+            if not item.acknowledged.done():
+                item.acknowledged.set_result(succeeded)
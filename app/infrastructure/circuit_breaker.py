@@ -0,0 +1,289 @@
+import enum
+import logging
+import time
+import uuid
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+from redis.asyncio import Redis as AsyncRedis
+from redis.exceptions import RedisError
+
+from app.config import settings
+from app.infrastructure.redis_client import get_redis_client
+from app.metrics import BACKEND_CIRCUIT_BREAKER_METRICS
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+CIRCUIT_BREAKER_KEY_PREFIX = 'circuit_breaker'
+
+# KEYS: current bucket, open flag, tripped flag, all window buckets...
+# ARGV: is_failure, bucket ttl ms, min calls, failure rate, open ms
+_RECORD_SCRIPT = """
+redis.call('hincrby', KEYS[1], 'total', 1)
+if ARGV[1] == '1' then
+    redis.call('hincrby', KEYS[1], 'failures', 1)
+end
+redis.call('pexpire', KEYS[1], ARGV[2])
+if ARGV[1] ~= '1' or redis.call('exists', KEYS[2]) == 1 then
+    return 0
+end
+local total = 0
+local failures = 0
+for i = 4, #KEYS do
+    local counts = redis.call('hmget', KEYS[i], 'total', 'failures')
+    total = total + (tonumber(counts[1]) or 0)
+    failures = failures + (tonumber(counts[2]) or 0)
+end
+if total >= tonumber(ARGV[3]) and failures / total >= tonumber(ARGV[4]) then
+    redis.call('set', KEYS[2], '1', 'PX', ARGV[5])
+    redis.call('set', KEYS[3], '1')
+    return 1
+end
+return 0
+"""
+
+
+class CircuitState(enum.IntEnum):
+    CLOSED = 0
+    OPEN = 1
+    HALF_OPEN = 2
+
+
+def _default_is_failure(result: Any) -> bool:
+    return not result
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker whose state is shared by all processes through Redis.
+
+    Closed: calls pass and their outcomes are counted in time buckets.
+    When the failure rate over the window reaches the threshold (with at
+    least min_calls calls), the circuit opens and calls are rejected for
+    open_seconds. After that it is half-open: a single probe call is let
+    through under a Redis lock. A successful probe closes the circuit,
+    a failed one opens it again.
+
+    If Redis is unavailable, calls are allowed and nothing is recorded.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        redis_client: Optional[AsyncRedis] = None,
+        failure_rate_threshold: float = (
+            settings.circuit_breaker_failure_rate_threshold
+        ),
+        min_calls: int = settings.circuit_breaker_min_calls,
+        window_seconds: int = settings.circuit_breaker_window_seconds,
+        bucket_seconds: int = settings.circuit_breaker_bucket_seconds,
+        open_seconds: int = settings.circuit_breaker_open_seconds,
+        probe_timeout_seconds: int = (
+            settings.circuit_breaker_probe_timeout_seconds
+        ),
+        is_failure: Callable[[Any], bool] = _default_is_failure,
+    ):
+        self.name = name
+        self._redis = redis_client
+        self._record_script: Any = None
+        self.failure_rate_threshold = failure_rate_threshold
+        self.min_calls = min_calls
+        self.window_seconds = window_seconds
+        self.bucket_seconds = bucket_seconds
+        self.open_seconds = open_seconds
+        self.probe_timeout_seconds = probe_timeout_seconds
+        self.is_failure = is_failure
+
+        key_prefix = f'{CIRCUIT_BREAKER_KEY_PREFIX}:{name}'
+        self._open_key = f'{key_prefix}:open'
+        self._tripped_key = f'{key_prefix}:tripped'
+        self._probe_key = f'{key_prefix}:probe'
+        self._bucket_key_prefix = f'{key_prefix}:bucket'
+
+    async def _get_redis(self) -> AsyncRedis:
+        if self._redis is None:
+            self._redis = await get_redis_client()
+        if self._record_script is None:
+            self._record_script = self._redis.register_script(_RECORD_SCRIPT)
+        return self._redis
+
+    def _bucket_keys(self) -> List[str]:
+        """Keys of the window buckets, the current bucket first."""
+        current = int(time.time()) // self.bucket_seconds
+        buckets = max(1, self.window_seconds // self.bucket_seconds)
+        return [
+            f'{self._bucket_key_prefix}:{current - i}' for i in range(buckets)
+        ]
+
+    def _set_state_metric(self, state: CircuitState) -> None:
+        BACKEND_CIRCUIT_BREAKER_METRICS['state'].labels(name=self.name).set(
+            state.value
+        )
+
+    async def get_state(self) -> CircuitState:
+        redis_client = await self._get_redis()
+        async with redis_client.pipeline(transaction=False) as pipe:
+            pipe.exists(self._open_key)
+            pipe.exists(self._tripped_key)
+            is_open, is_tripped = await pipe.execute()
+        if is_open:
+            state = CircuitState.OPEN
+        elif is_tripped:
+            state = CircuitState.HALF_OPEN
+        else:
+            state = CircuitState.CLOSED
+        self._set_state_metric(state)
+        return state
+
+    async def is_open(self) -> bool:
+        """True while calls are rejected without probing."""
+        try:
+            return await self.get_state() == CircuitState.OPEN
+        except RedisError as e:
+            logger.warning(
+                f'Circuit breaker {self.name}: Redis unavailable, '
+                f'treating as closed: {e}'
+            )
+            return False
+
+    async def _acquire_permit(self) -> Tuple[bool, Optional[str]]:
+        """
+        Decides whether one call may pass. Returns (allowed, probe_token);
+        the token is set when the call is the half-open probe.
+        """
+        state = await self.get_state()
+        if state == CircuitState.CLOSED:
+            return True, None
+        if state == CircuitState.HALF_OPEN:
+            token = uuid.uuid4().hex
+            redis_client = await self._get_redis()
+            if await redis_client.set(
+                self._probe_key,
+                token,
+                nx=True,
+                px=self.probe_timeout_seconds * 1000,
+            ):
+                logger.info(f'Circuit breaker {self.name}: sending probe.')
+                return True, token
+        return False, None
+
+    async def _record(self, failed: bool, probe_token: Optional[str]) -> None:
+        redis_client = await self._get_redis()
+        BACKEND_CIRCUIT_BREAKER_METRICS['calls'].labels(
+            name=self.name, result='failure' if failed else 'success'
+        ).inc()
+
+        if probe_token:
+            if failed:
+                await redis_client.set(
+                    self._open_key, '1', px=self.open_seconds * 1000
+                )
+                await redis_client.delete(self._probe_key)
+                self._set_state_metric(CircuitState.OPEN)
+                logger.warning(
+                    f'Circuit breaker {self.name}: probe failed, '
+                    f'open for {self.open_seconds}s.'
+                )
+            else:
+                await redis_client.delete(
+                    self._tripped_key, self._probe_key, *self._bucket_keys()
+                )
+                self._set_state_metric(CircuitState.CLOSED)
+                logger.info(
+                    f'Circuit breaker {self.name}: probe succeeded, closed.'
+                )
+            return
+
+        bucket_keys = self._bucket_keys()
+        tripped = await self._record_script(
+            keys=[
+                bucket_keys[0],
+                self._open_key,
+                self._tripped_key,
+                *bucket_keys,
+            ],
+            args=[
+                1 if failed else 0,
+                (self.window_seconds + self.bucket_seconds) * 1000,
+                self.min_calls,
+                self.failure_rate_threshold,
+                self.open_seconds * 1000,
+            ],
+        )
+        if tripped:
+            self._set_state_metric(CircuitState.OPEN)
+            logger.warning(
+                f'Circuit breaker {self.name}: failure rate reached '
+                f'{self.failure_rate_threshold:.0%}, '
+                f'open for {self.open_seconds}s.'
+            )
+
+    async def call(
+        self, func: Callable[..., Awaitable[T]], *args, **kwargs
+    ) -> Optional[T]:
+        """
+        Runs func through the breaker. Returns None without calling func
+        when the circuit rejects the call. Exceptions from func count as
+        failures and are re-raised.
+        """
+        allowed, probe_token = True, None
+        redis_available = True
+        try:
+            allowed, probe_token = await self._acquire_permit()
+        except RedisError as e:
+            redis_available = False
+            logger.warning(
+                f'Circuit breaker {self.name}: Redis unavailable, '
+                f'allowing call: {e}'
+            )
+
+        if not allowed:
+            BACKEND_CIRCUIT_BREAKER_METRICS['rejected'].labels(
+                name=self.name
+            ).inc()
+            logger.warning(f'Circuit breaker {self.name} is open, skipping.')
+            return None
+
+        try:
+            result = await func(*args, **kwargs)
+        except Exception:
+            if redis_available:
+                await self._safe_record(True, probe_token)
+            raise
+        if redis_available:
+            await self._safe_record(self.is_failure(result), probe_token)
+        return result
+
+    async def _safe_record(
+        self, failed: bool, probe_token: Optional[str]
+    ) -> None:
+        try:
+            await self._record(failed, probe_token)
+        except RedisError as e:
+            logger.warning(
+                f'Circuit breaker {self.name}: failed to record '
+                f'call result: {e}'
+            )
+
+
+_circuit_breakers: Dict[str, CircuitBreaker] = {}
+
+
+def get_circuit_breaker(name: str, **kwargs) -> CircuitBreaker:
+    """
+    Returns the process-wide breaker for an external provider. All
+    breakers with the same name share state through Redis.
+    """
+    if name not in _circuit_breakers:
+        _circuit_breakers[name] = CircuitBreaker(name, **kwargs)
+    return _circuit_breakers[name]
@@ -0,0 +1,118 @@
+import logging
+from datetime import datetime, timezone
+from typing import List, Optional, Tuple
+
+from redis.asyncio import Redis as AsyncRedis
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+DELAY_QUEUE_KEY_PREFIX = 'delay_queue'
+SESSION_REMINDER_QUEUE_NAME = 'session_reminders'
+
+# KEYS: queue zset. ARGV: max score, limit
+_POP_DUE_SCRIPT = """
+local members = redis.call(
+    'zrangebyscore', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, ARGV[2]
+)
+if #members > 0 then
+    redis.call('zrem', KEYS[1], unpack(members))
+end
+return members
+"""
+
+
+class RedisDelayQueue:
+    """
+    Delay queue stored in a Redis sorted set scored by due time (epoch
+    seconds with sub-second precision).
+
+    A member is unique, so scheduling it again only moves its due time.
+    Due members are popped atomically: each one is handed to exactly one
+    consumer.
+    """
+
+    def __init__(self, redis_client: AsyncRedis, name: str):
+        self.name = name
+        self._redis = redis_client
+        self._key = f'{DELAY_QUEUE_KEY_PREFIX}:{name}'
+        self._pop_due_script = redis_client.register_script(_POP_DUE_SCRIPT)
+
+    async def schedule(self, member: str, due_at: datetime) -> None:
+        await self._redis.zadd(self._key, {member: due_at.timestamp()})
+
+    async def cancel(self, member: str) -> bool:
+        return bool(await self._redis.zrem(self._key, member))
+
+    async def pop_due(
+        self, now: Optional[datetime] = None, limit: int = 100
+    ) -> List[str]:
+        now = now or datetime.now(timezone.utc)
+        members = await self._pop_due_script(
+            keys=[self._key], args=[now.timestamp(), limit]
+        )
+        return [member.decode() for member in members]
+
+    async def next_due_at(self) -> Optional[datetime]:
+        entries = await self._redis.zrange(self._key, 0, 0, withscores=True)
+        if not entries:
+            return None
+        return datetime.fromtimestamp(entries[0][1], tz=timezone.utc)
+
+    async def size(self) -> int:
+        return await self._redis.zcard(self._key)
+
+
+class SessionReminderQueue(RedisDelayQueue):
+    """Session-unlock reminders keyed by (user_id, bot_id)."""
+
+    def __init__(self, redis_client: AsyncRedis):
+        super().__init__(redis_client, SESSION_REMINDER_QUEUE_NAME)
+        self._sent_key_prefix = f'{self._key}:sent'
+
+    async def schedule_reminder(
+        self, user_id: int, bot_id: str, due_at: datetime
+    ) -> None:
+        await self.schedule(f'{user_id}:{bot_id}', due_at)
+
+    async def cancel_reminder(self, user_id: int, bot_id: str) -> bool:
+        return await self.cancel(f'{user_id}:{bot_id}')
+
+    async def pop_due_reminders(
+        self, now: Optional[datetime] = None, limit: int = 100
+    ) -> List[Tuple[int, str]]:
+        reminders = []
+        for member in await self.pop_due(now=now, limit=limit):
+            user_id, bot_id = member.split(':', 1)
+            reminders.append((int(user_id), bot_id))
+        return reminders
+
+    def _sent_key(
+        self, user_id: int, bot_id: str, frozen_until: datetime
+    ) -> str:
+        return (
+            f'{self._sent_key_prefix}:{user_id}:{bot_id}:'
+            f'{frozen_until.timestamp()}'
+        )
+
+    async def mark_sent(
+        self, user_id: int, bot_id: str, frozen_until: datetime
+    ) -> bool:
+        """
+        Records the reminder for this unlock time. Returns False if it
+        was already recorded, so duplicates are not sent twice.
+        """
+        return bool(
+            await self._redis.set(
+                self._sent_key(user_id, bot_id, frozen_until),
+                1,
+                nx=True,
+                ex=settings.session_reminder_dedup_ttl_seconds,
+            )
+        )
+
+    async def unmark_sent(
+        self, user_id: int, bot_id: str, frozen_until: datetime
+    ) -> None:
+        await self._redis.delete(self._sent_key(user_id, bot_id, frozen_until))
@@ -0,0 +1,40 @@
+import json
+import logging
+from typing import Any, Dict, Optional
+
+from redis.asyncio import Redis as AsyncRedis
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+JOB_CHECKPOINT_KEY_PREFIX = 'job_checkpoint'
+
+
+class JobCheckpoint:
+    """
+    Progress of a long-running job stored in Redis as JSON, so that a
+    restarted run can continue where the previous one stopped.
+    """
+
+    def __init__(
+        self,
+        redis_client: AsyncRedis,
+        name: str,
+        ttl_seconds: int = settings.job_checkpoint_ttl_seconds,
+    ):
+        self.name = name
+        self.ttl_seconds = ttl_seconds
+        self._redis = redis_client
+        self._key = f'{JOB_CHECKPOINT_KEY_PREFIX}:{name}'
+
+    async def load(self) -> Optional[Dict[str, Any]]:
+        value = await self._redis.get(self._key)
+        if not value:
+            return None
+        return json.loads(value)
+
+    async def save(self, state: Dict[str, Any]) -> None:
+        await self._redis.set(
+            self._key, json.dumps(state), ex=self.ttl_seconds
+        )
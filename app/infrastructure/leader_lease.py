@@ -0,0 +1,176 @@
+import asyncio
+import contextlib
+import logging
+import uuid
+from typing import Any, Callable, Coroutine, Optional
+
+from redis.asyncio import Redis as AsyncRedis
+from redis.exceptions import RedisError
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+LEADER_LEASE_KEY_PREFIX = 'leader_lease'
+
+_RENEW_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('pexpire', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+_RELEASE_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+LeaderLoopFactory = Callable[[asyncio.Event], Coroutine[Any, Any, None]]
+
+
+class LeaderLease:
+    """
+    Exclusive, expiring lease stored in Redis.
+
+    Only the holder of the random token may renew or release the lease,
+    so an instance that lost it (e.g. after a long GC pause) cannot
+    accidentally extend or delete a lease taken over by another instance.
+    """
+
+    def __init__(
+        self,
+        redis_client: AsyncRedis,
+        name: str,
+        ttl_seconds: Optional[int] = None,
+    ):
+        self.name = name
+        self._redis = redis_client
+        self._key = f'{LEADER_LEASE_KEY_PREFIX}:{name}'
+        self._token = uuid.uuid4().hex.encode()
+        self._ttl_ms = (
+            ttl_seconds or settings.leader_lease_ttl_seconds
+        ) * 1000
+        self._renew_script = redis_client.register_script(_RENEW_SCRIPT)
+        self._release_script = redis_client.register_script(_RELEASE_SCRIPT)
+
+    async def acquire(self) -> bool:
+        acquired = await self._redis.set(
+            self._key, self._token, nx=True, px=self._ttl_ms
+        )
+        return bool(acquired)
+
+    async def renew(self) -> bool:
+        renewed = await self._renew_script(
+            keys=[self._key], args=[self._token, self._ttl_ms]
+        )
+        return bool(renewed)
+
+    async def release(self) -> bool:
+        released = await self._release_script(
+            keys=[self._key], args=[self._token]
+        )
+        return bool(released)
+
+
+async def _stop_task(task: asyncio.Task, timeout: float) -> None:
+    if task.done():
+        return
+    try:
+        await asyncio.wait_for(task, timeout=timeout)
+    except asyncio.TimeoutError:
+        logger.warning(
+            f'Task {task.get_name()} did not stop in {timeout}s. Cancelling.'
+        )
+    except asyncio.CancelledError:
+        pass
+    except Exception as e:
+        logger.error(
+            f'Task {task.get_name()} failed during shutdown: {e}',
+            exc_info=True,
+        )
+
+
+async def _run_while_leader(
+    lease: LeaderLease,
+    loop_factory: LeaderLoopFactory,
+    stop_event: asyncio.Event,
+) -> None:
+    loop_stop_event = asyncio.Event()
+    loop_task: asyncio.Task[None] = asyncio.create_task(
+        loop_factory(loop_stop_event), name=f'{lease.name}_loop'
+    )
+    try:
+        while not stop_event.is_set() and not loop_task.done():
+            stop_waiter = asyncio.create_task(stop_event.wait())
+            try:
+                await asyncio.wait(
+                    {loop_task, stop_waiter},
+                    timeout=settings.leader_lease_renew_interval_seconds,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+            finally:
+                stop_waiter.cancel()
+
+            if stop_event.is_set() or loop_task.done():
+                break
+
+            try:
+                renewed = await lease.renew()
+            except RedisError as e:
+                logger.error(f'Failed to renew lease {lease.name}: {e}')
+                renewed = False
+            if not renewed:
+                logger.warning(
+                    f'Lost leader lease {lease.name}, stopping its loop.'
+                )
+                break
+
+        if loop_task.done() and not loop_task.cancelled():
+            exc = loop_task.exception()
+            if exc:
+                logger.error(
+                    f'Leader loop {lease.name} crashed: {exc}',
+                    exc_info=exc,
+                )
+    finally:
+        loop_stop_event.set()
+        await _stop_task(
+            loop_task, timeout=settings.worker_shutdown_timeout_seconds
+        )
+        try:
+            await lease.release()
+        except RedisError as e:
+            logger.error(f'Failed to release lease {lease.name}: {e}')
+
+
+async def run_as_leader(
+    name: str,
+    loop_factory: LeaderLoopFactory,
+    stop_event: asyncio.Event,
+    redis_client: AsyncRedis,
+) -> None:
+    """
+    Runs the loop built by `loop_factory` only while this instance holds
+    the `name` lease. Instances that lose the election keep retrying,
+    so a standby takes over when the leader dies or stops renewing.
+    """
+    lease = LeaderLease(redis_client, name)
+    while not stop_event.is_set():
+        try:
+            acquired = await lease.acquire()
+        except RedisError as e:
+            logger.error(f'Failed to acquire lease {name}: {e}')
+            acquired = False
+
+        if acquired:
+            logger.info(f'Acquired leader lease {name}.')
+            await _run_while_leader(lease, loop_factory, stop_event)
+            logger.info(f'Released leader lease {name}.')
+
+        with contextlib.suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(
+                stop_event.wait(),
+                timeout=settings.leader_lease_retry_interval_seconds,
+            )
@@ -0,0 +1,195 @@
+import asyncio
+import logging
+from datetime import datetime, timezone
+from typing import Dict, Optional, Set
+
+from pydantic import BaseModel
+from redis.asyncio import Redis as AsyncRedis
+from redis.exceptions import RedisError
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.core.entities.user_bot_profile import UserBotProfile, UserStatusInBot
+
+logger = logging.getLogger(__name__)
+
+PROFILE_STATE_KEY_PREFIX = 'profile_state'
+_PENDING_INVALIDATIONS = 'profile_state_pending_invalidations'
+NOTIFICATION_TASK_KEY_PREFIX = 'notification_task'
+
+
+class ProfileStateSnapshot(BaseModel):
+    """The profile fields notification relevance depends on."""
+
+    status: UserStatusInBot
+    session_frozen_until: Optional[datetime] = None
+    last_exercise_at: Optional[datetime] = None
+    wants_session_reminders: Optional[bool] = None
+
+    @classmethod
+    def from_profile(cls, profile: UserBotProfile) -> 'ProfileStateSnapshot':
+        return cls(
+            status=profile.status,
+            session_frozen_until=profile.session_frozen_until,
+            last_exercise_at=profile.last_exercise_at,
+            wants_session_reminders=profile.wants_session_reminders,
+        )
+
+
+class NotificationTaskRecord(BaseModel):
+    notification_type: str
+    created_at: datetime
+
+
+def _encode_datetime(value: Optional[datetime]) -> str:
+    return '' if value is None else str(value.timestamp())
+
+
+def _decode_datetime(value: Optional[bytes]) -> Optional[datetime]:
+    if not value:
+        return None
+    return datetime.fromtimestamp(float(value), tz=timezone.utc)
+
+
+class ProfileStateCache:
+    """
+    Compact copy of profile state in Redis hashes, one per
+    (user_id, bot_id). UserBotProfileService invalidates the entry on
+    every profile write and a relevance check that misses reloads it from
+    the database.
+
+    With a session, invalidations are deferred until that session
+    commits: a check running before the commit may still reload and save
+    the old row, and the delete after the commit removes it again.
+    Entries expire after a few minutes, so writes made without this
+    cache (or a failed delete) leave a snapshot stale only that long.
+    """
+
+    def __init__(
+        self,
+        redis_client: AsyncRedis,
+        session: Optional[AsyncSession] = None,
+        ttl_seconds: int = settings.profile_state_snapshot_ttl_seconds,
+    ):
+        self._redis = redis_client
+        self._session = session
+        self.ttl_seconds = ttl_seconds
+        self._delete_tasks: Set[asyncio.Task] = set()
+        if session is not None:
+            event.listen(session.sync_session, 'after_commit', self._on_commit)
+            event.listen(
+                session.sync_session, 'after_rollback', self._on_rollback
+            )
+
+    def _key(self, user_id: int, bot_id: str) -> str:
+        return f'{PROFILE_STATE_KEY_PREFIX}:{user_id}:{bot_id}'
+
+    async def save(self, profile: UserBotProfile) -> None:
+        key = self._key(profile.user_id, profile.bot_id)
+        wants_reminders = profile.wants_session_reminders
+        mapping: Dict[str, str] = {
+            's': profile.status.value,
+            'f': _encode_datetime(profile.session_frozen_until),
+            'e': _encode_datetime(profile.last_exercise_at),
+            'r': '' if wants_reminders is None else str(int(wants_reminders)),
+        }
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.hset(key, mapping=mapping)
+            pipe.expire(key, self.ttl_seconds)
+            await pipe.execute()
+
+    async def invalidate(self, user_id: int, bot_id: str) -> None:
+        """
+        Deletes the snapshot, after the commit of the bound session if
+        there is one.
+        """
+        key = self._key(user_id, bot_id)
+        if self._session is None:
+            await self._redis.delete(key)
+            return
+        self._session.info.setdefault(_PENDING_INVALIDATIONS, set()).add(key)
+
+    def _on_commit(self, session: Session) -> None:
+        keys = session.info.pop(_PENDING_INVALIDATIONS, None)
+        if not keys:
+            return
+        task = asyncio.get_running_loop().create_task(
+            self._delete_committed(keys)
+        )
+        self._delete_tasks.add(task)
+        task.add_done_callback(self._delete_tasks.discard)
+
+    def _on_rollback(self, session: Session) -> None:
+        # Nothing was written, so the snapshots are still current.
+        session.info.pop(_PENDING_INVALIDATIONS, None)
+
+    async def _delete_committed(self, keys: Set[str]) -> None:
+        try:
+            await self._redis.delete(*keys)
+        except RedisError as e:
+            logger.error(
+                f'Failed to invalidate profile state snapshots {keys}: {e}'
+            )
+
+    async def wait_for_invalidations(self) -> None:
+        """Waits for the deletes started by commits so far."""
+        if self._delete_tasks:
+            await asyncio.gather(*self._delete_tasks)
+
+    async def get(
+        self, user_id: int, bot_id: str
+    ) -> Optional[ProfileStateSnapshot]:
+        key = self._key(user_id, bot_id)
+        fields = await self._redis.hgetall(key)  # type: ignore[misc]
+        if not fields:
+            return None
+        wants_reminders = fields.get(b'r')
+        return ProfileStateSnapshot(
+            status=UserStatusInBot(fields[b's'].decode()),
+            session_frozen_until=_decode_datetime(fields.get(b'f')),
+            last_exercise_at=_decode_datetime(fields.get(b'e')),
+            wants_session_reminders=(
+                bool(int(wants_reminders)) if wants_reminders else None
+            ),
+        )
+
+
+class NotificationTaskRegistry:
+    """
+    Remembers the type and creation time of enqueued notification
+    tasks, so a relevance check needs only the task_id.
+    """
+
+    def __init__(
+        self,
+        redis_client: AsyncRedis,
+        ttl_seconds: int = settings.notification_task_record_ttl_seconds,
+    ):
+        self._redis = redis_client
+        self.ttl_seconds = ttl_seconds
+
+    def _key(self, task_id: str) -> str:
+        return f'{NOTIFICATION_TASK_KEY_PREFIX}:{task_id}'
+
+    async def register(
+        self, task_id: str, notification_type: str, created_at: datetime
+    ) -> None:
+        await self._redis.set(
+            self._key(task_id),
+            f'{notification_type}:{created_at.timestamp()}',
+            ex=self.ttl_seconds,
+        )
+
+    async def get(self, task_id: str) -> Optional[NotificationTaskRecord]:
+        value = await self._redis.get(self._key(task_id))
+        if not value:
+            return None
+        notification_type, timestamp = value.decode().split(':', 1)
+        return NotificationTaskRecord(
+            notification_type=notification_type,
+            created_at=datetime.fromtimestamp(
+                float(timestamp), tz=timezone.utc
+            ),
+        )
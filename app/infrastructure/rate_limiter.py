@@ -0,0 +1,77 @@
+import asyncio
+import logging
+from typing import Optional
+
+from redis.asyncio import Redis as AsyncRedis
+
+logger = logging.getLogger(__name__)
+
+TOKEN_BUCKET_KEY_PREFIX = 'token_bucket'
+
+# KEYS: bucket hash. ARGV: rate per second, capacity, requested tokens.
+# Returns 0 if the tokens were taken, otherwise the milliseconds to wait
+# until enough tokens are available. Uses the Redis clock so that all
+# processes sharing the bucket agree on the time.
+_TAKE_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local requested = tonumber(ARGV[3])
+local time = redis.call('time')
+local now = tonumber(time[1]) * 1000 + math.floor(tonumber(time[2]) / 1000)
+local state = redis.call('hmget', KEYS[1], 'tokens', 'updated_at')
+local tokens = tonumber(state[1]) or capacity
+local updated_at = tonumber(state[2]) or now
+tokens = math.min(
+    capacity, tokens + math.max(0, now - updated_at) * rate / 1000
+)
+local wait_ms = 0
+if tokens >= requested then
+    tokens = tokens - requested
+else
+    wait_ms = math.ceil((requested - tokens) * 1000 / rate)
+end
+redis.call('hset', KEYS[1], 'tokens', tostring(tokens), 'updated_at', now)
+redis.call('pexpire', KEYS[1], math.ceil(capacity * 1000 / rate) + 1000)
+return wait_ms
+"""
+
+
+class RedisTokenBucket:
+    """
+    Token bucket shared through Redis: every process using the same name
+    draws from one bucket that refills at rate_per_second up to capacity
+    tokens, so their combined rate stays within the limit while short
+    bursts of up to capacity are allowed.
+    """
+
+    def __init__(
+        self,
+        redis_client: AsyncRedis,
+        name: str,
+        rate_per_second: float,
+        capacity: Optional[int] = None,
+    ):
+        self.name = name
+        self.rate_per_second = rate_per_second
+        self.capacity = capacity or max(1, int(rate_per_second))
+        self._key = f'{TOKEN_BUCKET_KEY_PREFIX}:{name}'
+        self._take_script = redis_client.register_script(_TAKE_SCRIPT)
+
+    async def try_acquire(self, tokens: int = 1) -> float:
+        """
+        Takes tokens if available. Returns 0 on success, otherwise the
+        seconds to wait before trying again.
+        """
+        wait_ms = await self._take_script(
+            keys=[self._key],
+            args=[self.rate_per_second, self.capacity, tokens],
+        )
+        return int(wait_ms) / 1000
+
+    async def acquire(self, tokens: int = 1) -> None:
+        """Waits until the tokens could be taken."""
+        while True:
+            wait = await self.try_acquire(tokens)
+            if wait <= 0:
+                return
+            await asyncio.sleep(wait)
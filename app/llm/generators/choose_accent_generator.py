@@ -1,65 +1,74 @@
-import asyncio
 import logging
+import time
 import unicodedata
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import httpx
-from lxml import html
+from langchain_core.callbacks import get_usage_metadata_callback
 from pydantic import BaseModel, Field
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from app.core.configs.consts import VOCABULARY_TAGS
 from app.core.configs.enums import ExerciseType, LanguageLevel
 from app.core.configs.generation.config import ExerciseTopic
 from app.core.configs.generation.persona import Persona
 from app.core.configs.texts import get_text
+from app.core.entities.accent_word import AccentWord
 from app.core.entities.exercise import Exercise
 from app.core.value_objects.answer import Answer, ChooseAccentAnswer
 from app.core.value_objects.exercise import ChooseAccentExerciseData
+from app.db.db import async_session_maker
+from app.db.repositories.accent_word import SQLAlchemyAccentWordRepository
 from app.llm.assessors.quality_assessor import ExerciseForAssessor
 from app.llm.interfaces.exercise_generator import BaseExerciseGenerator
 from app.llm.llm_base import BaseLLMService
+from app.metrics import BACKEND_LLM_METRICS
 from app.utils.language_code_converter import (
     convert_iso639_language_code_to_full_name,
 )
 
 logger = logging.getLogger(__name__)
 
-BATCH_FETCH_NUM = 15
 MIN_VOWELS = 2
 MAX_VOWELS = 5
-HTTPX_TIMEOUT = 10
 
 
-class WordSuitabilityAssessment(BaseModel):
+class RankedWordAssessment(BaseModel):
     word_to_assess: str = Field(
-        description='The word that was assessed.',
+        description='The word that was assessed, exactly as given.',
     )
     is_common_and_suitable: bool = Field(
         description='True if the word is commonly used, widely known, '
         'and suitable for the specified language level.',
     )
-    reasoning: str = Field(
-        description='Brief explanation for the decision on commonness, '
-        'suitability, and knownness.',
-    )
     confidence_level: str = Field(
         description="Confidence in the assessment: 'HIGH', 'MEDIUM', 'LOW'.",
     )
-
-
-class WordDefinitionAndExamples(BaseModel):
-    meaning: str = Field(
-        description='A concise dictionary-like definition of the word '
-        'in the target language.'
+    rank: int = Field(
+        description='Position of the word in the ranking of all given '
+        'words by suitability, starting from 1 for the best word.',
+    )
+    meaning: Optional[str] = Field(
+        default=None,
+        description='For the top picks only: a concise dictionary-like '
+        'definition of the word in the target language.',
     )
     examples: List[str] = Field(
-        description='One or two example sentences using the word in'
-        " the target language, appropriate for the learner's "
-        'level.'
+        default_factory=list,
+        description='For the top picks only: one or two example sentences '
+        'using the word in the target language, appropriate for the '
+        "learner's level.",
     )
-    grammar_tags: dict = Field(
-        description="A JSON object with key 'vocabulary' "
-        'listing the topics covered in the exercise.'
+    grammar_tags: Dict[str, List[str]] = Field(
+        default_factory=dict,
+        description='For the top picks only: a JSON object with key '
+        "'vocabulary' listing the topics of the word.",
+    )
+
+
+class WordBatchAssessment(BaseModel):
+    assessments: List[RankedWordAssessment] = Field(
+        description='One assessment for every given word.',
     )
 
 
@@ -69,182 +78,132 @@ class ChooseAccentGenerationError(Exception):
 
 class ChooseAccentGenerator(BaseExerciseGenerator):
     def __init__(
-        self, llm_service: BaseLLMService, http_client: httpx.AsyncClient
+        self,
+        llm_service: BaseLLMService,
+        http_client: httpx.AsyncClient,
+        session_maker: Optional[async_sessionmaker[AsyncSession]] = None,
     ):
         super().__init__(llm_service, http_client)
+        self.session_maker = session_maker or async_session_maker
 
-    async def _assess_word_suitability_llm(
+    async def assess_words_batch(
         self,
-        word_no_accent: str,
+        words_no_accent: List[str],
         target_language_full_name: str,
         user_language: str,  # ISO code
         language_level: LanguageLevel,
-    ) -> Optional[WordSuitabilityAssessment]:
+        top_picks: int,
+    ) -> Optional[List[RankedWordAssessment]]:
+        """
+        Ranks all candidate words in a single LLM call. Definitions,
+        examples and tags are requested only for the `top_picks`
+        best suitable words. Returns assessments sorted by rank.
+        """
         user_language_description = convert_iso639_language_code_to_full_name(
             user_language
         )
 
         system_prompt_template = (
-            'You are an AI language expert. Your task is to assess a word '
-            'from {target_language_full_name} for a '
+            'You are an AI language expert. Your task is to assess a list of '
+            'words from {target_language_full_name} for a '
             '{user_language_description}-speaking '
             'learner at the {language_level_value} level.\n'
             'Focus ONLY on how common, widely known, and generally suitable '
-            'the word itself is for this level. '
+            'each word itself is for this level. '
             'Do NOT assess accent marking or specific grammatical nuances'
             ' unless they make the word unsuitable.\n'
-            'Provide your confidence level in this assessment '
+            'Provide your confidence level in each assessment '
             "('HIGH', 'MEDIUM', 'LOW')."
         )
         user_prompt_template = (
-            'Word to assess: {word_to_assess}\n\n'
+            'Words to assess:\n{words_to_assess}\n\n'
             'Based on your knowledge of {target_language_full_name} and '
             'typical vocabulary for {language_level_value} learners:\n'
-            '1. Is this word commonly used, widely known, and generally '
-            'suitable for this level?\n'
-            '2. Provide a brief reasoning for your decision.\n'
-            '3. Provide a list of the vocabulary topics covered in a JSON '
-            "object with key 'vocabulary' in the 'grammar_tags' field.\n"
-            'Use the following tag list. Each tag either is or is not '
-            'in the exercise:\n'
-            f'Vocabulary Tags: {VOCABULARY_TAGS}\n'
-            '4. What is your confidence level in this assessment '
-            '(HIGH, MEDIUM, LOW)?\n\n'
+            '1. For EVERY word decide whether it is commonly used, widely '
+            'known, and generally suitable for this level, and give your '
+            'confidence level (HIGH, MEDIUM, LOW).\n'
+            '2. Rank all words by suitability, 1 being the best.\n'
+            '3. For the {top_picks} best suitable words ONLY, provide:\n'
+            '- a concise dictionary-like definition IN '
+            '{target_language_full_name}, simple and understandable for a '
+            '{language_level_value} learner;\n'
+            '- one or two simple example sentences IN '
+            '{target_language_full_name} that clearly illustrate the '
+            "word's meaning;\n"
+            '- the vocabulary topics of the word in a JSON object with key '
+            "'vocabulary' in the 'grammar_tags' field, using the following "
+            f'tag list: {VOCABULARY_TAGS}\n'
+            'Leave these fields empty for all other words.\n\n'
             '{format_instructions}'
         )
 
+        metric_labels = dict(
+            exercise_type=ExerciseType.CHOOSE_ACCENT.value,
+            level=language_level.value,
+            user_language=user_language,
+            target_language=target_language_full_name,
+            llm_model=self.llm_service.model.model_name,
+        )
+        start_time = time.monotonic()
         try:
-            assessment: WordSuitabilityAssessment = (
-                await self._run_llm_generation_chain(
-                    pydantic_output_model=WordSuitabilityAssessment,
-                    specific_instructions='',
-                    user_language_code=user_language,
-                    target_language=target_language_full_name,
-                    language_level=language_level,
-                    topic=ExerciseTopic.GENERAL,
-                    user_prompt_text=user_prompt_template,
-                    system_prompt_override=system_prompt_template,
-                    additional_request_data={
-                        'target_language_full_name': target_language_full_name,
-                        'user_language_description': user_language_description,
-                        'language_level_value': language_level.value,
-                        'word_to_assess': word_no_accent,
-                    },
+            with get_usage_metadata_callback() as usage_callback:
+                batch_assessment: WordBatchAssessment = (
+                    await self._run_llm_generation_chain(
+                        pydantic_output_model=WordBatchAssessment,
+                        specific_instructions='',
+                        user_language_code=user_language,
+                        target_language=target_language_full_name,
+                        language_level=language_level,
+                        topic=ExerciseTopic.GENERAL,
+                        user_prompt_text=user_prompt_template,
+                        system_prompt_override=system_prompt_template,
+                        additional_request_data={
+                            'target_language_full_name': (
+                                target_language_full_name
+                            ),
+                            'user_language_description': (
+                                user_language_description
+                            ),
+                            'language_level_value': language_level.value,
+                            'words_to_assess': '\n'.join(
+                                f'- {word}' for word in words_no_accent
+                            ),
+                            'top_picks': top_picks,
+                        },
+                    )
                 )
-            )
-            return assessment
         except Exception as e:
             logger.error(
-                f'Error during LLM word suitability assessment for '
-                f"'{word_no_accent}': {e}",
+                f'Error during batched LLM word assessment for '
+                f'{len(words_no_accent)} words: {e}',
                 exc_info=True,
             )
             return None
-
-    async def _get_word_definition_llm(
-        self,
-        word_no_accent: str,
-        word_with_accent: str,
-        target_language_full_name: str,
-        language_level: LanguageLevel,
-    ) -> Optional[WordDefinitionAndExamples]:
-        system_prompt_template = (
-            'You are a helpful AI language assistant. Your task is to '
-            'provide a dictionary-like entry '
-            'for a word in {target_language_full_name} for a '
-            '{language_level_value} learner. '
-            'The definition and examples MUST be in '
-            '{target_language_full_name}.'
+        finally:
+            BACKEND_LLM_METRICS['accent_word_assessment_time'].labels(
+                **metric_labels
+            ).observe(time.monotonic() - start_time)
+
+        input_tokens = sum(
+            usage.get('input_tokens', 0)
+            for usage in usage_callback.usage_metadata.values()
         )
-        user_prompt_template = (
-            "For the {target_language_full_name} word '{word_to_define}'"
-            " (the original form with accent is '{word_for_context}'):\n"
-            '1. Provide a concise dictionary-like definition of '
-            "'{word_to_define}' IN {target_language_full_name}. "
-            'The definition should be simple and understandable for a '
-            '{language_level_value} learner.\n'
-            '2. Provide one or two simple example sentences using '
-            "'{word_to_define}' IN {target_language_full_name}. "
-            'The examples should also be suitable for a '
-            '{language_level_value} learner and clearly illustrate '
-            "the word's meaning.\n\n"
-            '{format_instructions}'
+        output_tokens = sum(
+            usage.get('output_tokens', 0)
+            for usage in usage_callback.usage_metadata.values()
         )
-
-        try:
-            definition_and_examples: WordDefinitionAndExamples = (
-                await self._run_llm_generation_chain(
-                    pydantic_output_model=WordDefinitionAndExamples,
-                    specific_instructions='',
-                    user_language_code='en',
-                    target_language=target_language_full_name,
-                    language_level=language_level,
-                    topic=ExerciseTopic.GENERAL,
-                    user_prompt_text=user_prompt_template,
-                    system_prompt_override=system_prompt_template,
-                    additional_request_data={
-                        'target_language_full_name': target_language_full_name,
-                        'language_level_value': language_level.value,
-                        'word_to_define': word_no_accent,
-                        'word_for_context': word_with_accent,
-                    },
-                )
-            )
-            return definition_and_examples
-        except Exception as e:
-            logger.error(
-                f'Error during LLM word definition generation for '
-                f"'{word_no_accent}': {e}",
-                exc_info=True,
-            )
-            return None
-
-    async def _fetch_word_candidate(self) -> Optional[str]:
-        if not self.http_client:
-            logger.error('HTTPX client not provided')
-            return None
-        try:
-            resp = await self.http_client.get(
-                'https://rechnik.chitanka.info/random',
-                follow_redirects=True,
-                timeout=HTTPX_TIMEOUT,
-            )
-            resp.raise_for_status()
-            tree = html.fromstring(resp.text)
-            word_elements = tree.xpath(
-                '/html/body/div[2]/div[2]/div[1]/h2/span[1]'
-            )
-            if not word_elements:
-                return None
-            word = word_elements[0].text_content().strip()
-            return word
-        except httpx.RequestError as e:
-            logger.error(
-                f'HTTPX RequestError while fetching word candidate: {e}'
-            )
-        except html.etree.ParserError as e:
-            logger.error(
-                f'lxml ParserError while fetching word candidate: {e}'
-            )
-        except Exception as e:
-            logger.error(
-                f'Unexpected error while fetching word candidate: {e}',
-                exc_info=True,
-            )
-        return None
-
-    async def _fetch_word_candidates_batch(
-        self, n: int = BATCH_FETCH_NUM
-    ) -> List[str]:
-        tasks = [self._fetch_word_candidate() for _ in range(n)]
-        words_results = await asyncio.gather(*tasks, return_exceptions=True)
-        valid_words = []
-        for i, res in enumerate(words_results):
-            if isinstance(res, Exception):
-                logger.error(f'Error in _fetch_word_candidate task {i}: {res}')
-            elif isinstance(res, str):
-                valid_words.append(res)
-        return valid_words
+        BACKEND_LLM_METRICS['input_tokens'].labels(**metric_labels).inc(
+            input_tokens
+        )
+        BACKEND_LLM_METRICS['output_tokens'].labels(**metric_labels).inc(
+            output_tokens
+        )
+        logger.info(
+            f'Assessed {len(words_no_accent)} accent words in one LLM call '
+            f'({time.monotonic() - start_time:.1f}s, '
+            f'{input_tokens} input / {output_tokens} output tokens).'
+        )
+        return sorted(batch_assessment.assessments, key=lambda a: a.rank)
 
     @staticmethod
     def _has_accent_nfd(word: str) -> bool:
@@ -329,6 +288,82 @@ class ChooseAccentGenerator(BaseExerciseGenerator):
                     res.append(incorrect_word_nfc)
         return list(set(res))
 
+    @staticmethod
+    def build_word_candidate(
+        raw_word: str,
+        language: str,
+        language_level: LanguageLevel,
+    ) -> Optional[AccentWord]:
+        """
+        Validates a scraped word and precomputes its accent data.
+        Returns None for words without an accent or with an unsuitable
+        number of vowels.
+        """
+        word_with_accent_nfc = unicodedata.normalize('NFC', raw_word.strip())
+
+        if not ChooseAccentGenerator._has_accent_nfd(word_with_accent_nfc):
+            logger.info(
+                f"Word candidate '{word_with_accent_nfc}' skipped "
+                f'(initial validation: word has no accent).'
+            )
+            return None
+
+        vowel_count = len(
+            ChooseAccentGenerator._get_vowels_indexes_nfc(word_with_accent_nfc)
+        )
+        if not MIN_VOWELS <= vowel_count <= MAX_VOWELS:
+            logger.info(
+                f"Word candidate '{word_with_accent_nfc}' skipped "
+                f'(initial validation: {vowel_count=}).'
+            )
+            return None
+
+        # Indexes are stored relative to the word without the accent mark,
+        # which is what the exercise options are built from.
+        decomposed = unicodedata.normalize('NFD', word_with_accent_nfc)
+        accent_mark_pos = decomposed.find('\u0300')
+        word_no_accent = unicodedata.normalize(
+            'NFC', decomposed.replace('\u0300', '')
+        )
+        accent_index = (
+            len(
+                unicodedata.normalize(
+                    'NFC', decomposed[:accent_mark_pos].replace('\u0300', '')
+                )
+            )
+            - 1
+        )
+        return AccentWord(
+            word_id=None,
+            language=language,
+            word=word_with_accent_nfc,
+            word_no_accent=word_no_accent,
+            accent_index=accent_index,
+            vowel_indexes=ChooseAccentGenerator._get_vowels_indexes_nfc(
+                word_no_accent
+            ),
+            language_level=language_level,
+            is_suitable=None,
+            confidence_level=None,
+            meaning=None,
+            used_at=None,
+        )
+
+    async def _claim_word_from_bank(
+        self, target_language: str, language_level: LanguageLevel
+    ) -> Optional[AccentWord]:
+        levels = list(LanguageLevel)
+        levels_up_to_requested = levels[: levels.index(language_level) + 1]
+        async with self.session_maker() as session:
+            repo = SQLAlchemyAccentWordRepository(session)
+            word = await repo.claim_available_word(
+                target_language, levels_up_to_requested
+            )
+            if not word:
+                word = await repo.claim_available_word(target_language, levels)
+            await session.commit()
+        return word
+
     async def generate(
         self,
         user_language: str,
@@ -344,165 +379,70 @@ class ChooseAccentGenerator(BaseExerciseGenerator):
                 f'{target_language}'
             )
 
-        word_candidates = await self._fetch_word_candidates_batch()
-
-        if not word_candidates:
+        accent_word = await self._claim_word_from_bank(
+            target_language, language_level
+        )
+        if not accent_word or not accent_word.meaning:
             logger.warning(
-                'Failed to fetch any word candidates for '
-                'accent exercise generation.'
+                f'Accent word bank for {target_language} is empty, '
+                f'waiting for the harvester to refill it.'
             )
             raise ChooseAccentGenerationError(
-                'Failed to fetch any word candidates.'
-            )
-
-        for word_with_accent_candidate in word_candidates:
-            word_with_accent_nfc = unicodedata.normalize(
-                'NFC', word_with_accent_candidate
-            )
-
-            if not ChooseAccentGenerator._has_accent_nfd(word_with_accent_nfc):
-                logger.info(
-                    f"Word candidate '{word_with_accent_nfc}' skipped "
-                    f'(initial validation: word has no accent).'
-                )
-                continue
-
-            vowel_count = len(
-                ChooseAccentGenerator._get_vowels_indexes_nfc(
-                    word_with_accent_nfc
-                )
-            )
-            if not MIN_VOWELS <= vowel_count <= MAX_VOWELS:
-                logger.info(
-                    f"Word candidate '{word_with_accent_nfc}' skipped "
-                    f'(initial validation: {vowel_count=}).'
-                )
-                continue
-
-            word_no_accent = ''.join(
-                c
-                for c in unicodedata.normalize('NFD', word_with_accent_nfc)
-                if unicodedata.category(c) != 'Mn'
-            )
-
-            suitability_assessment = await self._assess_word_suitability_llm(
-                word_no_accent,
-                target_language,
-                user_language,
-                language_level,
-            )
-
-            if (
-                not suitability_assessment
-                or not suitability_assessment.is_common_and_suitable
-                or suitability_assessment.confidence_level == 'LOW'
-            ):
-                reason = (
-                    suitability_assessment.reasoning
-                    if suitability_assessment
-                    else 'LLM assessment failed'
-                )
-                conf_level = (
-                    suitability_assessment.confidence_level
-                    if suitability_assessment
-                    else 'N/A'
-                )
-                logger.info(
-                    f"Word '{word_no_accent}' skipped by LLM suitability: "
-                    f'{reason} (Confidence: {conf_level}).'
-                )
-                continue
-            logger.info(
-                f"Word '{word_no_accent}' passed LLM suitability "
-                f'(Confidence: {suitability_assessment.confidence_level}). '
-                f'Reason: {suitability_assessment.reasoning}'
-            )
-
-            definition_and_examples = await self._get_word_definition_llm(
-                word_no_accent,
-                word_with_accent_nfc,
-                target_language,
-                language_level,
+                'No suitable word available in the word bank.'
             )
 
-            if (
-                not definition_and_examples
-                or not definition_and_examples.meaning
-            ):
-                logger.warning(
-                    f'LLM failed to generate definition for '
-                    f"'{word_no_accent}', skipping."
-                )
-                continue
-
-            formatted_meaning = f'Значение: {definition_and_examples.meaning}'
-            if definition_and_examples.examples:
-                formatted_meaning += '\nПримери:\n' + '\n'.join(
-                    f'- {ex}' for ex in definition_and_examples.examples
-                )
-            logger.info(
-                f"LLM generated meaning for '{word_no_accent}': "
-                f'{formatted_meaning[:100]}...'
+        word_with_accent_nfc = accent_word.word
+        formatted_meaning = f'Значение: {accent_word.meaning}'
+        if accent_word.examples:
+            formatted_meaning += '\nПримери:\n' + '\n'.join(
+                f'- {ex}' for ex in accent_word.examples
             )
 
-            incorrect_options = (
-                ChooseAccentGenerator._generate_incorrect_accents_nfc(
-                    word_with_accent_nfc
-                )
-            )
-            if not incorrect_options or len(incorrect_options) < 1:
-                logger.warning(
-                    f'Could not generate sufficient incorrect accent '
-                    f"options for '{word_with_accent_nfc}', skipping."
-                )
-                continue
-
-            all_options = [word_with_accent_nfc] + incorrect_options
-
-            grammar_tags = definition_and_examples.grammar_tags
-            grammar_tags['grammar'] = grammar_tags.get('grammar', []) + [
-                'accent'
-            ]
-
-            exercise = Exercise(
-                exercise_id=None,
-                exercise_type=ExerciseType.CHOOSE_ACCENT,
-                exercise_language=target_language,
-                language_level=language_level,
-                topic=ExerciseTopic.GENERAL,
-                exercise_text=get_text(
-                    ExerciseType.CHOOSE_ACCENT, user_language_code
-                ),
-                grammar_tags=grammar_tags,
-                data=ChooseAccentExerciseData(
-                    options=all_options,
-                    meaning=formatted_meaning,
-                ),
+        incorrect_options = (
+            ChooseAccentGenerator._generate_incorrect_accents_nfc(
+                word_with_accent_nfc
             )
-            correct_answer_obj = ChooseAccentAnswer(
-                answer=word_with_accent_nfc
+        )
+        if not incorrect_options:
+            raise ChooseAccentGenerationError(
+                f'Could not generate incorrect accent options for '
+                f"'{word_with_accent_nfc}'."
             )
 
-            exercise_for_assessor = ExerciseForAssessor(
-                text=exercise.exercise_text,
+        all_options = [word_with_accent_nfc] + incorrect_options
+
+        grammar_tags = dict(accent_word.grammar_tags)
+        grammar_tags['grammar'] = grammar_tags.get('grammar', []) + ['accent']
+
+        exercise = Exercise(
+            exercise_id=None,
+            exercise_type=ExerciseType.CHOOSE_ACCENT,
+            exercise_language=target_language,
+            language_level=language_level,
+            topic=ExerciseTopic.GENERAL,
+            exercise_text=get_text(
+                ExerciseType.CHOOSE_ACCENT, user_language_code
+            ),
+            grammar_tags=grammar_tags,
+            data=ChooseAccentExerciseData(
                 options=all_options,
-                correct_answer=word_with_accent_nfc,
-                correct_options=[word_with_accent_nfc],
-                incorrect_options=incorrect_options,
-                exercise_type=ExerciseType.CHOOSE_ACCENT,
-                language_level=language_level,
-            )
-
-            logger.info(
-                f'Generated CHOOSE_ACCENT exercise for word: '
-                f'{word_with_accent_nfc}'
-            )
-            return exercise, correct_answer_obj, exercise_for_assessor
-
-        logger.warning(
-            'Failed to generate a suitable CHOOSE_ACCENT '
-            'exercise after all checks.'
+                meaning=formatted_meaning,
+            ),
+        )
+        correct_answer_obj = ChooseAccentAnswer(answer=word_with_accent_nfc)
+
+        exercise_for_assessor = ExerciseForAssessor(
+            text=exercise.exercise_text,
+            options=all_options,
+            correct_answer=word_with_accent_nfc,
+            correct_options=[word_with_accent_nfc],
+            incorrect_options=incorrect_options,
+            exercise_type=ExerciseType.CHOOSE_ACCENT,
+            language_level=language_level,
         )
-        raise ChooseAccentGenerationError(
-            'No suitable word found after all processing steps.'
+
+        logger.info(
+            f'Generated CHOOSE_ACCENT exercise for word: '
+            f'{word_with_accent_nfc}'
         )
+        return exercise, correct_answer_obj, exercise_for_assessor
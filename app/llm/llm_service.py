@@ -1,9 +1,10 @@
 import logging
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Tuple
+from typing import AsyncGenerator, Dict, List, Optional, Tuple
 
 import httpx
 
+from app.config import settings
 from app.core.configs.enums import (
     ExerciseStatus,
     ExerciseType,
@@ -24,7 +25,14 @@ from app.llm.factories import (
 )
 from app.llm.llm_base import BaseLLMService
 from app.metrics import BACKEND_LLM_METRICS
-from app.utils.html_cleaner import clean_html_for_telegram
+from app.services.exercise_deduplicator import (
+    DuplicateExerciseError,
+    ExerciseDeduplicator,
+)
+from app.utils.html_cleaner import (
+    IncrementalHTMLCleaner,
+    clean_html_for_telegram,
+)
 from app.utils.language_code_converter import (
     convert_iso639_language_code_to_full_name,
 )
@@ -32,16 +40,69 @@ from app.utils.language_code_converter import (
 logger = logging.getLogger(__name__)
 
 ASSESSOR_EXERCISE_TYPES_EXCLUDE = (ExerciseType.CHOOSE_ACCENT,)
+DEDUPLICATION_EXERCISE_TYPES_EXCLUDE = (ExerciseType.CHOOSE_ACCENT,)
 
 
 class LLMService(BaseLLMService, LLMProvider):
-    def __init__(self, http_client: httpx.AsyncClient, *args, **kwargs):
+    def __init__(
+        self,
+        http_client: httpx.AsyncClient,
+        *args,
+        exercise_deduplicator: Optional[ExerciseDeduplicator] = None,
+        **kwargs,
+    ):
         super().__init__(*args, **kwargs)
         self.http_client = http_client
+        self.exercise_deduplicator = exercise_deduplicator
         self.exercise_quality_assessor = ExerciseQualityAssessor(
             *args, **kwargs
         )
 
+    async def _is_duplicate(
+        self, exercise: Exercise, user_language: str
+    ) -> bool:
+        """Checks a generated exercise against the published ones."""
+        if (
+            not self.exercise_deduplicator
+            or exercise.exercise_type in DEDUPLICATION_EXERCISE_TYPES_EXCLUDE
+        ):
+            return False
+
+        metric_labels = dict(
+            exercise_type=exercise.exercise_type.value,
+            level=exercise.language_level.value,
+            user_language=user_language,
+            target_language=exercise.exercise_language,
+            llm_model=self.model.model_name,
+        )
+        try:
+            duplicate = await self.exercise_deduplicator.find_duplicate(
+                exercise
+            )
+        except Exception as e:
+            logger.error(
+                f'Error during duplicate check, skipping it: {e}',
+                exc_info=True,
+            )
+            return False
+
+        BACKEND_LLM_METRICS['exercise_duplicate_checks'].labels(
+            **metric_labels
+        ).inc()
+        if not duplicate:
+            return False
+
+        duplicate_id, similarity = duplicate
+        BACKEND_LLM_METRICS['exercises_rejected_as_duplicate'].labels(
+            **metric_labels
+        ).inc()
+        logger.warning(
+            f'Generated {exercise.exercise_type.value} exercise duplicates '
+            f'published exercise {duplicate_id} '
+            f'(similarity {similarity:.2f}).'
+        )
+        return True
+
     async def generate_exercise(
         self,
         user_language: str,
@@ -73,18 +134,26 @@ class LLMService(BaseLLMService, LLMProvider):
                 convert_iso639_language_code_to_full_name(user_language)
             )
 
-            (
-                new_exercise,
-                new_answer,
-                exercise_for_quality_assessor,
-            ) = await generator.generate(
-                user_language=user_language_for_prompt,
-                user_language_code=user_language,
-                target_language=target_language,
-                language_level=language_level,
-                topic=topic,
-                persona=persona,
-            )
+            for _ in range(settings.exercise_duplicate_max_regenerations + 1):
+                (
+                    new_exercise,
+                    new_answer,
+                    exercise_for_quality_assessor,
+                ) = await generator.generate(
+                    user_language=user_language_for_prompt,
+                    user_language_code=user_language,
+                    target_language=target_language,
+                    language_level=language_level,
+                    topic=topic,
+                    persona=persona,
+                )
+                if not await self._is_duplicate(new_exercise, user_language):
+                    break
+            else:
+                raise DuplicateExerciseError(
+                    f'All generated {exercise_type.value} exercises for '
+                    f'{target_language} duplicate published ones.'
+                )
 
             if exercise_type not in ASSESSOR_EXERCISE_TYPES_EXCLUDE:
                 try:
@@ -177,6 +246,41 @@ class LLMService(BaseLLMService, LLMProvider):
         """
         Generates a detailed, LLM-powered weekly report with error analysis.
         """
+        full_prompt = self._build_detailed_report_prompt(
+            context, user_language, target_language
+        )
+        response = await self.model.ainvoke(full_prompt)
+
+        report_text = clean_html_for_telegram(response.text())
+
+        return report_text
+
+    async def stream_detailed_report_text(
+        self,
+        context: dict,
+        user_language: str,
+        target_language: str,
+    ) -> AsyncGenerator[str, None]:
+        """
+        Streams the detailed weekly report, yielding cleaned text as the
+        tokens arrive. The yielded pieces add up to the text
+        generate_detailed_report_text would return.
+        """
+        full_prompt = self._build_detailed_report_prompt(
+            context, user_language, target_language
+        )
+        cleaner = IncrementalHTMLCleaner()
+        async for chunk in self.model.astream(full_prompt):
+            cleaned = cleaner.feed(chunk.text())
+            if cleaned:
+                yield cleaned
+
+    @staticmethod
+    def _build_detailed_report_prompt(
+        context: dict,
+        user_language: str,
+        target_language: str,
+    ) -> str:
         system_prompt_template = (
             'You are an experienced and supportive language learning coach '
             'for {target_language}. '
@@ -286,9 +390,4 @@ class LLMService(BaseLLMService, LLMProvider):
                 incorrect_attempts_str=incorrect_attempts_str
                 )}"
         )
-
-        response = await self.model.ainvoke(full_prompt)
-
-        report_text = clean_html_for_telegram(response.content)
-
-        return report_text
+        return full_prompt
@@ -1,7 +1,24 @@
-from prometheus_client import Counter, Gauge, Histogram
+import logging
+import os
+
+from prometheus_client import (
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    multiprocess,
+)
+
+logger = logging.getLogger(__name__)
 
 METRIC_PREFIX = 'backend_'
 
+# prometheus_client switches to multiprocess mode when this variable is
+# set before it is imported. Each process then writes its values to
+# per-process files in that directory, and they are merged at scrape time.
+MULTIPROC_DIR_ENV = 'PROMETHEUS_MULTIPROC_DIR'
+
 backend_exercise_metrics_label_names = [
     'exercise_type',
     'level',
@@ -43,6 +60,7 @@ BACKEND_EXERCISE_METRICS = {
         METRIC_PREFIX + 'untouched_exercises_total',
         'Total number of untouched exercises',
         labelnames=['exercise_language'],
+        multiprocess_mode='mostrecent',
     ),
 }
 
@@ -63,6 +81,7 @@ BACKEND_USER_METRICS = {
         METRIC_PREFIX + 'active_users_total',
         'Total number of active users',
         labelnames=backend_user_metrics_label_names,
+        multiprocess_mode='mostrecent',
     ),
     'session_length': Histogram(
         METRIC_PREFIX + 'user_session_length_seconds',
@@ -155,6 +174,27 @@ BACKEND_LLM_METRICS = {
         'Total number of output tokens used by LLM',
         labelnames=backend_llm_metrics_label_names,
     ),
+    'exercise_duplicate_checks': Counter(
+        METRIC_PREFIX + 'exercise_duplicate_checks_total',
+        'Total number of generated exercises checked for near-duplicates',
+        labelnames=backend_llm_metrics_label_names,
+    ),
+    'exercises_rejected_as_duplicate': Counter(
+        METRIC_PREFIX + 'exercise_rejected_as_duplicate_total',
+        'Total number of generated exercises rejected as near-duplicates',
+        labelnames=backend_llm_metrics_label_names,
+    ),
+    'accent_word_assessment_time': Histogram(
+        METRIC_PREFIX + 'accent_word_assessment_time_seconds',
+        'Time spent for one batched LLM assessment of accent words',
+        labelnames=backend_llm_metrics_label_names,
+        buckets=(1, 2, 5, 10, 15, 20, 30, 45, 60),
+    ),
+    'accent_words_harvested': Counter(
+        METRIC_PREFIX + 'accent_words_harvested_total',
+        'Total number of harvested accent words by assessment result',
+        labelnames=['target_language', 'result'],
+    ),
 }
 
 backend_translator_metrics_label_names = [
@@ -179,6 +219,103 @@ BACKEND_TRANSLATOR_METRICS = {
     ),
 }
 
+BACKEND_TTS_METRICS = {
+    'audio_cache_lookups': Counter(
+        METRIC_PREFIX + 'tts_audio_cache_lookups_total',
+        'Story audio cache lookups by result (hit, partial, miss)',
+        labelnames=['result'],
+    ),
+    'chunks_per_text': Histogram(
+        METRIC_PREFIX + 'tts_chunks_per_text',
+        'Number of sentence chunks a text was split into for synthesis',
+        buckets=(1, 2, 3, 4, 6, 8, 12, 16),
+    ),
+    'chunk_synthesis_time': Histogram(
+        METRIC_PREFIX + 'tts_chunk_synthesis_time_seconds',
+        'Wall time of one successful chunk synthesis request',
+        buckets=(0.5, 1, 2, 5, 10, 20, 30, 60),
+    ),
+    'chunk_retries': Counter(
+        METRIC_PREFIX + 'tts_chunk_retries_total',
+        'Chunk synthesis attempts retried after a failure',
+    ),
+    'transcode_time': Histogram(
+        METRIC_PREFIX + 'tts_transcode_time_seconds',
+        'Wall time of one PCM to OGG Opus ffmpeg transcode',
+        buckets=(0.05, 0.1, 0.25, 0.5, 1, 2, 5, 10, 30, 60),
+    ),
+    'transcode_realtime_factor': Histogram(
+        METRIC_PREFIX + 'tts_transcode_realtime_factor',
+        'Transcode wall time divided by the audio duration',
+        buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1),
+    ),
+    'transcode_cpu_per_audio_second': Histogram(
+        METRIC_PREFIX + 'tts_transcode_cpu_seconds_per_audio_second',
+        'ffmpeg CPU seconds spent per second of transcoded audio',
+        buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1),
+    ),
+}
+
+BACKEND_CIRCUIT_BREAKER_METRICS = {
+    'state': Gauge(
+        METRIC_PREFIX + 'circuit_breaker_state',
+        'Circuit breaker state: 0 closed, 1 open, 2 half-open',
+        labelnames=['name'],
+        multiprocess_mode='livemax',
+    ),
+    'calls': Counter(
+        METRIC_PREFIX + 'circuit_breaker_calls_total',
+        'Calls passed through a circuit breaker by result',
+        labelnames=['name', 'result'],
+    ),
+    'rejected': Counter(
+        METRIC_PREFIX + 'circuit_breaker_rejected_total',
+        'Calls rejected by an open circuit breaker',
+        labelnames=['name'],
+    ),
+}
+
+BACKEND_CELERY_PUBLISHER_METRICS = {
+    'loop_blocking_seconds': Histogram(
+        METRIC_PREFIX + 'celery_publish_loop_blocking_seconds',
+        'Time a task enqueue holds the event loop without awaiting',
+        labelnames=['mode'],
+        buckets=(
+            0.00005,
+            0.0001,
+            0.00025,
+            0.0005,
+            0.001,
+            0.0025,
+            0.005,
+            0.01,
+            0.025,
+            0.05,
+            0.1,
+            0.5,
+        ),
+    ),
+    'batch_size': Histogram(
+        METRIC_PREFIX + 'celery_publish_batch_size',
+        'Number of task messages pushed to Redis in one pipeline',
+        buckets=(1, 2, 5, 10, 25, 50, 100, 250, 500),
+    ),
+    'flush_duration_seconds': Histogram(
+        METRIC_PREFIX + 'celery_publish_flush_duration_seconds',
+        'Duration of pushing one batch of task messages to Redis',
+        buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1),
+    ),
+    'flush_failures': Counter(
+        METRIC_PREFIX + 'celery_publish_flush_failures_total',
+        'Batches of task messages that could not be pushed to Redis',
+    ),
+    'buffered': Gauge(
+        METRIC_PREFIX + 'celery_publish_buffered',
+        'Task messages waiting in the publisher buffer',
+        multiprocess_mode='livesum',
+    ),
+}
+
 BACKEND_NOTIFICATION_METRICS = {
     'enqueue_attempt_total': Counter(
         METRIC_PREFIX + 'notification_enqueue_attempt_total',
@@ -201,4 +338,70 @@ BACKEND_NOTIFICATION_METRICS = {
         ['notification_type'],
         buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2, 5, 10),
     ),
+    'relevance_check_total': Counter(
+        METRIC_PREFIX + 'notification_relevance_check_total',
+        'Notification relevance checks by outcome',
+        ['notification_type', 'result'],
+    ),
+    'relevance_snapshot_miss_total': Counter(
+        METRIC_PREFIX + 'notification_relevance_snapshot_miss_total',
+        'Relevance checks that had to load the profile from the database',
+    ),
 }
+
+
+def is_multiprocess() -> bool:
+    return MULTIPROC_DIR_ENV in os.environ
+
+
+def metrics_registry() -> CollectorRegistry:
+    """
+    Registry to expose: the default one, or in multiprocess mode one that
+    merges the files of all processes.
+    """
+    if not is_multiprocess():
+        return REGISTRY
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return registry
+
+
+def _is_process_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def mark_dead_processes_metrics() -> int:
+    """
+    Drops the live gauge values of processes that no longer exist, e.g.
+    crashed web workers. Counters and histograms of dead processes are
+    kept, so the merged totals do not go down. Returns the number of
+    processes marked dead.
+    """
+    if not is_multiprocess():
+        return 0
+    path = os.environ[MULTIPROC_DIR_ENV]
+    pids: set[int] = set()
+    for file_name in os.listdir(path):
+        if not file_name.endswith('.db'):
+            continue
+        file_pid = file_name[: -len('.db')].rsplit('_', 1)[-1]
+        if file_pid.isdigit():
+            pids.add(int(file_pid))
+    dead_pids = [pid for pid in pids if not _is_process_alive(pid)]
+    for pid in dead_pids:
+        multiprocess.mark_process_dead(pid, path)
+    if dead_pids:
+        logger.info(f'Marked metrics of dead processes {dead_pids} as dead.')
+    return len(dead_pids)
+
+
+def mark_current_process_metrics_dead() -> None:
+    """Drops the live gauge values of this process when it shuts down."""
+    if is_multiprocess():
+        multiprocess.mark_process_dead(os.getpid())
@@ -0,0 +1,76 @@
+import asyncio
+import logging
+from typing import List, Optional
+
+import httpx
+from lxml import etree, html
+
+from app.infrastructure.circuit_breaker import (
+    CircuitBreaker,
+    get_circuit_breaker,
+)
+
+logger = logging.getLogger(__name__)
+
+DICTIONARY_CIRCUIT_BREAKER_NAME = 'accent_dictionary'
+
+RANDOM_WORD_URL = 'https://rechnik.chitanka.info/random'
+RANDOM_WORD_XPATH = '/html/body/div[2]/div[2]/div[1]/h2/span[1]'
+HTTPX_TIMEOUT = 10
+
+
+def parse_random_word_page(page_html: str) -> Optional[str]:
+    """Extracts the accented headword from a dictionary word page."""
+    try:
+        tree = html.fromstring(page_html)
+    except (etree.ParserError, ValueError) as e:
+        logger.error(f'Failed to parse dictionary page: {e}')
+        return None
+    word_elements = tree.xpath(RANDOM_WORD_XPATH)
+    if not word_elements:
+        return None
+    word = word_elements[0].text_content().strip()
+    return word or None
+
+
+class AccentDictionaryClient:
+    """Fetches random words with stress marks from rechnik.chitanka.info."""
+
+    def __init__(
+        self,
+        http_client: httpx.AsyncClient,
+        random_word_url: str = RANDOM_WORD_URL,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+    ):
+        self.http_client = http_client
+        self.random_word_url = random_word_url
+        self.circuit_breaker = circuit_breaker or get_circuit_breaker(
+            DICTIONARY_CIRCUIT_BREAKER_NAME
+        )
+
+    async def fetch_random_word(self) -> Optional[str]:
+        return await self.circuit_breaker.call(self._fetch_random_word)
+
+    async def _fetch_random_word(self) -> Optional[str]:
+        try:
+            resp = await self.http_client.get(
+                self.random_word_url,
+                follow_redirects=True,
+                timeout=HTTPX_TIMEOUT,
+            )
+            resp.raise_for_status()
+            return parse_random_word_page(resp.text)
+        except httpx.HTTPError as e:
+            logger.error(f'HTTP error while fetching word candidate: {e}')
+        except Exception as e:
+            logger.error(
+                f'Unexpected error while fetching word candidate: {e}',
+                exc_info=True,
+            )
+        return None
+
+    async def fetch_random_words(self, n: int) -> List[str]:
+        results = await asyncio.gather(
+            *(self.fetch_random_word() for _ in range(n))
+        )
+        return [word for word in results if word]
@@ -0,0 +1,191 @@
+import asyncio
+import contextlib
+import logging
+import re
+import subprocess
+import time
+from typing import List, Optional
+
+from app.config import settings
+from app.metrics import BACKEND_TTS_METRICS
+
+logger = logging.getLogger(__name__)
+
+PCM_SAMPLE_WIDTH_BYTES = 2
+_BENCH_RE = re.compile(rb'bench: utime=([\d.]+)s stime=([\d.]+)s')
+
+
+def _parse_cpu_seconds(stderr: bytes) -> Optional[float]:
+    """Reads user+system CPU time from ffmpeg `-benchmark` output."""
+    match = _BENCH_RE.search(stderr)
+    if not match:
+        return None
+    return float(match.group(1)) + float(match.group(2))
+
+
+class FFmpegTranscoder:
+    """
+    Runs ffmpeg with input on stdin and output on stdout, so no temporary
+    files are touched. A semaphore caps the number of concurrent ffmpeg
+    processes; a process that times out or whose caller is cancelled is
+    killed.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = settings.ffmpeg_max_concurrency,
+        timeout_seconds: float = settings.ffmpeg_timeout_seconds,
+        ffmpeg_binary: str = 'ffmpeg',
+    ):
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self.timeout_seconds = timeout_seconds
+        self.ffmpeg_binary = ffmpeg_binary
+
+    async def run_process(
+        self, command: List[str], input_data: bytes
+    ) -> Optional[tuple[bytes, bytes]]:
+        """
+        Pipes input_data through the command inside the pool.
+        Returns (stdout, stderr), or None on timeout or non-zero exit.
+        """
+        async with self._semaphore:
+            process = await asyncio.create_subprocess_exec(
+                *command,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+            )
+            try:
+                stdout, stderr = await asyncio.wait_for(
+                    process.communicate(input_data),
+                    timeout=self.timeout_seconds,
+                )
+            except asyncio.TimeoutError:
+                logger.error(
+                    f'{command[0]} timed out after {self.timeout_seconds}s, '
+                    f'killing pid {process.pid}.'
+                )
+                await self._kill(process)
+                return None
+            except asyncio.CancelledError:
+                await self._kill(process)
+                raise
+
+        if process.returncode != 0:
+            logger.error(
+                f'{command[0]} failed. Return code: {process.returncode}. '
+                f'Stderr: {stderr.decode(errors="ignore")}'
+            )
+            return None
+        return stdout, stderr
+
+    @staticmethod
+    async def _kill(process: asyncio.subprocess.Process) -> None:
+        if process.returncode is None:
+            with contextlib.suppress(ProcessLookupError):
+                process.kill()
+            await process.wait()
+
+    async def pcm_to_ogg_opus(
+        self,
+        pcm_data: bytes,
+        input_sample_rate: int,
+        output_sample_rate: int,
+        bitrate: str = '64k',
+    ) -> Optional[bytes]:
+        """
+        Converts raw PCM (16-bit signed little-endian, mono) to OGG Opus.
+        """
+        command = [
+            self.ffmpeg_binary,
+            '-hide_banner',
+            '-nostats',
+            '-benchmark',
+            '-f',
+            's16le',
+            '-ar',
+            str(input_sample_rate),
+            '-ac',
+            '1',
+            '-i',
+            'pipe:0',
+            '-c:a',
+            'libopus',
+            '-b:a',
+            bitrate,
+            '-vbr',
+            'on',
+            '-ar',
+            str(output_sample_rate),
+            '-f',
+            'ogg',
+            'pipe:1',
+        ]
+        started_at = time.perf_counter()
+        result = await self.run_process(command, pcm_data)
+        elapsed = time.perf_counter() - started_at
+        if result is None:
+            return None
+
+        ogg_data, stderr = result
+        audio_seconds = len(pcm_data) / (
+            input_sample_rate * PCM_SAMPLE_WIDTH_BYTES
+        )
+        BACKEND_TTS_METRICS['transcode_time'].observe(elapsed)
+        if audio_seconds:
+            BACKEND_TTS_METRICS['transcode_realtime_factor'].observe(
+                elapsed / audio_seconds
+            )
+            cpu_seconds = _parse_cpu_seconds(stderr)
+            if cpu_seconds is not None:
+                BACKEND_TTS_METRICS['transcode_cpu_per_audio_second'].observe(
+                    cpu_seconds / audio_seconds
+                )
+        return ogg_data
+
+
+if __name__ == '__main__':
+    import math
+    import resource
+    import struct
+    import sys
+
+    logging.basicConfig(level=logging.INFO)
+
+    async def benchmark(runs: int, audio_seconds: int) -> None:
+        """Transcodes a synthetic tone `runs` times through the pool."""
+        sample_rate = 24000
+        pcm = b''.join(
+            struct.pack('<h', int(8000 * math.sin(i / 10)))
+            for i in range(sample_rate * audio_seconds)
+        )
+        transcoder = FFmpegTranscoder()
+        usage_before = resource.getrusage(resource.RUSAGE_CHILDREN)
+        started_at = time.perf_counter()
+        results = await asyncio.gather(
+            *(
+                transcoder.pcm_to_ogg_opus(pcm, sample_rate, 48000)
+                for _ in range(runs)
+            )
+        )
+        elapsed = time.perf_counter() - started_at
+        usage_after = resource.getrusage(resource.RUSAGE_CHILDREN)
+        cpu_seconds = (usage_after.ru_utime - usage_before.ru_utime) + (
+            usage_after.ru_stime - usage_before.ru_stime
+        )
+        ok = sum(1 for r in results if r)
+        print(
+            f'{ok}/{runs} transcodes of {audio_seconds}s audio in '
+            f'{elapsed:.2f}s: {runs * audio_seconds / elapsed:.1f} '
+            f'audio seconds per second with '
+            f'{settings.ffmpeg_max_concurrency} concurrent processes, '
+            f'{cpu_seconds / (runs * audio_seconds):.4f} CPU seconds '
+            f'per audio second.'
+        )
+
+    asyncio.run(
+        benchmark(
+            runs=int(sys.argv[1]) if len(sys.argv) > 1 else 10,
+            audio_seconds=int(sys.argv[2]) if len(sys.argv) > 2 else 60,
+        )
+    )
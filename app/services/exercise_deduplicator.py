@@ -0,0 +1,148 @@
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config import settings
+from app.core.entities.exercise import Exercise
+from app.core.entities.exercise_fingerprint import ExerciseFingerprint
+from app.db.db import async_session_maker
+from app.db.repositories.exercise_fingerprint import (
+    SQLAlchemyExerciseFingerprintRepository,
+)
+from app.utils.minhash import (
+    estimate_similarity,
+    lsh_band_keys,
+    minhash_signature,
+    shingles,
+)
+
+logger = logging.getLogger(__name__)
+
+NON_TEXT_DATA_FIELDS = ('type', 'audio_url', 'audio_telegram_file_id')
+
+
+class DuplicateExerciseError(Exception):
+    """Raised when every generated variant duplicates a published one."""
+
+
+def exercise_data_text(data: Dict[str, Any]) -> str:
+    """Collects the learner-facing text of the exercise data."""
+    parts = []
+    for key, value in data.items():
+        if key in NON_TEXT_DATA_FIELDS:
+            continue
+        if isinstance(value, str):
+            parts.append(value)
+        elif isinstance(value, list):
+            parts.extend(item for item in value if isinstance(item, str))
+    return '\n'.join(parts)
+
+
+def build_fingerprint(
+    language: str, data: Dict[str, Any], exercise_id: Optional[int] = None
+) -> ExerciseFingerprint:
+    signature = minhash_signature(
+        shingles(exercise_data_text(data), settings.minhash_shingle_size),
+        settings.minhash_num_permutations,
+    )
+    return ExerciseFingerprint(
+        exercise_id=exercise_id,
+        exercise_language=language,
+        signature=signature,
+        band_keys=lsh_band_keys(signature, settings.minhash_lsh_bands),
+    )
+
+
+def build_fingerprints(
+    exercises: List[Tuple[int, str, Dict[str, Any]]],
+) -> List[ExerciseFingerprint]:
+    return [
+        build_fingerprint(language, data, exercise_id)
+        for exercise_id, language, data in exercises
+    ]
+
+
+class ExerciseDeduplicator:
+    """
+    Finds near-duplicates of a generated exercise among published ones
+    with MinHash signatures and a banded LSH index stored in Postgres.
+    The index is filled by index_missing() in its own leader loop;
+    published exercises it has not reached yet are compared directly.
+    Signatures are computed in a thread, off the event loop.
+    """
+
+    def __init__(
+        self,
+        session_maker: async_sessionmaker[AsyncSession] = async_session_maker,
+    ):
+        self.session_maker = session_maker
+
+    async def index_missing(self, limit: int) -> int:
+        """
+        Fingerprints up to limit published exercises missing from the
+        index. Returns the number of added fingerprints.
+        """
+        async with self.session_maker() as session:
+            repository = SQLAlchemyExerciseFingerprintRepository(session)
+            missing = await repository.get_published_without_fingerprint(limit)
+            if not missing:
+                return 0
+            fingerprints = await asyncio.to_thread(build_fingerprints, missing)
+            added = await repository.add_many(fingerprints)
+            await session.commit()
+        logger.info(
+            f'Indexed {added} published exercises for duplicate detection.'
+        )
+        return added
+
+    async def find_duplicate(
+        self, exercise: Exercise
+    ) -> Optional[Tuple[int, float]]:
+        """
+        Returns (exercise_id, similarity) of the most similar published
+        exercise if it is above the duplicate threshold.
+        """
+        language = exercise.exercise_language
+        fingerprint = await asyncio.to_thread(
+            build_fingerprint, language, exercise.data.model_dump()
+        )
+        check_limit = settings.exercise_duplicate_unindexed_check_limit
+        async with self.session_maker() as session:
+            repository = SQLAlchemyExerciseFingerprintRepository(session)
+            candidates = await repository.find_candidates(
+                language, fingerprint.band_keys
+            )
+            unindexed = await repository.get_published_without_fingerprint(
+                check_limit + 1, language
+            )
+            if len(unindexed) > check_limit:
+                logger.warning(
+                    f'Duplicate check for {language} compares only '
+                    f'{check_limit} of the published exercises missing '
+                    f'from the fingerprint index.'
+                )
+                unindexed = unindexed[:check_limit]
+            if unindexed:
+                unindexed_fingerprints = await asyncio.to_thread(
+                    build_fingerprints, unindexed
+                )
+                await repository.add_many(unindexed_fingerprints)
+                await session.commit()
+                candidates.extend(unindexed_fingerprints)
+
+        best: Optional[Tuple[int, float]] = None
+        for candidate in candidates:
+            if candidate.exercise_id is None:
+                continue
+            similarity = estimate_similarity(
+                fingerprint.signature, candidate.signature
+            )
+            if best is None or similarity > best[1]:
+                best = (candidate.exercise_id, similarity)
+
+        threshold = settings.exercise_duplicate_similarity_threshold
+        if best and best[1] >= threshold:
+            return best
+        return None
@@ -1,7 +1,10 @@
+import asyncio
+import contextlib
 import logging
-from typing import Optional
+from typing import Any, Optional
 
 import aioboto3
+from aiobotocore.config import AioConfig
 from botocore.exceptions import (
     ClientError,
     NoCredentialsError,
@@ -9,9 +12,15 @@ from botocore.exceptions import (
 )
 
 from app.config import settings
+from app.infrastructure.circuit_breaker import (
+    CircuitBreaker,
+    get_circuit_breaker,
+)
 
 logger = logging.getLogger(__name__)
 
+R2_CIRCUIT_BREAKER_NAME = 'cloudflare_r2'
+
 
 class R2FileStorageService:
     def __init__(
@@ -21,6 +30,8 @@ class R2FileStorageService:
         secret_access_key: str = settings.cloudflare_r2_secret_access_key,
         bucket_name: str = settings.cloudflare_r2_bucket_name,
         public_url_prefix: str = settings.cloudflare_r2_public_url_prefix,
+        endpoint_url: Optional[str] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
     ):
         if not all(
             [
@@ -38,15 +49,70 @@ class R2FileStorageService:
             logger.error(error_msg)
             raise ValueError(error_msg)
 
-        self.endpoint_url = f'https://{account_id}.r2.cloudflarestorage.com'
+        self.endpoint_url = (
+            endpoint_url or f'https://{account_id}.r2.cloudflarestorage.com'
+        )
+        self.access_key_id = access_key_id
+        self.secret_access_key = secret_access_key
         self.bucket_name = bucket_name
         self.public_url_prefix = public_url_prefix.rstrip('/')
         self.session = aioboto3.Session()
+        self.client_config = AioConfig(
+            retries={
+                'max_attempts': settings.r2_max_attempts,
+                'mode': settings.r2_retry_mode,
+            },
+            max_pool_connections=settings.r2_max_pool_connections,
+            connect_timeout=settings.r2_connect_timeout_seconds,
+            read_timeout=settings.r2_read_timeout_seconds,
+        )
+        self._exit_stack: Optional[contextlib.AsyncExitStack] = None
+        self._s3_client: Any = None
+        self._client_lock = asyncio.Lock()
+        self.circuit_breaker = circuit_breaker or get_circuit_breaker(
+            R2_CIRCUIT_BREAKER_NAME
+        )
         logger.info(
             f'R2FileStorageService (aioboto3) session configured for bucket: '
             f'{self.bucket_name}'
         )
 
+    async def start(self) -> None:
+        """
+        Opens the long-lived S3 client. Its connection pool and resolved
+        credentials are shared by all uploads until close() is called.
+        """
+        async with self._client_lock:
+            if self._s3_client is not None:
+                return
+            exit_stack = contextlib.AsyncExitStack()
+            self._s3_client = await exit_stack.enter_async_context(
+                self.session.client(
+                    's3',
+                    endpoint_url=self.endpoint_url,
+                    aws_access_key_id=self.access_key_id,
+                    aws_secret_access_key=self.secret_access_key,
+                    region_name='auto',
+                    config=self.client_config,
+                )
+            )
+            self._exit_stack = exit_stack
+            logger.info('R2FileStorageService: S3 client started.')
+
+    async def close(self) -> None:
+        async with self._client_lock:
+            if self._exit_stack is None:
+                return
+            await self._exit_stack.aclose()
+            self._exit_stack = None
+            self._s3_client = None
+            logger.info('R2FileStorageService: S3 client closed.')
+
+    async def _get_client(self) -> Any:
+        if self._s3_client is None:
+            await self.start()
+        return self._s3_client
+
     async def upload_audio(
         self,
         file_data: bytes,
@@ -57,20 +123,24 @@ class R2FileStorageService:
         Uploads audio data to Cloudflare R2 using aioboto3
         and returns the public URL.
         """
+        return await self.circuit_breaker.call(
+            self._upload_audio, file_data, file_name, content_type
+        )
+
+    async def _upload_audio(
+        self,
+        file_data: bytes,
+        file_name: str,
+        content_type: str,
+    ) -> Optional[str]:
         try:
-            async with self.session.client(
-                's3',
-                endpoint_url=self.endpoint_url,
-                aws_access_key_id=settings.cloudflare_r2_access_key_id,
-                aws_secret_access_key=settings.cloudflare_r2_secret_access_key,
-                region_name='auto',
-            ) as s3_client:
-                await s3_client.put_object(
-                    Bucket=self.bucket_name,
-                    Key=file_name,
-                    Body=file_data,
-                    ContentType=content_type,
-                )
+            s3_client = await self._get_client()
+            await s3_client.put_object(
+                Bucket=self.bucket_name,
+                Key=file_name,
+                Body=file_data,
+                ContentType=content_type,
+            )
             public_url = f'{self.public_url_prefix}/{file_name}'
             logger.info(
                 f'Successfully uploaded {file_name} to R2. URL: {public_url}'
@@ -91,3 +161,27 @@ class R2FileStorageService:
                 exc_info=True,
             )
             return None
+
+    async def download_audio(self, file_name: str) -> Optional[bytes]:
+        """Downloads a previously uploaded object from Cloudflare R2."""
+        return await self.circuit_breaker.call(self._download_audio, file_name)
+
+    async def _download_audio(self, file_name: str) -> Optional[bytes]:
+        try:
+            s3_client = await self._get_client()
+            response = await s3_client.get_object(
+                Bucket=self.bucket_name,
+                Key=file_name,
+            )
+            async with response['Body'] as stream:
+                return await stream.read()
+        except ClientError as e:
+            logger.error(f'Failed to download {file_name} from R2: {e}')
+            return None
+        except Exception as e:
+            logger.error(
+                f'An unexpected error occurred during R2 download '
+                f'of {file_name}: {e}',
+                exc_info=True,
+            )
+            return None
@@ -1,10 +1,12 @@
 import logging
+import time
 import uuid
 from datetime import datetime, timezone
 from enum import Enum
 from typing import Any, Dict, Optional, cast
 
 from pydantic import BaseModel, Field, field_validator
+from redis.exceptions import RedisError
 
 from app.celery_producer import NOTIFIER_TASK_NAME, notifier_celery_producer
 from app.config import settings
@@ -21,7 +23,12 @@ from app.core.services.payment import (
     INITIATE_PAYMENT_PREFIX,
     REPORT_DONATION_PREFIX,
 )
-from app.metrics import BACKEND_NOTIFICATION_METRICS
+from app.infrastructure.celery_publisher import CeleryTaskPublisher
+from app.infrastructure.notification_state import NotificationTaskRegistry
+from app.metrics import (
+    BACKEND_CELERY_PUBLISHER_METRICS,
+    BACKEND_NOTIFICATION_METRICS,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -97,10 +104,20 @@ class NotificationProducerService:
     """
     Service responsible for preparing
     and enqueuing notification tasks to Redis.
+
+    With a task_publisher, tasks are pushed in batches without blocking
+    the event loop; otherwise Celery's blocking send_task is used. With a
+    task_registry, each task is recorded for the relevance check.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        task_publisher: Optional[CeleryTaskPublisher] = None,
+        task_registry: Optional[NotificationTaskRegistry] = None,
+    ):
         self.celery_producer = notifier_celery_producer
+        self.task_publisher = task_publisher
+        self.task_registry = task_registry
         self.queue_name = settings.notification_tasks_queue_name
 
     async def enqueue_notification(
@@ -139,19 +156,30 @@ class NotificationProducerService:
             ).inc()
             return False
 
+        await self._register_task(task_data)
         try:
             with (
                 BACKEND_NOTIFICATION_METRICS['enqueue_duration_seconds']
                 .labels(notification_type=task_data.notification_type.value)
                 .time()
             ):
-                self.celery_producer.send_task(
-                    NOTIFIER_TASK_NAME,
-                    args=task_args,
-                    queue=self.queue_name,
-                    task_id=task_data.task_id,
-                    # eta=task_data.scheduled_at
-                )
+                if self.task_publisher:
+                    published = await self.task_publisher.publish(
+                        NOTIFIER_TASK_NAME,
+                        args=task_args,
+                        queue=self.queue_name,
+                        task_id=task_data.task_id,
+                    )
+                else:
+                    self._send_task(task_args, task_data.task_id)
+                    published = True
+
+            if not published:
+                BACKEND_NOTIFICATION_METRICS['enqueue_failure_total'].labels(
+                    reason='publish_error',
+                    notification_type=task_data.notification_type.value,
+                ).inc()
+                return False
 
             BACKEND_NOTIFICATION_METRICS['enqueue_success_total'].labels(
                 notification_type=task_data.notification_type.value
@@ -174,6 +202,40 @@ class NotificationProducerService:
             ).inc()
             return False
 
+    async def _register_task(self, task_data: NotificationTaskData) -> None:
+        """
+        Without a record the relevance check only looks at the profile
+        status, so a failure here does not stop the notification.
+        """
+        if not self.task_registry:
+            return
+        try:
+            await self.task_registry.register(
+                task_data.task_id,
+                task_data.notification_type.value,
+                task_data.created_at,
+            )
+        except RedisError as e:
+            logger.warning(
+                f'Failed to register notification task '
+                f'{task_data.task_id}: {e}'
+            )
+
+    def _send_task(self, task_args: list, task_id: str) -> None:
+        """Blocks the event loop for a broker round-trip."""
+        started = time.perf_counter()
+        try:
+            self.celery_producer.send_task(
+                NOTIFIER_TASK_NAME,
+                args=task_args,
+                queue=self.queue_name,
+                task_id=task_id,
+            )
+        finally:
+            BACKEND_CELERY_PUBLISHER_METRICS['loop_blocking_seconds'].labels(
+                mode='send_task'
+            ).observe(time.perf_counter() - started)
+
     async def prepare_and_enqueue_session_reminder(
         self, user: User, user_profile: UserBotProfile
     ) -> bool:
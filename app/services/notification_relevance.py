@@ -0,0 +1,127 @@
+import logging
+from datetime import datetime, timezone
+from typing import Optional
+
+from redis.exceptions import RedisError
+
+from app.core.entities.user_bot_profile import UserStatusInBot
+from app.core.services.user_bot_profile import UserBotProfileService
+from app.infrastructure.notification_state import (
+    NotificationTaskRecord,
+    NotificationTaskRegistry,
+    ProfileStateCache,
+    ProfileStateSnapshot,
+)
+from app.metrics import BACKEND_NOTIFICATION_METRICS
+from app.services.notification_producer import NotificationType
+
+logger = logging.getLogger(__name__)
+
+
+def get_irrelevance_reason(
+    state: Optional[ProfileStateSnapshot],
+    task: Optional[NotificationTaskRecord],
+    now: datetime,
+) -> Optional[str]:
+    """
+    Returns why a notification should no longer be sent, or None if it
+    is still relevant. Without a task record only the profile status is
+    checked.
+    """
+    if state is None:
+        return 'profile_not_found'
+    if state.status != UserStatusInBot.ACTIVE:
+        return 'user_not_active'
+    if task is None:
+        return None
+
+    user_active_since_task = (
+        state.last_exercise_at is not None
+        and state.last_exercise_at > task.created_at
+    )
+    if task.notification_type == NotificationType.SESSION_REMINDER:
+        if state.wants_session_reminders is False:
+            return 'reminders_disabled'
+        if state.session_frozen_until and state.session_frozen_until > now:
+            return 'session_frozen'
+        if user_active_since_task:
+            return 'user_already_active'
+    elif task.notification_type == NotificationType.LONG_BREAK_REMINDER:
+        if user_active_since_task:
+            return 'user_already_active'
+    return None
+
+
+class NotificationRelevanceService:
+    """
+    Decides whether a queued notification is still worth sending.
+
+    Profile state is read from the Redis snapshot; the database is only
+    queried when the snapshot is missing, and the snapshot is then
+    restored for the following checks.
+    """
+
+    def __init__(
+        self,
+        profile_state_cache: ProfileStateCache,
+        task_registry: NotificationTaskRegistry,
+        user_bot_profile_service: UserBotProfileService,
+    ):
+        self.profile_state_cache = profile_state_cache
+        self.task_registry = task_registry
+        self.user_bot_profile_service = user_bot_profile_service
+
+    async def _get_task(
+        self, task_id: str
+    ) -> Optional[NotificationTaskRecord]:
+        try:
+            return await self.task_registry.get(task_id)
+        except RedisError as e:
+            logger.warning(f'Failed to read notification task {task_id}: {e}')
+            return None
+
+    async def _get_profile_state(
+        self, user_id: int, bot_id: str
+    ) -> Optional[ProfileStateSnapshot]:
+        try:
+            state = await self.profile_state_cache.get(user_id, bot_id)
+            if state:
+                return state
+        except RedisError as e:
+            logger.warning(
+                f'Failed to read profile state snapshot for '
+                f'{user_id}/{bot_id}: {e}'
+            )
+
+        BACKEND_NOTIFICATION_METRICS['relevance_snapshot_miss_total'].inc()
+        profile = await self.user_bot_profile_service.get(user_id, bot_id)
+        if not profile:
+            return None
+        try:
+            await self.profile_state_cache.save(profile)
+        except RedisError as e:
+            logger.warning(
+                f'Failed to save profile state snapshot for '
+                f'{user_id}/{bot_id}: {e}'
+            )
+        return ProfileStateSnapshot.from_profile(profile)
+
+    async def is_relevant(
+        self, task_id: str, user_id: int, bot_id: str
+    ) -> bool:
+        task = await self._get_task(task_id)
+        state = await self._get_profile_state(user_id, bot_id)
+        reason = get_irrelevance_reason(
+            state, task, datetime.now(timezone.utc)
+        )
+
+        BACKEND_NOTIFICATION_METRICS['relevance_check_total'].labels(
+            notification_type=task.notification_type if task else 'unknown',
+            result=reason or 'relevant',
+        ).inc()
+        if reason:
+            logger.info(
+                f'Notification task {task_id} for user {user_id}, '
+                f'bot_id {bot_id} is no longer relevant: {reason}.'
+            )
+        return reason is None
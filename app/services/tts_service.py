@@ -1,18 +1,89 @@
 import asyncio
 import base64
+import hashlib
+import json
 import logging
-import subprocess
-import tempfile
-from typing import Optional
+import re
+import time
+from typing import List, Optional
 
 import httpx
 from google import genai
 from google.genai import types
 
 from app.config import settings
+from app.infrastructure.circuit_breaker import (
+    CircuitBreaker,
+    get_circuit_breaker,
+)
+from app.metrics import BACKEND_TTS_METRICS
+from app.services.audio_transcoder import FFmpegTranscoder
 
 logger = logging.getLogger(__name__)
 
+GEMINI_SAMPLE_RATE = 24000
+OPUS_TARGET_SAMPLE_RATE = 48000
+OPUS_BITRATE = '64k'
+TTS_CIRCUIT_BREAKER_NAME = 'google_tts'
+_SENTENCE_END_RE = re.compile(r'(?<=[.!?…])\s+|(?<=[.!?…]["»”)])\s+')
+
+
+def split_text_into_chunks(text: str, max_chars: int) -> List[str]:
+    """
+    Splits text at sentence boundaries into chunks of at most max_chars,
+    packing consecutive sentences together. A sentence longer than
+    max_chars is split at word boundaries.
+    """
+    chunks: List[str] = []
+    current = ''
+    for sentence in _SENTENCE_END_RE.split(text.strip()):
+        pieces = [sentence]
+        if len(sentence) > max_chars:
+            pieces, piece = [], ''
+            for word in sentence.split():
+                if piece and len(piece) + 1 + len(word) > max_chars:
+                    pieces.append(piece)
+                    piece = word
+                else:
+                    piece = f'{piece} {word}' if piece else word
+            pieces.append(piece)
+        for piece in pieces:
+            if current and len(current) + 1 + len(piece) > max_chars:
+                chunks.append(current)
+                current = piece
+            else:
+                current = f'{current} {piece}' if current else piece
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def story_audio_digest(
+    text: str,
+    voice_name: str,
+    emotion_instruction: Optional[str],
+    tts_model: str = settings.tts_model,
+    chunk_max_chars: int = settings.tts_chunk_max_chars,
+) -> str:
+    """
+    Digest of everything that determines the synthesized OGG: equal
+    digests mean the audio can be reused instead of synthesized again.
+    """
+    key = {
+        'text': text,
+        'voice_name': voice_name,
+        'emotion_instruction': emotion_instruction or '',
+        'tts_model': tts_model,
+        'chunk_max_chars': chunk_max_chars,
+        'input_sample_rate': GEMINI_SAMPLE_RATE,
+        'output_sample_rate': OPUS_TARGET_SAMPLE_RATE,
+        'codec': 'libopus',
+        'bitrate': OPUS_BITRATE,
+    }
+    return hashlib.sha256(
+        json.dumps(key, ensure_ascii=False, sort_keys=True).encode('utf-8')
+    ).hexdigest()
+
 
 class GoogleTTSService:
     def __init__(
@@ -20,6 +91,11 @@ class GoogleTTSService:
         api_key: str = settings.google_api_key,
         tts_model: str = settings.tts_model,
         proxy_url: Optional[str] = settings.google_tts_proxy_url,
+        transcoder: Optional[FFmpegTranscoder] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        chunk_max_chars: int = settings.tts_chunk_max_chars,
+        chunk_max_concurrency: int = settings.tts_chunk_max_concurrency,
+        chunk_max_attempts: int = settings.tts_chunk_max_attempts,
     ):
         if not api_key:
             logger.error('GOOGLE_API_KEY is not set for TTSService')
@@ -39,8 +115,15 @@ class GoogleTTSService:
         self.default_speech_config = types.SpeechConfig(
             voice_config=self.default_voice_config,
         )
-        self.gemini_sample_rate = 24000
-        self.opus_target_sample_rate = 48000
+        self.gemini_sample_rate = GEMINI_SAMPLE_RATE
+        self.opus_target_sample_rate = OPUS_TARGET_SAMPLE_RATE
+        self.transcoder = transcoder or FFmpegTranscoder()
+        self.circuit_breaker = circuit_breaker or get_circuit_breaker(
+            TTS_CIRCUIT_BREAKER_NAME
+        )
+        self.chunk_max_chars = chunk_max_chars
+        self.chunk_max_concurrency = chunk_max_concurrency
+        self.chunk_max_attempts = chunk_max_attempts
 
         if proxy_url:
             self._http_client = httpx.AsyncClient(
@@ -66,61 +149,12 @@ class GoogleTTSService:
         Assumes PCM data is 16-bit signed little-endian, mono.
         """
         try:
-            with (
-                tempfile.NamedTemporaryFile(
-                    suffix='.raw',
-                    delete=True,
-                ) as pcm_file,
-                tempfile.NamedTemporaryFile(
-                    suffix='.ogg',
-                    delete=True,
-                ) as ogg_file,
-            ):
-                pcm_file.write(pcm_data)
-                pcm_file.flush()
-
-                ffmpeg_command = [
-                    'ffmpeg',
-                    '-f',
-                    's16le',
-                    '-ar',
-                    str(self.gemini_sample_rate),
-                    '-ac',
-                    '1',
-                    '-i',
-                    pcm_file.name,
-                    '-c:a',
-                    'libopus',
-                    '-b:a',
-                    '64k',
-                    '-vbr',
-                    'on',
-                    '-ar',
-                    str(self.opus_target_sample_rate),
-                    '-y',
-                    ogg_file.name,
-                ]
-
-                process = await asyncio.create_subprocess_exec(
-                    *ffmpeg_command,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                )
-                stdout, stderr = await process.communicate()
-
-                if process.returncode != 0:
-                    logger.error(
-                        f'FFmpeg conversion failed. '
-                        f'Return code: {process.returncode}',
-                    )
-                    logger.error(
-                        f"FFmpeg stderr: " f"{stderr.decode(errors='ignore')}",
-                    )
-                    return None
-
-                with open(ogg_file.name, 'rb') as f_out:
-                    return f_out.read()
-
+            return await self.transcoder.pcm_to_ogg_opus(
+                pcm_data,
+                input_sample_rate=self.gemini_sample_rate,
+                output_sample_rate=self.opus_target_sample_rate,
+                bitrate=OPUS_BITRATE,
+            )
         except FileNotFoundError:
             logger.error(
                 'FFmpeg not found. Please ensure FFmpeg '
@@ -223,20 +257,15 @@ class GoogleTTSService:
             )
             return None
 
-    async def text_to_speech_ogg(
+    async def _synthesize_pcm(
         self,
-        text: str,
+        text_to_synthesize: str,
         voice_name: str | None = None,
-        emotion_instruction: Optional[str] = None,
     ) -> bytes | None:
         """
-        Converts text to speech and returns OGG Opus audio data as bytes.
-        Returns None if generation fails.
+        Requests speech from Google GenAI, falling back to the REST API
+        on location errors. Returns raw PCM audio data.
         """
-        text_to_synthesize = text
-        if emotion_instruction:
-            text_to_synthesize = f'{emotion_instruction.strip()} {text}'
-
         current_voice_name = voice_name if voice_name else 'Leda'
         pcm_data: Optional[bytes] = None
 
@@ -306,12 +335,91 @@ class GoogleTTSService:
                     exc_info=True,
                 )
 
-        if not pcm_data:
+        return pcm_data
+
+    async def _synthesize_chunk(
+        self,
+        chunk: str,
+        voice_name: str,
+        emotion_instruction: Optional[str],
+        semaphore: asyncio.Semaphore,
+    ) -> bytes | None:
+        """
+        Synthesizes one chunk through the circuit breaker, retrying only
+        this chunk on failure.
+        """
+        text_to_synthesize = chunk
+        if emotion_instruction:
+            text_to_synthesize = f'{emotion_instruction.strip()} {chunk}'
+
+        for attempt in range(1, self.chunk_max_attempts + 1):
+            async with semaphore:
+                started_at = time.perf_counter()
+                try:
+                    pcm_data = await self.circuit_breaker.call(
+                        self._synthesize_pcm, text_to_synthesize, voice_name
+                    )
+                except Exception as e:
+                    logger.error(
+                        f'Unexpected error synthesizing TTS chunk: {e}',
+                        exc_info=True,
+                    )
+                    pcm_data = None
+            if pcm_data:
+                BACKEND_TTS_METRICS['chunk_synthesis_time'].observe(
+                    time.perf_counter() - started_at
+                )
+                return pcm_data
+            if attempt < self.chunk_max_attempts:
+                BACKEND_TTS_METRICS['chunk_retries'].inc()
+                logger.warning(
+                    f"TTS chunk '{chunk[:50]}...' failed "
+                    f'(attempt {attempt}/{self.chunk_max_attempts}), '
+                    f'retrying.'
+                )
+                await asyncio.sleep(
+                    settings.tts_chunk_retry_delay_seconds * attempt
+                )
+        return None
+
+    async def text_to_speech_ogg(
+        self,
+        text: str,
+        voice_name: str | None = None,
+        emotion_instruction: Optional[str] = None,
+    ) -> bytes | None:
+        """
+        Converts text to speech and returns OGG Opus audio data as bytes.
+        Long texts are split at sentence boundaries and the chunks are
+        synthesized concurrently with the same voice settings; their PCM
+        is joined and transcoded once.
+        Returns None if generation fails or the TTS circuit is open.
+        """
+        chunks = split_text_into_chunks(text, self.chunk_max_chars)
+        if not chunks:
+            logger.error('TTS generation failed: empty text')
+            return None
+        BACKEND_TTS_METRICS['chunks_per_text'].observe(len(chunks))
+
+        current_voice_name = voice_name if voice_name else 'Leda'
+        semaphore = asyncio.Semaphore(self.chunk_max_concurrency)
+        chunk_pcm = await asyncio.gather(
+            *(
+                self._synthesize_chunk(
+                    chunk, current_voice_name, emotion_instruction, semaphore
+                )
+                for chunk in chunks
+            )
+        )
+        pcm_chunks = [pcm for pcm in chunk_pcm if pcm]
+        if len(pcm_chunks) < len(chunk_pcm):
+            failed = len(chunk_pcm) - len(pcm_chunks)
             logger.error(
-                'TTS generation failed: '
-                'No PCM data received after all attempts'
+                f'TTS generation failed: no PCM data for {failed} of '
+                f'{len(chunks)} chunks after all attempts'
             )
             return None
+        pcm_data = b''.join(pcm_chunks)
 
         ogg_data = await self._convert_pcm_to_ogg_opus(pcm_data)
 
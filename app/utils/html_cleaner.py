@@ -16,22 +16,56 @@ class CustomHTMLParser(HTMLParser):
     def __init__(self):
         super().__init__()
         self.result = []
+        self.open_tags = []
 
     def handle_starttag(self, tag, attrs):
         if tag in ALLOWED_TAGS:
             self.result.append(f'<{tag}>')
+            self.open_tags.append(tag)
         elif tag in TAG_REPLACEMENTS:
             self.result.append(TAG_REPLACEMENTS[tag])
 
     def handle_endtag(self, tag):
         if tag in ALLOWED_TAGS:
             self.result.append(f'</{tag}>')
+            if self.open_tags and self.open_tags[-1] == tag:
+                self.open_tags.pop()
 
     def handle_data(self, data):
         self.result.append(data)
 
 
+class IncrementalHTMLCleaner:
+    """
+    Cleans HTML arriving in chunks. Incomplete tags and entities at the end
+    of a chunk are held back by the parser until the rest arrives, so the
+    concatenated output equals clean_html_for_telegram of the whole text.
+    """
+
+    def __init__(self):
+        self.parser = CustomHTMLParser()
+        self.emitted = 0
+
+    def feed(self, chunk: str) -> str:
+        """Returns the cleaned text that became available with chunk."""
+        self.parser.feed(chunk)
+        cleaned = ''.join(self.parser.result[self.emitted :])
+        self.emitted = len(self.parser.result)
+        return cleaned
+
+    @property
+    def text(self) -> str:
+        return ''.join(self.parser.result)
+
+
 def clean_html_for_telegram(text: str) -> str:
+    cleaner = IncrementalHTMLCleaner()
+    cleaner.feed(text)
+    return cleaner.text
+
+
+def close_open_tags(text: str) -> str:
+    """Closes the tags left open in a cut-off piece of cleaned text."""
     parser = CustomHTMLParser()
     parser.feed(text)
-    return ''.join(parser.result)
+    return text + ''.join(f'</{tag}>' for tag in reversed(parser.open_tags))
@@ -0,0 +1,85 @@
+import hashlib
+import random
+import re
+from functools import lru_cache
+from typing import Iterable, List, Set, Tuple
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+_PERMUTATION_SEED = 1
+_WORD_RE = re.compile(r'\w+', re.UNICODE)
+
+
+def shingles(text: str, size: int) -> Set[str]:
+    """
+    Splits the text into lowercased word n-grams. Texts shorter than
+    the shingle size become a single shingle.
+    """
+    words = _WORD_RE.findall(text.lower())
+    if not words:
+        return set()
+    if len(words) <= size:
+        return {' '.join(words)}
+    return {
+        ' '.join(words[i : i + size]) for i in range(len(words) - size + 1)
+    }
+
+
+def _hash_shingle(shingle: str) -> int:
+    return int.from_bytes(
+        hashlib.blake2b(shingle.encode('utf-8'), digest_size=4).digest(),
+        'little',
+    )
+
+
+@lru_cache(maxsize=8)
+def _permutations(num_perm: int) -> Tuple[Tuple[int, int], ...]:
+    rng = random.Random(_PERMUTATION_SEED)
+    return tuple(
+        (rng.randint(1, _MERSENNE_PRIME - 1), rng.randint(0, _MERSENNE_PRIME))
+        for _ in range(num_perm)
+    )
+
+
+def minhash_signature(shingle_set: Iterable[str], num_perm: int) -> List[int]:
+    """
+    Computes a MinHash signature. Signatures are deterministic across
+    processes, so they can be stored and compared later.
+    """
+    hashes = [_hash_shingle(shingle) for shingle in shingle_set]
+    if not hashes:
+        return [_MAX_HASH] * num_perm
+    return [
+        min(((a * h + b) % _MERSENNE_PRIME) & _MAX_HASH for h in hashes)
+        for a, b in _permutations(num_perm)
+    ]
+
+
+def lsh_band_keys(signature: List[int], bands: int) -> List[str]:
+    """
+    Splits the signature into bands and hashes each band into a key.
+    Two signatures sharing any key are candidates for a near-duplicate.
+    """
+    rows = len(signature) // bands
+    if rows < 1:
+        raise ValueError('Signature is shorter than the number of bands')
+    keys = []
+    for band in range(bands):
+        band_values = signature[band * rows : (band + 1) * rows]
+        digest = hashlib.blake2b(
+            ','.join(map(str, band_values)).encode('ascii'), digest_size=8
+        ).hexdigest()
+        keys.append(f'{band}:{digest}')
+    return keys
+
+
+def estimate_similarity(
+    signature_a: List[int], signature_b: List[int]
+) -> float:
+    """Estimates the Jaccard similarity of two MinHash signatures."""
+    if not signature_a or len(signature_a) != len(signature_b):
+        return 0.0
+    matches = sum(
+        1 for a, b in zip(signature_a, signature_b, strict=True) if a == b
+    )
+    return matches / len(signature_a)
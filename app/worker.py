@@ -0,0 +1,160 @@
+import asyncio
+import logging
+import signal
+from typing import Dict
+
+import httpx
+from prometheus_client import start_http_server
+
+from app.config import settings
+from app.core.services.language_config import LanguageConfigService
+from app.db.db import init_db
+from app.infrastructure.celery_publisher import CeleryTaskPublisher
+from app.infrastructure.leader_lease import LeaderLoopFactory, run_as_leader
+from app.infrastructure.notification_state import NotificationTaskRegistry
+from app.infrastructure.redis_client import (
+    close_redis_client,
+    get_redis_client,
+)
+from app.llm.llm_service import LLMService
+from app.logging_config import configure_logging
+from app.metrics import metrics_registry
+from app.sentry_sdk import sentry_init
+from app.services.exercise_deduplicator import ExerciseDeduplicator
+from app.services.file_storage_service import R2FileStorageService
+from app.services.notification_producer import NotificationProducerService
+from app.services.tts_service import GoogleTTSService
+from app.workers.accent_word_harvester import accent_word_harvester_loop
+from app.workers.daily_activity_rollup import daily_activity_rollup_loop
+from app.workers.exercise_fingerprint_indexer import (
+    exercise_fingerprint_index_loop,
+)
+from app.workers.exercise_quality_monitor import quality_monitoring_worker_loop
+from app.workers.exercise_review_processor import (
+    exercise_review_processor_loop,
+)
+from app.workers.exercise_stock_refill import exercise_stock_refill_loop
+from app.workers.metrics_updater import metrics_loop
+from app.workers.notification_scheduler import notification_scheduler_loop
+from app.workers.session_reminder_consumer import session_reminder_loop
+
+configure_logging()
+
+logger = logging.getLogger(__name__)
+
+
+async def run_worker() -> None:
+    """
+    Runs the background loops outside the API process.
+
+    Every loop is guarded by its own Redis leader lease, so any number of
+    worker replicas can be started: one of them runs each loop and the
+    others stand by to take over.
+    """
+    if not settings.debug:
+        sentry_init()
+
+    await init_db()
+    start_http_server(
+        settings.worker_metrics_port, registry=metrics_registry()
+    )
+
+    http_client = httpx.AsyncClient()
+    redis_client = await get_redis_client()
+    language_config_service = LanguageConfigService()
+    file_storage_service = R2FileStorageService()
+    await file_storage_service.start()
+    tts_service = GoogleTTSService()
+    exercise_deduplicator = ExerciseDeduplicator()
+    llm_service = LLMService(
+        http_client=http_client,
+        exercise_deduplicator=exercise_deduplicator,
+    )
+    task_publisher = CeleryTaskPublisher(redis_client)
+    task_publisher.start()
+    notification_producer = NotificationProducerService(
+        task_publisher=task_publisher,
+        task_registry=NotificationTaskRegistry(redis_client),
+    )
+
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop_event.set)
+
+    leader_loops: Dict[str, LeaderLoopFactory] = {
+        'metrics_loop': lambda stop: metrics_loop(stop_event=stop),
+        'exercise_refill_loop': lambda stop: exercise_stock_refill_loop(
+            llm_service=llm_service,
+            tts_service=tts_service,
+            file_storage_service=file_storage_service,
+            http_client=http_client,
+            stop_event=stop,
+            language_config_service=language_config_service,
+        ),
+        'accent_word_harvester_loop': (
+            lambda stop: accent_word_harvester_loop(
+                llm_service=llm_service,
+                http_client=http_client,
+                stop_event=stop,
+            )
+        ),
+        'notification_scheduler_loop': (
+            lambda stop: notification_scheduler_loop(
+                notification_producer=notification_producer,
+                stop_event=stop,
+            )
+        ),
+        'session_reminder_loop': (
+            lambda stop: session_reminder_loop(
+                notification_producer=notification_producer,
+                redis_client=redis_client,
+                stop_event=stop,
+            )
+        ),
+        'quality_monitoring_loop': (
+            lambda stop: quality_monitoring_worker_loop(stop_event=stop)
+        ),
+        'exercise_review_processor_loop': (
+            lambda stop: exercise_review_processor_loop(stop_event=stop)
+        ),
+        'daily_activity_rollup_loop': (
+            lambda stop: daily_activity_rollup_loop(stop_event=stop)
+        ),
+        'exercise_fingerprint_index_loop': (
+            lambda stop: exercise_fingerprint_index_loop(
+                deduplicator=exercise_deduplicator, stop_event=stop
+            )
+        ),
+    }
+    tasks = [
+        asyncio.create_task(
+            run_as_leader(name, factory, stop_event, redis_client),
+            name=name,
+        )
+        for name, factory in leader_loops.items()
+    ]
+
+    logger.info('Worker startup complete. Competing for leader leases.')
+    await stop_event.wait()
+
+    logger.info('Worker shutdown initiated.')
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    for task, result in zip(tasks, results, strict=True):
+        if isinstance(result, BaseException):
+            logger.error(
+                f'Worker task {task.get_name()} failed: {result}',
+                exc_info=result,
+            )
+
+    await http_client.aclose()
+    await tts_service.close_rest_http_client()
+    await file_storage_service.close()
+    await task_publisher.close()
+    await close_redis_client()
+
+    logger.info('Worker shutdown complete.')
+
+
+if __name__ == '__main__':
+    asyncio.run(run_worker())
@@ -0,0 +1,178 @@
+import asyncio
+import contextlib
+import logging
+from typing import Dict, List
+
+import httpx
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config import settings
+from app.core.configs.enums import LanguageLevel
+from app.core.entities.accent_word import AccentWord
+from app.db.db import async_session_maker
+from app.db.repositories.accent_word import SQLAlchemyAccentWordRepository
+from app.llm.generators.choose_accent_generator import ChooseAccentGenerator
+from app.llm.llm_service import LLMService
+from app.metrics import BACKEND_LLM_METRICS
+from app.services.accent_dictionary_client import AccentDictionaryClient
+
+logger = logging.getLogger(__name__)
+
+ACCENT_WORD_BANK_LANGUAGE = 'Bulgarian'
+
+
+async def _assess_candidates(
+    candidates: List[AccentWord],
+    generator: ChooseAccentGenerator,
+    language: str,
+    language_level: LanguageLevel,
+) -> List[AccentWord]:
+    """
+    Assesses all candidates in a single LLM call and returns the words to
+    store: rejected ones and suitable ones that came with a definition.
+    Suitable words left out of the top picks are not stored, so they can
+    be offered again in a later batch.
+    """
+    assessments = await generator.assess_words_batch(
+        [candidate.word_no_accent for candidate in candidates],
+        language,
+        settings.default_user_language,
+        language_level,
+        top_picks=settings.accent_word_batch_top_picks,
+    )
+    if not assessments:
+        return []
+
+    candidates_by_word = {
+        candidate.word_no_accent: candidate for candidate in candidates
+    }
+    assessed = []
+    for assessment in assessments:
+        candidate = candidates_by_word.pop(
+            assessment.word_to_assess.strip(), None
+        )
+        if not candidate:
+            continue
+
+        candidate.confidence_level = assessment.confidence_level
+        candidate.is_suitable = (
+            assessment.is_common_and_suitable
+            and assessment.confidence_level != 'LOW'
+        )
+        if candidate.is_suitable:
+            if not assessment.meaning:
+                continue
+            candidate.meaning = assessment.meaning
+            candidate.examples = assessment.examples
+            candidate.grammar_tags = assessment.grammar_tags
+        assessed.append(candidate)
+    return assessed
+
+
+async def harvest_accent_words(
+    dictionary_client: AccentDictionaryClient,
+    generator: ChooseAccentGenerator,
+    language: str = ACCENT_WORD_BANK_LANGUAGE,
+    language_level: LanguageLevel = settings.default_language_level,
+    session_maker: async_sessionmaker[AsyncSession] = async_session_maker,
+) -> int:
+    """
+    Fetches a batch of random dictionary words, assesses the ones not seen
+    before in one batched LLM call and stores them with their verdict.
+    Rejected words are stored too, so they are never sent to the LLM again.
+    Returns the number of new suitable words.
+    """
+    raw_words = await dictionary_client.fetch_random_words(
+        settings.accent_word_harvest_batch_size
+    )
+    candidates: Dict[str, AccentWord] = {}
+    for raw_word in raw_words:
+        candidate = ChooseAccentGenerator.build_word_candidate(
+            raw_word, language, language_level
+        )
+        if candidate:
+            candidates.setdefault(candidate.word, candidate)
+    if not candidates:
+        return 0
+
+    async with session_maker() as session:
+        existing_words = await SQLAlchemyAccentWordRepository(
+            session
+        ).get_existing_words(language, list(candidates))
+    new_candidates = [
+        candidate
+        for word, candidate in candidates.items()
+        if word not in existing_words
+    ]
+    if not new_candidates:
+        return 0
+
+    assessed = await _assess_candidates(
+        new_candidates, generator, language, language_level
+    )
+
+    async with session_maker() as session:
+        await SQLAlchemyAccentWordRepository(session).add_many(assessed)
+        await session.commit()
+
+    suitable_count = sum(1 for word in assessed if word.is_suitable)
+    BACKEND_LLM_METRICS['accent_words_harvested'].labels(
+        target_language=language, result='suitable'
+    ).inc(suitable_count)
+    BACKEND_LLM_METRICS['accent_words_harvested'].labels(
+        target_language=language, result='rejected'
+    ).inc(len(assessed) - suitable_count)
+    logger.info(
+        f'Accent word harvest: fetched {len(raw_words)}, '
+        f'new {len(new_candidates)}, stored {len(assessed)}, '
+        f'suitable {suitable_count}.'
+    )
+    return suitable_count
+
+
+async def accent_word_harvester_loop(
+    llm_service: LLMService,
+    http_client: httpx.AsyncClient,
+    stop_event: asyncio.Event,
+):
+    logger.info('Accent word harvester started.')
+    dictionary_client = AccentDictionaryClient(http_client)
+    generator = ChooseAccentGenerator(
+        llm_service=llm_service, http_client=http_client
+    )
+
+    while not stop_event.is_set():
+        harvested = 0
+        below_threshold = False
+        try:
+            async with async_session_maker() as session:
+                available = await SQLAlchemyAccentWordRepository(
+                    session
+                ).count_available(ACCENT_WORD_BANK_LANGUAGE)
+            below_threshold = (
+                available < settings.accent_word_bank_min_available
+            )
+            if below_threshold:
+                logger.info(
+                    f'Accent word bank has {available} words available, '
+                    f'harvesting more.'
+                )
+                harvested = await harvest_accent_words(
+                    dictionary_client, generator
+                )
+        except Exception as e:
+            logger.error(
+                f'Error in accent word harvester cycle: {e}', exc_info=True
+            )
+
+        # Keep harvesting without pause while the bank is short and
+        # batches are productive.
+        timeout = (
+            0
+            if below_threshold and harvested
+            else settings.accent_word_harvest_interval_seconds
+        )
+        with contextlib.suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(stop_event.wait(), timeout=timeout)
+
+    logger.info('Accent word harvester stopped.')
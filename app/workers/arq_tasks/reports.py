@@ -1,11 +1,24 @@
 import asyncio
 import logging
-from datetime import timedelta
+import time
+from contextlib import aclosing
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, List
+
+from arq import Retry
+from redis.asyncio import Redis as AsyncRedis
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
 from app.core.configs.enums import ReportStatus
+from app.core.entities.user import User
+from app.core.entities.user_bot_profile import UserBotProfile
+from app.core.entities.user_report import UserReport
 from app.core.services.user_bot_profile import UserBotProfileService
-from app.core.services.user_report import UserReportService
+from app.core.services.user_report import (
+    UserReportService,
+    get_weekly_report_period,
+)
 from app.db.db import async_session_maker
 from app.db.repositories.exercise_attempt import (
     SQLAlchemyExerciseAttemptRepository,
@@ -15,6 +28,8 @@ from app.db.repositories.user_bot_profile import (
     SQLAlchemyUserBotProfileRepository,
 )
 from app.db.repositories.user_report import SQLAlchemyUserReportRepository
+from app.infrastructure.job_checkpoint import JobCheckpoint
+from app.infrastructure.rate_limiter import RedisTokenBucket
 from app.llm.llm_service import LLMService
 from app.services.notification_producer import NotificationProducerService
 
@@ -58,9 +73,18 @@ async def _async_generate_detailed_report_task(
                 llm_service=llm_service,
             )
 
+            async def save_partial_report(text: str) -> None:
+                report.full_report = text
+                await report_repo.update(report)
+                await session.commit()
+
             full_report_text = await (
                 detailed_report_service.generate_full_report_text(
-                    user_id=user_id, bot_id=bot_id
+                    user_id=user_id,
+                    bot_id=bot_id,
+                    on_partial=save_partial_report
+                    if settings.detailed_report_streaming
+                    else None,
                 )
             )
 
@@ -81,6 +105,7 @@ async def _async_generate_detailed_report_task(
                 exc_info=True,
             )
             if report:
+                report.full_report = None
                 report.status = ReportStatus.FAILED
                 await report_repo.update(report)
                 await session.commit()
@@ -123,7 +148,10 @@ async def send_detailed_report_notification_arq(ctx, report_id: int):
             )
             return
 
-        notification_producer = NotificationProducerService()
+        notification_producer = NotificationProducerService(
+            task_publisher=ctx.get('task_publisher'),
+            task_registry=ctx.get('task_registry'),
+        )
 
         if await notification_producer.enqueue_detailed_report_notification(
             user=user, profile=profile, report=report
@@ -194,12 +222,80 @@ async def generate_and_send_detailed_report_arq(ctx, report_id: int):
 
 async def run_report_generation_cycle_arq(ctx):
     """
-    ARQ task to generate short weekly reports for active users, save them,
-    and enqueue notifications in throttled batches.
+    ARQ cron task that fans the weekly report generation out into one
+    sub-job per user shard. Job ids are fixed per week and shard, so a
+    repeated run does not enqueue a shard that is still queued or running.
     This task is scheduled to run on Mondays via cron.
     """
-    logger.info('Starting ARQ task for weekly report generation cycle.')
+    arq_pool = ctx.get('arq_pool') or ctx.get('redis')
+    if not arq_pool:
+        logger.error('arq_pool not found in ARQ context.')
+        return
 
+    report_start_date, _ = get_weekly_report_period(datetime.now(timezone.utc))
+    week = report_start_date.date().isoformat()
+    shard_count = settings.report_generation_shard_count
+    for shard_index in range(shard_count):
+        await arq_pool.enqueue_job(
+            'run_report_generation_shard_arq',
+            shard_index,
+            shard_count,
+            _job_id=f'weekly_report:{week}:{shard_index}/{shard_count}',
+        )
+    logger.info(
+        f'Enqueued {shard_count} weekly report shards for the week of {week}.'
+    )
+
+
+async def run_report_generation_shard_arq(
+    ctx, shard_index: int, shard_count: int
+):
+    """
+    ARQ task to generate short weekly reports for one shard of active
+    users, save them, and enqueue notifications paced by a per-bot token
+    bucket, one chunk of profiles at a time.
+
+    Before a chunk of reports is committed its profiles are saved in the
+    checkpoint as pending, and after their notifications were enqueued
+    the last profile replaces them. A run that stopped in between sends
+    the pending notifications of committed reports first (they are no
+    longer due, so they would not be generated again) and then continues
+    after the last profile. Once report_generation_shard_budget_seconds
+    have passed the job raises Retry, so each run stays well within the
+    job timeout and the shard continues from the checkpoint.
+    """
+    arq_pool = ctx.get('arq_pool') or ctx.get('redis')
+    llm_service = ctx.get('llm_service')
+    redis_client = ctx.get('redis_client')
+
+    if not arq_pool or not llm_service or not redis_client:
+        logger.error(
+            'arq_pool, llm_service or redis_client not found in ARQ '
+            'context. Check on_startup hook.'
+        )
+        return
+
+    report_start_date, _ = get_weekly_report_period(datetime.now(timezone.utc))
+    week = report_start_date.date().isoformat()
+    checkpoint = JobCheckpoint(
+        redis_client, f'weekly_report:{week}:{shard_index}/{shard_count}'
+    )
+    progress = await checkpoint.load() or {'sent': 0, 'done': False}
+    if progress['done']:
+        logger.info(
+            f'Weekly report shard {shard_index}/{shard_count} for the week '
+            f'of {week} is already done, skipping.'
+        )
+        return
+    after = progress.get('last_key')
+    if after:
+        logger.info(
+            f'Resuming weekly report shard {shard_index}/{shard_count} '
+            f'after profile {after[0]}/{after[1]}.'
+        )
+
+    started = time.monotonic()
+    out_of_budget = False
     async with async_session_maker() as session:
         user_profile_repo = SQLAlchemyUserBotProfileRepository(session)
         attempt_repo = SQLAlchemyExerciseAttemptRepository(session)
@@ -208,17 +304,6 @@ async def run_report_generation_cycle_arq(ctx):
         user_bot_profile_service = UserBotProfileService(
             profile_repo=user_profile_repo
         )
-
-        arq_pool = ctx.get('arq_pool') or ctx.get('redis')
-        llm_service = ctx.get('llm_service')
-
-        if not arq_pool or not llm_service:
-            logger.error(
-                'arq_pool or llm_service not found in ARQ context. '
-                'Check on_startup hook.'
-            )
-            return
-
         report_service = UserReportService(
             user_report_repository=report_repo,
             exercise_attempt_repository=attempt_repo,
@@ -227,33 +312,139 @@ async def run_report_generation_cycle_arq(ctx):
             llm_service=llm_service,
         )
 
-        reports_to_notify = await (
-            report_service.generate_and_save_short_weekly_reports()
+        notification_producer = NotificationProducerService(
+            task_publisher=ctx.get('task_publisher'),
+            task_registry=ctx.get('task_registry'),
         )
+        buckets: Dict[str, RedisTokenBucket] = {}
+        if progress.get('pending'):
+            pending_reports = await _load_pending_reports(
+                session, progress['pending'], report_start_date.date()
+            )
+            logger.info(
+                f'Sending {len(pending_reports)} pending notifications of '
+                f'weekly report shard {shard_index}/{shard_count}.'
+            )
+            progress['sent'] += await _notify_weekly_reports(
+                notification_producer, pending_reports, redis_client, buckets
+            )
+            progress['pending'] = []
+            await checkpoint.save(progress)
 
-        await session.commit()
+        report_chunks = report_service.iter_short_weekly_reports(
+            shard=(shard_index, shard_count),
+            after=tuple(after) if after else None,
+        )
+        async with aclosing(report_chunks):
+            async for reports_to_notify in report_chunks:
+                if reports_to_notify:
+                    progress['pending'] = [
+                        [profile.user_id, profile.bot_id]
+                        for profile, _, _ in reports_to_notify
+                    ]
+                    await checkpoint.save(progress)
+                await session.commit()
+                if reports_to_notify:
+                    progress['sent'] += await _notify_weekly_reports(
+                        notification_producer,
+                        reports_to_notify,
+                        redis_client,
+                        buckets,
+                    )
+                    last_profile = reports_to_notify[-1][0]
+                    progress['last_key'] = [
+                        last_profile.user_id,
+                        last_profile.bot_id,
+                    ]
+                    progress['pending'] = []
+                    await checkpoint.save(progress)
+                budget = settings.report_generation_shard_budget_seconds
+                if time.monotonic() - started >= budget:
+                    out_of_budget = True
+                    break
+
+    if out_of_budget:
+        logger.info(
+            f'Weekly report shard {shard_index}/{shard_count} used its time '
+            f'budget after {progress["sent"]} notifications, continuing in '
+            f'a retry.'
+        )
+        raise Retry(defer=0)
 
-    if not reports_to_notify:
-        logger.info('No reports were generated, finishing task.')
-        return
+    progress['done'] = True
+    await checkpoint.save(progress)
+    logger.info(
+        f'Weekly report shard {shard_index}/{shard_count} finished, '
+        f'{progress["sent"]} notifications enqueued in total.'
+    )
 
-    notification_producer = NotificationProducerService()
 
-    batch_size = settings.report_notification_batch_size
-    delay = settings.report_notification_batch_delay_seconds
+async def _load_pending_reports(
+    session: AsyncSession,
+    pending_keys: List[List],
+    week_start_date: date,
+) -> list[tuple[UserBotProfile, User, UserReport]]:
+    """
+    Returns (profile, user, report) for the pending profiles whose report
+    for the week was committed. Reports that were not committed are
+    generated again, as their profiles are still due.
+    """
+    report_repo = SQLAlchemyUserReportRepository(session)
+    profile_repo = SQLAlchemyUserBotProfileRepository(session)
+    pending_reports = []
+    for user_id, bot_id in pending_keys:
+        report = await report_repo.get_by_user_bot_and_week(
+            user_id, bot_id, week_start_date
+        )
+        if not report:
+            continue
+        db_profile = await profile_repo.get_with_user(user_id, bot_id)
+        if not db_profile:
+            continue
+        pending_reports.append(
+            (
+                UserBotProfile.model_validate(db_profile),
+                User.model_validate(db_profile.user),
+                report,
+            )
+        )
+    return pending_reports
+
 
-    for i in range(0, len(reports_to_notify), batch_size):
-        batch = reports_to_notify[i : i + batch_size]
-        for profile, user, report in batch:
-            if not user:
-                logger.warning(
-                    f'Profile {profile.user_id}/{profile.bot_id} '
-                    'is missing user data. Skipping notification.'
+async def _notify_weekly_reports(
+    notification_producer: NotificationProducerService,
+    reports_to_notify: list[tuple[UserBotProfile, User, UserReport]],
+    redis_client: AsyncRedis,
+    buckets: Dict[str, RedisTokenBucket],
+) -> int:
+    """
+    Enqueues report notifications, taking a token from the bot's bucket
+    before each one. Returns the number of enqueued notifications.
+    """
+    enqueues = []
+    for profile, user, report in reports_to_notify:
+        if not user:
+            logger.warning(
+                f'Profile {profile.user_id}/{profile.bot_id} '
+                'is missing user data. Skipping notification.'
+            )
+            continue
+        bucket = buckets.get(profile.bot_id)
+        if bucket is None:
+            bucket = RedisTokenBucket(
+                redis_client,
+                f'telegram:{profile.bot_id}',
+                rate_per_second=settings.report_notification_rate_per_second,
+                capacity=settings.report_notification_burst,
+            )
+            buckets[profile.bot_id] = bucket
+        await bucket.acquire()
+        enqueues.append(
+            asyncio.create_task(
+                notification_producer.enqueue_weekly_report_notification(
+                    user=user, profile=profile, report=report
                 )
-                continue
-            await notification_producer.enqueue_weekly_report_notification(
-                user=user, profile=profile, report=report
             )
-        if i + batch_size < len(reports_to_notify):
-            logger.info(f'Waiting for {delay} seconds before next batch.')
-            await asyncio.sleep(delay)
+        )
+    results = await asyncio.gather(*enqueues)
+    return sum(1 for enqueued in results if enqueued)
@@ -0,0 +1,86 @@
+import argparse
+import asyncio
+import logging
+from datetime import timedelta
+
+from app.config import settings
+from app.db.db import async_session_maker
+from app.db.repositories.daily_user_activity import (
+    SQLAlchemyDailyUserActivityRepository,
+)
+
+logger = logging.getLogger(__name__)
+
+
+async def advance_daily_user_activity(
+    stop_event: asyncio.Event, batch_span: timedelta
+) -> int:
+    """
+    Consumes new attempts into daily_user_activity in batches of at most
+    batch_span of history, committing each batch, until it is caught up.
+    Returns the number of batches committed.
+    """
+    batches = 0
+    while not stop_event.is_set():
+        async with async_session_maker() as session:
+            repo = SQLAlchemyDailyUserActivityRepository(session)
+            watermark = await repo.advance(max_span=batch_span)
+            if watermark is None:
+                break
+            await session.commit()
+        batches += 1
+    return batches
+
+
+async def daily_activity_rollup_loop(stop_event: asyncio.Event):
+    logger.info('Daily Activity Rollup Worker started.')
+    batch_span = timedelta(days=settings.daily_activity_rollup_batch_days)
+
+    while not stop_event.is_set():
+        try:
+            await advance_daily_user_activity(stop_event, batch_span)
+        except Exception as e:
+            logger.error(
+                f'Error in Daily Activity Rollup Worker cycle: {e}',
+                exc_info=True,
+            )
+
+        try:
+            await asyncio.wait_for(
+                stop_event.wait(),
+                timeout=settings.daily_activity_rollup_interval_seconds,
+            )
+        except asyncio.TimeoutError:
+            pass
+        except asyncio.CancelledError:
+            logger.info(
+                'Daily Activity Rollup Worker loop task '
+                'cancelled during sleep interval.'
+            )
+            break
+    logger.info('Daily Activity Rollup Worker loop terminated.')
+
+
+async def backfill(batch_days: int) -> None:
+    batches = await advance_daily_user_activity(
+        asyncio.Event(), timedelta(days=batch_days)
+    )
+    logger.info(f'Backfilled daily user activity in {batches} batches.')
+
+
+if __name__ == '__main__':
+    from app.logging_config import configure_logging
+
+    configure_logging()
+    parser = argparse.ArgumentParser(
+        description='Aggregates all existing exercise attempts into '
+        'daily_user_activity, continuing from the last watermark.'
+    )
+    parser.add_argument(
+        '--batch-days',
+        type=int,
+        default=settings.daily_activity_rollup_batch_days,
+        help='Days of attempt history consumed per transaction.',
+    )
+    args = parser.parse_args()
+    asyncio.run(backfill(args.batch_days))
@@ -0,0 +1,54 @@
+import asyncio
+import logging
+
+from app.config import settings
+from app.services.exercise_deduplicator import ExerciseDeduplicator
+
+logger = logging.getLogger(__name__)
+
+
+async def index_all_missing(
+    deduplicator: ExerciseDeduplicator, stop_event: asyncio.Event
+) -> int:
+    """
+    Indexes published exercises in batches until none is missing.
+    Returns the number of added fingerprints.
+    """
+    batch_size = settings.exercise_fingerprint_backfill_batch_size
+    total = 0
+    while not stop_event.is_set():
+        added = await deduplicator.index_missing(batch_size)
+        total += added
+        if added < batch_size:
+            break
+    return total
+
+
+async def exercise_fingerprint_index_loop(
+    deduplicator: ExerciseDeduplicator, stop_event: asyncio.Event
+):
+    logger.info('Exercise Fingerprint Index Worker started.')
+
+    while not stop_event.is_set():
+        try:
+            await index_all_missing(deduplicator, stop_event)
+        except Exception as e:
+            logger.error(
+                f'Error in Exercise Fingerprint Index Worker cycle: {e}',
+                exc_info=True,
+            )
+
+        try:
+            await asyncio.wait_for(
+                stop_event.wait(),
+                timeout=settings.exercise_fingerprint_index_interval_seconds,
+            )
+        except asyncio.TimeoutError:
+            pass
+        except asyncio.CancelledError:
+            logger.info(
+                'Exercise Fingerprint Index Worker loop task '
+                'cancelled during sleep interval.'
+            )
+            break
+    logger.info('Exercise Fingerprint Index Worker loop terminated.')
@@ -20,13 +20,13 @@ MIN_HOURS_SINCE_LAST_UPDATE_FOR_REVIEW = 24
 
 async def check_exercises_for_review(session: AsyncSession):
     exercise_repo = SQLAlchemyExerciseRepository(session)
+    await exercise_repo.advance_exercise_quality_stats()
 
     min_weighted_attempts_sum = MIN_WEIGHTED_ATTEMPTS_SUM_FOR_REVIEW
     getter = exercise_repo.get_exercise_ids_for_quality_review
     exercise_ids_to_review = await getter(
         min_weighted_attempts_sum_for_review=min_weighted_attempts_sum,
         weighted_error_threshold=EXERCISE_REVIEW_CANDIDATE_THRESHOLD,
-        default_user_rating=0.1,
         min_hours_since_last_update=MIN_HOURS_SINCE_LAST_UPDATE_FOR_REVIEW,
     )
 
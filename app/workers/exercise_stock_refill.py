@@ -1,4 +1,5 @@
 import asyncio
+import hashlib
 import logging
 import random
 from datetime import datetime, timezone
@@ -15,6 +16,7 @@ from app.core.configs.enums import (
 from app.core.configs.generation.config import PERSONAS, ExerciseTopic
 from app.core.configs.generation.persona import Persona
 from app.core.configs.generation.selector import select_persona_for_topic
+from app.core.entities.audio_artifact import AudioArtifact
 from app.core.entities.exercise import Exercise
 from app.core.entities.exercise_answer import ExerciseAnswer
 from app.core.services.language_config import LanguageConfigService
@@ -23,17 +25,26 @@ from app.core.value_objects.exercise import (
     StoryComprehensionExerciseData,
 )
 from app.db.db import async_session_maker
+from app.db.repositories.audio_artifact import (
+    SQLAlchemyAudioArtifactRepository,
+)
 from app.db.repositories.exercise import SQLAlchemyExerciseRepository
 from app.db.repositories.exercise_answers import (
     SQLAlchemyExerciseAnswerRepository,
 )
+from app.infrastructure.circuit_breaker import get_circuit_breaker
 from app.llm.generators.choose_accent_generator import (
     ChooseAccentGenerationError,
 )
 from app.llm.llm_service import LLMService
-from app.metrics import BACKEND_EXERCISE_METRICS
+from app.metrics import BACKEND_EXERCISE_METRICS, BACKEND_TTS_METRICS
+from app.services.exercise_deduplicator import DuplicateExerciseError
 from app.services.file_storage_service import R2FileStorageService
-from app.services.tts_service import GoogleTTSService
+from app.services.tts_service import (
+    TTS_CIRCUIT_BREAKER_NAME,
+    GoogleTTSService,
+    story_audio_digest,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -44,7 +55,6 @@ EXERCISE_REFILL_INTERVAL = settings.exercise_refill_interval
 CHANCE_TO_GENERATE_PERSONA_FOR_TOPIC = (
     settings.chance_to_generate_persona_for_topic
 )
-TTS_COOLDOWN_SECONDS = settings.tts_cooldown_seconds
 DEFAULT_VOICE_NAMES = [
     'Leda',
     'Enceladus',
@@ -52,64 +62,32 @@ DEFAULT_VOICE_NAMES = [
 
 exercise_generation_semaphore = asyncio.Semaphore(5)
 
-_tts_last_failure_timestamp: Optional[datetime] = None
-_tts_cooldown_lock = asyncio.Lock()
+TELEGRAM_UPLOAD_CIRCUIT_BREAKER_NAME = 'telegram_upload'
 
 
-async def is_tts_cooldown_active() -> bool:
-    async with _tts_cooldown_lock:
-        if _tts_last_failure_timestamp:
-            return (
-                datetime.now(timezone.utc) - _tts_last_failure_timestamp
-            ).total_seconds() < TTS_COOLDOWN_SECONDS
-        return False
+async def is_tts_circuit_open() -> bool:
+    return await get_circuit_breaker(TTS_CIRCUIT_BREAKER_NAME).is_open()
 
 
-async def set_tts_failure_timestamp():
-    async with _tts_cooldown_lock:
-        global _tts_last_failure_timestamp
-        _tts_last_failure_timestamp = datetime.now(timezone.utc)
-        logger.warning(
-            f'TTS failure detected. Activating cooldown. '
-            f'Last failure set to: {_tts_last_failure_timestamp}',
-        )
+def get_story_audio_file_name(digest: str) -> str:
+    """R2 key of story audio; equal audio always maps to the same key."""
+    return f'story_audio/{digest}.ogg'
 
 
-async def reset_tts_cooldown_if_passed():
-    async with _tts_cooldown_lock:
-        global _tts_last_failure_timestamp
-        if _tts_last_failure_timestamp and (
-            (
-                datetime.now(
-                    timezone.utc,
-                )
-                - _tts_last_failure_timestamp
-            ).total_seconds()
-            >= TTS_COOLDOWN_SECONDS
-        ):
-            logger.info(
-                'TTS cooldown period has passed. '
-                'Resetting failure timestamp.',
-            )
-            _tts_last_failure_timestamp = None
+def get_default_voice_name(text: str) -> str:
+    """
+    Picks a default voice deterministically from the text, so retries of
+    the same story hit the audio cache.
+    """
+    text_hash = hashlib.sha256(text.encode('utf-8')).digest()
+    return DEFAULT_VOICE_NAMES[text_hash[0] % len(DEFAULT_VOICE_NAMES)]
 
 
 async def get_saved_audio_url(
     ogg_audio_data: bytes,
     file_storage_service: R2FileStorageService,
-    bot_id: str,
-    language_level: LanguageLevel,
-    topic: ExerciseTopic,
+    file_name: str,
 ) -> str:
-    timestamp = int(datetime.now(timezone.utc).timestamp())
-    file_name = (
-        f'{bot_id}/'
-        f'story_audio/'
-        f'{language_level.value}/'
-        f'{topic.value}/'
-        f'{timestamp}.ogg'
-    )
-
     stored_audio_url = await file_storage_service.upload_audio(
         file_data=ogg_audio_data,
         file_name=file_name,
@@ -135,6 +113,17 @@ async def get_saved_audio_telegram_file_id(
         logger.error(f'Failed to get bot token for {bot_id}')
         return ''
 
+    file_id = await get_circuit_breaker(
+        TELEGRAM_UPLOAD_CIRCUIT_BREAKER_NAME
+    ).call(_send_voice_to_telegram, ogg_audio_data, http_client, token)
+    return file_id or ''
+
+
+async def _send_voice_to_telegram(
+    ogg_audio_data: bytes,
+    http_client: httpx.AsyncClient,
+    token: str,
+) -> str:
     url = f'https://api.telegram.org/bot{token}/sendVoice'
     files = {'voice': ('audio.ogg', ogg_audio_data, 'audio/ogg')}
     data = {'chat_id': settings.telegram_upload_bot_chat_id}
@@ -171,8 +160,6 @@ async def get_saved_audio_telegram_file_id(
 async def _generate_and_upload_audio(
     exercise_data: StoryComprehensionExerciseData,
     target_language: str,
-    language_level: LanguageLevel,
-    topic: ExerciseTopic,
     tts_service: GoogleTTSService,
     file_storage_service: R2FileStorageService,
     http_client: httpx.AsyncClient,
@@ -181,11 +168,11 @@ async def _generate_and_upload_audio(
 ) -> tuple[Optional[str], Optional[str], bool]:
     """
     Generates OGG audio from text, uploads it to R2 and Telegram.
+    Synthesis and uploads already done for the same audio digest are
+    skipped and taken from the audio artifact cache.
     Returns a tuple: (audio_url, telegram_file_id, success_flag).
     success_flag is True if both audio_url and telegram_file_id are obtained.
     """
-    audio_url: Optional[str] = None
-    telegram_file_id: Optional[str] = None
     audio_generation_successful = False
 
     if not exercise_data.content_text:
@@ -202,32 +189,82 @@ async def _generate_and_upload_audio(
         return None, None, True
 
     if not voice_name:
-        voice_name = random.choice(DEFAULT_VOICE_NAMES)
+        voice_name = get_default_voice_name(exercise_data.content_text)
 
-    ogg_audio_data = await tts_service.text_to_speech_ogg(
+    digest = story_audio_digest(
         text=exercise_data.content_text,
         voice_name=voice_name,
         emotion_instruction=emotion_instruction,
     )
+    async with async_session_maker() as session:
+        artifact = await SQLAlchemyAudioArtifactRepository(
+            session
+        ).get_by_digest(digest) or AudioArtifact(
+            digest=digest, r2_key=None, audio_url=None
+        )
 
-    if ogg_audio_data:
-        r2_url = await get_saved_audio_url(
-            ogg_audio_data=ogg_audio_data,
-            bot_id=target_language,
-            language_level=language_level,
-            topic=topic,
-            file_storage_service=file_storage_service,
+    audio_url = artifact.audio_url
+    telegram_file_id = artifact.telegram_file_ids.get(target_language)
+    cache_result = (
+        'hit'
+        if audio_url and telegram_file_id
+        else 'partial'
+        if audio_url or artifact.telegram_file_ids
+        else 'miss'
+    )
+    BACKEND_TTS_METRICS['audio_cache_lookups'].labels(
+        result=cache_result
+    ).inc()
+    if cache_result == 'hit':
+        logger.info(f'Reusing cached story audio {digest}.')
+        return audio_url, telegram_file_id, True
+
+    ogg_audio_data: Optional[bytes] = None
+    if audio_url and artifact.r2_key:
+        ogg_audio_data = await file_storage_service.download_audio(
+            artifact.r2_key
+        )
+    if not ogg_audio_data:
+        ogg_audio_data = await tts_service.text_to_speech_ogg(
+            text=exercise_data.content_text,
+            voice_name=voice_name,
+            emotion_instruction=emotion_instruction,
         )
-        if r2_url:
-            audio_url = r2_url
 
-        tg_file_id = await get_saved_audio_telegram_file_id(
-            ogg_audio_data=ogg_audio_data,
-            bot_id=target_language,
-            http_client=http_client,
+    if ogg_audio_data:
+        file_name = get_story_audio_file_name(digest)
+        uploads = {}
+        if not audio_url:
+            uploads['r2'] = get_saved_audio_url(
+                ogg_audio_data=ogg_audio_data,
+                file_storage_service=file_storage_service,
+                file_name=file_name,
+            )
+        if not telegram_file_id:
+            uploads['telegram'] = get_saved_audio_telegram_file_id(
+                ogg_audio_data=ogg_audio_data,
+                bot_id=target_language,
+                http_client=http_client,
+            )
+        upload_results = dict(
+            zip(
+                uploads,
+                await asyncio.gather(*uploads.values()),
+                strict=True,
+            )
         )
-        if tg_file_id:
-            telegram_file_id = tg_file_id
+        if upload_results.get('r2'):
+            audio_url = upload_results['r2']
+            artifact.r2_key = file_name
+            artifact.audio_url = audio_url
+        if upload_results.get('telegram'):
+            telegram_file_id = upload_results['telegram']
+            artifact.telegram_file_ids[target_language] = telegram_file_id
+
+        if artifact.audio_url or artifact.telegram_file_ids:
+            async with async_session_maker() as session:
+                await SQLAlchemyAudioArtifactRepository(session).save(artifact)
+                await session.commit()
 
         if audio_url and telegram_file_id:
             audio_generation_successful = True
@@ -299,8 +336,6 @@ async def _try_to_regenerate_audio_for_exercise(
     ) = await _generate_and_upload_audio(
         exercise_data=exercise_to_retry.data,
         target_language=target_language,
-        language_level=exercise_to_retry.language_level,
-        topic=exercise_to_retry.topic,
         tts_service=tts_service,
         file_storage_service=file_storage_service,
         http_client=http_client,
@@ -361,9 +396,9 @@ async def _repair_broken_audio_for_exercise(
     file_storage_service: R2FileStorageService,
     http_client: httpx.AsyncClient,
 ) -> Tuple[bool, bool]:
-    if await is_tts_cooldown_active():
+    if await is_tts_circuit_open():
         logger.info(
-            'TTS cooldown active, skipping repair attempt for broken audio.',
+            'TTS circuit open, skipping repair attempt for broken audio.',
         )
         return False, False
 
@@ -446,7 +481,7 @@ async def generate_and_save_exercise(
 
             if (
                 exercise_type == ExerciseType.STORY_COMPREHENSION
-                and not await is_tts_cooldown_active()
+                and not await is_tts_circuit_open()
             ):
                 (
                     repaired_and_published,
@@ -469,13 +504,13 @@ async def generate_and_save_exercise(
 
             if (
                 exercise_type == ExerciseType.STORY_COMPREHENSION
-                and await is_tts_cooldown_active()
+                and await is_tts_circuit_open()
             ):
                 logger.warning(
                     f'Skipping STORY_COMPREHENSION exercise generation '
                     f'(Topic: {topic.value}, '
                     f'Level: {language_level.value}) '
-                    f'due to TTS cooldown.',
+                    f'because the TTS circuit is open.',
                 )
                 return False, False
 
@@ -494,6 +529,9 @@ async def generate_and_save_exercise(
                     exc_info=True,
                 )
                 return False, tts_failed_this_generation
+            except DuplicateExerciseError as e:
+                logger.warning(f'Skipping duplicate exercise: {e}')
+                return False, tts_failed_this_generation
 
             if exercise.status == ExerciseStatus.PUBLISHED and isinstance(
                 exercise.data,
@@ -516,8 +554,6 @@ async def generate_and_save_exercise(
                 ) = await _generate_and_upload_audio(
                     exercise_data=exercise.data,
                     target_language=target_language,
-                    language_level=exercise.language_level,
-                    topic=exercise.topic,
                     tts_service=tts_service,
                     file_storage_service=file_storage_service,
                     http_client=http_client,
@@ -748,7 +784,6 @@ async def exercise_stock_refill_loop(
     try:
         while not stop_event.is_set():
             logger.info('Starting exercise refill cycle...')
-            await reset_tts_cooldown_if_passed()
 
             try:
                 tts_failure_detected_in_cycle = await exercise_stock_refill(
@@ -759,7 +794,10 @@ async def exercise_stock_refill_loop(
                     language_config_service=language_config_service,
                 )
                 if tts_failure_detected_in_cycle:
-                    await set_tts_failure_timestamp()
+                    logger.warning(
+                        'TTS failures in this refill cycle; the google_tts '
+                        'circuit breaker decides whether TTS is paused.',
+                    )
 
             except Exception as e:
                 logger.error(
@@ -1,12 +1,10 @@
 import asyncio
-import collections
 import logging
 from datetime import datetime, timezone
-from typing import List, Set
+from typing import Set
 
 from app.config import settings
 from app.db.db import async_session_maker
-from app.db.models import DBUserBotProfile
 from app.db.repositories.user_bot_profile import (
     SQLAlchemyUserBotProfileRepository,
 )
@@ -18,110 +16,41 @@ all_possible_active_user_labels: Set[tuple] = set()
 
 
 async def update_user_sessions_metrics():
+    """
+    Sets the active sessions gauge from counts grouped in the database.
+    Session length and exercises per session are observed by
+    UserProgressService when a session ends.
+    """
     now = datetime.now(timezone.utc)
-    active_users_label_counts = collections.Counter()
     try:
         async with async_session_maker() as session:
             user_profile_repo = SQLAlchemyUserBotProfileRepository(session)
-            period_seconds = int(
-                settings.session_ttl_since_last_exercise.total_seconds()
-                + settings.update_user_metrics_interval
+            rows = await user_profile_repo.count_active_sessions_by_labels(
+                active_since=now - settings.session_ttl_since_last_exercise
             )
-            profiles: List[
-                DBUserBotProfile
-            ] = await user_profile_repo.get_by_recent_exercise_with_user_data(
-                period_seconds=period_seconds
-            )
-
-            for profile in profiles:
-                if not profile.user:
-                    logger.warning(
-                        f'Profile {profile.user_id}/{profile.bot_id} '
-                        f'is missing user data. Skipping.'
-                    )
-                    continue
-                label_tuple = (
-                    profile.user.cohort,
-                    profile.user.plan,
-                    profile.bot_id,
-                    profile.user_language,
-                    profile.language_level.value,
-                )
 
-                label_dict = dict(
-                    zip(
-                        backend_user_metrics_label_names,
-                        label_tuple,
-                        strict=False,
-                    )
-                )
-                all_possible_active_user_labels.add(label_tuple)
+        active_users_label_counts = {}
+        for cohort, plan, bot_id, user_language, level, sessions in rows:
+            label_tuple = (cohort, plan, bot_id, user_language, level.value)
+            active_users_label_counts[label_tuple] = sessions
+        all_possible_active_user_labels.update(active_users_label_counts)
 
-                session_ended = profile.session_frozen_until is not None or (
-                    profile.last_exercise_at
-                    and (
-                        now - profile.last_exercise_at
-                        > settings.session_ttl_since_last_exercise
-                    )
+        for label_tuple in all_possible_active_user_labels:
+            label_dict = dict(
+                zip(
+                    backend_user_metrics_label_names,
+                    label_tuple,
+                    strict=False,
                 )
-
-                if (
-                    session_ended
-                    and profile.session_started_at
-                    and profile.last_exercise_at
-                ):
-                    session_duration = (
-                        profile.last_exercise_at - profile.session_started_at
-                    ).total_seconds()
-                    if session_duration >= 0:
-                        BACKEND_USER_METRICS['session_length'].labels(
-                            **label_dict
-                        ).observe(session_duration)
-                        BACKEND_USER_METRICS['exercises_per_session'].labels(
-                            **label_dict
-                        ).inc(profile.exercises_get_in_session)
-                        logger.debug(
-                            f'Session ended for user {profile.user_id}'
-                            f'/{profile.bot_id}: '
-                            f'duration {session_duration}s, exercises '
-                            f'{profile.exercises_get_in_session}'
-                        )
-                elif (
-                    profile.session_started_at
-                    and profile.last_exercise_at
-                    and not session_ended
-                ):
-                    active_users_label_counts[label_tuple] += 1
-
-            for existing_label_tuple in list(all_possible_active_user_labels):
-                if existing_label_tuple not in active_users_label_counts:
-                    label_dict_to_reset = dict(
-                        zip(
-                            backend_user_metrics_label_names,
-                            existing_label_tuple,
-                            strict=False,
-                        )
-                    )
-                    BACKEND_USER_METRICS['active'].labels(
-                        **label_dict_to_reset
-                    ).set(0)
-
-            for label_tuple, count in active_users_label_counts.items():
-                label_dict_to_set = dict(
-                    zip(
-                        backend_user_metrics_label_names,
-                        label_tuple,
-                        strict=False,
-                    )
-                )
-                BACKEND_USER_METRICS['active'].labels(**label_dict_to_set).set(
-                    count
-                )
-
-            logger.info(
-                f'Users metrics updated. Active sessions processed: '
-                f'{sum(active_users_label_counts.values())}'
             )
+            BACKEND_USER_METRICS['active'].labels(**label_dict).set(
+                active_users_label_counts.get(label_tuple, 0)
+            )
+
+        logger.info(
+            f'Users metrics updated. Active sessions: '
+            f'{sum(active_users_label_counts.values())}'
+        )
     except Exception as e:
         logger.error(
             f'Error in update_user_sessions_metrics: {e}', exc_info=True
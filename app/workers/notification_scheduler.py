@@ -1,7 +1,7 @@
 import asyncio
 import logging
-from datetime import datetime, time, timedelta, timezone
-from typing import List, Tuple
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional, Tuple
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -11,7 +11,6 @@ from app.core.entities.user_bot_profile import (
     UserBotProfile,
 )
 from app.db.db import async_session_maker
-from app.db.models import DBUserBotProfile
 from app.db.repositories.user_bot_profile import (
     SQLAlchemyUserBotProfileRepository,
 )
@@ -35,54 +34,15 @@ class NotificationScheduler:
         self._running = False
         self._stop_event = stop_event
 
-    async def _process_session_reminders(
-        self, user: User, profile: UserBotProfile
-    ) -> None:
-        """
-        Checks and enqueues session reminders for a user profile.
-        """
-        now = datetime.now(timezone.utc)
-
-        if profile.wants_session_reminders is not True:
-            return
-
-        if not profile.session_frozen_until:
-            return
-
-        window_start_time = now - timedelta(
-            seconds=settings.notification_scheduler_interval_seconds
-        )
-        window_end_time = now
-
-        if not (
-            window_start_time < profile.session_frozen_until <= window_end_time
-        ):
-            return
-
-        logger.info(
-            f'Attempting to send session reminder to user {user.user_id} '
-            f'for bot_id {profile.bot_id} '
-            f'(session became available recently)'
-        )
-        success = await self.producer.prepare_and_enqueue_session_reminder(
-            user, profile
-        )
-        if success:
-            logger.info(
-                f'Session reminder successfully enqueued for user '
-                f'{user.user_id}, '
-                f'bot_id {profile.bot_id}'
-            )
-
     async def _process_long_break_reminders(
-        self, session: AsyncSession, user: User, profile: UserBotProfile
-    ) -> None:
+        self, user: User, profile: UserBotProfile, now: datetime
+    ) -> Optional[str]:
         """
-        Checks and enqueues long break reminders for a user profile.
+        Checks and enqueues a long break reminder for a user profile.
+        Returns the type of the enqueued reminder, if any.
         """
-        now = datetime.now(timezone.utc)
         if not profile.last_exercise_at:
-            return
+            return None
 
         time_since_last_activity = now - profile.last_exercise_at
 
@@ -137,7 +97,7 @@ class NotificationScheduler:
                         f'({time_since_last_long_break_sent_hours:.2f} '
                         f'hours ago). Skipping.'
                     )
-                    return
+                    return None
 
             logger.info(
                 f'User {user.user_id}, bot_id {profile.bot_id} '
@@ -158,125 +118,75 @@ class NotificationScheduler:
                     f' successfully enqueued '
                     f'for user {user.user_id}, bot_id {profile.bot_id}'
                 )
-                profile_repo = self.profile_repo_class(session)
-                updated_profile_data = profile.model_copy(
-                    update={
-                        'last_long_break_reminder_type_sent': reminder_type,
-                        'last_long_break_reminder_sent_at': now,
-                    }
-                )
-                await profile_repo.update(updated_profile_data)
+                return reminder_type
+        return None
 
     async def _process_user_profiles(
         self,
-        profiles: List[DBUserBotProfile],
+        profiles: List[Tuple[User, UserBotProfile]],
         reminder_type: NotificationType,
         session: AsyncSession,
     ):
+        """
+        Enqueues reminders and then records all sent ones in one bulk
+        update instead of a read-modify-write per profile.
+        """
+        now = datetime.now(timezone.utc)
+        sent: List[Tuple[UserBotProfile, str]] = []
         processed_users_count = 0
-        for profile in profiles:
-            user_entity = User.model_validate(profile.user)
-            profile_entity = UserBotProfile.model_validate(profile)
-            if not user_entity.user_id or not user_entity.telegram_id:
+        for user, profile in profiles:
+            if not user.user_id or not user.telegram_id:
                 logger.warning(
-                    f'Skipping user with incomplete '
-                    f'data: {user_entity.user_id}'
+                    f'Skipping user with incomplete data: {user.user_id}'
                 )
                 continue
 
             try:
                 match reminder_type:
-                    case NotificationType.SESSION_REMINDER:
-                        await self._process_session_reminders(
-                            user_entity, profile_entity
-                        )
                     case NotificationType.LONG_BREAK_REMINDER:
-                        await self._process_long_break_reminders(
-                            session, user_entity, profile_entity
+                        sent_type = await self._process_long_break_reminders(
+                            user, profile, now
                         )
+                        if sent_type:
+                            sent.append((profile, sent_type))
 
             except Exception as e:
                 logger.error(
-                    f'Error processing profile {user_entity.user_id}'
-                    f'/{profile_entity.bot_id} '
+                    f'Error processing profile {user.user_id}'
+                    f'/{profile.bot_id} '
                     f'for notifications: {e}',
                     exc_info=True,
                 )
             processed_users_count += 1
+
+        if sent:
+            profile_repo = self.profile_repo_class(session)
+            await profile_repo.mark_long_break_reminders_sent(
+                sent, sent_at=now
+            )
         logger.info(
             f'Notification scheduler: Processed {processed_users_count} '
-            f'{reminder_type.value} notifications.'
+            f'{reminder_type.value} notifications, sent {len(sent)}.'
         )
 
     async def run_check_cycle(self) -> None:
         """
         Runs a single cycle of checking and enqueuing notifications.
         """
-
-        def _get_min_long_break_duration() -> int:
-            first_reminder = settings.long_break_reminder_sequence[0]
-            result = settings.long_break_reminder_intervals.get(first_reminder)
-            if result:
-                return int(result.total_seconds())
-            else:
-                return 0
-
-        def _get_long_reminder_window_time() -> Tuple[time, time]:
-            now = datetime.now(timezone.utc)
-            current_utc_time = now.time()
-            half_window_seconds = (
-                settings.long_break_reminder_time_window_seconds / 2
-            )
-            base_dt_for_window = datetime.combine(now.date(), current_utc_time)
-
-            calculated_window_start = (
-                base_dt_for_window - timedelta(seconds=half_window_seconds)
-            ).time()
-            calculated_window_end = (
-                base_dt_for_window + timedelta(seconds=half_window_seconds)
-            ).time()
-            logger.debug(
-                f'Scheduler: Preparing to fetch long break reminders. '
-                f'Current UTC time for window: {current_utc_time}. '
-                f'Configured window: '
-                f'{settings.long_break_reminder_time_window_seconds}. '
-                f'Calculated window: '
-                f'{calculated_window_start} - {calculated_window_end}'
-            )
-            return calculated_window_start, calculated_window_end
-
         logger.info('Notification scheduler: Starting check cycle.')
 
         async with async_session_maker() as session:
             profile_repo = self.profile_repo_class(session)
-            profiles_for_unfreeze_notification = (
-                await profile_repo.get_unfrozen_for_reminder(
-                    settings.notification_scheduler_interval_seconds
-                )
+            profile_chunks = profile_repo.iter_due_for_long_break_reminder(
+                now=datetime.now(timezone.utc)
             )
-            await self._process_user_profiles(
-                profiles=profiles_for_unfreeze_notification,
-                reminder_type=NotificationType.SESSION_REMINDER,
-                session=session,
-            )
-
-            min_break_duration_seconds = _get_min_long_break_duration()
-            window_start_time, window_end_time = (
-                _get_long_reminder_window_time()
-            )
-            profiles_for_long_break_notification = (
-                await profile_repo.get_with_long_break_for_reminder(
-                    min_break_duration_seconds=min_break_duration_seconds,
-                    window_start_time=window_start_time,
-                    window_end_time=window_end_time,
+            async for profiles in profile_chunks:
+                await self._process_user_profiles(
+                    profiles=profiles,
+                    reminder_type=NotificationType.LONG_BREAK_REMINDER,
+                    session=session,
                 )
-            )
-            await self._process_user_profiles(
-                profiles=profiles_for_long_break_notification,
-                reminder_type=NotificationType.LONG_BREAK_REMINDER,
-                session=session,
-            )
-            await session.commit()
+                await session.commit()
 
         logger.info('Notification scheduler: Check cycle finished.')
 
@@ -0,0 +1,187 @@
+import asyncio
+import contextlib
+import logging
+from datetime import datetime, timedelta, timezone
+
+from redis.asyncio import Redis as AsyncRedis
+from redis.exceptions import RedisError
+
+from app.config import settings
+from app.core.entities.user import User
+from app.core.entities.user_bot_profile import (
+    UserBotProfile,
+    UserStatusInBot,
+)
+from app.db.db import async_session_maker
+from app.db.repositories.user_bot_profile import (
+    SQLAlchemyUserBotProfileRepository,
+)
+from app.infrastructure.delay_queue import SessionReminderQueue
+from app.services.notification_producer import NotificationProducerService
+
+logger = logging.getLogger(__name__)
+
+
+class SessionReminderConsumer:
+    """
+    Sends session-unlock reminders at the moment the session unlocks.
+
+    UserBotProfileService puts an entry into the delay queue whenever it
+    freezes a session; this consumer sleeps until the earliest entry is
+    due, pops due entries and re-checks the profile before enqueueing the
+    notification.
+    """
+
+    def __init__(
+        self,
+        queue: SessionReminderQueue,
+        notification_producer: NotificationProducerService,
+        profile_repo_class=SQLAlchemyUserBotProfileRepository,
+    ):
+        self.queue = queue
+        self.producer = notification_producer
+        self.profile_repo_class = profile_repo_class
+
+    async def backfill(self) -> int:
+        """
+        Queues reminders for sessions frozen before the queue existed or
+        while Redis was unavailable, and for sessions that unlocked within
+        the backfill window: their entry may have been popped by a worker
+        that died before sending, or never popped while no worker ran.
+        Re-adding a queued entry is a no-op and mark_sent drops reminders
+        that were already sent.
+        """
+        unlocks_after = datetime.now(timezone.utc) - timedelta(
+            seconds=settings.session_reminder_backfill_window_seconds
+        )
+        queued = 0
+        async with async_session_maker() as session:
+            profile_repo = self.profile_repo_class(session)
+            profile_chunks = profile_repo.iter_frozen_for_session_reminder(
+                unlocks_after
+            )
+            async for profiles in profile_chunks:
+                for profile in profiles:
+                    await self.queue.schedule_reminder(
+                        profile.user_id,
+                        profile.bot_id,
+                        profile.session_frozen_until,
+                    )
+                queued += len(profiles)
+        logger.info(
+            f'Session reminder consumer: queued {queued} frozen or '
+            f'recently unlocked sessions on startup.'
+        )
+        return queued
+
+    async def _send_reminder(self, user_id: int, bot_id: str) -> None:
+        now = datetime.now(timezone.utc)
+        async with async_session_maker() as session:
+            profile_repo = self.profile_repo_class(session)
+            db_profile = await profile_repo.get_with_user(user_id, bot_id)
+            if not db_profile:
+                return
+            profile = UserBotProfile.model_validate(db_profile)
+            user = User.model_validate(db_profile.user)
+
+        if (
+            profile.wants_session_reminders is not True
+            or profile.status != UserStatusInBot.ACTIVE
+            or not profile.session_frozen_until
+            or profile.session_frozen_until > now
+            or not user.telegram_id
+        ):
+            return
+        if not await self.queue.mark_sent(
+            user_id, bot_id, profile.session_frozen_until
+        ):
+            logger.info(
+                f'Session reminder for user {user_id}, bot_id {bot_id} '
+                f'was already sent, skipping duplicate.'
+            )
+            return
+
+        try:
+            success = await self.producer.prepare_and_enqueue_session_reminder(
+                user, profile
+            )
+        except Exception:
+            await self.queue.unmark_sent(
+                user_id, bot_id, profile.session_frozen_until
+            )
+            raise
+        if success:
+            logger.info(
+                f'Session reminder enqueued for user {user_id}, '
+                f'bot_id {bot_id}, '
+                f'{(now - profile.session_frozen_until).total_seconds():.3f}s '
+                f'after unlock.'
+            )
+
+    async def process_due(self) -> int:
+        """Pops and handles one batch of due reminders."""
+        reminders = await self.queue.pop_due_reminders(
+            limit=settings.session_reminder_batch_size
+        )
+        for user_id, bot_id in reminders:
+            try:
+                await self._send_reminder(user_id, bot_id)
+            except Exception as e:
+                logger.error(
+                    f'Failed to send session reminder to user {user_id}, '
+                    f'bot_id {bot_id}: {e}. Retrying later.',
+                    exc_info=True,
+                )
+                await self.queue.schedule_reminder(
+                    user_id,
+                    bot_id,
+                    datetime.now(timezone.utc)
+                    + timedelta(
+                        seconds=settings.session_reminder_retry_delay_seconds
+                    ),
+                )
+        return len(reminders)
+
+    async def seconds_until_next_due(self) -> float:
+        """
+        Sleep time until the earliest entry is due, capped so that entries
+        added in the meantime are not missed by more than the cap.
+        """
+        max_wait = settings.session_reminder_max_wait_seconds
+        next_due_at = await self.queue.next_due_at()
+        if next_due_at is None:
+            return max_wait
+        wait = (next_due_at - datetime.now(timezone.utc)).total_seconds()
+        return min(max(wait, 0.0), max_wait)
+
+    async def run(self, stop_event: asyncio.Event) -> None:
+        try:
+            await self.backfill()
+        except Exception as e:
+            logger.error(
+                f'Session reminder backfill failed: {e}', exc_info=True
+            )
+        while not stop_event.is_set():
+            try:
+                if await self.process_due():
+                    continue
+                wait = await self.seconds_until_next_due()
+            except RedisError as e:
+                logger.error(f'Session reminder consumer Redis error: {e}')
+                wait = settings.session_reminder_max_wait_seconds
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(stop_event.wait(), timeout=wait)
+        logger.info('Session reminder consumer stopped.')
+
+
+async def session_reminder_loop(
+    notification_producer: NotificationProducerService,
+    redis_client: AsyncRedis,
+    stop_event: asyncio.Event,
+) -> None:
+    consumer = SessionReminderConsumer(
+        queue=SessionReminderQueue(redis_client),
+        notification_producer=notification_producer,
+    )
+    logger.info('Session reminder consumer started.')
+    await consumer.run(stop_event)
@@ -4,5 +4,11 @@ set -e
 echo "Applying Alembic migrations..."
 alembic upgrade head
 
+if [ -n "$PROMETHEUS_MULTIPROC_DIR" ]; then
+    echo "Resetting Prometheus multiprocess directory..."
+    rm -rf "$PROMETHEUS_MULTIPROC_DIR"
+    mkdir -p "$PROMETHEUS_MULTIPROC_DIR"
+fi
+
 echo "Starting application..."
 exec "$@"
\ No newline at end of file
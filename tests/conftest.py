@@ -1,6 +1,7 @@
 import os
 import sys
-from datetime import datetime
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
 from typing import Any, AsyncGenerator, Dict, List, Optional
 from unittest.mock import AsyncMock, create_autospec, patch
 
@@ -11,6 +12,7 @@ from arq import ArqRedis
 from fastapi import FastAPI
 from httpx import ASGITransport, AsyncClient
 from redis.asyncio import Redis
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
@@ -72,6 +74,9 @@ from app.db.base import Base
 from app.db.db import get_async_session
 from app.db.models.exercise import Exercise as ExerciseModel
 from app.db.models.exercise_answer import ExerciseAnswer as ExerciseAnswerModel
+from app.db.models.exercise_attempt import (
+    ExerciseAttempt as ExerciseAttemptModel,
+)
 from app.db.models.user import User as UserModel
 from app.db.repositories.exercise import SQLAlchemyExerciseRepository
 from app.db.repositories.exercise_answers import (
@@ -156,6 +161,22 @@ async def redis() -> Redis:
     await redis.aclose()
 
 
+@pytest_asyncio.fixture(autouse=True)
+async def circuit_breakers(redis: Redis, monkeypatch):
+    """Gives circuit breakers the test Redis and fresh state per test."""
+
+    async def get_test_redis_client() -> Redis:
+        return redis
+
+    monkeypatch.setattr(
+        'app.infrastructure.circuit_breaker.get_redis_client',
+        get_test_redis_client,
+    )
+    monkeypatch.setattr(
+        'app.infrastructure.circuit_breaker._circuit_breakers', {}
+    )
+
+
 @pytest_asyncio.fixture
 async def mock_http_client():
     """Mock httpx.AsyncClient for testing."""
@@ -461,6 +482,66 @@ async def db_sample_exercise(async_session_maker: async_sessionmaker, user):
     yield exercise
 
 
+@pytest.fixture
+def aggregation_settle_seconds() -> int:
+    """Settle window for db_exercise_attempts; override to keep it."""
+    return 0
+
+
+@dataclass
+class ExerciseAttempts:
+    session: AsyncSession
+    exercise_id: int
+
+    async def add(self, attempts: List[tuple]) -> None:
+        """
+        Add (user_id, is_correct[, created_at]) attempts; created_at
+        defaults to a second ago and failed attempts get a grammar error
+        tag.
+        """
+        default_created_at = datetime.now(timezone.utc) - timedelta(seconds=1)
+        await self.session.execute(
+            insert(ExerciseAttemptModel),
+            [
+                {
+                    'user_id': user_id,
+                    'exercise_id': self.exercise_id,
+                    'answer': {},
+                    'is_correct': is_correct,
+                    'error_tags': (
+                        None if is_correct else {'grammar': 'gender'}
+                    ),
+                    'created_at': (
+                        created_at[0] if created_at else default_created_at
+                    ),
+                }
+                for user_id, is_correct, *created_at in attempts
+            ],
+        )
+
+
+@pytest_asyncio.fixture
+async def db_exercise_attempts(
+    db_session: AsyncSession, monkeypatch, aggregation_settle_seconds
+) -> ExerciseAttempts:
+    """A tagged exercise to add attempts on for the aggregation tests."""
+    monkeypatch.setattr(
+        settings, 'aggregation_settle_seconds', aggregation_settle_seconds
+    )
+    exercise = ExerciseModel(
+        exercise_type=ExerciseType.FILL_IN_THE_BLANK.value,
+        exercise_language='Bulgarian',
+        language_level='A1',
+        topic=ExerciseTopic.GENERAL.value,
+        exercise_text='Fill in the blank.',
+        data={'text_with_blanks': '____', 'words': ['word']},
+        grammar_tags={'grammar': ['articles'], 'vocabulary': 'food'},
+    )
+    db_session.add(exercise)
+    await db_session.flush()
+    return ExerciseAttempts(db_session, exercise.exercise_id)
+
+
 @pytest.fixture
 def user_id_for_sample_request(user_data, db_sample_exercise):
     return user_data['user_id']
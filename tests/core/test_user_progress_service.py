@@ -333,6 +333,9 @@ async def test_get_next_action_returns_congratulations_and_wait(
     user_bot_profile.session_started_at = datetime.now(
         timezone.utc
     ) - timedelta(minutes=10)
+    user_bot_profile.last_exercise_at = (
+        user_bot_profile.session_started_at + timedelta(minutes=8)
+    )
     user_bot_profile.exercises_get_in_session = test_session_limit
     user_bot_profile.exercises_get_in_set = 1
     user_bot_profile.current_streak_days = 1
@@ -361,9 +364,12 @@ async def test_get_next_action_returns_congratulations_and_wait(
         side_effect=mock_update_session_effect
     )
 
-    result: NextAction = await user_progress_service.get_next_action(
-        user.user_id, bot_id=user_bot_profile.bot_id
-    )
+    with patch(
+        'app.core.services.user_progress.BACKEND_USER_METRICS'
+    ) as mock_metrics:
+        result: NextAction = await user_progress_service.get_next_action(
+            user.user_id, bot_id=user_bot_profile.bot_id
+        )
 
     user_progress_service.user_service.get_by_id.assert_awaited_once_with(
         user.user_id
@@ -378,6 +384,10 @@ async def test_get_next_action_returns_congratulations_and_wait(
         wants_session_reminders=None,
     )
     assert result.action == UserAction.congratulations_and_wait
+    # The session ends with the freeze and is recorded exactly then.
+    session_metrics = mock_metrics.__getitem__.return_value.labels
+    session_metrics.return_value.observe.assert_called_once_with(8 * 60)
+    session_metrics.return_value.inc.assert_any_call(test_session_limit)
 
     assert result.keyboard is not None
     assert result.keyboard[0]['text'] == get_text(
@@ -1,12 +1,13 @@
 from datetime import date, datetime, timedelta, timezone
 from typing import Any, AsyncGenerator
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 import pytest_asyncio
 from arq.connections import ArqRedis
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import settings
 from app.core.configs.enums import ExerciseType, LanguageLevel, ReportStatus
 from app.core.configs.generation.config import ExerciseTopic
 from app.core.entities.user import User
@@ -218,9 +219,11 @@ async def test_generate_and_save_short_weekly_reports_for_active_user(
         service_db_session, mock_http_client
     )
 
-    reports_to_notify = (
-        await user_report_service.generate_and_save_short_weekly_reports()
-    )
+    reports_to_notify = [
+        report
+        async for chunk in user_report_service.iter_short_weekly_reports()
+        for report in chunk
+    ]
     await service_db_session.commit()
 
     assert len(reports_to_notify) == 1
@@ -258,9 +261,11 @@ async def test_generate_reports_skips_inactive_and_low_activity_users(
         service_db_session, mock_http_client
     )
 
-    reports_to_notify = (
-        await user_report_service.generate_and_save_short_weekly_reports()
-    )
+    reports_to_notify = [
+        report
+        async for chunk in user_report_service.iter_short_weekly_reports()
+        for report in chunk
+    ]
     await service_db_session.commit()
 
     assert len(reports_to_notify) == 1
@@ -291,9 +296,12 @@ async def test_request_detailed_report_enqueues_task(
     mock_arq_pool = AsyncMock(spec=ArqRedis)
     user_report_service.arq_pool = mock_arq_pool
 
-    status = await user_report_service.request_detailed_report(profile)
+    status, report_text = await user_report_service.request_detailed_report(
+        profile
+    )
 
     assert status == ReportStatus.GENERATING
+    assert report_text is None
     mock_arq_pool.enqueue_job.assert_awaited_once_with(
         'generate_and_send_detailed_report_arq',
         report.report_id,
@@ -357,3 +365,106 @@ async def test_generate_full_report_text(
         f'completed {MIN_ATTEMPTS_FOR_WEEKLY_REPORT} exercises'
         in call_context['current_summary']
     )
+
+
+async def test_generate_full_report_text_streams_partial_text(
+    service_db_session: AsyncSession,
+    active_user_with_attempts,
+    fixed_test_time,
+    mock_http_client,
+    monkeypatch,
+):
+    monkeypatch.setattr(
+        settings, 'detailed_report_partial_save_interval_seconds', 0
+    )
+    user, profile = active_user_with_attempts
+    report = UserReportModel(
+        user_id=user.user_id,
+        bot_id=profile.bot_id,
+        week_start_date=fixed_test_time.date() - timedelta(days=7),
+        short_report='Test',
+    )
+    service_db_session.add(report)
+    await service_db_session.commit()
+
+    user_report_service = create_user_report_service(
+        service_db_session, mock_http_client
+    )
+    mock_llm_service = MagicMock()
+
+    async def stream_report(**kwargs):
+        for piece in ['<b>Your ', 'week</b>', ' was great.']:
+            yield piece
+
+    mock_llm_service.stream_detailed_report_text.side_effect = stream_report
+    user_report_service.llm_service = mock_llm_service
+    partial_texts = []
+
+    async def on_partial(text: str) -> None:
+        partial_texts.append(text)
+
+    full_text = await user_report_service.generate_full_report_text(
+        user_id=user.user_id, bot_id=profile.bot_id, on_partial=on_partial
+    )
+
+    assert full_text == '<b>Your week</b> was great.'
+    assert partial_texts == [
+        '<b>Your </b>',
+        '<b>Your week</b>',
+        '<b>Your week</b> was great.',
+    ]
+    mock_llm_service.generate_detailed_report_text.assert_not_called()
+
+
+async def test_generate_full_report_text_reuses_stored_summaries(
+    service_db_session: AsyncSession,
+    active_user_with_attempts,
+    fixed_test_time,
+    mock_http_client,
+):
+    user, profile = active_user_with_attempts
+    week_start_date = fixed_test_time.date() - timedelta(days=7)
+    prev_report = UserReportModel(
+        user_id=user.user_id,
+        bot_id=profile.bot_id,
+        week_start_date=week_start_date - timedelta(days=7),
+        short_report='Test',
+        summary={
+            'active_days': 2,
+            'total_attempts': 42,
+            'correct_attempts': 21,
+            'grammar_tags': {},
+            'vocab_tags': {},
+            'error_grammar_tags': {},
+            'error_vocab_tags': {},
+        },
+    )
+    report = UserReportModel(
+        user_id=user.user_id,
+        bot_id=profile.bot_id,
+        week_start_date=week_start_date,
+        short_report='Test',
+    )
+    service_db_session.add_all([prev_report, report])
+    await service_db_session.commit()
+
+    user_report_service = create_user_report_service(
+        service_db_session, mock_http_client
+    )
+    mock_llm_service = AsyncMock()
+    mock_llm_service.generate_detailed_report_text.return_value = 'Report.'
+    user_report_service.llm_service = mock_llm_service
+
+    await user_report_service.generate_full_report_text(
+        user_id=user.user_id, bot_id=profile.bot_id
+    )
+
+    call_context = (
+        mock_llm_service.generate_detailed_report_text.call_args.kwargs[
+            'context'
+        ]
+    )
+    assert 'completed 42 exercises' in call_context['prev_summary']
+    # The summary of the finished week is stored with its report.
+    await service_db_session.refresh(report)
+    assert report.summary['total_attempts'] == MIN_ATTEMPTS_FOR_WEEKLY_REPORT
@@ -0,0 +1,113 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import select
+
+from app.db.models import DailyUserActivity
+from app.db.models import User as UserModel
+from app.db.repositories.aggregation_watermark import (
+    SQLAlchemyAggregationWatermarkRepository,
+)
+from app.db.repositories.daily_user_activity import (
+    SQLAlchemyDailyUserActivityRepository,
+)
+from app.db.repositories.exercise_attempt import (
+    SQLAlchemyExerciseAttemptRepository,
+)
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.fixture
+async def exercise(db_session, db_exercise_attempts):
+    db_session.add(UserModel(user_id=1, telegram_id='1'))
+    await db_session.flush()
+    return db_exercise_attempts
+
+
+async def test_rollup_advances_per_day(db_session, exercise):
+    today = datetime.now(timezone.utc).replace(
+        hour=0, minute=0, second=0, microsecond=0
+    )
+    await exercise.add(
+        [
+            (1, True, today - timedelta(days=2, hours=-1)),
+            (1, False, today - timedelta(days=2, hours=-2)),
+            (1, True, today - timedelta(days=1, hours=-1)),
+        ],
+    )
+    repo = SQLAlchemyDailyUserActivityRepository(db_session)
+
+    await repo.advance()
+    await exercise.add([(1, False, datetime.now(timezone.utc))])
+    await repo.advance()
+
+    rows = (
+        await db_session.scalars(
+            select(DailyUserActivity).order_by(DailyUserActivity.activity_date)
+        )
+    ).all()
+    assert [
+        (row.activity_date, row.attempts, row.correct_attempts) for row in rows
+    ] == [
+        ((today - timedelta(days=2)).date(), 2, 1),
+        ((today - timedelta(days=1)).date(), 1, 1),
+        (today.date(), 1, 0),
+    ]
+    assert rows[0].grammar_tags == {'articles': 2}
+    assert rows[0].error_grammar_tags == {'gender': 1}
+    assert rows[1].error_grammar_tags is None
+    assert await repo.get_complete_until() == today
+
+
+async def test_summary_reads_rollup_and_raw_tail(db_session, exercise):
+    now = datetime.now(timezone.utc)
+    await exercise.add(
+        [
+            (1, True, now - timedelta(days=8)),
+            (1, False, now - timedelta(days=6, hours=23)),
+            (1, True, now - timedelta(days=3)),
+            (1, False, now - timedelta(days=3, minutes=1)),
+            (1, True, now - timedelta(minutes=1)),
+        ],
+    )
+    attempt_repo = SQLAlchemyExerciseAttemptRepository(db_session)
+    start_date, end_date = now - timedelta(days=7), now
+
+    raw_summary = await attempt_repo.get_period_summary_for_user_and_bot(
+        1, 'Bulgarian', start_date, end_date
+    )
+    await SQLAlchemyDailyUserActivityRepository(db_session).advance()
+    rollup_summary = await attempt_repo.get_period_summary_for_user_and_bot(
+        1, 'Bulgarian', start_date, end_date
+    )
+
+    assert raw_summary['total_attempts'] == 4
+    assert raw_summary['correct_attempts'] == 2
+    assert raw_summary['grammar_tags'] == {'articles': 4}
+    assert raw_summary['vocab_tags'] == {'food': 4}
+    assert raw_summary['error_grammar_tags'] == {'gender': 2}
+    assert rollup_summary == raw_summary
+
+
+async def test_first_runs_are_serialized(async_session_maker):
+    """Concurrent runs wait for each other before any watermark exists."""
+    watermark = datetime(2025, 7, 1, tzinfo=timezone.utc)
+    async with async_session_maker() as first:
+        first_repo = SQLAlchemyAggregationWatermarkRepository(first)
+        assert await first_repo.lock('test') is None
+
+        async def lock_in_second_session():
+            async with async_session_maker() as second:
+                second_repo = SQLAlchemyAggregationWatermarkRepository(second)
+                return await second_repo.lock('test')
+
+        second_lock = asyncio.create_task(lock_in_second_session())
+        await asyncio.sleep(0.2)
+        assert not second_lock.done()
+
+        await first_repo.save('test', watermark)
+        await first.commit()
+
+    assert await second_lock == watermark
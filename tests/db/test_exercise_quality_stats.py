@@ -0,0 +1,148 @@
+import pytest
+from sqlalchemy import insert, text
+
+from app.config import settings
+from app.core.entities.user_bot_profile import UserStatusInBot
+from app.db.models import DBUserBotProfile, ExerciseQualityStats
+from app.db.models import User as UserModel
+from app.db.repositories.exercise import SQLAlchemyExerciseRepository
+from app.db.repositories.user_bot_profile import (
+    SQLAlchemyUserBotProfileRepository,
+)
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.fixture
+async def exercise(db_session, db_exercise_attempts):
+    await db_session.execute(
+        insert(UserModel),
+        [
+            {'user_id': i, 'telegram_id': str(i), 'is_active': True}
+            for i in (1, 2, 3)
+        ],
+    )
+    await db_session.execute(
+        insert(DBUserBotProfile),
+        [
+            {
+                'user_id': user_id,
+                'bot_id': 'Bulgarian',
+                'user_language': 'en',
+                'status': UserStatusInBot.ACTIVE,
+                'rating': rating,
+                'quality_weight': rating,
+            }
+            for user_id, rating in ((1, 0.5), (2, None))
+        ],
+    )
+    return db_exercise_attempts
+
+
+async def get_weighted_sums(db_session, exercise_id) -> tuple:
+    stats = await db_session.get(ExerciseQualityStats, exercise_id)
+    await db_session.refresh(stats)
+    return (
+        round(stats.weighted_attempts, 6),
+        round(stats.weighted_incorrect, 6),
+    )
+
+
+async def recompute_weighted_sums(db_session, exercise_id) -> tuple:
+    """Weighted sums over all attempts with the current weights."""
+    row = (
+        await db_session.execute(
+            text("""
+            SELECT
+                SUM(COALESCE(p.quality_weight, :default_rating)),
+                SUM(COALESCE(p.quality_weight, :default_rating))
+                    FILTER (WHERE ea.is_correct IS FALSE)
+            FROM exercise_attempts ea
+            LEFT JOIN user_bot_profiles p
+                ON p.user_id = ea.user_id AND p.bot_id = 'Bulgarian'
+            WHERE ea.exercise_id = :exercise_id
+            """),
+            {
+                'exercise_id': exercise_id,
+                'default_rating': settings.quality_review_default_user_rating,
+            },
+        )
+    ).one()
+    return round(row[0], 6), round(row[1], 6)
+
+
+async def test_stats_follow_new_attempts_and_rating_changes(
+    db_session, exercise, monkeypatch
+):
+    monkeypatch.setattr(settings, 'quality_stats_reweight_epsilon', 0)
+    exercise_id = exercise.exercise_id
+    exercise_repo = SQLAlchemyExerciseRepository(db_session)
+    profile_repo = SQLAlchemyUserBotProfileRepository(db_session)
+    await exercise.add([(1, False), (1, True), (2, False), (3, True)])
+
+    await exercise_repo.advance_exercise_quality_stats()
+
+    # User 1 weighs 0.5; user 2 has no rating and user 3 no profile.
+    assert await get_weighted_sums(db_session, exercise_id) == (1.2, 0.6)
+
+    ratings = await profile_repo.calc_and_store_ratings_for_profiles()
+
+    assert ratings[(1, 'Bulgarian')] != 0.5
+    profile = await db_session.get(DBUserBotProfile, (1, 'Bulgarian'))
+    await db_session.refresh(profile)
+    assert profile.quality_weight == profile.rating
+    assert await get_weighted_sums(
+        db_session, exercise_id
+    ) == await recompute_weighted_sums(db_session, exercise_id)
+
+    await exercise.add([(2, False)])
+    await exercise_repo.advance_exercise_quality_stats()
+
+    assert await get_weighted_sums(
+        db_session, exercise_id
+    ) == await recompute_weighted_sums(db_session, exercise_id)
+
+
+async def test_small_rating_changes_keep_weights(
+    db_session, exercise, monkeypatch
+):
+    monkeypatch.setattr(settings, 'quality_stats_reweight_epsilon', 1)
+    exercise_id = exercise.exercise_id
+    exercise_repo = SQLAlchemyExerciseRepository(db_session)
+    profile_repo = SQLAlchemyUserBotProfileRepository(db_session)
+    await exercise.add([(1, False), (2, True)])
+    await exercise_repo.advance_exercise_quality_stats()
+
+    ratings = await profile_repo.calc_and_store_ratings_for_profiles()
+
+    assert ratings[(1, 'Bulgarian')] != 0.5
+    profile = await db_session.get(DBUserBotProfile, (1, 'Bulgarian'))
+    await db_session.refresh(profile)
+    assert profile.quality_weight == 0.5
+    assert await get_weighted_sums(db_session, exercise_id) == (0.6, 0.5)
+
+
+async def test_quality_review_selects_by_error_ratio(db_session, exercise):
+    exercise_id = exercise.exercise_id
+    exercise_repo = SQLAlchemyExerciseRepository(db_session)
+    await exercise.add([(1, False), (2, True)])
+    await exercise_repo.advance_exercise_quality_stats()
+
+    # The weighted error ratio is 0.5 / 0.6.
+    assert await exercise_repo.get_exercise_ids_for_quality_review(
+        min_weighted_attempts_sum_for_review=0.5,
+        weighted_error_threshold=0.8,
+    ) == [exercise_id]
+    assert not await exercise_repo.get_exercise_ids_for_quality_review(
+        min_weighted_attempts_sum_for_review=0.5,
+        weighted_error_threshold=0.9,
+    )
+    assert not await exercise_repo.get_exercise_ids_for_quality_review(
+        min_weighted_attempts_sum_for_review=1.0,
+        weighted_error_threshold=0.8,
+    )
+    assert not await exercise_repo.get_exercise_ids_for_quality_review(
+        min_weighted_attempts_sum_for_review=0.5,
+        weighted_error_threshold=0.8,
+        min_hours_since_last_update=24,
+    )
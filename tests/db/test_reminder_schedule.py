@@ -0,0 +1,253 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import insert, text
+from sqlalchemy.dialects import postgresql
+
+from app.config import settings
+from app.core.entities.user_bot_profile import UserStatusInBot
+from app.core.services.reminder_schedule import (
+    compute_next_long_break_reminder,
+)
+from app.db.models import DBUserBotProfile
+from app.db.models import User as UserModel
+from app.db.repositories.user_bot_profile import (
+    SQLAlchemyUserBotProfileRepository,
+)
+
+pytestmark = pytest.mark.asyncio
+
+LAST_EXERCISE_AT = datetime(2025, 7, 1, 18, 30, tzinfo=timezone.utc)
+
+
+async def collect(chunks) -> list:
+    return [item async for chunk in chunks for item in chunk]
+
+
+@pytest.mark.parametrize(
+    'last_type_sent, last_sent_at, expected_delay, expected_type',
+    [
+        (None, None, timedelta(days=1), '1d'),
+        ('1d', LAST_EXERCISE_AT + timedelta(days=1), timedelta(days=3), '3d'),
+        (
+            '1d',
+            LAST_EXERCISE_AT + timedelta(days=2, hours=1),
+            timedelta(days=4),
+            '3d',
+        ),
+        ('unknown', None, timedelta(days=1), '1d'),
+        (
+            '3d',
+            LAST_EXERCISE_AT + timedelta(days=10),
+            timedelta(days=12),
+            '8d',
+        ),
+        ('90d', LAST_EXERCISE_AT + timedelta(days=90), None, None),
+    ],
+)
+async def test_compute_next_long_break_reminder(
+    last_type_sent, last_sent_at, expected_delay, expected_type
+):
+    due_at, reminder_type = compute_next_long_break_reminder(
+        LAST_EXERCISE_AT, last_type_sent, last_sent_at
+    )
+
+    expected_due_at = (
+        LAST_EXERCISE_AT + expected_delay if expected_delay else None
+    )
+    assert (due_at, reminder_type) == (expected_due_at, expected_type)
+
+
+async def test_compute_without_activity_schedules_nothing():
+    assert compute_next_long_break_reminder(None, None, None) == (None, None)
+
+
+async def test_repository_maintains_next_reminder(
+    db_session, add_db_user, add_user_bot_profile, user_bot_profile
+):
+    repository = SQLAlchemyUserBotProfileRepository(db_session)
+    assert add_user_bot_profile.next_reminder_due_at is None
+
+    profile = await repository.update(
+        user_bot_profile.model_copy(
+            update={'last_exercise_at': LAST_EXERCISE_AT}
+        )
+    )
+    assert profile.next_reminder_due_at == LAST_EXERCISE_AT + timedelta(days=1)
+    assert profile.next_reminder_type == '1d'
+
+    profile = await repository.update(
+        profile.model_copy(
+            update={
+                'last_long_break_reminder_type_sent': '1d',
+                'last_long_break_reminder_sent_at': (
+                    LAST_EXERCISE_AT + timedelta(days=1)
+                ),
+            }
+        )
+    )
+    assert profile.next_reminder_due_at == LAST_EXERCISE_AT + timedelta(days=3)
+    assert profile.next_reminder_type == '3d'
+
+    due = await collect(
+        repository.iter_due_for_long_break_reminder(
+            now=LAST_EXERCISE_AT + timedelta(days=3)
+        )
+    )
+    not_yet_due = await collect(
+        repository.iter_due_for_long_break_reminder(
+            now=LAST_EXERCISE_AT + timedelta(days=2)
+        )
+    )
+    assert [(u.telegram_id, p.bot_id) for u, p in due] == [
+        (add_db_user.telegram_id, profile.bot_id)
+    ]
+    assert due[0][1].last_long_break_reminder_type_sent == '1d'
+    assert not_yet_due == []
+
+
+async def test_mark_long_break_reminders_sent_updates_in_one_statement(
+    db_session, add_user_bot_profile, user_bot_profile
+):
+    repository = SQLAlchemyUserBotProfileRepository(db_session)
+    profile = await repository.update(
+        user_bot_profile.model_copy(
+            update={'last_exercise_at': LAST_EXERCISE_AT}
+        )
+    )
+    finished = profile.model_copy(update={'bot_id': 'Serbian'})
+    await repository.create(finished)
+    sent_at = LAST_EXERCISE_AT + timedelta(days=1)
+
+    updated = await repository.mark_long_break_reminders_sent(
+        [(profile, '1d'), (finished, '90d')], sent_at=sent_at
+    )
+
+    assert updated == 2
+    db_session.expire_all()
+    first = await repository.get(profile.user_id, profile.bot_id)
+    last = await repository.get(finished.user_id, finished.bot_id)
+    assert first.last_long_break_reminder_type_sent == '1d'
+    assert first.last_long_break_reminder_sent_at == sent_at
+    assert first.next_reminder_due_at == LAST_EXERCISE_AT + timedelta(days=3)
+    assert first.next_reminder_type == '3d'
+    assert last.last_long_break_reminder_type_sent == '90d'
+    assert last.next_reminder_due_at is None
+    assert last.next_reminder_type is None
+
+
+async def test_mark_long_break_reminders_sent_keeps_refreshed_schedule(
+    db_session, add_user_bot_profile, user_bot_profile
+):
+    repository = SQLAlchemyUserBotProfileRepository(db_session)
+    scanned = await repository.update(
+        user_bot_profile.model_copy(
+            update={'last_exercise_at': LAST_EXERCISE_AT}
+        )
+    )
+    # The user finishes an exercise after the scheduler fetched the row.
+    exercised_at = LAST_EXERCISE_AT + timedelta(days=1)
+    refreshed = await repository.update(
+        scanned.model_copy(update={'last_exercise_at': exercised_at})
+    )
+
+    updated = await repository.mark_long_break_reminders_sent(
+        [(scanned, '1d')], sent_at=exercised_at
+    )
+
+    assert updated == 0
+    db_session.expire_all()
+    profile = await repository.get(scanned.user_id, scanned.bot_id)
+    assert profile.last_long_break_reminder_type_sent is None
+    assert profile.next_reminder_due_at == refreshed.next_reminder_due_at
+    assert profile.next_reminder_type == refreshed.next_reminder_type
+    assert profile.next_reminder_due_at == exercised_at + timedelta(days=1)
+
+
+async def test_due_reminder_query_uses_index(db_session):
+    now = datetime.now(timezone.utc)
+    profiles = 2000
+    await db_session.execute(
+        insert(UserModel),
+        [
+            {'user_id': i, 'telegram_id': str(i), 'is_active': True}
+            for i in range(1, profiles + 1)
+        ],
+    )
+    await db_session.execute(
+        insert(DBUserBotProfile),
+        [
+            {
+                'user_id': i,
+                'bot_id': settings.default_target_language,
+                'user_language': 'en',
+                'status': UserStatusInBot.ACTIVE,
+                'next_reminder_due_at': now
+                + timedelta(hours=-1 if i % 500 == 0 else i),
+            }
+            for i in range(1, profiles + 1)
+        ],
+    )
+    await db_session.execute(text('ANALYZE user_bot_profiles'))
+
+    repository = SQLAlchemyUserBotProfileRepository(db_session)
+    due = await collect(repository.iter_due_for_long_break_reminder(now=now))
+    assert len(due) == profiles // 500
+
+    stmt = SQLAlchemyUserBotProfileRepository.due_for_long_break_reminder_stmt(
+        now
+    )
+    _, first_profile = due[0]
+    for after in (None, (first_profile.user_id, first_profile.bot_id)):
+        page = SQLAlchemyUserBotProfileRepository.keyset_page(
+            stmt, settings.profile_scan_chunk_size, after
+        )
+        compiled = page.compile(
+            dialect=postgresql.dialect(),
+            compile_kwargs={'literal_binds': True},
+        )
+        plan = await db_session.execute(text(f'EXPLAIN {compiled}'))
+        plan_text = '\n'.join(row[0] for row in plan)
+
+        assert 'ix_user_bot_profiles_next_reminder_due_at' in plan_text
+        assert 'Seq Scan on user_bot_profiles' not in plan_text
+
+
+async def test_frozen_profiles_are_streamed_in_keyset_chunks(db_session):
+    now = datetime.now(timezone.utc)
+    await db_session.execute(
+        insert(UserModel),
+        [
+            {'user_id': i, 'telegram_id': str(i), 'is_active': True}
+            for i in range(1, 4)
+        ],
+    )
+    await db_session.execute(
+        insert(DBUserBotProfile),
+        [
+            {
+                'user_id': user_id,
+                'bot_id': bot_id,
+                'user_language': 'en',
+                'status': UserStatusInBot.ACTIVE,
+                'session_frozen_until': now + timedelta(hours=1),
+            }
+            for user_id in range(1, 4)
+            for bot_id in ('Bulgarian', 'Serbian')
+        ],
+    )
+
+    repository = SQLAlchemyUserBotProfileRepository(db_session)
+    chunks = [
+        chunk
+        async for chunk in repository.iter_frozen_for_session_reminder(
+            now, chunk_size=4
+        )
+    ]
+
+    assert [len(chunk) for chunk in chunks] == [4, 2]
+    assert [(p.user_id, p.bot_id) for chunk in chunks for p in chunk] == [
+        (user_id, bot_id)
+        for user_id in range(1, 4)
+        for bot_id in ('Bulgarian', 'Serbian')
+    ]
@@ -0,0 +1,89 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import insert, select
+
+from app.config import settings
+from app.core.entities.user_bot_profile import UserStatusInBot
+from app.db.models import DBUserBotProfile, UserLanguageStats
+from app.db.models import User as UserModel
+from app.db.repositories.user_bot_profile import (
+    SQLAlchemyUserBotProfileRepository,
+)
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.fixture
+def aggregation_settle_seconds() -> int:
+    return settings.aggregation_settle_seconds
+
+
+@pytest.fixture
+async def exercise(db_session, db_exercise_attempts):
+    await db_session.execute(
+        insert(UserModel),
+        [
+            {'user_id': i, 'telegram_id': str(i), 'is_active': True}
+            for i in (1, 2)
+        ],
+    )
+    await db_session.execute(
+        insert(DBUserBotProfile),
+        [
+            {
+                'user_id': i,
+                'bot_id': 'Bulgarian',
+                'user_language': 'en',
+                'status': UserStatusInBot.ACTIVE,
+            }
+            for i in (1, 2)
+        ],
+    )
+    return db_exercise_attempts
+
+
+async def get_stats(db_session) -> dict:
+    rows = await db_session.execute(
+        select(
+            UserLanguageStats.user_id,
+            UserLanguageStats.active_days,
+            UserLanguageStats.total_attempts,
+            UserLanguageStats.correct_attempts,
+        ).order_by(UserLanguageStats.user_id)
+    )
+    return {row[0]: tuple(row[1:]) for row in rows}
+
+
+async def test_ratings_are_computed_from_incremental_stats(
+    db_session, exercise, monkeypatch
+):
+    now = datetime.now(timezone.utc)
+    two_days_ago = now - timedelta(days=2)
+    yesterday = now - timedelta(days=1)
+    await exercise.add(
+        [
+            (1, True, two_days_ago),
+            (1, False, two_days_ago + timedelta(minutes=1)),
+            (1, True, yesterday),
+            (2, True, yesterday),
+            # Too recent to be aggregated yet.
+            (2, False, now),
+        ],
+    )
+    repository = SQLAlchemyUserBotProfileRepository(db_session)
+
+    ratings = await repository.calc_and_store_ratings_for_profiles()
+
+    assert await get_stats(db_session) == {1: (2, 3, 2), 2: (1, 1, 1)}
+    assert ratings == {(1, 'Bulgarian'): 0.9, (2, 'Bulgarian'): 0.3}
+    profile = await db_session.get(DBUserBotProfile, (1, 'Bulgarian'))
+    assert profile.rating == 0.9
+
+    # The next run adds only attempts past the watermark, and counts
+    # today once although user 2 has two attempts today.
+    monkeypatch.setattr(settings, 'aggregation_settle_seconds', 0)
+    await exercise.add([(2, True, now - timedelta(seconds=1))])
+    await repository.calc_and_store_ratings_for_profiles()
+
+    assert await get_stats(db_session) == {1: (2, 3, 2), 2: (2, 3, 2)}
@@ -0,0 +1,105 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.core.configs.enums import ExerciseType, LanguageLevel
+from app.core.configs.generation.config import ExerciseTopic
+from app.core.entities.exercise import Exercise
+from app.core.value_objects.answer import FillInTheBlankAnswer
+from app.core.value_objects.exercise import FillInTheBlankExerciseData
+from app.llm.assessors.quality_assessor import ExerciseQualityAssessor
+from app.llm.generators.fill_in_blank_generator import (
+    FillInTheBlankGenerator,
+)
+from app.llm.llm_service import LLMService
+from app.services.exercise_deduplicator import (
+    DuplicateExerciseError,
+    ExerciseDeduplicator,
+)
+
+pytestmark = pytest.mark.asyncio
+
+STORY = (
+    'Мария отиде на пазара рано сутринта и купи ___ за обяд, '
+    'после се върна у дома и сготви супа за цялото семейство.'
+)
+
+
+def make_exercise(text_with_blanks: str) -> Exercise:
+    return Exercise(
+        exercise_id=None,
+        exercise_type=ExerciseType.FILL_IN_THE_BLANK,
+        exercise_language='Bulgarian',
+        language_level=LanguageLevel.A2,
+        topic=ExerciseTopic.GENERAL,
+        exercise_text='Fill in the blank',
+        data=FillInTheBlankExerciseData(
+            text_with_blanks=text_with_blanks,
+            words=['домати', 'хляб', 'сирене'],
+        ),
+    )
+
+
+@pytest.fixture
+def llm_service(mock_http_client):
+    with patch('tiktoken.encoding_for_model'):
+        service = LLMService(
+            openai_api_key='test-key',
+            model_name='test-model',
+            http_client=mock_http_client,
+            exercise_deduplicator=AsyncMock(spec=ExerciseDeduplicator),
+        )
+    service.model = MagicMock(model_name='test-model')
+    return service
+
+
+@patch.object(ExerciseQualityAssessor, 'assess')
+@patch.object(FillInTheBlankGenerator, 'generate')
+async def test_generate_exercise_regenerates_duplicates(
+    mock_generate, mock_assess, llm_service
+):
+    answer = FillInTheBlankAnswer(words=['хляб'])
+    mock_generate.side_effect = [
+        (make_exercise(STORY), answer, MagicMock()),
+        (make_exercise('Нов текст с ___ празно място.'), answer, MagicMock()),
+    ]
+    llm_service.exercise_deduplicator.find_duplicate.side_effect = [
+        (1, 0.95),
+        None,
+    ]
+
+    exercise, _ = await llm_service.generate_exercise(
+        user_language='ru',
+        target_language='Bulgarian',
+        language_level=LanguageLevel.A2,
+        exercise_type=ExerciseType.FILL_IN_THE_BLANK,
+        topic=ExerciseTopic.GENERAL,
+    )
+
+    assert mock_generate.await_count == 2
+    assert exercise.data.text_with_blanks.startswith('Нов текст')
+    mock_assess.assert_awaited_once()
+
+
+@patch.object(ExerciseQualityAssessor, 'assess')
+@patch.object(FillInTheBlankGenerator, 'generate')
+async def test_generate_exercise_raises_when_only_duplicates(
+    mock_generate, mock_assess, llm_service
+):
+    mock_generate.return_value = (
+        make_exercise(STORY),
+        FillInTheBlankAnswer(words=['хляб']),
+        MagicMock(),
+    )
+    llm_service.exercise_deduplicator.find_duplicate.return_value = (1, 1.0)
+
+    with pytest.raises(DuplicateExerciseError):
+        await llm_service.generate_exercise(
+            user_language='ru',
+            target_language='Bulgarian',
+            language_level=LanguageLevel.A2,
+            exercise_type=ExerciseType.FILL_IN_THE_BLANK,
+            topic=ExerciseTopic.GENERAL,
+        )
+
+    mock_assess.assert_not_awaited()
@@ -0,0 +1,88 @@
+import os
+import subprocess
+import sys
+import textwrap
+
+from app.metrics import MULTIPROC_DIR_ENV, mark_dead_processes_metrics
+
+
+def run_python(code: str, multiproc_dir) -> str:
+    result = subprocess.run(
+        [sys.executable, '-c', textwrap.dedent(code)],
+        env={**os.environ, MULTIPROC_DIR_ENV: str(multiproc_dir)},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout
+
+
+def test_metrics_of_worker_processes_are_merged(tmp_path):
+    for active_users in (3, 5):
+        run_python(
+            f"""
+            from app.metrics import (
+                BACKEND_CELERY_PUBLISHER_METRICS,
+                BACKEND_USER_METRICS,
+            )
+            labels = dict(
+                cohort='a', plan='free', target_language='Bulgarian',
+                user_language='en', language_level='A1',
+            )
+            BACKEND_USER_METRICS['new'].labels(**labels).inc()
+            BACKEND_USER_METRICS['active'].labels(**labels).set(
+                {active_users}
+            )
+            BACKEND_CELERY_PUBLISHER_METRICS['buffered'].set(
+                {active_users}
+            )
+            """,
+            tmp_path,
+        )
+
+    exposition = run_python(
+        """
+        from prometheus_client import generate_latest
+        from app.metrics import metrics_registry
+        print(generate_latest(metrics_registry()).decode())
+        """,
+        tmp_path,
+    )
+
+    samples = dict(
+        line.rsplit(' ', 1)
+        for line in exposition.splitlines()
+        if line and not line.startswith('#')
+    )
+    labels = (
+        'cohort="a",language_level="A1",plan="free",'
+        'target_language="Bulgarian",user_language="en"'
+    )
+    assert float(samples[f'backend_new_users_total{{{labels}}}']) == 2
+    assert float(samples[f'backend_active_users_total{{{labels}}}']) == 5
+    # Live gauges are summed over the writers until they are marked dead.
+    assert float(samples['backend_celery_publish_buffered']) == 8
+
+
+def test_mark_dead_processes_metrics(tmp_path, monkeypatch):
+    dead_pid = int(
+        subprocess.run(
+            [sys.executable, '-c', 'import os; print(os.getpid())'],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+    )
+    for file_name in (
+        f'gauge_livesum_{dead_pid}.db',
+        f'counter_{dead_pid}.db',
+        f'gauge_livesum_{os.getpid()}.db',
+    ):
+        (tmp_path / file_name).touch()
+    monkeypatch.setenv(MULTIPROC_DIR_ENV, str(tmp_path))
+
+    assert mark_dead_processes_metrics() == 1
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == sorted(
+        [f'counter_{dead_pid}.db', f'gauge_livesum_{os.getpid()}.db']
+    )
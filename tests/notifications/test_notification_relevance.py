@@ -0,0 +1,205 @@
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.core.entities.user_bot_profile import UserBotProfile, UserStatusInBot
+from app.core.services.user_bot_profile import UserBotProfileService
+from app.db.models import DBUserBotProfile
+from app.db.models import User as UserModel
+from app.db.repositories.user_bot_profile import (
+    SQLAlchemyUserBotProfileRepository,
+)
+from app.infrastructure.notification_state import (
+    NotificationTaskRecord,
+    NotificationTaskRegistry,
+    ProfileStateCache,
+    ProfileStateSnapshot,
+)
+from app.services.notification_producer import NotificationType
+from app.services.notification_relevance import (
+    NotificationRelevanceService,
+    get_irrelevance_reason,
+)
+
+pytestmark = pytest.mark.asyncio
+
+NOW = datetime(2025, 7, 10, 12, 0, tzinfo=timezone.utc)
+ENQUEUED_AT = NOW - timedelta(minutes=10)
+
+
+def make_profile(**fields) -> UserBotProfile:
+    return UserBotProfile(
+        user_id=1, bot_id='Bulgarian', user_language='en', **fields
+    )
+
+
+def make_task(notification_type: NotificationType) -> NotificationTaskRecord:
+    return NotificationTaskRecord(
+        notification_type=notification_type.value, created_at=ENQUEUED_AT
+    )
+
+
+@pytest.mark.parametrize(
+    'notification_type, profile_fields, expected_reason',
+    [
+        (NotificationType.SESSION_REMINDER, {}, None),
+        (
+            NotificationType.SESSION_REMINDER,
+            {'status': UserStatusInBot.BLOCKED},
+            'user_not_active',
+        ),
+        (
+            NotificationType.SESSION_REMINDER,
+            {'wants_session_reminders': False},
+            'reminders_disabled',
+        ),
+        (
+            NotificationType.SESSION_REMINDER,
+            {'session_frozen_until': NOW + timedelta(hours=1)},
+            'session_frozen',
+        ),
+        (
+            NotificationType.SESSION_REMINDER,
+            {'last_exercise_at': NOW - timedelta(minutes=1)},
+            'user_already_active',
+        ),
+        (
+            NotificationType.LONG_BREAK_REMINDER,
+            {'last_exercise_at': ENQUEUED_AT - timedelta(days=3)},
+            None,
+        ),
+        (
+            NotificationType.LONG_BREAK_REMINDER,
+            {'last_exercise_at': NOW - timedelta(minutes=1)},
+            'user_already_active',
+        ),
+        (
+            NotificationType.WEEKLY_REPORT,
+            {'session_frozen_until': NOW + timedelta(hours=1)},
+            None,
+        ),
+    ],
+)
+async def test_irrelevance_reason(
+    notification_type, profile_fields, expected_reason
+):
+    state = ProfileStateSnapshot.from_profile(make_profile(**profile_fields))
+
+    reason = get_irrelevance_reason(state, make_task(notification_type), NOW)
+
+    assert reason == expected_reason
+
+
+async def test_unknown_task_only_checks_profile_status():
+    frozen = ProfileStateSnapshot.from_profile(
+        make_profile(session_frozen_until=NOW + timedelta(hours=1))
+    )
+    blocked = ProfileStateSnapshot.from_profile(
+        make_profile(status=UserStatusInBot.BLOCKED)
+    )
+
+    assert get_irrelevance_reason(frozen, None, NOW) is None
+    assert get_irrelevance_reason(blocked, None, NOW) == 'user_not_active'
+    assert get_irrelevance_reason(None, None, NOW) == 'profile_not_found'
+
+
+async def test_profile_writes_invalidate_snapshot(redis):
+    cache = ProfileStateCache(redis)
+    profile = make_profile(
+        last_exercise_at=ENQUEUED_AT, wants_session_reminders=True
+    )
+    await cache.save(profile)
+    assert await cache.get(1, 'Bulgarian') == ProfileStateSnapshot(
+        status=UserStatusInBot.ACTIVE,
+        last_exercise_at=ENQUEUED_AT,
+        wants_session_reminders=True,
+    )
+    repo = AsyncMock()
+    repo.get.return_value = profile.model_copy()
+    repo.update.side_effect = lambda updated: updated
+    service = UserBotProfileService(repo, profile_state_cache=cache)
+
+    await service.update_session(
+        user_id=1, bot_id='Bulgarian', session_frozen_until=NOW
+    )
+
+    assert await cache.get(1, 'Bulgarian') is None
+
+
+async def test_relevance_is_served_from_snapshot(redis):
+    cache = ProfileStateCache(redis)
+    registry = NotificationTaskRegistry(redis)
+    profile_service = AsyncMock(spec=UserBotProfileService)
+    profile_service.get.return_value = make_profile(
+        last_exercise_at=datetime.now(timezone.utc)
+    )
+    relevance = NotificationRelevanceService(cache, registry, profile_service)
+    await registry.register(
+        'task-1', NotificationType.LONG_BREAK_REMINDER.value, ENQUEUED_AT
+    )
+
+    assert await relevance.is_relevant('task-1', 1, 'Bulgarian') is False
+    assert await relevance.is_relevant('task-1', 1, 'Bulgarian') is False
+    profile_service.get.assert_awaited_once_with(1, 'Bulgarian')
+
+
+async def test_relevance_of_missing_profile(redis):
+    profile_service = AsyncMock(spec=UserBotProfileService)
+    profile_service.get.return_value = None
+    relevance = NotificationRelevanceService(
+        ProfileStateCache(redis),
+        NotificationTaskRegistry(redis),
+        profile_service,
+    )
+
+    assert await relevance.is_relevant('task-1', 1, 'Bulgarian') is False
+
+
+async def test_check_before_commit_does_not_keep_stale_snapshot(
+    redis, async_session_maker
+):
+    async with async_session_maker() as session:
+        session.add(UserModel(user_id=1, telegram_id='1'))
+        session.add(
+            DBUserBotProfile(
+                user_id=1,
+                bot_id='Bulgarian',
+                user_language='en',
+                last_exercise_at=ENQUEUED_AT - timedelta(days=2),
+            )
+        )
+        await session.commit()
+    registry = NotificationTaskRegistry(redis)
+    await registry.register(
+        'task-1', NotificationType.LONG_BREAK_REMINDER.value, ENQUEUED_AT
+    )
+
+    async with (
+        async_session_maker() as write_session,
+        async_session_maker() as read_session,
+    ):
+        write_cache = ProfileStateCache(redis, session=write_session)
+        writer = UserBotProfileService(
+            SQLAlchemyUserBotProfileRepository(write_session),
+            profile_state_cache=write_cache,
+        )
+        relevance = NotificationRelevanceService(
+            ProfileStateCache(redis),
+            registry,
+            UserBotProfileService(
+                SQLAlchemyUserBotProfileRepository(read_session)
+            ),
+        )
+        profile = await writer.get(1, 'Bulgarian')
+        profile.last_exercise_at = datetime.now(timezone.utc)
+        await writer.save(profile)
+
+        # Reads and caches the committed row from before the write.
+        assert await relevance.is_relevant('task-1', 1, 'Bulgarian') is True
+
+        await write_session.commit()
+        await write_cache.wait_for_invalidations()
+        await read_session.rollback()
+
+        assert await relevance.is_relevant('task-1', 1, 'Bulgarian') is False
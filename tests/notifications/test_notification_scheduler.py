@@ -9,8 +9,6 @@ from freezegun import freeze_time
 from app.config import settings
 from app.core.entities.user import User
 from app.core.entities.user_bot_profile import UserBotProfile
-from app.db.models import DBUserBotProfile as DBUserBotProfileModel
-from app.db.models import User as DBUserModel
 from app.services.notification_producer import (
     NotificationProducerService,
     NotificationType,
@@ -22,6 +20,11 @@ from app.workers.notification_scheduler import (
 pytestmark = pytest.mark.asyncio
 
 
+async def iter_chunks(*chunks):
+    for chunk in chunks:
+        yield chunk
+
+
 # --- Fixtures for NotificationScheduler ---
 
 
@@ -38,12 +41,13 @@ def mock_notification_producer_service(mocker) -> AsyncMock:
 def mock_profile_repo_class(mocker) -> MagicMock:
     """Mock for UserBotProfileRepository class."""
     mock_repo_instance = mocker.AsyncMock()
-    mock_repo_instance.update = AsyncMock(return_value=None)
+    mock_repo_instance.mark_long_break_reminders_sent = AsyncMock(
+        return_value=0
+    )
 
     # Fetch methods
-    mock_repo_instance.get_unfrozen_for_reminder = AsyncMock(return_value=[])
-    mock_repo_instance.get_with_long_break_for_reminder = AsyncMock(
-        return_value=[]
+    mock_repo_instance.iter_due_for_long_break_reminder = MagicMock(
+        return_value=iter_chunks()
     )
 
     mock_class = mocker.MagicMock()
@@ -71,74 +75,6 @@ def notification_scheduler(
     )
 
 
-# --- Tests for _process_session_reminders ---
-
-
-@freeze_time('2023-01-15 12:00:00 UTC')
-async def test_process_session_reminders_sends_when_conditions_met(
-    notification_scheduler: NotificationScheduler,
-    mock_notification_producer_service: AsyncMock,
-    user: User,
-    user_bot_profile: UserBotProfile,
-):
-    user_bot_profile.wants_session_reminders = True
-    user_bot_profile.session_frozen_until = datetime.now(
-        timezone.utc
-    ) - timedelta(minutes=1)
-
-    await notification_scheduler._process_session_reminders(
-        user, user_bot_profile
-    )
-
-    mock_notification_producer_service.prepare_and_enqueue_session_reminder.assert_awaited_once_with(
-        user, user_bot_profile
-    )
-
-
-@freeze_time('2023-01-15 12:00:00 UTC')
-@pytest.mark.parametrize(
-    'wants_reminders, frozen_until_delta_minutes, expect_call',
-    [
-        (False, -1, False),
-        (True, 60, False),
-        (
-            True,
-            -(settings.notification_scheduler_interval_seconds // 60 + 5),
-            False,
-        ),
-        (None, -1, False),
-        (True, None, False),
-    ],
-)
-async def test_process_session_reminders_various_conditions(
-    notification_scheduler: NotificationScheduler,
-    mock_notification_producer_service: AsyncMock,
-    user: User,
-    user_bot_profile: UserBotProfile,
-    wants_reminders: Optional[bool],
-    frozen_until_delta_minutes: Optional[int],
-    expect_call: bool,
-):
-    user_bot_profile.wants_session_reminders = wants_reminders
-    if frozen_until_delta_minutes is not None:
-        user_bot_profile.session_frozen_until = datetime.now(
-            timezone.utc
-        ) + timedelta(minutes=frozen_until_delta_minutes)
-    else:
-        user_bot_profile.session_frozen_until = None
-
-    await notification_scheduler._process_session_reminders(
-        user, user_bot_profile
-    )
-
-    if expect_call:
-        mock_notification_producer_service.prepare_and_enqueue_session_reminder.assert_awaited_once_with(
-            user, user_bot_profile
-        )
-    else:
-        mock_notification_producer_service.prepare_and_enqueue_session_reminder.assert_not_awaited()
-
-
 # --- Tests for _process_long_break_reminders ---
 
 
@@ -149,16 +85,15 @@ async def test_process_long_break_no_last_exercise_at(
     mock_profile_repo_class: MagicMock,
     user: User,
     user_bot_profile: UserBotProfile,
-    db_session: AsyncMock,
 ):
     user_bot_profile.last_exercise_at = None
 
-    await notification_scheduler._process_long_break_reminders(
-        db_session, user, user_bot_profile
+    sent_type = await notification_scheduler._process_long_break_reminders(
+        user, user_bot_profile, datetime.now(timezone.utc)
     )
 
+    assert sent_type is None
     mock_notification_producer_service.prepare_and_enqueue_long_break_reminder.assert_not_awaited()
-    mock_profile_repo_class.return_value.update.assert_not_awaited()
 
 
 @freeze_time('2023-01-15 12:00:00 UTC')
@@ -284,10 +219,8 @@ async def test_process_long_break_no_last_exercise_at(
 async def test_process_long_break_reminders_scenarios(
     notification_scheduler: NotificationScheduler,
     mock_notification_producer_service: AsyncMock,
-    mock_profile_repo_class: MagicMock,
     user: User,
     user_bot_profile: UserBotProfile,
-    db_session: AsyncMock,
     days_inactive: int,
     last_sent_type: Optional[str],
     hours_since_last_sent: Optional[int],
@@ -309,12 +242,10 @@ async def test_process_long_break_reminders_scenarios(
     else:
         user_bot_profile.last_long_break_reminder_sent_at = None
 
-    mock_repo_instance = mock_profile_repo_class.return_value
-    mock_repo_instance.update.reset_mock()
     mock_notification_producer_service.prepare_and_enqueue_long_break_reminder.reset_mock()
 
-    await notification_scheduler._process_long_break_reminders(
-        db_session, user, user_bot_profile
+    sent_type = await notification_scheduler._process_long_break_reminders(
+        user, user_bot_profile, now
     )
 
     if should_send and expected_reminder_type:
@@ -324,74 +255,69 @@ async def test_process_long_break_reminders_scenarios(
             reminder_type=expected_reminder_type,
             days_inactive=days_inactive,
         )
-        mock_repo_instance.update.assert_awaited_once()
-        updated_data_arg = mock_repo_instance.update.call_args[0][0]
-        assert isinstance(updated_data_arg, UserBotProfile)
-        assert (
-            updated_data_arg.last_long_break_reminder_type_sent
-            == expected_reminder_type
-        )
-        assert updated_data_arg.last_long_break_reminder_sent_at is not None
-        assert (
-            abs(
-                (
-                    updated_data_arg.last_long_break_reminder_sent_at - now
-                ).total_seconds()
-            )
-            < 1
-        )
+        assert sent_type == expected_reminder_type
     else:
         mock_notification_producer_service.prepare_and_enqueue_long_break_reminder.assert_not_awaited()
-        mock_repo_instance.update.assert_not_awaited()
-
-
-# --- Tests for run_check_cycle ---
+        assert sent_type is None
 
 
 @freeze_time('2023-01-15 12:00:00 UTC')
-async def test_run_check_cycle_processes_both_reminder_types(
+async def test_process_user_profiles_records_sent_reminders_in_bulk(
     notification_scheduler: NotificationScheduler,
+    mock_notification_producer_service: AsyncMock,
     mock_profile_repo_class: MagicMock,
     user: User,
     user_bot_profile: UserBotProfile,
 ):
-    db_user = DBUserModel(
-        **user.model_dump(exclude={'language_level'}),
+    now = datetime.now(timezone.utc)
+    inactive_profile = user_bot_profile.model_copy(
+        update={'last_exercise_at': now - timedelta(days=3)}
     )
+    active_profile = user_bot_profile.model_copy(
+        update={'bot_id': 'Serbian', 'last_exercise_at': now}
+    )
+    session = AsyncMock()
 
-    db_profile_session = DBUserBotProfileModel(**user_bot_profile.model_dump())
-    db_profile_session.user = db_user
-    db_profile_session.wants_session_reminders = True
-    db_profile_session.session_frozen_until = datetime.now(
-        timezone.utc
-    ) - timedelta(minutes=1)
-
-    user_bot_profile_long_break = user_bot_profile.model_copy(
-        update={'user_id': user.user_id + 1 if user.user_id else 2}
+    await notification_scheduler._process_user_profiles(
+        profiles=[(user, inactive_profile), (user, active_profile)],
+        reminder_type=NotificationType.LONG_BREAK_REMINDER,
+        session=session,
     )
-    db_user_long_break = DBUserModel(
-        **User(
-            user_id=user_bot_profile_long_break.user_id,
-            telegram_id='another_tg_id',
-        ).model_dump(exclude={'language_level'}),
+
+    mock_notification_producer_service.prepare_and_enqueue_long_break_reminder.assert_awaited_once()
+    mock_profile_repo_class.assert_called_once_with(session)
+    mock_profile_repo_class.return_value.mark_long_break_reminders_sent.assert_awaited_once_with(
+        [(inactive_profile, '3d')], sent_at=now
     )
 
-    db_profile_long_break = DBUserBotProfileModel(
-        **user_bot_profile_long_break.model_dump()
+
+# --- Tests for run_check_cycle ---
+
+
+@freeze_time('2023-01-15 12:00:00 UTC')
+async def test_run_check_cycle_processes_long_break_reminders(
+    notification_scheduler: NotificationScheduler,
+    mock_profile_repo_class: MagicMock,
+    user: User,
+    user_bot_profile: UserBotProfile,
+):
+    user_long_break = User(
+        user_id=user.user_id + 1 if user.user_id else 2,
+        telegram_id='another_tg_id',
+    )
+    profile_long_break = user_bot_profile.model_copy(
+        update={
+            'user_id': user_long_break.user_id,
+            # Corresponds to '8d' reminder
+            'last_exercise_at': datetime.now(timezone.utc) - timedelta(days=8),
+            'last_long_break_reminder_type_sent': None,
+        }
     )
-    db_profile_long_break.user = db_user_long_break
-    db_profile_long_break.last_exercise_at = datetime.now(
-        timezone.utc
-    ) - timedelta(days=8)  # Corresponds to '8d' reminder
-    db_profile_long_break.last_long_break_reminder_type_sent = None
 
     mock_repo_instance = mock_profile_repo_class.return_value
-    mock_repo_instance.get_unfrozen_for_reminder.return_value = [
-        db_profile_session
-    ]
-    mock_repo_instance.get_with_long_break_for_reminder.return_value = [
-        db_profile_long_break
-    ]
+    mock_repo_instance.iter_due_for_long_break_reminder.return_value = (
+        iter_chunks([(user_long_break, profile_long_break)])
+    )
 
     with patch.object(
         notification_scheduler,
@@ -408,34 +334,12 @@ async def test_run_check_cycle_processes_both_reminder_types(
         ):
             await notification_scheduler.run_check_cycle()
 
-    mock_repo_instance.get_unfrozen_for_reminder.assert_awaited_once_with(
-        settings.notification_scheduler_interval_seconds
+    mock_repo_instance.iter_due_for_long_break_reminder.assert_called_once_with(
+        now=datetime.now(timezone.utc)
     )
 
-    first_reminder_key = settings.long_break_reminder_sequence[0]
-    expected_min_break_seconds = settings.long_break_reminder_intervals[
-        first_reminder_key
-    ].total_seconds()
-
-    now = datetime.now(timezone.utc)
-    window_half = settings.long_break_reminder_time_window_seconds // 2
-    expected_window_start_time = (now - timedelta(seconds=window_half)).time()
-    expected_window_end_time = (now + timedelta(seconds=window_half)).time()
-
-    mock_repo_instance.get_with_long_break_for_reminder.assert_awaited_once_with(
-        min_break_duration_seconds=expected_min_break_seconds,
-        window_start_time=expected_window_start_time,
-        window_end_time=expected_window_end_time,
-    )
-
-    assert mock_process_profiles.call_count == 2
-    mock_process_profiles.assert_any_call(
-        profiles=[db_profile_session],
-        reminder_type=NotificationType.SESSION_REMINDER,
-        session=mock_session,
-    )
-    mock_process_profiles.assert_any_call(
-        profiles=[db_profile_long_break],
+    mock_process_profiles.assert_awaited_once_with(
+        profiles=[(user_long_break, profile_long_break)],
         reminder_type=NotificationType.LONG_BREAK_REMINDER,
         session=mock_session,
     )
@@ -447,8 +351,6 @@ async def test_run_check_cycle_no_profiles_found(
     mock_profile_repo_class: MagicMock,
 ):
     mock_repo_instance = mock_profile_repo_class.return_value
-    mock_repo_instance.get_unfrozen_for_reminder.return_value = []
-    mock_repo_instance.get_with_long_break_for_reminder.return_value = []
 
     with patch.object(
         notification_scheduler,
@@ -465,17 +367,5 @@ async def test_run_check_cycle_no_profiles_found(
         ):
             await notification_scheduler.run_check_cycle()
 
-    mock_repo_instance.get_unfrozen_for_reminder.assert_awaited_once()
-    mock_repo_instance.get_with_long_break_for_reminder.assert_awaited_once()
-
-    assert mock_process_profiles.call_count == 2
-    mock_process_profiles.assert_any_call(
-        profiles=[],
-        reminder_type=NotificationType.SESSION_REMINDER,
-        session=mock_session,
-    )
-    mock_process_profiles.assert_any_call(
-        profiles=[],
-        reminder_type=NotificationType.LONG_BREAK_REMINDER,
-        session=mock_session,
-    )
+    mock_repo_instance.iter_due_for_long_break_reminder.assert_called_once()
+    mock_process_profiles.assert_not_awaited()
@@ -0,0 +1,87 @@
+import asyncio
+import os
+import time
+
+import pytest
+
+from app.services.audio_transcoder import FFmpegTranscoder, _parse_cpu_seconds
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.fixture
+def spawned_processes(monkeypatch):
+    processes = []
+    create_subprocess_exec = asyncio.create_subprocess_exec
+
+    async def spy(*args, **kwargs):
+        process = await create_subprocess_exec(*args, **kwargs)
+        processes.append(process)
+        return process
+
+    monkeypatch.setattr(asyncio, 'create_subprocess_exec', spy)
+    return processes
+
+
+def _process_exists(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    return True
+
+
+async def test_run_process_pipes_stdin_to_stdout():
+    transcoder = FFmpegTranscoder(max_concurrency=1, timeout_seconds=5)
+
+    result = await transcoder.run_process(['cat'], b'pcm-bytes')
+
+    assert result == (b'pcm-bytes', b'')
+
+
+async def test_run_process_returns_none_on_failure():
+    transcoder = FFmpegTranscoder(max_concurrency=1, timeout_seconds=5)
+
+    assert await transcoder.run_process(['false'], b'') is None
+
+
+async def test_run_process_caps_concurrency():
+    transcoder = FFmpegTranscoder(max_concurrency=2, timeout_seconds=5)
+
+    started_at = time.perf_counter()
+    await asyncio.gather(
+        *(transcoder.run_process(['sleep', '0.2'], b'') for _ in range(4))
+    )
+
+    assert time.perf_counter() - started_at >= 0.4
+
+
+async def test_run_process_kills_on_timeout(spawned_processes):
+    transcoder = FFmpegTranscoder(max_concurrency=1, timeout_seconds=0.1)
+
+    assert await transcoder.run_process(['sleep', '5'], b'') is None
+
+    (process,) = spawned_processes
+    assert process.returncode is not None
+    assert not _process_exists(process.pid)
+
+
+async def test_run_process_kills_on_cancel(spawned_processes):
+    transcoder = FFmpegTranscoder(max_concurrency=1, timeout_seconds=5)
+
+    task = asyncio.create_task(transcoder.run_process(['sleep', '5'], b''))
+    await asyncio.sleep(0.1)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    (process,) = spawned_processes
+    assert process.returncode is not None
+    assert not _process_exists(process.pid)
+
+
+async def test_parse_cpu_seconds_from_benchmark_output():
+    stderr = b'bench: utime=0.120s stime=0.030s rtime=0.200s\n'
+
+    assert _parse_cpu_seconds(stderr) == pytest.approx(0.15)
+    assert _parse_cpu_seconds(b'') is None
@@ -0,0 +1,93 @@
+import pytest
+
+from app.config import settings
+from app.core.configs.enums import ExerciseType, LanguageLevel
+from app.core.configs.generation.config import ExerciseTopic
+from app.core.entities.exercise import Exercise
+from app.core.value_objects.exercise import FillInTheBlankExerciseData
+from app.db.repositories.exercise import SQLAlchemyExerciseRepository
+from app.services.exercise_deduplicator import (
+    ExerciseDeduplicator,
+    exercise_data_text,
+)
+
+pytestmark = pytest.mark.asyncio
+
+STORY = (
+    'Мария отиде на пазара рано сутринта и купи ___ за обяд, '
+    'после се върна у дома и сготви супа за цялото семейство.'
+)
+
+
+def make_exercise(text_with_blanks: str) -> Exercise:
+    return Exercise(
+        exercise_id=None,
+        exercise_type=ExerciseType.FILL_IN_THE_BLANK,
+        exercise_language='Bulgarian',
+        language_level=LanguageLevel.A2,
+        topic=ExerciseTopic.GENERAL,
+        exercise_text='Fill in the blank',
+        data=FillInTheBlankExerciseData(
+            text_with_blanks=text_with_blanks,
+            words=['домати', 'хляб', 'сирене'],
+        ),
+    )
+
+
+async def test_exercise_data_text_skips_service_fields():
+    text = exercise_data_text(
+        {
+            'type': 'StoryComprehensionExerciseData',
+            'content_text': 'История',
+            'audio_url': 'https://example.com/a.ogg',
+            'audio_telegram_file_id': 'file-id',
+            'options': ['Първо', 'Второ'],
+        }
+    )
+
+    assert text == 'История\nПърво\nВторо'
+
+
+async def test_deduplicator_checks_exercises_missing_from_index(
+    async_session_maker,
+):
+    async with async_session_maker() as session:
+        await SQLAlchemyExerciseRepository(session).create(
+            make_exercise(STORY)
+        )
+        await session.commit()
+    deduplicator = ExerciseDeduplicator(session_maker=async_session_maker)
+
+    duplicate = await deduplicator.find_duplicate(make_exercise(STORY))
+    unique = await deduplicator.find_duplicate(
+        make_exercise(
+            'Утре ще вали сняг в планината, затова ___ ще отложим '
+            'екскурзията до хижата за следващата седмица.'
+        )
+    )
+
+    assert duplicate is not None
+    assert duplicate[1] == 1.0
+    assert unique is None
+    assert await deduplicator.index_missing(limit=10) == 0
+
+
+async def test_deduplicator_finds_indexed_exercises(
+    async_session_maker, monkeypatch
+):
+    monkeypatch.setattr(
+        settings, 'exercise_duplicate_unindexed_check_limit', 0
+    )
+    async with async_session_maker() as session:
+        await SQLAlchemyExerciseRepository(session).create(
+            make_exercise(STORY)
+        )
+        await session.commit()
+    deduplicator = ExerciseDeduplicator(session_maker=async_session_maker)
+    assert await deduplicator.find_duplicate(make_exercise(STORY)) is None
+
+    assert await deduplicator.index_missing(limit=10) == 1
+
+    duplicate = await deduplicator.find_duplicate(make_exercise(STORY))
+    assert duplicate is not None
+    assert duplicate[1] == 1.0
@@ -0,0 +1,126 @@
+import statistics
+import time
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from app.services.file_storage_service import R2FileStorageService
+
+pytestmark = pytest.mark.asyncio
+
+
+class S3StandIn:
+    """Minimal S3-compatible object store served by aiohttp."""
+
+    def __init__(self):
+        self.objects = {}
+        self.connections = set()
+        app = web.Application()
+        app.router.add_route('PUT', '/{bucket}/{key:.+}', self.put_object)
+        app.router.add_route('GET', '/{bucket}/{key:.+}', self.get_object)
+        self.runner = web.AppRunner(app)
+        self.endpoint_url = ''
+
+    async def start(self):
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, '127.0.0.1', 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.endpoint_url = f'http://127.0.0.1:{port}'
+
+    async def stop(self):
+        await self.runner.cleanup()
+
+    def _track_connection(self, request: web.Request):
+        self.connections.add(request.transport.get_extra_info('peername'))
+
+    async def put_object(self, request: web.Request) -> web.Response:
+        self._track_connection(request)
+        self.objects[request.match_info['key']] = await request.read()
+        return web.Response(headers={'ETag': '"stand-in"'})
+
+    async def get_object(self, request: web.Request) -> web.Response:
+        self._track_connection(request)
+        body = self.objects.get(request.match_info['key'])
+        if body is None:
+            return web.Response(
+                status=404,
+                text=(
+                    '<Error><Code>NoSuchKey</Code>'
+                    '<Message>Not found</Message></Error>'
+                ),
+                content_type='application/xml',
+            )
+        return web.Response(body=body, content_type='audio/ogg')
+
+
+@pytest_asyncio.fixture
+async def s3_stand_in():
+    stand_in = S3StandIn()
+    await stand_in.start()
+    yield stand_in
+    await stand_in.stop()
+
+
+def make_service(endpoint_url: str) -> R2FileStorageService:
+    return R2FileStorageService(
+        account_id='test-account',
+        access_key_id='test-key',
+        secret_access_key='test-secret',
+        bucket_name='test-bucket',
+        public_url_prefix='https://cdn.example.com/',
+        endpoint_url=endpoint_url,
+    )
+
+
+async def test_pooled_client_uploads_and_downloads(s3_stand_in):
+    service = make_service(s3_stand_in.endpoint_url)
+    await service.start()
+
+    url = await service.upload_audio(b'ogg-bytes', 'story_audio/abc.ogg')
+    data = await service.download_audio('story_audio/abc.ogg')
+    missing = await service.download_audio('story_audio/missing.ogg')
+    await service.close()
+
+    assert url == 'https://cdn.example.com/story_audio/abc.ogg'
+    assert data == b'ogg-bytes'
+    assert missing is None
+    assert s3_stand_in.objects == {'story_audio/abc.ogg': b'ogg-bytes'}
+
+
+async def test_upload_latency_with_pooled_client(s3_stand_in):
+    """
+    Benchmarks sequential uploads through one long-lived client against
+    a client opened per upload, the previous behaviour.
+    """
+    payload = b'\0' * 64 * 1024
+    uploads = 20
+
+    pooled = make_service(s3_stand_in.endpoint_url)
+    await pooled.start()
+    pooled_latencies = []
+    for i in range(uploads):
+        started_at = time.perf_counter()
+        assert await pooled.upload_audio(payload, f'pooled/{i}.ogg')
+        pooled_latencies.append(time.perf_counter() - started_at)
+    await pooled.close()
+    pooled_connections = len(s3_stand_in.connections)
+
+    s3_stand_in.connections.clear()
+    per_upload_latencies = []
+    for i in range(uploads):
+        service = make_service(s3_stand_in.endpoint_url)
+        started_at = time.perf_counter()
+        assert await service.upload_audio(payload, f'per_upload/{i}.ogg')
+        await service.close()
+        per_upload_latencies.append(time.perf_counter() - started_at)
+
+    print(
+        f'R2 upload latency p50: pooled '
+        f'{statistics.median(pooled_latencies) * 1000:.1f} ms, '
+        f'client per upload '
+        f'{statistics.median(per_upload_latencies) * 1000:.1f} ms'
+    )
+    assert pooled_connections == 1
+    assert len(s3_stand_in.connections) == uploads
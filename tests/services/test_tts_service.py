@@ -0,0 +1,122 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.config import settings
+from app.infrastructure.circuit_breaker import CircuitBreaker
+from app.services.audio_transcoder import FFmpegTranscoder
+from app.services.tts_service import GoogleTTSService, split_text_into_chunks
+
+pytestmark = pytest.mark.asyncio
+
+STORY = (
+    'Мария отиде на пазара. Купи хляб и сирене! '
+    'Защо се върна толкова рано? Никой не знаеше… '
+    'Вечерта тя сготви супа.'
+)
+
+
+@pytest.fixture
+def transcoder():
+    transcoder = AsyncMock(spec=FFmpegTranscoder)
+    transcoder.pcm_to_ogg_opus.side_effect = lambda pcm, **kwargs: (
+        b'ogg:' + pcm
+    )
+    return transcoder
+
+
+def make_service(redis, transcoder, **kwargs) -> GoogleTTSService:
+    return GoogleTTSService(
+        api_key='test-key',
+        tts_model='test-tts-model',
+        proxy_url=None,
+        transcoder=transcoder,
+        circuit_breaker=CircuitBreaker('test_tts', redis_client=redis),
+        **kwargs,
+    )
+
+
+async def test_split_text_into_chunks_keeps_sentences_whole():
+    chunks = split_text_into_chunks(STORY, 50)
+
+    assert chunks == [
+        'Мария отиде на пазара. Купи хляб и сирене!',
+        'Защо се върна толкова рано? Никой не знаеше…',
+        'Вечерта тя сготви супа.',
+    ]
+    assert split_text_into_chunks(STORY, 1000) == [STORY]
+    assert split_text_into_chunks('дълга дума тук', 5) == [
+        'дълга',
+        'дума',
+        'тук',
+    ]
+
+
+async def test_chunks_are_synthesized_concurrently_and_joined_in_order(
+    redis, transcoder
+):
+    service = make_service(
+        redis, transcoder, chunk_max_chars=50, chunk_max_concurrency=2
+    )
+    in_flight = []
+    max_in_flight = 0
+    requests = []
+
+    async def synthesize(text, voice_name):
+        nonlocal max_in_flight
+        requests.append((text, voice_name))
+        in_flight.append(text)
+        max_in_flight = max(max_in_flight, len(in_flight))
+        await asyncio.sleep(0.01)
+        in_flight.remove(text)
+        return f'[{text.split()[1]}]'.encode()
+
+    service._synthesize_pcm = synthesize
+
+    ogg = await service.text_to_speech_ogg(
+        STORY, voice_name='Enceladus', emotion_instruction='Calmly:'
+    )
+
+    assert ogg == 'ogg:[Мария][Защо][Вечерта]'.encode()
+    assert max_in_flight == 2
+    assert {voice for _, voice in requests} == {'Enceladus'}
+    assert all(text.startswith('Calmly: ') for text, _ in requests)
+    transcoder.pcm_to_ogg_opus.assert_awaited_once()
+
+
+async def test_failed_chunk_is_retried_alone(redis, transcoder, monkeypatch):
+    monkeypatch.setattr(settings, 'tts_chunk_retry_delay_seconds', 0)
+    service = make_service(redis, transcoder, chunk_max_chars=50)
+    requests = []
+
+    async def synthesize(text, voice_name):
+        requests.append(text)
+        if 'Защо' in text and requests.count(text) == 1:
+            return None
+        return b'pcm'
+
+    service._synthesize_pcm = synthesize
+
+    ogg = await service.text_to_speech_ogg(STORY)
+
+    assert ogg == b'ogg:pcmpcmpcm'
+    assert len(requests) == 4
+    assert sum(1 for text in requests if 'Защо' in text) == 2
+
+
+async def test_returns_none_when_chunk_keeps_failing(
+    redis, transcoder, monkeypatch
+):
+    monkeypatch.setattr(settings, 'tts_chunk_retry_delay_seconds', 0)
+    service = make_service(
+        redis, transcoder, chunk_max_chars=50, chunk_max_attempts=2
+    )
+
+    async def synthesize(text, voice_name):
+        return None if 'Вечерта' in text else b'pcm'
+
+    service._synthesize_pcm = synthesize
+
+    assert await service.text_to_speech_ogg(STORY) is None
+    transcoder.pcm_to_ogg_opus.assert_not_awaited()
@@ -0,0 +1,35 @@
+from app.utils.html_cleaner import (
+    IncrementalHTMLCleaner,
+    clean_html_for_telegram,
+    close_open_tags,
+)
+
+REPORT_HTML = (
+    '<p>Great week! <b>Progress</b> &amp; <i>tips</i>:</p>'
+    '<ul><li>Use <code>на</code>&nbsp;here</li></ul>'
+    '<h2>Next</h2><span>Keep <u>going</u></span>'
+)
+
+
+def test_clean_html_for_telegram():
+    assert clean_html_for_telegram(REPORT_HTML) == (
+        '\nGreat week! <b>Progress</b> & <i>tips</i>:'
+        '\n\n- Use <code>на</code>\xa0here'
+        'NextKeep <u>going</u>'
+    )
+
+
+def test_incremental_cleaner_matches_whole_text_cleaning():
+    cleaner = IncrementalHTMLCleaner()
+
+    pieces = [cleaner.feed(char) for char in REPORT_HTML]
+
+    assert ''.join(pieces) == clean_html_for_telegram(REPORT_HTML)
+    assert cleaner.text == clean_html_for_telegram(REPORT_HTML)
+    # A tag split across chunks is emitted once it is complete.
+    assert pieces[REPORT_HTML.index('<b>') + 2] == '<b>'
+
+
+def test_close_open_tags():
+    assert close_open_tags('<b>Progress <i>so') == '<b>Progress <i>so</i></b>'
+    assert close_open_tags('<b>Done</b>') == '<b>Done</b>'
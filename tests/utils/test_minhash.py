@@ -0,0 +1,32 @@
+from app.utils.minhash import (
+    estimate_similarity,
+    lsh_band_keys,
+    minhash_signature,
+    shingles,
+)
+
+STORY = (
+    'Мария отиде на пазара рано сутринта и купи ___ за обяд, '
+    'после се върна у дома и сготви супа за цялото семейство.'
+)
+
+
+def signature(text: str):
+    return minhash_signature(shingles(text, 3), 128)
+
+
+def test_minhash_similarity_separates_near_duplicates():
+    near_duplicate = STORY.replace('супа', 'яхния')
+    unrelated = (
+        'Утре ще вали сняг в планината, затова ___ ще отложим '
+        'екскурзията до хижата за следващата седмица.'
+    )
+
+    assert signature(STORY) == signature(STORY)
+    assert estimate_similarity(
+        signature(STORY), signature(near_duplicate)
+    ) > estimate_similarity(signature(STORY), signature(unrelated))
+    assert estimate_similarity(signature(STORY), signature(unrelated)) < 0.2
+    assert set(lsh_band_keys(signature(STORY), 32)) & set(
+        lsh_band_keys(signature(near_duplicate), 32)
+    )
@@ -0,0 +1,276 @@
+import itertools
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+from sqlalchemy import select
+
+from app.config import settings
+from app.core.configs.enums import ExerciseType, LanguageLevel
+from app.core.configs.generation.config import ExerciseTopic
+from app.core.entities.accent_word import AccentWord
+from app.db.models import AccentWord as AccentWordModel
+from app.db.repositories.accent_word import SQLAlchemyAccentWordRepository
+from app.llm.generators.choose_accent_generator import (
+    ChooseAccentGenerationError,
+    ChooseAccentGenerator,
+    RankedWordAssessment,
+    WordBatchAssessment,
+)
+from app.services.accent_dictionary_client import (
+    AccentDictionaryClient,
+    parse_random_word_page,
+)
+from app.workers.accent_word_harvester import harvest_accent_words
+
+pytestmark = pytest.mark.asyncio
+
+FIXTURE_PAGE = (
+    Path(__file__).parent / 'fixtures' / 'rechnik_random_word.html'
+).read_text(encoding='utf-8')
+FIXTURE_WORD = 'я̀бълка'
+
+
+def make_dictionary_stand_in(words):
+    """Local stand-in for the dictionary site serving the fixture page."""
+    words_cycle = itertools.cycle(words)
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        page = FIXTURE_PAGE.replace(FIXTURE_WORD, next(words_cycle))
+        return httpx.Response(200, text=page)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client, requests
+
+
+@pytest.fixture
+def generator(mock_llm_service, async_session_maker):
+    generator = ChooseAccentGenerator(
+        llm_service=mock_llm_service,
+        http_client=AsyncMock(),
+        session_maker=async_session_maker,
+    )
+
+    async def assess_batch(words_no_accent, *args, **kwargs):
+        return [
+            RankedWordAssessment(
+                word_to_assess=word,
+                is_common_and_suitable=word == 'ябълка',
+                confidence_level='HIGH',
+                rank=rank,
+                meaning='Кълбовиден плод.' if word == 'ябълка' else None,
+                examples=['Ям ябълка.'] if word == 'ябълка' else [],
+                grammar_tags=(
+                    {'vocabulary': ['food']} if word == 'ябълка' else {}
+                ),
+            )
+            for rank, word in enumerate(
+                sorted(words_no_accent, key=lambda w: w != 'ябълка'),
+                start=1,
+            )
+        ]
+
+    generator.assess_words_batch = AsyncMock(side_effect=assess_batch)
+    return generator
+
+
+async def test_parse_random_word_page_fixture():
+    assert parse_random_word_page(FIXTURE_PAGE) == FIXTURE_WORD
+
+
+async def test_parse_random_word_page_unexpected_layout():
+    assert parse_random_word_page('<html><body></body></html>') is None
+
+
+async def test_dictionary_client_uses_local_stand_in():
+    http_client, requests = make_dictionary_stand_in([FIXTURE_WORD])
+    client = AccentDictionaryClient(
+        http_client, random_word_url='http://dictionary.local/random'
+    )
+
+    words = await client.fetch_random_words(3)
+
+    assert words == [FIXTURE_WORD] * 3
+    assert len(requests) == 3
+    await http_client.aclose()
+
+
+async def test_harvest_stores_verdicts_and_never_reassesses(
+    generator, async_session_maker, monkeypatch
+):
+    monkeypatch.setattr(settings, 'accent_word_harvest_batch_size', 4)
+    http_client, _ = make_dictionary_stand_in(
+        [FIXTURE_WORD, 'ку̀че', 'котка', 'хля̀б']
+    )
+    client = AccentDictionaryClient(
+        http_client, random_word_url='http://dictionary.local/random'
+    )
+
+    suitable = await harvest_accent_words(
+        client,
+        generator,
+        language_level=LanguageLevel.A2,
+        session_maker=async_session_maker,
+    )
+
+    assert suitable == 1
+    generator.assess_words_batch.assert_awaited_once()
+    assert sorted(generator.assess_words_batch.await_args.args[0]) == [
+        'куче',
+        'ябълка',
+    ]
+
+    async with async_session_maker() as session:
+        rows = (
+            (
+                await session.execute(
+                    select(AccentWordModel).order_by(AccentWordModel.word)
+                )
+            )
+            .scalars()
+            .all()
+        )
+    by_word = {row.word_no_accent: row for row in rows}
+    assert set(by_word) == {'ябълка', 'куче'}
+    assert by_word['ябълка'].is_suitable is True
+    assert by_word['ябълка'].vowel_indexes == [0, 2, 5]
+    assert by_word['ябълка'].meaning == 'Кълбовиден плод.'
+    assert by_word['куче'].is_suitable is False
+
+    suitable = await harvest_accent_words(
+        client,
+        generator,
+        language_level=LanguageLevel.A2,
+        session_maker=async_session_maker,
+    )
+
+    assert suitable == 0
+    generator.assess_words_batch.assert_awaited_once()
+    await http_client.aclose()
+
+
+async def test_generate_draws_each_bank_word_once(
+    generator, async_session_maker
+):
+    async with async_session_maker() as session:
+        candidate = ChooseAccentGenerator.build_word_candidate(
+            FIXTURE_WORD, 'Bulgarian', LanguageLevel.A2
+        )
+        candidate.is_suitable = True
+        candidate.meaning = 'Кълбовиден плод.'
+        candidate.examples = ['Ям ябълка.']
+        candidate.grammar_tags = {'vocabulary': ['food']}
+        await SQLAlchemyAccentWordRepository(session).add_many([candidate])
+        await session.commit()
+
+    exercise, answer, _ = await generator.generate(
+        user_language='en',
+        user_language_code='en',
+        target_language='Bulgarian',
+        language_level=LanguageLevel.B1,
+        topic=ExerciseTopic.GENERAL,
+    )
+
+    assert exercise.exercise_type == ExerciseType.CHOOSE_ACCENT
+    assert answer.answer == FIXTURE_WORD
+    assert FIXTURE_WORD in exercise.data.options
+    assert len(exercise.data.options) == 3
+    assert exercise.data.meaning.startswith('Значение: Кълбовиден плод.')
+    assert 'accent' in exercise.grammar_tags['grammar']
+    generator.assess_words_batch.assert_not_awaited()
+
+    with pytest.raises(ChooseAccentGenerationError):
+        await generator.generate(
+            user_language='en',
+            user_language_code='en',
+            target_language='Bulgarian',
+            language_level=LanguageLevel.B1,
+            topic=ExerciseTopic.GENERAL,
+        )
+
+
+async def test_build_word_candidate_validation():
+    assert (
+        ChooseAccentGenerator.build_word_candidate(
+            'котка', 'Bulgarian', LanguageLevel.A2
+        )
+        is None
+    )
+    assert (
+        ChooseAccentGenerator.build_word_candidate(
+            'хля̀б', 'Bulgarian', LanguageLevel.A2
+        )
+        is None
+    )
+    candidate = ChooseAccentGenerator.build_word_candidate(
+        'ку̀че', 'Bulgarian', LanguageLevel.A2
+    )
+    assert isinstance(candidate, AccentWord)
+    assert candidate.word_no_accent == 'куче'
+    assert candidate.accent_index == 1
+    assert candidate.vowel_indexes == [1, 3]
+
+
+async def test_assess_words_batch_makes_single_llm_call():
+    llm_service = MagicMock()
+    llm_service.model.model_name = 'test-model'
+    generator = ChooseAccentGenerator(
+        llm_service=llm_service, http_client=AsyncMock()
+    )
+    generator._run_llm_generation_chain = AsyncMock(
+        return_value=WordBatchAssessment(
+            assessments=[
+                RankedWordAssessment(
+                    word_to_assess='куче',
+                    is_common_and_suitable=True,
+                    confidence_level='HIGH',
+                    rank=2,
+                ),
+                RankedWordAssessment(
+                    word_to_assess='ябълка',
+                    is_common_and_suitable=True,
+                    confidence_level='HIGH',
+                    rank=1,
+                    meaning='Кълбовиден плод.',
+                ),
+            ]
+        )
+    )
+
+    assessments = await generator.assess_words_batch(
+        ['ябълка', 'куче'],
+        'Bulgarian',
+        'en',
+        LanguageLevel.A2,
+        top_picks=1,
+    )
+
+    generator._run_llm_generation_chain.assert_awaited_once()
+    request_data = generator._run_llm_generation_chain.await_args.kwargs[
+        'additional_request_data'
+    ]
+    assert request_data['top_picks'] == 1
+    assert '- ябълка' in request_data['words_to_assess']
+    assert '- куче' in request_data['words_to_assess']
+    assert [a.word_to_assess for a in assessments] == ['ябълка', 'куче']
+
+
+async def test_assess_words_batch_returns_none_on_llm_error():
+    llm_service = MagicMock()
+    llm_service.model.model_name = 'test-model'
+    generator = ChooseAccentGenerator(
+        llm_service=llm_service, http_client=AsyncMock()
+    )
+    generator._run_llm_generation_chain = AsyncMock(
+        side_effect=RuntimeError('LLM service error')
+    )
+
+    assert (
+        await generator.assess_words_batch(
+            ['ябълка'], 'Bulgarian', 'en', LanguageLevel.A2, top_picks=1
+        )
+        is None
+    )
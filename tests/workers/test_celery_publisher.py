@@ -0,0 +1,141 @@
+import asyncio
+import base64
+import json
+from unittest.mock import MagicMock
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from app.celery_producer import NOTIFIER_TASK_NAME
+from app.config import settings
+from app.infrastructure.celery_publisher import CeleryTaskPublisher
+from app.services.notification_producer import (
+    NotificationProducerService,
+    NotificationTaskData,
+    NotificationType,
+    TelegramMessagePayload,
+)
+
+pytestmark = pytest.mark.asyncio
+
+QUEUE = 'test_notification_tasks'
+
+
+def decode(raw: bytes) -> dict:
+    message = json.loads(raw)
+    message['body'] = json.loads(base64.b64decode(message['body']))
+    return message
+
+
+async def test_message_matches_celery_task_protocol(redis):
+    publisher = CeleryTaskPublisher(redis)
+
+    message = decode(
+        publisher.build_message(
+            NOTIFIER_TASK_NAME, [{'user_id': 1}], QUEUE, 'task-1'
+        )
+    )
+
+    assert message['content-type'] == 'application/json'
+    assert message['headers']['task'] == NOTIFIER_TASK_NAME
+    assert message['headers']['id'] == 'task-1'
+    assert message['properties']['correlation_id'] == 'task-1'
+    assert message['properties']['body_encoding'] == 'base64'
+    assert message['properties']['delivery_info']['routing_key'] == QUEUE
+    args, kwargs, embed = message['body']
+    assert args == [{'user_id': 1}]
+    assert kwargs == {}
+    assert embed['callbacks'] is None
+
+
+async def test_concurrent_publishes_share_a_batch_and_keep_order(redis):
+    publisher = CeleryTaskPublisher(
+        redis, batch_size=10, flush_interval_seconds=0.05
+    )
+    pipeline = MagicMock(wraps=redis.pipeline)
+    redis.pipeline = pipeline
+
+    results = await asyncio.gather(
+        *(
+            publisher.publish(NOTIFIER_TASK_NAME, [i], QUEUE, f'task-{i}')
+            for i in range(5)
+        )
+    )
+    await publisher.close()
+
+    assert results == [True] * 5
+    assert pipeline.call_count == 1
+    consumed = [decode(await redis.rpop(QUEUE)) for _ in range(5)]
+    assert [m['headers']['id'] for m in consumed] == [
+        f'task-{i}' for i in range(5)
+    ]
+
+
+async def test_publish_reports_failed_flush(redis, monkeypatch):
+    publisher = CeleryTaskPublisher(redis)
+
+    async def broken_execute(self, *args, **kwargs):
+        raise RedisConnectionError('redis is down')
+
+    monkeypatch.setattr(type(redis.pipeline()), 'execute', broken_execute)
+
+    assert (
+        await publisher.publish(NOTIFIER_TASK_NAME, [1], QUEUE, 'task-1')
+        is False
+    )
+    await publisher.close()
+
+
+async def test_timed_out_message_is_not_pushed_later(redis):
+    publisher = CeleryTaskPublisher(
+        redis,
+        batch_size=100,
+        flush_interval_seconds=10,
+        ack_timeout_seconds=0.05,
+    )
+
+    assert (
+        await publisher.publish(NOTIFIER_TASK_NAME, [1], QUEUE, 'task-1')
+        is False
+    )
+    await publisher.close()
+
+    assert await redis.llen(QUEUE) == 0
+
+
+async def test_close_flushes_buffer_and_rejects_new_tasks(redis):
+    publisher = CeleryTaskPublisher(
+        redis, batch_size=100, flush_interval_seconds=10
+    )
+    pending = asyncio.create_task(
+        publisher.publish(NOTIFIER_TASK_NAME, [1], QUEUE, 'task-1')
+    )
+    await asyncio.sleep(0.01)
+
+    await publisher.close()
+
+    assert await pending is True
+    assert await redis.llen(QUEUE) == 1
+    assert (
+        await publisher.publish(NOTIFIER_TASK_NAME, [2], QUEUE, 'task-2')
+        is False
+    )
+
+
+async def test_producer_enqueues_through_publisher(redis):
+    publisher = CeleryTaskPublisher(redis)
+    producer = NotificationProducerService(task_publisher=publisher)
+    task_data = NotificationTaskData(
+        user_id=1,
+        bot_id='Bulgarian',
+        text='Test notification text',
+        notification_type=NotificationType.SESSION_REMINDER,
+        payload=TelegramMessagePayload(telegram_id=123),
+    )
+
+    assert await producer.enqueue_notification(task_data) is True
+    await publisher.close()
+
+    message = decode(await redis.rpop(settings.notification_tasks_queue_name))
+    assert message['headers']['id'] == task_data.task_id
+    assert message['body'][0][0]['user_id'] == 1
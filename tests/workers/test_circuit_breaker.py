@@ -0,0 +1,118 @@
+import asyncio
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from app.infrastructure.circuit_breaker import CircuitBreaker, CircuitState
+
+pytestmark = pytest.mark.asyncio
+
+
+def make_breaker(redis, **kwargs) -> CircuitBreaker:
+    params = {
+        'failure_rate_threshold': 0.5,
+        'min_calls': 4,
+        'window_seconds': 60,
+        'bucket_seconds': 10,
+        'open_seconds': 1,
+        'probe_timeout_seconds': 5,
+    }
+    params.update(kwargs)
+    return CircuitBreaker('test_provider', redis_client=redis, **params)
+
+
+async def succeed():
+    return 'ok'
+
+
+async def fail():
+    return None
+
+
+async def test_opens_when_failure_rate_reached(redis):
+    breaker = make_breaker(redis)
+
+    assert await breaker.call(succeed) == 'ok'
+    assert await breaker.call(fail) is None
+    assert await breaker.call(succeed) == 'ok'
+    assert await breaker.get_state() == CircuitState.CLOSED
+
+    assert await breaker.call(fail) is None
+    assert await breaker.get_state() == CircuitState.OPEN
+
+
+async def test_open_circuit_rejects_calls_from_all_instances(redis):
+    breaker = make_breaker(redis, min_calls=2)
+    for _ in range(2):
+        await breaker.call(fail)
+    calls = []
+
+    async def tracked():
+        calls.append(1)
+        return 'ok'
+
+    other_process_breaker = make_breaker(redis, min_calls=2)
+
+    assert await other_process_breaker.is_open() is True
+    assert await other_process_breaker.call(tracked) is None
+    assert calls == []
+
+
+async def test_exceptions_count_as_failures(redis):
+    breaker = make_breaker(redis, min_calls=2)
+
+    async def boom():
+        raise RuntimeError('provider down')
+
+    for _ in range(2):
+        with pytest.raises(RuntimeError):
+            await breaker.call(boom)
+
+    assert await breaker.get_state() == CircuitState.OPEN
+
+
+async def test_half_open_lets_single_probe_through(redis):
+    breaker = make_breaker(redis, min_calls=2)
+    for _ in range(2):
+        await breaker.call(fail)
+    await asyncio.sleep(1.1)
+    assert await breaker.get_state() == CircuitState.HALF_OPEN
+
+    release = asyncio.Event()
+    calls = []
+
+    async def slow_success():
+        calls.append(1)
+        await release.wait()
+        return 'ok'
+
+    probe = asyncio.create_task(breaker.call(slow_success))
+    await asyncio.sleep(0.05)
+    assert await breaker.call(slow_success) is None
+    release.set()
+
+    assert await probe == 'ok'
+    assert calls == [1]
+    assert await breaker.get_state() == CircuitState.CLOSED
+
+
+async def test_failed_probe_reopens_circuit(redis):
+    breaker = make_breaker(redis, min_calls=2)
+    for _ in range(2):
+        await breaker.call(fail)
+    await asyncio.sleep(1.1)
+
+    assert await breaker.call(fail) is None
+    assert await breaker.get_state() == CircuitState.OPEN
+
+
+async def test_allows_calls_when_redis_unavailable(redis, monkeypatch):
+    breaker = make_breaker(redis)
+
+    async def redis_down(*args, **kwargs):
+        raise RedisConnectionError('connection refused')
+
+    monkeypatch.setattr(breaker, 'get_state', redis_down)
+
+    assert await breaker.is_open() is False
+    assert await breaker.call(succeed) == 'ok'
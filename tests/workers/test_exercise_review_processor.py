@@ -198,6 +198,16 @@ def assessor_analysis_default_archive():
     )
 
 
+def claims(*exercises):
+    """Side effect handing out each exercise once, then nothing."""
+    queue = list(exercises)
+
+    def claim(*args, **kwargs):
+        return queue.pop(0) if queue else None
+
+    return claim
+
+
 @contextlib.contextmanager
 def patch_processor_dependencies_manager(
     mock_exercise_repo, mock_answer_repo, mock_session_context_manager
@@ -224,7 +234,7 @@ async def test_exercise_review_processor_no_exercises(
     mock_answer_repo: AsyncMock,
     mock_assessor: AsyncMock,
 ):
-    mock_exercise_repo.get_exercises_by_status.return_value = []
+    mock_exercise_repo.claim_exercise_by_status.side_effect = claims()
     mock_session_context = AsyncMock()
     mock_session_context.__aenter__.return_value = AsyncMock(spec=AsyncSession)
     mock_session_context.__aexit__ = AsyncMock(return_value=False)
@@ -238,7 +248,7 @@ async def test_exercise_review_processor_no_exercises(
             stop_event=stop_event,
         )
 
-    mock_exercise_repo.get_exercises_by_status.assert_awaited_once()
+    mock_exercise_repo.claim_exercise_by_status.assert_awaited()
     mock_answer_repo.get_answers_with_attempt_counts.assert_not_awaited()
     mock_assessor.assess_pending_exercise.assert_not_awaited()
     mock_exercise_repo.update_exercise_status_and_data.assert_not_awaited()
@@ -251,7 +261,9 @@ async def test_exercise_review_processor_no_answers(
     mock_assessor: AsyncMock,
     sample_exercise: ExerciseEntity,
 ):
-    mock_exercise_repo.get_exercises_by_status.return_value = [sample_exercise]
+    mock_exercise_repo.claim_exercise_by_status.side_effect = claims(
+        sample_exercise
+    )
     mock_answer_repo.get_answers_with_attempt_counts.return_value = []
     mock_exercise_repo.update_exercise_status_and_data.return_value = (
         sample_exercise
@@ -269,7 +281,7 @@ async def test_exercise_review_processor_no_answers(
             stop_event=stop_event,
         )
 
-    mock_exercise_repo.get_exercises_by_status.assert_awaited_once()
+    mock_exercise_repo.claim_exercise_by_status.assert_awaited()
     mock_answer_repo.get_answers_with_attempt_counts.assert_awaited_once_with(
         sample_exercise.exercise_id,
     )
@@ -298,7 +310,9 @@ async def test_exercise_review_processor_no_correct_answers(
     sample_exercise: ExerciseEntity,
     sample_incorrect_answer_entity_en: ExerciseAnswerEntity,
 ):
-    mock_exercise_repo.get_exercises_by_status.return_value = [sample_exercise]
+    mock_exercise_repo.claim_exercise_by_status.side_effect = claims(
+        sample_exercise
+    )
     mock_answer_repo.get_answers_with_attempt_counts.return_value = [
         (sample_incorrect_answer_entity_en, 5)
     ]
@@ -318,7 +332,7 @@ async def test_exercise_review_processor_no_correct_answers(
             stop_event=stop_event,
         )
 
-    mock_exercise_repo.get_exercises_by_status.assert_awaited_once()
+    mock_exercise_repo.claim_exercise_by_status.assert_awaited()
     mock_answer_repo.get_answers_with_attempt_counts.assert_awaited_once_with(
         sample_exercise.exercise_id,
     )
@@ -352,7 +366,9 @@ async def test_exercise_review_processor_publish_ok(
     sample_incorrect_answer_entity_en: ExerciseAnswerEntity,
     sample_assessor_analysis_publish_ok: PendingExerciseAnalysis,
 ):
-    mock_exercise_repo.get_exercises_by_status.return_value = [sample_exercise]
+    mock_exercise_repo.claim_exercise_by_status.side_effect = claims(
+        sample_exercise
+    )
     mock_answer_repo.get_answers_with_attempt_counts.return_value = [
         (sample_correct_answer_entity, 10),
         (sample_incorrect_answer_entity_en, 5),
@@ -376,7 +392,7 @@ async def test_exercise_review_processor_publish_ok(
             stop_event=stop_event,
         )
 
-    mock_exercise_repo.get_exercises_by_status.assert_awaited_once()
+    mock_exercise_repo.claim_exercise_by_status.assert_awaited()
     mock_answer_repo.get_answers_with_attempt_counts.assert_awaited_once_with(
         sample_exercise.exercise_id,
     )
@@ -438,7 +454,9 @@ async def test_exercise_review_processor_keep_complex(
     sample_incorrect_answer_entity_en: ExerciseAnswerEntity,
     sample_assessor_analysis_keep_complex: PendingExerciseAnalysis,
 ):
-    mock_exercise_repo.get_exercises_by_status.return_value = [sample_exercise]
+    mock_exercise_repo.claim_exercise_by_status.side_effect = claims(
+        sample_exercise
+    )
     mock_answer_repo.get_answers_with_attempt_counts.return_value = [
         (sample_correct_answer_entity, 10),
         (sample_incorrect_answer_entity_en, 5),
@@ -499,7 +517,9 @@ async def test_exercise_review_processor_archive_flawed(
     sample_incorrect_answer_entity_en: ExerciseAnswerEntity,
     assessor_analysis_archive_flawed: PendingExerciseAnalysis,
 ):
-    mock_exercise_repo.get_exercises_by_status.return_value = [sample_exercise]
+    mock_exercise_repo.claim_exercise_by_status.side_effect = claims(
+        sample_exercise
+    )
     mock_answer_repo.get_answers_with_attempt_counts.return_value = [
         (sample_correct_answer_entity, 10),
         (sample_incorrect_answer_entity_en, 5),
@@ -567,7 +587,9 @@ async def test_exercise_review_processor_admin_review_revision(
     sample_incorrect_answer_entity_en: ExerciseAnswerEntity,
     sample_assessor_analysis_admin_review_revision: PendingExerciseAnalysis,
 ):
-    mock_exercise_repo.get_exercises_by_status.return_value = [sample_exercise]
+    mock_exercise_repo.claim_exercise_by_status.side_effect = claims(
+        sample_exercise
+    )
     mock_answer_repo.get_answers_with_attempt_counts.return_value = [
         (sample_correct_answer_entity, 10),
         (sample_incorrect_answer_entity_en, 5),
@@ -643,9 +665,9 @@ async def test_exercise_review_processor_admin_review_no_revision(
         options=['сло̀во', 'слово̀'],
     )
 
-    mock_exercise_repo.get_exercises_by_status.return_value = [
+    mock_exercise_repo.claim_exercise_by_status.side_effect = claims(
         choose_accent_exercise
-    ]
+    )
     mock_answer_repo.get_answers_with_attempt_counts.return_value = [
         (sample_correct_answer_entity, 10),
         (sample_incorrect_answer_entity_en, 5),
@@ -670,7 +692,7 @@ async def test_exercise_review_processor_admin_review_no_revision(
             stop_event=stop_event,
         )
 
-    mock_exercise_repo.get_exercises_by_status.assert_awaited_once()
+    mock_exercise_repo.claim_exercise_by_status.assert_awaited()
     mock_answer_repo.get_answers_with_attempt_counts.assert_awaited_once_with(
         choose_accent_exercise.exercise_id,
     )
@@ -711,7 +733,9 @@ async def test_exercise_review_processor_default_archive(
     sample_incorrect_answer_entity_en: ExerciseAnswerEntity,
     assessor_analysis_default_archive: PendingExerciseAnalysis,
 ):
-    mock_exercise_repo.get_exercises_by_status.return_value = [sample_exercise]
+    mock_exercise_repo.claim_exercise_by_status.side_effect = claims(
+        sample_exercise
+    )
     mock_answer_repo.get_answers_with_attempt_counts.return_value = [
         (sample_correct_answer_entity, 10),
         (sample_incorrect_answer_entity_en, 5),
@@ -782,7 +806,9 @@ async def test_exercise_review_processor_aggregates_answers(
     sample_incorrect_answer_entity_other: ExerciseAnswerEntity,
     sample_assessor_analysis_publish_ok: PendingExerciseAnalysis,
 ):
-    mock_exercise_repo.get_exercises_by_status.return_value = [sample_exercise]
+    mock_exercise_repo.claim_exercise_by_status.side_effect = claims(
+        sample_exercise
+    )
     mock_answer_repo.get_answers_with_attempt_counts.return_value = [
         (sample_correct_answer_entity, 10),
         (sample_incorrect_answer_entity_en, 5),
@@ -854,7 +880,9 @@ async def test_exercise_review_processor_assessor_exception(
     sample_correct_answer_entity: ExerciseAnswerEntity,
     sample_incorrect_answer_entity_en: ExerciseAnswerEntity,
 ):
-    mock_exercise_repo.get_exercises_by_status.return_value = [sample_exercise]
+    mock_exercise_repo.claim_exercise_by_status.side_effect = claims(
+        sample_exercise
+    )
     mock_answer_repo.get_answers_with_attempt_counts.return_value = [
         (sample_correct_answer_entity, 10),
         (sample_incorrect_answer_entity_en, 5),
@@ -896,11 +924,9 @@ async def test_exercise_review_processor_loop(
     sample_incorrect_answer_entity_en: ExerciseAnswerEntity,
     sample_assessor_analysis_publish_ok: PendingExerciseAnalysis,
 ):
-    mock_exercise_repo.get_exercises_by_status.side_effect = [
-        [sample_exercise],
-        [],
-        StopAsyncIteration,
-    ]
+    mock_exercise_repo.claim_exercise_by_status.side_effect = claims(
+        sample_exercise
+    )
     mock_answer_repo.get_answers_with_attempt_counts.return_value = [
         (sample_correct_answer_entity, 10),
         (sample_incorrect_answer_entity_en, 5),
@@ -915,68 +941,95 @@ async def test_exercise_review_processor_loop(
     stop_event = asyncio.Event()
     mock_session = AsyncMock(spec=AsyncSession)
     mock_session.commit = AsyncMock()
-    mock_session.rollback = AsyncMock()
-
-    async def run_and_stop():
-        nonlocal mock_session
-        mock_session_context = AsyncMock()
-        mock_session_context.__aenter__.return_value = mock_session
-        mock_session_context.__aexit__ = AsyncMock(return_value=False)
-
-        with (
-            patch(
-                'app.workers.exercise_review_processor.async_session_maker',
-                return_value=mock_session_context,
-            ),
-            patch(
-                'app.workers.exercise_review_processor.SQLAlchemyExerciseRepository',
-                return_value=mock_exercise_repo,
-            ),
-            patch(
-                'app.workers.exercise_review_processor.SQLAlchemyExerciseAnswerRepository',
-                return_value=mock_answer_repo,
-            ),
-            patch(
-                'app.workers.exercise_review_processor.PendingReviewAssessor',
-                return_value=mock_assessor,
-            ),
-            patch(
-                'app.workers.exercise_review_processor.EXERCISE_REVIEW_INTERVAL_SECONDS',
-                0.01,
-            ),
-        ):
-            loop_task = asyncio.create_task(
-                exercise_review_processor_loop(stop_event),
-            )
-            # Allow time for the loop to run enough cycles to exhaust
-            # side_effect and hit the StopAsyncIteration, then be stopped.
-            # With interval 0.01s, 0.05s sleep allows ~5 cycles.
-            # side_effect has 3 items.
-            await asyncio.sleep(0.05)
-            stop_event.set()
-            try:
-                await asyncio.wait_for(loop_task, timeout=1.0)
-            except asyncio.TimeoutError:
-                print('Loop task timed out during stop.')
-                loop_task.cancel()
-                contextlib.suppress(asyncio.CancelledError)
-                await loop_task
-
-    await run_and_stop()
-
-    # get_exercises_by_status is called until side_effect is exhausted.
-    # It's called in each cycle of the loop.
-    # The number of calls will be number of loop iterations before stop_event.
-    # Given 0.05s sleep and 0.01s interval, loop runs ~5 times.
-    assert mock_exercise_repo.get_exercises_by_status.call_count == 5
+    mock_session_context = AsyncMock()
+    mock_session_context.__aenter__.return_value = mock_session
+    mock_session_context.__aexit__ = AsyncMock(return_value=False)
+
+    with (
+        patch_processor_dependencies_manager(
+            mock_exercise_repo, mock_answer_repo, mock_session_context
+        ),
+        patch(
+            'app.workers.exercise_review_processor.PendingReviewAssessor',
+            return_value=mock_assessor,
+        ),
+        patch(
+            'app.workers.exercise_review_processor.EXERCISE_REVIEW_INTERVAL_SECONDS',
+            0.01,
+        ),
+    ):
+        loop_task = asyncio.create_task(
+            exercise_review_processor_loop(stop_event),
+        )
+        # With a 0.01s interval the loop runs several cycles.
+        await asyncio.sleep(0.05)
+        stop_event.set()
+        await asyncio.wait_for(loop_task, timeout=1.0)
+
+    # Every cycle tries to claim; only the first one finds the exercise.
+    assert mock_exercise_repo.claim_exercise_by_status.await_count > 2
     mock_assessor.assess_pending_exercise.assert_awaited_once()
     mock_exercise_repo.update_exercise_status_and_data.assert_awaited_once()
+    mock_session.commit.assert_awaited_once()
+
+
+async def test_exercise_review_processor_reviews_concurrently(
+    mock_exercise_repo: AsyncMock,
+    mock_answer_repo: AsyncMock,
+    mock_assessor: AsyncMock,
+    sample_exercise: ExerciseEntity,
+    sample_correct_answer_entity: ExerciseAnswerEntity,
+    sample_incorrect_answer_entity_en: ExerciseAnswerEntity,
+    sample_assessor_analysis_publish_ok: PendingExerciseAnalysis,
+):
+    exercises = [
+        sample_exercise.model_copy(update={'exercise_id': exercise_id})
+        for exercise_id in (1, 2, 3)
+    ]
+    mock_exercise_repo.claim_exercise_by_status.side_effect = claims(
+        *exercises
+    )
+    mock_answer_repo.get_answers_with_attempt_counts.return_value = [
+        (sample_correct_answer_entity, 10),
+        (sample_incorrect_answer_entity_en, 5),
+    ]
+    in_flight = 0
+    max_in_flight = 0
+
+    async def assess(**kwargs):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        if kwargs['exercise'].exercise_id == 2:
+            raise Exception('Assessor failed')
+        return sample_assessor_analysis_publish_ok
+
+    mock_assessor.assess_pending_exercise.side_effect = assess
+    mock_session = AsyncMock(spec=AsyncSession)
+    mock_session.commit = AsyncMock()
+    mock_session_context = AsyncMock()
+    mock_session_context.__aenter__.return_value = mock_session
+    mock_session_context.__aexit__ = AsyncMock(return_value=False)
+
+    with patch_processor_dependencies_manager(
+        mock_exercise_repo, mock_answer_repo, mock_session_context
+    ):
+        decisions = await exercise_review_processor(
+            assessor=mock_assessor,
+            stop_event=asyncio.Event(),
+            concurrency=2,
+        )
 
-    # Commit is called after the first cycle (with exercise)
-    # and the second cycle (no exercises).
-    # Not called in subsequent cycles due to StopAsyncIteration before commit.
-    assert mock_session.commit.await_count == 2
-    # Rollback is called when StopAsyncIteration is caught.
-    # This will happen for the 3rd, 4th,
-    # and 5th calls to get_exercises_by_status.
-    assert mock_session.rollback.await_count == 3
+    assert max_in_flight == 2
+    assert {d.exercise_id: d.new_status for d in decisions} == {
+        1: ExerciseStatus.PUBLISHED,
+        2: ExerciseStatus.PENDING_REVIEW,
+        3: ExerciseStatus.PUBLISHED,
+    }
+    # Each decision is committed on its own.
+    assert mock_session.commit.await_count == 3
+    # The failed exercise is not claimed again in the same cycle.
+    last_claim = mock_exercise_repo.claim_exercise_by_status.await_args
+    assert last_claim.kwargs['exclude_ids'] == {2}
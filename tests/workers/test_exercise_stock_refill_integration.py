@@ -19,7 +19,9 @@ from app.db.models.exercise import (
     Exercise as ExerciseModel,
 )
 from app.db.repositories.exercise import SQLAlchemyExerciseRepository
+from app.services.tts_service import story_audio_digest
 from app.workers.exercise_stock_refill import (
+    _generate_and_upload_audio,
     exercise_stock_refill,
     generate_and_save_exercise,
 )
@@ -344,3 +346,109 @@ async def test_exercise_stock_refill_uses_language_config(
         for call in mock_generate_and_save.call_args_list
     }
     assert called_languages.issubset({'Bulgarian', 'Serbian'})
+
+
+@pytest.mark.asyncio
+async def test_story_audio_is_reused_from_artifact_cache(
+    db_session,
+    mock_tts_service,
+    mock_file_storage_service,
+    mock_http_client_telegram,
+):
+    story = StoryComprehensionExerciseData(
+        content_text='A story told twice.',
+        audio_url='',
+        audio_telegram_file_id='',
+        options=['A', 'B', 'C'],
+    )
+
+    with patch(
+        'app.workers.exercise_stock_refill.async_session_maker'
+    ) as mock_session_maker:
+        mock_session_scope = AsyncMock()
+        mock_session_scope.__aenter__.return_value = db_session
+        mock_session_scope.__aexit__.return_value = None
+        mock_session_maker.return_value = mock_session_scope
+
+        results = [
+            await _generate_and_upload_audio(
+                exercise_data=story,
+                target_language='Bulgarian',
+                tts_service=mock_tts_service,
+                file_storage_service=mock_file_storage_service,
+                http_client=mock_http_client_telegram,
+                voice_name='Leda',
+            )
+            for _ in range(2)
+        ]
+
+    expected = (
+        'http://fake-r2-url.com/audio.ogg',
+        'fake_telegram_file_id',
+        True,
+    )
+    assert results == [expected, expected]
+    mock_tts_service.text_to_speech_ogg.assert_called_once()
+    mock_http_client_telegram.post.assert_called_once()
+    mock_file_storage_service.upload_audio.assert_called_once()
+    digest = story_audio_digest('A story told twice.', 'Leda', None)
+    assert (
+        mock_file_storage_service.upload_audio.call_args.kwargs['file_name']
+        == f'story_audio/{digest}.ogg'
+    )
+
+
+@pytest.mark.asyncio
+async def test_story_audio_retry_skips_synthesis_after_r2_upload(
+    db_session,
+    mock_tts_service,
+    mock_file_storage_service,
+    mock_http_client_telegram,
+):
+    story = StoryComprehensionExerciseData(
+        content_text='A story whose Telegram upload failed.',
+        audio_url='',
+        audio_telegram_file_id='',
+        options=['A', 'B', 'C'],
+    )
+    mock_file_storage_service.download_audio = AsyncMock(
+        return_value=b'fake_ogg_data'
+    )
+    telegram_response = mock_http_client_telegram.post.return_value
+    mock_http_client_telegram.post = AsyncMock(
+        side_effect=[Exception('Telegram is down'), telegram_response]
+    )
+
+    with patch(
+        'app.workers.exercise_stock_refill.async_session_maker'
+    ) as mock_session_maker:
+        mock_session_scope = AsyncMock()
+        mock_session_scope.__aenter__.return_value = db_session
+        mock_session_scope.__aexit__.return_value = None
+        mock_session_maker.return_value = mock_session_scope
+
+        first = await _generate_and_upload_audio(
+            exercise_data=story,
+            target_language='Bulgarian',
+            tts_service=mock_tts_service,
+            file_storage_service=mock_file_storage_service,
+            http_client=mock_http_client_telegram,
+        )
+        second = await _generate_and_upload_audio(
+            exercise_data=story,
+            target_language='Bulgarian',
+            tts_service=mock_tts_service,
+            file_storage_service=mock_file_storage_service,
+            http_client=mock_http_client_telegram,
+        )
+
+    assert first == ('http://fake-r2-url.com/audio.ogg', None, False)
+    assert second == (
+        'http://fake-r2-url.com/audio.ogg',
+        'fake_telegram_file_id',
+        True,
+    )
+    mock_tts_service.text_to_speech_ogg.assert_called_once()
+    mock_file_storage_service.upload_audio.assert_called_once()
+    mock_file_storage_service.download_audio.assert_called_once()
+    assert mock_http_client_telegram.post.call_count == 2
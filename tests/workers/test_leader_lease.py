@@ -0,0 +1,102 @@
+import asyncio
+
+import pytest
+
+from app.config import settings
+from app.infrastructure.leader_lease import LeaderLease, run_as_leader
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_lease_is_exclusive(redis):
+    first = LeaderLease(redis, 'test_loop')
+    second = LeaderLease(redis, 'test_loop')
+
+    assert await first.acquire() is True
+    assert await second.acquire() is False
+    assert await second.renew() is False
+    assert await second.release() is False
+
+    assert await first.renew() is True
+    assert await first.release() is True
+    assert await second.acquire() is True
+
+
+async def test_lease_expires_when_not_renewed(redis):
+    first = LeaderLease(redis, 'test_loop', ttl_seconds=1)
+    second = LeaderLease(redis, 'test_loop', ttl_seconds=1)
+
+    assert await first.acquire() is True
+    await asyncio.sleep(1.2)
+
+    assert await second.acquire() is True
+    assert await first.renew() is False
+
+
+async def test_only_one_instance_runs_leader_loop(redis, monkeypatch):
+    monkeypatch.setattr(settings, 'leader_lease_renew_interval_seconds', 0.05)
+    monkeypatch.setattr(settings, 'leader_lease_retry_interval_seconds', 0.05)
+
+    running = []
+    max_running = 0
+
+    async def fake_loop(loop_stop_event: asyncio.Event):
+        nonlocal max_running
+        running.append(1)
+        max_running = max(max_running, len(running))
+        try:
+            await loop_stop_event.wait()
+        finally:
+            running.pop()
+
+    stop_event = asyncio.Event()
+    instances = [
+        asyncio.create_task(
+            run_as_leader('test_loop', fake_loop, stop_event, redis)
+        )
+        for _ in range(3)
+    ]
+    await asyncio.sleep(0.3)
+
+    assert max_running == 1
+    assert len(running) == 1
+
+    stop_event.set()
+    await asyncio.wait_for(asyncio.gather(*instances), timeout=5)
+
+    assert running == []
+    assert await redis.exists('leader_lease:test_loop') == 0
+
+
+async def test_standby_takes_over_after_leader_stops(redis, monkeypatch):
+    monkeypatch.setattr(settings, 'leader_lease_renew_interval_seconds', 0.05)
+    monkeypatch.setattr(settings, 'leader_lease_retry_interval_seconds', 0.05)
+
+    started_by = []
+
+    def make_loop(instance_name: str):
+        async def fake_loop(loop_stop_event: asyncio.Event):
+            started_by.append(instance_name)
+            await loop_stop_event.wait()
+
+        return fake_loop
+
+    leader_stop = asyncio.Event()
+    standby_stop = asyncio.Event()
+    leader = asyncio.create_task(
+        run_as_leader('test_loop', make_loop('leader'), leader_stop, redis)
+    )
+    await asyncio.sleep(0.1)
+    standby = asyncio.create_task(
+        run_as_leader('test_loop', make_loop('standby'), standby_stop, redis)
+    )
+    await asyncio.sleep(0.2)
+    assert started_by == ['leader']
+
+    leader_stop.set()
+    await asyncio.wait_for(leader, timeout=5)
+    await asyncio.sleep(0.2)
+    assert started_by == ['leader', 'standby']
+
+    standby_stop.set()
+    await asyncio.wait_for(standby, timeout=5)
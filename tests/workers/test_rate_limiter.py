@@ -0,0 +1,45 @@
+import asyncio
+import time
+
+import pytest
+
+from app.infrastructure.rate_limiter import RedisTokenBucket
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_bucket_allows_burst_then_asks_to_wait(redis):
+    bucket = RedisTokenBucket(redis, 'test', rate_per_second=10, capacity=3)
+
+    waits = [await bucket.try_acquire() for _ in range(4)]
+
+    assert waits[:3] == [0, 0, 0]
+    assert 0 < waits[3] <= 0.1
+
+
+async def test_bucket_is_shared_between_instances(redis):
+    first = RedisTokenBucket(redis, 'test', rate_per_second=10, capacity=2)
+    second = RedisTokenBucket(redis, 'test', rate_per_second=10, capacity=2)
+    other_bot = RedisTokenBucket(
+        redis, 'other', rate_per_second=10, capacity=2
+    )
+
+    assert await first.try_acquire() == 0
+    assert await second.try_acquire() == 0
+    assert await second.try_acquire() > 0
+    assert await other_bot.try_acquire() == 0
+
+
+async def test_acquire_paces_to_rate(redis):
+    buckets = [
+        RedisTokenBucket(redis, 'test', rate_per_second=50, capacity=5)
+        for _ in range(2)
+    ]
+
+    started = time.perf_counter()
+    await asyncio.gather(
+        *(bucket.acquire() for bucket in buckets for _ in range(15))
+    )
+
+    # 5 tokens of burst, the other 25 arrive at 50 per second.
+    assert time.perf_counter() - started >= 0.45
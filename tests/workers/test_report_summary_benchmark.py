@@ -0,0 +1,112 @@
+"""
+Timing of the weekly summary queries for a large number of users.
+Skipped unless REPORT_BENCHMARK_USERS is set, e.g.
+
+    REPORT_BENCHMARK_USERS=10000 pytest -s \
+        tests/workers/test_report_summary_benchmark.py
+"""
+
+import os
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import insert, text
+
+from app.config import settings
+from app.db.models import DBUserBotProfile
+from app.db.models import User as UserModel
+from app.db.repositories.exercise_attempt import (
+    SQLAlchemyExerciseAttemptRepository,
+)
+
+pytestmark = [
+    pytest.mark.asyncio,
+    pytest.mark.skipif(
+        not os.getenv('REPORT_BENCHMARK_USERS'),
+        reason='REPORT_BENCHMARK_USERS is not set',
+    ),
+]
+
+ATTEMPTS_PER_USER = 20
+PER_USER_SAMPLE_SIZE = 500
+INSERT_BATCH_SIZE = 5000
+
+
+@pytest.fixture
+def aggregation_settle_seconds() -> int:
+    return settings.aggregation_settle_seconds
+
+
+async def seed(
+    db_session, exercise_id: int, users_count: int, now: datetime
+) -> None:
+    for start in range(1, users_count + 1, INSERT_BATCH_SIZE):
+        user_ids = range(
+            start, min(start + INSERT_BATCH_SIZE, users_count + 1)
+        )
+        await db_session.execute(
+            insert(UserModel),
+            [{'user_id': i, 'telegram_id': str(i)} for i in user_ids],
+        )
+        await db_session.execute(
+            insert(DBUserBotProfile),
+            [
+                {'user_id': i, 'bot_id': 'Bulgarian', 'user_language': 'en'}
+                for i in user_ids
+            ],
+        )
+    await db_session.execute(
+        text("""
+        INSERT INTO exercise_attempts (
+            user_id, exercise_id, answer, is_correct, error_tags, created_at
+        )
+        SELECT
+            u, CAST(:exercise_id AS integer), '{}'::jsonb, n % 3 <> 0,
+            '{"grammar": ["articles"]}'::jsonb,
+            CAST(:now AS timestamptz) - make_interval(hours => n * 7)
+        FROM generate_series(1, CAST(:users_count AS integer)) AS u
+        CROSS JOIN
+            generate_series(1, CAST(:attempts_per_user AS integer)) AS n
+        """),
+        {
+            'exercise_id': exercise_id,
+            'now': now,
+            'users_count': users_count,
+            'attempts_per_user': ATTEMPTS_PER_USER,
+        },
+    )
+    await db_session.execute(text('ANALYZE exercise_attempts'))
+
+
+async def test_weekly_summary_benchmark(db_session, db_exercise_attempts):
+    users_count = int(os.environ['REPORT_BENCHMARK_USERS'])
+    now = datetime.now(timezone.utc)
+    start_date = now - timedelta(days=7)
+    await seed(db_session, db_exercise_attempts.exercise_id, users_count, now)
+    repo = SQLAlchemyExerciseAttemptRepository(db_session)
+    pairs = [(i, 'Bulgarian') for i in range(1, users_count + 1)]
+    chunk_size = settings.profile_scan_chunk_size
+
+    started = time.perf_counter()
+    for i in range(0, users_count, chunk_size):
+        await repo.get_period_summaries_for_users_and_bots(
+            pairs[i : i + chunk_size], start_date, now
+        )
+    bulk_seconds = time.perf_counter() - started
+
+    sample = pairs[:PER_USER_SAMPLE_SIZE]
+    started = time.perf_counter()
+    for user_id, bot_id in sample:
+        await repo.get_period_summary_for_user_and_bot(
+            user_id, bot_id, start_date, now
+        )
+    per_user_seconds = (
+        (time.perf_counter() - started) / len(sample) * users_count
+    )
+
+    print(
+        f'\n{users_count} users: bulk {bulk_seconds:.2f}s, '
+        f'per user (extrapolated) {per_user_seconds:.2f}s'
+    )
+    assert bulk_seconds < per_user_seconds
@@ -1,9 +1,10 @@
 from datetime import datetime, timedelta, timezone
 from typing import Any, AsyncGenerator
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, call, patch
 
 import pytest
 import pytest_asyncio
+from arq import Retry
 from arq.connections import ArqRedis
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -13,6 +14,7 @@ from app.core.configs.generation.config import ExerciseTopic
 from app.core.entities.user import User
 from app.core.entities.user_bot_profile import UserBotProfile
 from app.core.services.user_bot_profile import UserBotProfileService
+from app.core.services.user_report import get_weekly_report_period
 from app.core.value_objects.exercise import FillInTheBlankExerciseData
 from app.db.models import DBUserBotProfile
 from app.db.models import User as DBUser
@@ -28,15 +30,27 @@ from app.db.repositories.exercise_attempt import (
 from app.db.repositories.user_bot_profile import (
     SQLAlchemyUserBotProfileRepository,
 )
+from app.infrastructure.job_checkpoint import JobCheckpoint
 from app.workers.arq_tasks.reports import (
     generate_and_send_detailed_report_arq,
     run_report_generation_cycle_arq,
+    run_report_generation_shard_arq,
     send_detailed_report_notification_arq,
 )
 
 pytestmark = pytest.mark.asyncio
 
 
+async def iter_chunks(*chunks):
+    for chunk in chunks:
+        yield chunk
+
+
+def report_week() -> str:
+    start, _ = get_weekly_report_period(datetime.now(timezone.utc))
+    return start.date().isoformat()
+
+
 @pytest_asyncio.fixture(scope='function')
 async def worker_db_session(
     async_session_maker,
@@ -365,13 +379,23 @@ async def test_get_period_summary_for_user_and_bot(
     assert summary['error_grammar_tags'] == {'verb tense: past': 1}
     assert summary['error_vocab_tags'] == {'travel': 1}
 
+    summaries = await repo.get_period_summaries_for_users_and_bots(
+        [(user.user_id, profile.bot_id), (user.user_id, 'en')],
+        start_date=now - timedelta(days=7),
+        end_date=now,
+    )
+
+    assert summaries[(user.user_id, profile.bot_id)] == summary
+    assert summaries[(user.user_id, 'en')]['total_attempts'] == 0
+
 
 @patch('app.workers.arq_tasks.reports.NotificationProducerService')
 @patch('app.workers.arq_tasks.reports.UserReportService')
-async def test_run_report_generation_cycle_arq(
+async def test_run_report_generation_shard_arq(
     mock_report_service_cls,
     mock_notification_producer_cls,
     add_user_with_active_attempts,
+    redis,
 ):
     user, profile = add_user_with_active_attempts
 
@@ -390,19 +414,29 @@ async def test_run_report_generation_cycle_arq(
         status=ReportStatus.PENDING,
         generated_at=datetime.now(timezone.utc),
     )
-    mock_report_service.generate_and_save_short_weekly_reports.return_value = [
-        (
-            UserBotProfile.model_validate(profile),
-            User.model_validate(user),
-            report,
+    mock_report_service.iter_short_weekly_reports = MagicMock(
+        return_value=iter_chunks(
+            [
+                (
+                    UserBotProfile.model_validate(profile),
+                    User.model_validate(user),
+                    report,
+                )
+            ]
         )
-    ]
+    )
 
-    ctx = {'arq_pool': AsyncMock(spec=ArqRedis), 'llm_service': AsyncMock()}
+    ctx = {
+        'arq_pool': AsyncMock(spec=ArqRedis),
+        'llm_service': AsyncMock(),
+        'redis_client': redis,
+    }
 
-    await run_report_generation_cycle_arq(ctx)
+    await run_report_generation_shard_arq(ctx, 1, 2)
 
-    mock_report_service.generate_and_save_short_weekly_reports.assert_awaited_once()
+    mock_report_service.iter_short_weekly_reports.assert_called_once_with(
+        shard=(1, 2), after=None
+    )
 
     mock_producer.enqueue_weekly_report_notification.assert_awaited_once()
 
@@ -413,6 +447,172 @@ async def test_run_report_generation_cycle_arq(
     assert isinstance(call_args['profile'], UserBotProfile)
     assert call_args['user'].user_id == user.user_id
     assert call_args['report'].report_id == report.report_id
+    progress = await JobCheckpoint(
+        redis, f'weekly_report:{report_week()}:1/2'
+    ).load()
+    assert progress == {
+        'sent': 1,
+        'done': True,
+        'last_key': [user.user_id, profile.bot_id],
+        'pending': [],
+    }
+
+
+@patch('app.workers.arq_tasks.reports.UserReportService')
+async def test_report_generation_shard_resumes_from_checkpoint(
+    mock_report_service_cls, redis
+):
+    mock_report_service = AsyncMock()
+    mock_report_service.iter_short_weekly_reports = MagicMock(
+        return_value=iter_chunks()
+    )
+    mock_report_service_cls.return_value = mock_report_service
+    ctx = {
+        'arq_pool': AsyncMock(spec=ArqRedis),
+        'llm_service': AsyncMock(),
+        'redis_client': redis,
+    }
+    await JobCheckpoint(redis, f'weekly_report:{report_week()}:0/2').save(
+        {'sent': 10, 'done': False, 'last_key': [42, 'Bulgarian']}
+    )
+    await JobCheckpoint(redis, f'weekly_report:{report_week()}:1/2').save(
+        {'sent': 10, 'done': True, 'last_key': [43, 'Bulgarian']}
+    )
+
+    await run_report_generation_shard_arq(ctx, 0, 2)
+    await run_report_generation_shard_arq(ctx, 1, 2)
+
+    mock_report_service.iter_short_weekly_reports.assert_called_once_with(
+        shard=(0, 2), after=(42, 'Bulgarian')
+    )
+
+
+@patch('app.workers.arq_tasks.reports.NotificationProducerService')
+@patch('app.workers.arq_tasks.reports.UserReportService')
+async def test_report_generation_shard_sends_pending_notifications(
+    mock_report_service_cls,
+    mock_notification_producer_cls,
+    add_user_with_short_report,
+    worker_db_session,
+    redis,
+):
+    user, profile, report = add_user_with_short_report
+    report_start_date, _ = get_weekly_report_period(datetime.now(timezone.utc))
+    report.week_start_date = report_start_date.date()
+    await worker_db_session.commit()
+    mock_report_service = AsyncMock()
+    mock_report_service.iter_short_weekly_reports = MagicMock(
+        return_value=iter_chunks()
+    )
+    mock_report_service_cls.return_value = mock_report_service
+    mock_producer = AsyncMock()
+    mock_notification_producer_cls.return_value = mock_producer
+    ctx = {
+        'arq_pool': AsyncMock(spec=ArqRedis),
+        'llm_service': AsyncMock(),
+        'redis_client': redis,
+    }
+    checkpoint = JobCheckpoint(redis, f'weekly_report:{report_week()}:0/1')
+    # The previous run committed the report but stopped before notifying.
+    await checkpoint.save(
+        {
+            'sent': 0,
+            'done': False,
+            'last_key': [1, 'Bulgarian'],
+            'pending': [[user.user_id, profile.bot_id]],
+        }
+    )
+
+    await run_report_generation_shard_arq(ctx, 0, 1)
+
+    call_args = (
+        mock_producer.enqueue_weekly_report_notification.call_args.kwargs
+    )
+    assert call_args['report'].report_id == report.report_id
+    assert call_args['user'].user_id == user.user_id
+    mock_report_service.iter_short_weekly_reports.assert_called_once_with(
+        shard=(0, 1), after=(1, 'Bulgarian')
+    )
+    progress = await checkpoint.load()
+    assert progress['pending'] == []
+    assert progress['sent'] == 1
+    assert progress['done'] is True
+
+
+@patch('app.workers.arq_tasks.reports.NotificationProducerService')
+@patch('app.workers.arq_tasks.reports.UserReportService')
+async def test_report_generation_shard_retries_after_budget(
+    mock_report_service_cls,
+    mock_notification_producer_cls,
+    redis,
+    monkeypatch,
+):
+    monkeypatch.setattr(settings, 'report_generation_shard_budget_seconds', 0)
+    first, second = (
+        UserBotProfile(user_id=user_id, bot_id='Bulgarian', user_language='en')
+        for user_id in (1, 2)
+    )
+    mock_report_service = AsyncMock()
+    mock_report_service.iter_short_weekly_reports = MagicMock(
+        side_effect=[
+            iter_chunks(
+                [(first, MagicMock(), MagicMock())],
+                [(second, MagicMock(), MagicMock())],
+            ),
+            iter_chunks([(second, MagicMock(), MagicMock())]),
+        ]
+    )
+    mock_report_service_cls.return_value = mock_report_service
+    mock_producer = AsyncMock()
+    mock_notification_producer_cls.return_value = mock_producer
+    ctx = {
+        'arq_pool': AsyncMock(spec=ArqRedis),
+        'llm_service': AsyncMock(),
+        'redis_client': redis,
+    }
+    checkpoint = JobCheckpoint(redis, f'weekly_report:{report_week()}:0/1')
+
+    with pytest.raises(Retry):
+        await run_report_generation_shard_arq(ctx, 0, 1)
+
+    progress = await checkpoint.load()
+    assert progress['last_key'] == [1, 'Bulgarian']
+    assert progress['done'] is False
+
+    with pytest.raises(Retry):
+        await run_report_generation_shard_arq(ctx, 0, 1)
+    monkeypatch.setattr(settings, 'report_generation_shard_budget_seconds', 60)
+    mock_report_service.iter_short_weekly_reports.side_effect = None
+    mock_report_service.iter_short_weekly_reports.return_value = iter_chunks()
+    await run_report_generation_shard_arq(ctx, 0, 1)
+
+    assert mock_report_service.iter_short_weekly_reports.call_args_list[
+        1
+    ] == call(shard=(0, 1), after=(1, 'Bulgarian'))
+    assert mock_report_service.iter_short_weekly_reports.call_args_list[
+        2
+    ] == call(shard=(0, 1), after=(2, 'Bulgarian'))
+    assert mock_producer.enqueue_weekly_report_notification.await_count == 2
+    assert (await checkpoint.load())['done'] is True
+
+
+async def test_run_report_generation_cycle_arq_enqueues_shards(
+    monkeypatch,
+):
+    monkeypatch.setattr(settings, 'report_generation_shard_count', 3)
+    arq_pool = AsyncMock(spec=ArqRedis)
+
+    await run_report_generation_cycle_arq({'arq_pool': arq_pool})
+
+    assert arq_pool.enqueue_job.await_args_list == [
+        call(
+            'run_report_generation_shard_arq',
+            shard_index,
+            3,
+            _job_id=f'weekly_report:{report_week()}:{shard_index}/3',
+        )
+        for shard_index in range(3)
+    ]
 
 
 @patch('app.workers.arq_tasks.reports.async_session_maker')
@@ -420,7 +620,11 @@ async def test_generate_and_send_detailed_report_arq(
     mock_async_session_maker,
     worker_db_session,
     add_user_with_short_report,
+    monkeypatch,
 ):
+    monkeypatch.setattr(
+        settings, 'detailed_report_partial_save_interval_seconds', 0
+    )
     user, profile, report = add_user_with_short_report
     mock_async_session_maker.return_value = AsyncMock()
     mock_async_session_maker.return_value.__aenter__.return_value = (
@@ -428,10 +632,16 @@ async def test_generate_and_send_detailed_report_arq(
     )
     mock_async_session_maker.return_value.__aexit__.return_value = None
 
-    mock_llm_service = AsyncMock()
-    mock_llm_service.generate_detailed_report_text.return_value = (
-        'Detailed report text.'
-    )
+    mock_llm_service = MagicMock()
+    saved_partial_texts = []
+
+    async def stream_report(**kwargs):
+        yield 'Detailed '
+        await worker_db_session.refresh(report)
+        saved_partial_texts.append(report.full_report)
+        yield 'report text.'
+
+    mock_llm_service.stream_detailed_report_text.side_effect = stream_report
 
     mock_arq_pool = AsyncMock(spec=ArqRedis)
     mock_arq_pool.enqueue_job = AsyncMock()
@@ -443,8 +653,9 @@ async def test_generate_and_send_detailed_report_arq(
     await worker_db_session.refresh(report)
     assert report.full_report == 'Detailed report text.'
     assert report.status == ReportStatus.GENERATED.value
+    assert saved_partial_texts == ['Detailed ']
 
-    mock_llm_service.generate_detailed_report_text.assert_awaited_once()
+    mock_llm_service.stream_detailed_report_text.assert_called_once()
     mock_arq_pool.enqueue_job.assert_awaited_once_with(
         'send_detailed_report_notification_arq',
         report.report_id,
@@ -0,0 +1,193 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.core.entities.user import User
+from app.core.entities.user_bot_profile import UserBotProfile
+from app.core.services.user_bot_profile import UserBotProfileService
+from app.db.models import DBUserBotProfile
+from app.db.models import User as DBUser
+from app.infrastructure.delay_queue import SessionReminderQueue
+from app.services.notification_producer import NotificationProducerService
+from app.workers.session_reminder_consumer import SessionReminderConsumer
+
+pytestmark = pytest.mark.asyncio
+
+
+async def iter_chunks(*chunks):
+    for chunk in chunks:
+        yield chunk
+
+
+def make_db_profile(
+    user: User, profile: UserBotProfile, frozen_until: datetime
+) -> DBUserBotProfile:
+    db_profile = DBUserBotProfile(
+        **profile.model_dump(
+            exclude={'session_frozen_until', 'wants_session_reminders'}
+        ),
+        session_frozen_until=frozen_until,
+        wants_session_reminders=True,
+    )
+    db_profile.user = DBUser(**user.model_dump())
+    return db_profile
+
+
+def make_consumer(redis, db_profile):
+    producer = AsyncMock(spec=NotificationProducerService)
+    producer.prepare_and_enqueue_session_reminder.return_value = True
+    repo = AsyncMock()
+    repo.get_with_user.return_value = db_profile
+    repo.iter_frozen_for_session_reminder = MagicMock(
+        return_value=iter_chunks()
+    )
+    consumer = SessionReminderConsumer(
+        queue=SessionReminderQueue(redis),
+        notification_producer=producer,
+        profile_repo_class=MagicMock(return_value=repo),
+    )
+    return consumer, producer
+
+
+@pytest.fixture
+def session_maker_stub():
+    with patch(
+        'app.workers.session_reminder_consumer.async_session_maker',
+        return_value=MagicMock(
+            __aenter__=AsyncMock(return_value=AsyncMock()),
+            __aexit__=AsyncMock(return_value=None),
+        ),
+    ):
+        yield
+
+
+async def test_queue_pops_only_due_entries_once(redis):
+    queue = SessionReminderQueue(redis)
+    now = datetime.now(timezone.utc)
+
+    await queue.schedule_reminder(1, 'Bulgarian', now - timedelta(seconds=1))
+    await queue.schedule_reminder(1, 'Bulgarian', now - timedelta(seconds=2))
+    await queue.schedule_reminder(2, 'Bulgarian', now + timedelta(hours=1))
+    await queue.schedule_reminder(3, 'Bulgarian', now - timedelta(seconds=1))
+    assert await queue.cancel_reminder(3, 'Bulgarian') is True
+
+    assert await queue.size() == 2
+    assert await queue.pop_due_reminders(now=now) == [(1, 'Bulgarian')]
+    assert await queue.pop_due_reminders(now=now) == []
+    assert await queue.next_due_at() == pytest.approx(
+        now + timedelta(hours=1), abs=timedelta(milliseconds=1)
+    )
+
+
+async def test_update_session_schedules_and_cancels_reminder(
+    redis, user_bot_profile
+):
+    queue = SessionReminderQueue(redis)
+    repo = AsyncMock()
+    repo.get.return_value = user_bot_profile
+    repo.update.side_effect = lambda profile: profile.model_copy()
+    service = UserBotProfileService(repo, session_reminder_queue=queue)
+    frozen_until = datetime.now(timezone.utc) + timedelta(hours=3)
+
+    await service.update_session(
+        user_id=user_bot_profile.user_id,
+        bot_id=user_bot_profile.bot_id,
+        session_frozen_until=frozen_until,
+    )
+    assert await queue.next_due_at() == pytest.approx(
+        frozen_until, abs=timedelta(milliseconds=1)
+    )
+
+    await service.reset_and_start_new_session(
+        user_id=user_bot_profile.user_id, bot_id=user_bot_profile.bot_id
+    )
+    assert await queue.size() == 0
+
+
+async def test_consumer_sends_each_reminder_once(
+    redis, user, user_bot_profile, session_maker_stub
+):
+    frozen_until = datetime.now(timezone.utc) - timedelta(seconds=1)
+    consumer, producer = make_consumer(
+        redis, make_db_profile(user, user_bot_profile, frozen_until)
+    )
+
+    for _ in range(2):
+        await consumer.queue.schedule_reminder(
+            user.user_id, user_bot_profile.bot_id, frozen_until
+        )
+        assert await consumer.process_due() == 1
+
+    producer.prepare_and_enqueue_session_reminder.assert_awaited_once()
+
+
+async def test_consumer_skips_reminder_when_session_still_frozen(
+    redis, user, user_bot_profile, session_maker_stub
+):
+    frozen_until = datetime.now(timezone.utc) + timedelta(hours=1)
+    consumer, producer = make_consumer(
+        redis, make_db_profile(user, user_bot_profile, frozen_until)
+    )
+    await consumer.queue.schedule_reminder(
+        user.user_id,
+        user_bot_profile.bot_id,
+        datetime.now(timezone.utc) - timedelta(seconds=1),
+    )
+
+    assert await consumer.process_due() == 1
+    producer.prepare_and_enqueue_session_reminder.assert_not_awaited()
+
+
+async def test_consumer_sends_reminder_with_sub_second_delay(
+    redis, user, user_bot_profile, session_maker_stub
+):
+    frozen_until = datetime.now(timezone.utc) + timedelta(milliseconds=300)
+    consumer, producer = make_consumer(
+        redis, make_db_profile(user, user_bot_profile, frozen_until)
+    )
+    sent_at = []
+    producer.prepare_and_enqueue_session_reminder.side_effect = lambda *args: (
+        sent_at.append(datetime.now(timezone.utc)) or True
+    )
+    await consumer.queue.schedule_reminder(
+        user.user_id, user_bot_profile.bot_id, frozen_until
+    )
+    stop_event = asyncio.Event()
+    task = asyncio.create_task(consumer.run(stop_event))
+
+    await asyncio.sleep(0.6)
+    stop_event.set()
+    await task
+
+    assert len(sent_at) == 1
+    assert (
+        timedelta(0) <= sent_at[0] - frozen_until < timedelta(milliseconds=200)
+    )
+
+
+async def test_backfill_requeues_reminders_lost_while_consumer_was_down(
+    redis, user, user_bot_profile, session_maker_stub
+):
+    frozen_until = datetime.now(timezone.utc) - timedelta(minutes=5)
+    db_profile = make_db_profile(user, user_bot_profile, frozen_until)
+    consumer, producer = make_consumer(redis, db_profile)
+    repo = consumer.profile_repo_class.return_value
+
+    # A worker popped the entry and died before sending it.
+    await consumer.queue.schedule_reminder(
+        user.user_id, user_bot_profile.bot_id, frozen_until
+    )
+    await consumer.queue.pop_due_reminders()
+
+    for _ in range(2):
+        repo.iter_frozen_for_session_reminder.return_value = iter_chunks(
+            [db_profile]
+        )
+        assert await consumer.backfill() == 1
+        assert await consumer.process_due() == 1
+
+    (unlocks_after,) = repo.iter_frozen_for_session_reminder.call_args.args
+    assert unlocks_after < frozen_until
+    producer.prepare_and_enqueue_session_reminder.assert_awaited_once()